@@ -0,0 +1,98 @@
+"""
+Benchmark the IVF index of the local vector search backend against exact search.
+
+Generates clustered synthetic embeddings (unit-length, like OpenAI embeddings) at several corpus
+sizes and reports index build time, queries per second and recall@k of the approximate index
+relative to exact brute-force search.
+
+Usage:
+    python scripts/benchmark_vector_index.py --sizes 10000 50000 100000 --nprobe 4 8 16 32
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from horizon_scope.infrastructure.index.exact_index import exact_search
+from horizon_scope.infrastructure.index.ivf_index import IVFIndex
+from horizon_scope.infrastructure.services.local_vector_search_service import (
+    normalize_rows,
+)
+
+
+def make_corpus(
+    n: int, dim: int, n_topics: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Sample n unit vectors scattered around n_topics random topic directions."""
+    topics = rng.standard_normal((n_topics, dim), dtype=np.float32)
+    vectors = topics[rng.integers(0, n_topics, n)]
+    vectors += 0.6 * rng.standard_normal((n, dim), dtype=np.float32)
+    return normalize_rows(vectors)
+
+
+def make_queries(
+    corpus: np.ndarray, n_queries: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Sample queries as perturbed corpus rows, like a paraphrased project description."""
+    rows = corpus[rng.integers(0, len(corpus), n_queries)]
+    noise = 0.05 * rng.standard_normal(rows.shape, dtype=np.float32)
+    return normalize_rows(rows + noise)
+
+
+def measure(search, queries: np.ndarray, k: int):
+    """Run all queries and return (results, queries per second)."""
+    start = time.perf_counter()
+    results = [search(query, k)[0] for query in queries]
+    elapsed = time.perf_counter() - start
+    return results, len(queries) / elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print one table row per corpus size and nprobe."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 100_000])
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--n-lists", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(
+        f"{'size':>8} {'lists':>6} {'build s':>8} {'nprobe':>6} "
+        f"{'exact q/s':>10} {'ivf q/s':>10} {'recall@' + str(args.k):>10}"
+    )
+    for size in args.sizes:
+        corpus = make_corpus(size, args.dim, n_topics=max(8, size // 200), rng=rng)
+        queries = make_queries(corpus, args.queries, rng)
+
+        start = time.perf_counter()
+        index = IVFIndex.build(corpus, n_lists=args.n_lists, seed=args.seed)
+        build_seconds = time.perf_counter() - start
+
+        exact_results, exact_qps = measure(
+            lambda query, k: exact_search(corpus, query, k), queries, args.k
+        )
+        for nprobe in args.nprobe:
+            ivf_results, ivf_qps = measure(
+                lambda query, k: index.search(corpus, query, k, nprobe=nprobe),
+                queries,
+                args.k,
+            )
+            recall = np.mean(
+                [
+                    len(set(exact.tolist()) & set(approximate.tolist())) / args.k
+                    for exact, approximate in zip(exact_results, ivf_results)
+                ]
+            )
+            print(
+                f"{size:>8} {index.n_lists:>6} {build_seconds:>8.2f} {nprobe:>6} "
+                f"{exact_qps:>10.0f} {ivf_qps:>10.0f} {recall:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
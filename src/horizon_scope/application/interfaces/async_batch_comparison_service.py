@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import List
+from horizon_scope.domain.entities.comparison import Comparison
+
+
+class AsyncBatchComparisonService(ABC):
+    """Abstract base class for asynchronous comparison services that compare many projects at once.
+
+    This class is the asyncio counterpart of BatchComparisonService.
+
+    Methods:
+        acompare_many (str, List[str]) -> List[Comparison]: Asynchronously compare a project with several existing projects.
+    """
+
+    @abstractmethod
+    async def acompare_many(
+        self, my_project: str, existing_projects: List[str]
+    ) -> List[Comparison]:
+        """Asynchronously compare a project with several existing projects.
+
+        Args:
+            my_project (str): The description of the user's project idea.
+            existing_projects (List[str]): The descriptions of the existing projects.
+
+        Returns:
+            List[Comparison]: One comparison per existing project, in the same order.
+        """
+        pass
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from horizon_scope.domain.entities.comparison import Comparison
+
+
+class AsyncComparisonService(ABC):
+    """Abstract base class for asynchronous comparison services.
+
+    This class is the asyncio counterpart of ComparisonService. Implementations perform the
+    comparison without blocking the event loop, so that a single loop can serve many concurrent
+    comparisons.
+
+    Methods:
+        acompare (str, str) -> Comparison: Asynchronously compare two project descriptions and return a Comparison object.
+    """
+
+    @abstractmethod
+    async def acompare(self, my_project: str, existing_project: str) -> Comparison:
+        """Asynchronously compare two project descriptions and return a Comparison object.
+
+        Args:
+            my_project (str): The description of the user's project idea.
+            existing_project (str): The description of an existing project to compare against.
+
+        Returns:
+            Comparison: An object containing the comparison details.
+        """
+        pass
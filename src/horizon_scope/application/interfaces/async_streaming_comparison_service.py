@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from horizon_scope.application.interfaces.streaming_comparison_service import (
+    ComparisonUpdateCallback,
+)
+from horizon_scope.domain.entities.comparison import Comparison
+
+
+class AsyncStreamingComparisonService(ABC):
+    """Abstract base class for asynchronous comparison services that report partial results.
+
+    This class defines the asyncio counterpart of StreamingComparisonService.
+
+    Methods:
+        acompare_streaming (str, str, ComparisonUpdateCallback) -> Comparison: Asynchronously compare two projects and report partial results.
+    """
+
+    @abstractmethod
+    async def acompare_streaming(
+        self,
+        my_project: str,
+        existing_project: str,
+        on_update: ComparisonUpdateCallback,
+    ) -> Comparison:
+        """Asynchronously compare two project descriptions and report the fields as they are generated.
+
+        Args:
+            my_project (str): The description of the user's project idea.
+            existing_project (str): The description of the existing project.
+            on_update (ComparisonUpdateCallback): Called with the fields generated so far whenever they change.
+
+        Returns:
+            Comparison: The complete, validated comparison.
+        """
+        pass
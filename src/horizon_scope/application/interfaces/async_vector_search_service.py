@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import List
+from horizon_scope.domain.entities.project import Project
+
+
+class AsyncVectorSearchService(ABC):
+    """Abstract base class for asynchronous vector search services.
+
+    This class is the asyncio counterpart of VectorSearchService. Implementations perform the
+    search without blocking the event loop.
+
+    Methods:
+        asearch (str, int) -> List[Project]: Asynchronously perform a vector search for similar projects based on the given query.
+    """
+
+    @abstractmethod
+    async def asearch(self, query: str, k: int) -> List[Project]:
+        """Asynchronously perform a vector search for similar projects based on the given query.
+
+        Args:
+            query (str): The project description or search query.
+            k (int): The number of similar projects to return.
+
+        Returns:
+            List[Project]: A list of Project objects representing the most similar projects.
+        """
+        pass
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import List
+from horizon_scope.domain.entities.comparison import Comparison
+
+
+class BatchComparisonService(ABC):
+    """Abstract base class for comparison services that compare many projects at once.
+
+    This class defines an interface for comparing one project description with several
+    existing ones, so that implementations can share the instructions and the user's project
+    across the comparisons instead of repeating them in every request.
+
+    Methods:
+        compare_many (str, List[str]) -> List[Comparison]: Compare a project with several existing projects.
+    """
+
+    @abstractmethod
+    def compare_many(
+        self, my_project: str, existing_projects: List[str]
+    ) -> List[Comparison]:
+        """Compare a project with several existing projects.
+
+        Args:
+            my_project (str): The description of the user's project idea.
+            existing_projects (List[str]): The descriptions of the existing projects.
+
+        Returns:
+            List[Comparison]: One comparison per existing project, in the same order.
+        """
+        pass
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from horizon_scope.domain.entities.comparison import Comparison
+
+
+class ComparisonCache(ABC):
+    """Abstract base class for comparison result caches.
+
+    This class defines an interface for storing and retrieving Comparison objects under an
+    opaque key. Concrete implementations decide where the entries live and when they expire.
+
+    Methods:
+        get (str) -> Optional[Comparison]: Retrieve a cached comparison.
+        set (str, Comparison) -> None: Store a comparison.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Comparison]:
+        """Retrieve a cached comparison.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Comparison]: The cached comparison, or None if the key is missing or expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, comparison: Comparison) -> None:
+        """Store a comparison.
+
+        Args:
+            key (str): The cache key.
+            comparison (Comparison): The comparison to store.
+        """
+        pass
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from horizon_scope.domain.entities.comparison import Comparison
+
+
+class ComparisonLog(ABC):
+    """Abstract base class for logs of past comparisons.
+
+    This class defines an interface for recording the vector similarity of every compared
+    search hit together with the comparison result, so that the relation between the two can be
+    fitted later.
+
+    Methods:
+        record (float, Comparison, Optional[str]) -> None: Record a comparison.
+        samples (Optional[int]) -> List[Tuple[float, float, float]]: Return recorded samples.
+    """
+
+    @abstractmethod
+    def record(
+        self, similarity: float, comparison: Comparison, key: Optional[str] = None
+    ) -> None:
+        """Record a comparison.
+
+        Args:
+            similarity (float): The vector similarity of the compared search hit.
+            comparison (Comparison): The comparison result.
+            key (Optional[str]): Identifies the compared pair; a pair is recorded only once, so
+                repeated (e.g. cached) comparisons add no duplicate samples. Defaults to None.
+        """
+        pass
+
+    @abstractmethod
+    def samples(self, limit: Optional[int] = None) -> List[Tuple[float, float, float]]:
+        """Return recorded samples, most recent first.
+
+        Args:
+            limit (Optional[int]): The maximum number of samples. Defaults to None (all).
+
+        Returns:
+            List[Tuple[float, float, float]]: Similarity, score and confidence of every sample.
+        """
+        pass
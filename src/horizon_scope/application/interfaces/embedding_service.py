@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class EmbeddingService(ABC):
+    """Abstract base class for text embedding services.
+
+    This class defines an interface for turning texts into dense vectors. Vector search services
+    use it to embed queries and projects, independently of where the vectors are stored.
+
+    Methods:
+        embed (str) -> List[float]: Embed a single text.
+        embed_many (List[str]) -> List[List[float]]: Embed several texts in one request.
+        aembed (str) -> List[float]: Asynchronously embed a single text.
+    """
+
+    @abstractmethod
+    def embed(self, text: str) -> List[float]:
+        """Embed a single text.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            List[float]: The embedding of the text.
+        """
+        pass
+
+    @abstractmethod
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts in one request.
+
+        Args:
+            texts (List[str]): The texts to embed.
+
+        Returns:
+            List[List[float]]: The embeddings, in the order of the texts.
+        """
+        pass
+
+    @abstractmethod
+    async def aembed(self, text: str) -> List[float]:
+        """Asynchronously embed a single text.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            List[float]: The embedding of the text.
+        """
+        pass
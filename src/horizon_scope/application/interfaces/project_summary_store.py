@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from horizon_scope.domain.entities.project_summary import ProjectSummary
+
+
+class ProjectSummaryStore(ABC):
+    """Abstract base class for stores of precomputed project summaries.
+
+    This class defines an interface for looking up the summary of an existing project by its
+    description, which is all the comparison path knows about it. Implementations key the
+    entries by the description content, so an updated description never returns a stale
+    summary.
+
+    Methods:
+        get (str) -> Optional[ProjectSummary]: Retrieve the summary of a project description.
+        set (str, ProjectSummary, Optional[str]) -> None: Store the summary of a project description.
+    """
+
+    @abstractmethod
+    def get(self, description: str) -> Optional[ProjectSummary]:
+        """Retrieve the summary of a project description.
+
+        Args:
+            description (str): The description of the existing project.
+
+        Returns:
+            Optional[ProjectSummary]: The stored summary, or None if there is none.
+        """
+        pass
+
+    @abstractmethod
+    def set(
+        self,
+        description: str,
+        summary: ProjectSummary,
+        project_id: Optional[str] = None,
+    ) -> None:
+        """Store the summary of a project description.
+
+        Args:
+            description (str): The description of the existing project.
+            summary (ProjectSummary): The summary to store.
+            project_id (Optional[str]): The project identifier, for reference. Defaults to None.
+        """
+        pass
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+from horizon_scope.domain.entities.project import Project
+
+
+class Reranker(ABC):
+    """Abstract base class for rerankers.
+
+    This class defines an interface for rescoring the candidates of a vector search against
+    the query with a model that is more accurate than the retrieval embeddings but much cheaper
+    than an LLM comparison. Scores are only comparable within one reranker.
+
+    Methods:
+        rerank (str, List[Project]) -> List[Tuple[Project, float]]: Score the candidates against the query.
+    """
+
+    @abstractmethod
+    def rerank(self, query: str, projects: List[Project]) -> List[Tuple[Project, float]]:
+        """Score the candidates against the query.
+
+        Args:
+            query (str): The project description or search query.
+            projects (List[Project]): The candidates found by the vector search.
+
+        Returns:
+            List[Tuple[Project, float]]: Every candidate with its relevance score, highest score first.
+        """
+        pass
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict
+from horizon_scope.domain.entities.comparison import Comparison
+
+# Receives the Comparison fields generated so far; the last string field may be incomplete
+ComparisonUpdateCallback = Callable[[Dict[str, Any]], None]
+
+
+class StreamingComparisonService(ABC):
+    """Abstract base class for comparison services that report partial results.
+
+    This class defines an interface for comparing two project descriptions while the result
+    is being generated, so that a user interface can show the first fields of a comparison
+    long before the last one is complete.
+
+    Methods:
+        compare_streaming (str, str, ComparisonUpdateCallback) -> Comparison: Compare two projects and report partial results.
+    """
+
+    @abstractmethod
+    def compare_streaming(
+        self,
+        my_project: str,
+        existing_project: str,
+        on_update: ComparisonUpdateCallback,
+    ) -> Comparison:
+        """Compare two project descriptions and report the fields as they are generated.
+
+        Args:
+            my_project (str): The description of the user's project idea.
+            existing_project (str): The description of the existing project.
+            on_update (ComparisonUpdateCallback): Called with the fields generated so far whenever they change.
+
+        Returns:
+            Comparison: The complete, validated comparison.
+        """
+        pass
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from horizon_scope.domain.entities.project_summary import ProjectSummary
+
+
+class SummaryService(ABC):
+    """Abstract base class for services that summarize existing projects.
+
+    This class defines an interface for generating the summary and facets of many project
+    descriptions at once, e.g. in an offline job that fills a ProjectSummaryStore.
+
+    Methods:
+        summarize_many (List[str]) -> List[Optional[ProjectSummary]]: Summarize several project descriptions.
+    """
+
+    @abstractmethod
+    def summarize_many(self, descriptions: List[str]) -> List[Optional[ProjectSummary]]:
+        """Summarize several project descriptions.
+
+        Args:
+            descriptions (List[str]): The descriptions of the existing projects.
+
+        Returns:
+            List[Optional[ProjectSummary]]: One summary per description, in the same order, or None where no summary could be generated.
+        """
+        pass
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import List
+from horizon_scope.domain.entities.project import Project
+
+
+class VectorIndexWriter(ABC):
+    """Abstract base class for vector stores that accept precomputed embeddings.
+
+    This class defines the write side of a vector store, so that ingestion can compute
+    embeddings once and store them in any backend.
+
+    Methods:
+        upsert_embeddings (List[Project], List[List[float]]) -> None: Add or replace projects with their embeddings.
+        delete (List[str]) -> None: Remove projects from the index.
+        flush () -> None: Persist all changes.
+    """
+
+    @abstractmethod
+    def upsert_embeddings(
+        self, projects: List[Project], embeddings: List[List[float]]
+    ) -> None:
+        """Add or replace projects with their embeddings.
+
+        Chunks left over from a longer previous version of a project are removed.
+
+        Args:
+            projects (List[Project]): The projects to store, one per chunk, with all chunks of each project.
+            embeddings (List[List[float]]): The embeddings, aligned with the projects.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, project_ids: List[str]) -> None:
+        """Remove projects from the index. Unknown ids are ignored.
+
+        Args:
+            project_ids (List[str]): The ids of the projects to remove.
+        """
+        pass
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Persist all changes, so that they survive a restart."""
+        pass
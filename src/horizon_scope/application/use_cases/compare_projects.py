@@ -1,59 +1,714 @@
-from typing import List
+import asyncio
+import bisect
+import contextvars
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Iterator, List, Optional, Sequence, Tuple, Union
+from horizon_scope.application.interfaces.async_batch_comparison_service import (
+    AsyncBatchComparisonService,
+)
+from horizon_scope.application.interfaces.async_comparison_service import (
+    AsyncComparisonService,
+)
+from horizon_scope.application.interfaces.batch_comparison_service import (
+    BatchComparisonService,
+)
+from horizon_scope.application.interfaces.async_vector_search_service import (
+    AsyncVectorSearchService,
+)
 from horizon_scope.application.interfaces.vector_search_service import (
     VectorSearchService,
 )
+from horizon_scope.application.interfaces.comparison_log import ComparisonLog
 from horizon_scope.application.interfaces.comparison_service import ComparisonService
+from horizon_scope.application.interfaces.reranker import Reranker
+from horizon_scope.domain.entities.comparison import Comparison
 from horizon_scope.domain.entities.horizon_scope_result import HorizonScopeResult
+from horizon_scope.domain.entities.match_update import MatchUpdate
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.domain.entities.score_calibration import ScoreCalibration
+
+logger = logging.getLogger(__name__)
+
+
+def sample_key(query: str, project_id: str) -> str:
+    """Build the comparison log key of a compared pair of query and project.
+
+    Args:
+        query (str): The description of the query project.
+        project_id (str): The id of the compared project.
+
+    Returns:
+        str: A SHA-256 hex digest of the query and the project id.
+    """
+    digest = hashlib.sha256(query.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(project_id.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def select_candidates(
+    ranked: Sequence[Tuple[Project, float]],
+    k: int,
+    min_score: Optional[float] = None,
+    max_gap: Optional[float] = None,
+) -> List[Project]:
+    """Choose how many reranked candidates are worth an LLM comparison.
+
+    Candidates are taken in rank order, up to k. The selection stops at the first candidate
+    scoring below min_score, or scoring more than max_gap below its predecessor, since a large
+    drop separates the relevant head of the ranking from the tail. The best candidate is always
+    kept.
+
+    Args:
+        ranked (Sequence[Tuple[Project, float]]): Candidates with their rerank scores, best first.
+        k (int): The maximum number of candidates to select.
+        min_score (Optional[float]): Lowest score worth comparing. Defaults to None (no threshold).
+        max_gap (Optional[float]): Largest score drop between consecutive candidates. Defaults to None (no gap cut).
+
+    Returns:
+        List[Project]: The selected candidates, best first.
+    """
+    selected: List[Project] = []
+    previous_score: Optional[float] = None
+    for project, score in ranked[:k]:
+        if selected and (
+            (min_score is not None and score < min_score)
+            or (max_gap is not None and previous_score - score > max_gap)
+        ):
+            break
+        selected.append(project)
+        previous_score = score
+    return selected
+
+
+class RankedResults:
+    """Running view of a streamed match, sorted like the results of execute.
+
+    Feed every MatchUpdate of execute_iter or aexecute_iter to update to keep the results
+    sorted by comparison score as they arrive.
+
+    Attributes:
+        hits (List[Project]): The search hits of the match.
+        results (List[HorizonScopeResult]): The results received so far, highest score first.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty RankedResults."""
+        self.hits: List[Project] = []
+        self.results: List[HorizonScopeResult] = []
+
+    def update(self, update: MatchUpdate) -> List[HorizonScopeResult]:
+        """Add the hits or the result of an update.
+
+        Results with equal scores keep their arrival order.
+
+        Args:
+            update (MatchUpdate): The update to add.
+
+        Returns:
+            List[HorizonScopeResult]: The results received so far, highest score first.
+        """
+        if update.hits:
+            self.hits = list(update.hits)
+        if update.result is not None:
+            bisect.insort_right(
+                self.results,
+                update.result,
+                key=lambda result: -result.comparison.score,
+            )
+        return self.results
+
+    @property
+    def pending(self) -> List[Project]:
+        """List[Project]: The hits without a result so far."""
+        done = {result.project.id for result in self.results}
+        return [project for project in self.hits if project.id not in done]
 
 
 class CompareProjects:
     """Handles the comparison of a query project against a set of similar projects.
 
     This class uses a vector search service to find projects similar to the query and then uses
-    a comparison service to evaluate the similarity of each found project. Results are sorted
-    by similarity score.
+    a comparison service to evaluate the similarity of each found project. Comparisons run
+    concurrently on a bounded worker pool (or as bounded asyncio tasks in aexecute), and a failed
+    comparison only drops its own project from the results. Results are sorted by similarity score.
+    If the comparison service implements BatchComparisonService, all hits are compared with one
+    compare_many call instead; if that call fails, the hits are compared one by one.
+    execute_iter and aexecute_iter stream the hits and then every result as it completes.
+
+    With a reranker, retrieval runs in two stages: a wider candidate list is fetched, rescored by
+    the reranker, and only the candidates that pass select_candidates are sent to the (much more
+    expensive) comparison service.
+
+    With a score calibration, hits whose vector similarity maps to an expected comparison score
+    below min_expected_score are not sent to the comparison service. They are returned with an
+    estimated comparison, or dropped if estimate_skipped is False, and counted in saved_calls.
+    A comparison log records the similarity and result of every compared pair of query and
+    project once, to fit the calibration on.
 
     Attributes:
         vector_search_service (VectorSearchService): Service for performing vector-based searches to find similar projects.
         comparison_service (ComparisonService): Service for comparing project descriptions to determine similarity.
+        max_workers (int): Maximum number of comparisons running at the same time.
+        reranker (Optional[Reranker]): Reranker applied between search and comparison, or None.
+        candidates (int): Number of candidates retrieved for the reranker.
+        min_rerank_score (Optional[float]): Lowest rerank score worth comparing.
+        max_rerank_gap (Optional[float]): Largest rerank score drop between consecutive compared candidates.
+        comparison_log (Optional[ComparisonLog]): Log that records every comparison, or None.
+        calibration (Optional[ScoreCalibration]): Mapping from vector similarity to expected comparison score, or None.
+        min_expected_score (Optional[float]): Hits expected to score lower are not compared. None disables gating.
+        estimate_skipped (bool): Whether skipped hits are returned with an estimated comparison.
+        saved_calls (int): Number of comparison calls skipped by the gate so far.
     """
 
     def __init__(
         self,
         vector_search_service: VectorSearchService,
         comparison_service: ComparisonService,
+        max_workers: int = 1,
+        reranker: Optional[Reranker] = None,
+        candidates: int = 50,
+        min_rerank_score: Optional[float] = None,
+        max_rerank_gap: Optional[float] = None,
+        comparison_log: Optional[ComparisonLog] = None,
+        calibration: Optional[ScoreCalibration] = None,
+        min_expected_score: Optional[float] = None,
+        estimate_skipped: bool = True,
     ) -> None:
         """Initialize CompareProjects with vector search and comparison services.
 
         Args:
             vector_search_service (VectorSearchService): The service to search for similar projects.
             comparison_service (ComparisonService): The service to compare project descriptions.
+            max_workers (int): Maximum number of concurrent comparisons. Defaults to 1 (sequential).
+            reranker (Optional[Reranker]): Reranker applied between search and comparison. Defaults to None.
+            candidates (int): Number of candidates retrieved for the reranker. Defaults to 50.
+            min_rerank_score (Optional[float]): Lowest rerank score worth comparing. Defaults to None.
+            max_rerank_gap (Optional[float]): Largest rerank score drop between compared candidates. Defaults to None.
+            comparison_log (Optional[ComparisonLog]): Log that records every comparison. Defaults to None.
+            calibration (Optional[ScoreCalibration]): Mapping from vector similarity to expected score. Defaults to None.
+            min_expected_score (Optional[float]): Hits expected to score lower are not compared. Defaults to None.
+            estimate_skipped (bool): Whether skipped hits are returned with an estimated comparison. Defaults to True.
+
+        Raises:
+            ValueError: If max_workers is smaller than 1.
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self.vector_search_service = vector_search_service
         self.comparison_service = comparison_service
+        self.max_workers = max_workers
+        self.reranker = reranker
+        self.candidates = candidates
+        self.min_rerank_score = min_rerank_score
+        self.max_rerank_gap = max_rerank_gap
+        self.comparison_log = comparison_log
+        self.calibration = calibration
+        self.min_expected_score = min_expected_score
+        self.estimate_skipped = estimate_skipped
+        self.saved_calls = 0
 
     def execute(self, query: str, k: int) -> List[HorizonScopeResult]:
         """Perform the comparison of the query project with similar projects.
 
+        Comparisons that raise are logged and left out of the results. If every comparison
+        fails, the first error is re-raised so that systemic problems (e.g. an invalid API key)
+        are not hidden behind an empty result list.
+
         Args:
             query (str): The description of the query project to compare.
-            k (int): The number of similar projects to retrieve and compare.
+            k (int): The maximum number of similar projects to compare.
 
         Returns:
             List[HorizonScopeResult]: A list of HorizonScopeResult objects, sorted by similarity score in descending order.
         """
-        # Perform vector search to find similar projects
-        similar_projects = self.vector_search_service.search(query, k)
+        similar_projects, estimated = self._candidates(query, k)
+        if not similar_projects:
+            return self._collect_results([], estimated)
+
+        outcomes = self._compare_batch(query, similar_projects)
+        if outcomes is not None:
+            return self._collect_results(outcomes, estimated)
 
         # Compare the query with each similar project
-        results: List[HorizonScopeResult] = []
-        for project in similar_projects:
-            # Compare the query description with the project description
-            comparison = self.comparison_service.compare(query, project.description)
-            result = HorizonScopeResult(project=project, comparison=comparison)
-            results.append(result)
+        workers = min(self.max_workers, len(similar_projects))
+        if workers == 1:
+            outcomes = [self._compare(query, project) for project in similar_projects]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Copy the caller's context into every task, as asyncio.to_thread does
+                outcomes = list(
+                    executor.map(
+                        lambda project, context: context.run(
+                            self._compare, query, project
+                        ),
+                        similar_projects,
+                        [contextvars.copy_context() for _ in similar_projects],
+                    )
+                )
+
+        return self._collect_results(outcomes, estimated)
+
+    async def aexecute(self, query: str, k: int) -> List[HorizonScopeResult]:
+        """Asynchronously perform the comparison of the query project with similar projects.
+
+        Services implementing the async interfaces are awaited directly; synchronous services
+        are run in worker threads. At most max_workers comparisons are in flight at once.
+
+        Args:
+            query (str): The description of the query project to compare.
+            k (int): The maximum number of similar projects to compare.
+
+        Returns:
+            List[HorizonScopeResult]: A list of HorizonScopeResult objects, sorted by similarity score in descending order.
+        """
+        similar_projects, estimated = await self._acandidates(query, k)
+        if not similar_projects:
+            return self._collect_results([], estimated)
+
+        outcomes = await self._acompare_batch(query, similar_projects)
+        if outcomes is not None:
+            return self._collect_results(outcomes, estimated)
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+        outcomes = await asyncio.gather(
+            *(
+                self._acompare(query, project, semaphore)
+                for project in similar_projects
+            )
+        )
+        return self._collect_results(outcomes, estimated)
+
+    def execute_iter(self, query: str, k: int) -> Iterator[MatchUpdate]:
+        """Perform the comparison and yield the results as the comparisons complete.
+
+        The first update carries the search hits and is yielded before any comparison runs,
+        followed by the estimated results of skipped hits and then one update per finished
+        comparison, in completion order. Every project is compared on its own, so the first
+        result arrives after one comparison instead of after a whole batch. Failed comparisons
+        are logged and skipped; if every comparison fails, the first error is raised once the
+        comparisons are done. Closing the iterator early cancels the comparisons not yet
+        started. Use RankedResults to keep a sorted view of the results.
+
+        Args:
+            query (str): The description of the query project to compare.
+            k (int): The maximum number of similar projects to compare.
+
+        Yields:
+            MatchUpdate: The search hits, then one result per update.
+        """
+        similar_projects, estimated = self._candidates(query, k)
+        yield MatchUpdate(hits=self._hits(similar_projects, estimated))
+        for result in estimated:
+            yield MatchUpdate(result=result)
+        if not similar_projects:
+            return
+
+        errors: List[Exception] = []
+        workers = min(self.max_workers, len(similar_projects))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                # Copy the caller's context into every task, as asyncio.to_thread does
+                executor.submit(
+                    contextvars.copy_context().run, self._compare, query, project
+                )
+                for project in similar_projects
+            ]
+            for future in as_completed(futures):
+                outcome = future.result()
+                if isinstance(outcome, Exception):
+                    errors.append(outcome)
+                else:
+                    yield MatchUpdate(result=outcome)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if len(errors) == len(similar_projects):
+            raise errors[0]
+
+    async def aexecute_iter(self, query: str, k: int) -> AsyncIterator[MatchUpdate]:
+        """Asynchronously perform the comparison and yield the results as they complete.
+
+        See execute_iter. At most max_workers comparisons are in flight at once, and closing
+        the iterator early cancels the pending comparisons.
+
+        Args:
+            query (str): The description of the query project to compare.
+            k (int): The maximum number of similar projects to compare.
+
+        Yields:
+            MatchUpdate: The search hits, then one result per update.
+        """
+        similar_projects, estimated = await self._acandidates(query, k)
+        yield MatchUpdate(hits=self._hits(similar_projects, estimated))
+        for result in estimated:
+            yield MatchUpdate(result=result)
+        if not similar_projects:
+            return
+
+        errors: List[Exception] = []
+        semaphore = asyncio.Semaphore(self.max_workers)
+        tasks = [
+            asyncio.ensure_future(self._acompare(query, project, semaphore))
+            for project in similar_projects
+        ]
+        try:
+            for next_outcome in asyncio.as_completed(tasks):
+                outcome = await next_outcome
+                if isinstance(outcome, Exception):
+                    errors.append(outcome)
+                else:
+                    yield MatchUpdate(result=outcome)
+        finally:
+            for task in tasks:
+                task.cancel()
+        if len(errors) == len(similar_projects):
+            raise errors[0]
+
+    def _candidates(
+        self, query: str, k: int
+    ) -> Tuple[List[Project], List[HorizonScopeResult]]:
+        """Search, rerank and gate the projects to compare with the query.
+
+        Args:
+            query (str): The description of the query project.
+            k (int): The maximum number of similar projects to compare.
+
+        Returns:
+            Tuple[List[Project], List[HorizonScopeResult]]: The hits to compare, and the
+            estimated results of the hits skipped by the gate.
+        """
+        # Perform vector search to find similar projects
+        similar_projects = self.vector_search_service.search(
+            query, self._retrieval_size(k)
+        )
+        if self.reranker is not None and similar_projects:
+            similar_projects = self._select(
+                self.reranker.rerank(query, similar_projects), k
+            )
+        return self._gate(similar_projects)
+
+    async def _acandidates(
+        self, query: str, k: int
+    ) -> Tuple[List[Project], List[HorizonScopeResult]]:
+        """Asynchronously search, rerank and gate the projects to compare with the query.
+
+        Args:
+            query (str): The description of the query project.
+            k (int): The maximum number of similar projects to compare.
+
+        Returns:
+            Tuple[List[Project], List[HorizonScopeResult]]: The hits to compare, and the
+            estimated results of the hits skipped by the gate.
+        """
+        n_candidates = self._retrieval_size(k)
+        if isinstance(self.vector_search_service, AsyncVectorSearchService):
+            similar_projects = await self.vector_search_service.asearch(
+                query, n_candidates
+            )
+        else:
+            similar_projects = await asyncio.to_thread(
+                self.vector_search_service.search, query, n_candidates
+            )
+        if self.reranker is not None and similar_projects:
+            # Rerankers are CPU-bound or blocking, keep them off the event loop
+            ranked = await asyncio.to_thread(
+                self.reranker.rerank, query, similar_projects
+            )
+            similar_projects = self._select(ranked, k)
+        return self._gate(similar_projects)
+
+    @staticmethod
+    def _hits(
+        projects: List[Project], estimated: List[HorizonScopeResult]
+    ) -> List[Project]:
+        """Return the hits announced at the start of a streamed match.
+
+        Args:
+            projects (List[Project]): The hits to compare.
+            estimated (List[HorizonScopeResult]): The estimated results of skipped hits.
+
+        Returns:
+            List[Project]: The hits to compare followed by the estimated ones.
+        """
+        return projects + [result.project for result in estimated]
+
+    def _retrieval_size(self, k: int) -> int:
+        """Return the number of candidates to retrieve for k results.
+
+        Args:
+            k (int): The maximum number of projects to compare.
+
+        Returns:
+            int: k, or at least candidates if a reranker narrows the list down afterwards.
+        """
+        if self.reranker is None:
+            return k
+        return max(k, self.candidates)
+
+    def _select(
+        self, ranked: Sequence[Tuple[Project, float]], k: int
+    ) -> List[Project]:
+        """Select the reranked candidates to compare, see select_candidates.
+
+        Args:
+            ranked (Sequence[Tuple[Project, float]]): Candidates with their rerank scores, best first.
+            k (int): The maximum number of candidates to select.
+
+        Returns:
+            List[Project]: The selected candidates, best first.
+        """
+        selected = select_candidates(
+            ranked, k, self.min_rerank_score, self.max_rerank_gap
+        )
+        logger.debug(
+            "Reranked %d candidates, comparing %d", len(ranked), len(selected)
+        )
+        return selected
+
+    def _gate(
+        self, projects: List[Project]
+    ) -> Tuple[List[Project], List[HorizonScopeResult]]:
+        """Split the hits into those worth comparing and those below the expected-score cutoff.
+
+        Args:
+            projects (List[Project]): The hits to compare.
+
+        Returns:
+            Tuple[List[Project], List[HorizonScopeResult]]: The hits to compare, and estimated
+            results for the skipped hits (empty if estimate_skipped is False).
+        """
+        if self.calibration is None or self.min_expected_score is None:
+            return projects, []
+        to_compare: List[Project] = []
+        estimated: List[HorizonScopeResult] = []
+        for project in projects:
+            if project.similarity is None:
+                to_compare.append(project)
+                continue
+            score, confidence = self.calibration.estimate(project.similarity)
+            if score >= self.min_expected_score:
+                to_compare.append(project)
+                continue
+            self.saved_calls += 1
+            if self.estimate_skipped:
+                estimated.append(
+                    HorizonScopeResult(
+                        project=project,
+                        comparison=self._estimated_comparison(
+                            project.similarity, score, confidence
+                        ),
+                        estimated=True,
+                    )
+                )
+        if len(to_compare) < len(projects):
+            logger.debug(
+                "Skipped %d of %d comparisons below the expected score %.2f",
+                len(projects) - len(to_compare),
+                len(projects),
+                self.min_expected_score,
+            )
+        return to_compare, estimated
+
+    @staticmethod
+    def _estimated_comparison(
+        similarity: float, score: float, confidence: float
+    ) -> Comparison:
+        """Build the comparison returned for a hit that was not compared.
+
+        Args:
+            similarity (float): The vector similarity of the hit.
+            score (float): The expected comparison score.
+            confidence (float): The expected comparison confidence.
+
+        Returns:
+            Comparison: A comparison carrying only the estimated score and confidence.
+        """
+        return Comparison(
+            summary="",
+            similarity="",
+            difference="",
+            score=round(score, 2),
+            confidence=round(confidence, 2),
+            reason=(
+                f"Estimated from a vector similarity of {similarity:.2f}; "
+                "the projects were not compared."
+            ),
+        )
+
+    def _record(self, query: str, project: Project, comparison: Comparison) -> None:
+        """Record a comparison in the comparison log, if there is one.
+
+        Args:
+            query (str): The description of the query project.
+            project (Project): The compared project.
+            comparison (Comparison): The comparison result.
+        """
+        if self.comparison_log is None or project.similarity is None:
+            return
+        try:
+            self.comparison_log.record(
+                project.similarity, comparison, key=sample_key(query, project.id)
+            )
+        except Exception as error:
+            logger.warning("Logging the comparison with %s failed: %s", project.id, error)
+
+    def _collect_results(
+        self,
+        outcomes: Sequence[Union[HorizonScopeResult, Exception]],
+        estimated: Sequence[HorizonScopeResult] = (),
+    ) -> List[HorizonScopeResult]:
+        """Drop failed comparisons and sort the remaining results.
+
+        Args:
+            outcomes (Sequence[Union[HorizonScopeResult, Exception]]): One outcome per compared project.
+            estimated (Sequence[HorizonScopeResult]): Estimated results of skipped hits. Defaults to ().
+
+        Returns:
+            List[HorizonScopeResult]: The successful and estimated results, sorted by similarity score in descending order.
+
+        Raises:
+            Exception: The first comparison error, if every comparison failed.
+        """
+        results = [
+            outcome for outcome in outcomes if isinstance(outcome, HorizonScopeResult)
+        ]
+        if outcomes and not results:
+            # Every comparison failed: surface the first error instead of an empty list
+            raise outcomes[0]
+        results.extend(estimated)
 
         # Sort results by AI similarity score in descending order
         results.sort(key=lambda x: x.comparison.score, reverse=True)
 
         return results
+
+    def _compare_batch(
+        self, query: str, projects: List[Project]
+    ) -> Optional[List[HorizonScopeResult]]:
+        """Compare the query with all projects in one compare_many call, if supported.
+
+        Args:
+            query (str): The description of the query project.
+            projects (List[Project]): The projects to compare.
+
+        Returns:
+            Optional[List[HorizonScopeResult]]: The results, or None if the service does not
+            support batches or the batch failed and the projects must be compared one by one.
+        """
+        if len(projects) < 2 or not isinstance(
+            self.comparison_service, BatchComparisonService
+        ):
+            return None
+        try:
+            comparisons = self.comparison_service.compare_many(
+                query, [project.description for project in projects]
+            )
+        except Exception as error:
+            logger.warning("Batch comparison failed, comparing one by one: %s", error)
+            return None
+        return self._batch_results(query, projects, comparisons)
+
+    async def _acompare_batch(
+        self, query: str, projects: List[Project]
+    ) -> Optional[List[HorizonScopeResult]]:
+        """Asynchronously compare the query with all projects in one call, if supported.
+
+        Args:
+            query (str): The description of the query project.
+            projects (List[Project]): The projects to compare.
+
+        Returns:
+            Optional[List[HorizonScopeResult]]: The results, or None if the service does not
+            support batches or the batch failed and the projects must be compared one by one.
+        """
+        if len(projects) < 2:
+            return None
+        descriptions = [project.description for project in projects]
+        try:
+            if isinstance(self.comparison_service, AsyncBatchComparisonService):
+                comparisons = await self.comparison_service.acompare_many(
+                    query, descriptions
+                )
+            elif isinstance(self.comparison_service, BatchComparisonService):
+                comparisons = await asyncio.to_thread(
+                    self.comparison_service.compare_many, query, descriptions
+                )
+            else:
+                return None
+        except Exception as error:
+            logger.warning("Batch comparison failed, comparing one by one: %s", error)
+            return None
+        return self._batch_results(query, projects, comparisons)
+
+    def _batch_results(
+        self, query: str, projects: List[Project], comparisons: List[Comparison]
+    ) -> List[HorizonScopeResult]:
+        """Pair the projects with the comparisons of a batch and record them.
+
+        Args:
+            query (str): The description of the query project.
+            projects (List[Project]): The compared projects.
+            comparisons (List[Comparison]): One comparison per project, in the same order.
+
+        Returns:
+            List[HorizonScopeResult]: The results.
+        """
+        results = []
+        for project, comparison in zip(projects, comparisons):
+            self._record(query, project, comparison)
+            results.append(HorizonScopeResult(project=project, comparison=comparison))
+        return results
+
+    def _compare(
+        self, query: str, project: Project
+    ) -> Union[HorizonScopeResult, Exception]:
+        """Compare the query with a single project, isolating any failure.
+
+        Args:
+            query (str): The description of the query project.
+            project (Project): The project found by the vector search.
+
+        Returns:
+            Union[HorizonScopeResult, Exception]: The result, or the raised exception if the comparison failed.
+        """
+        try:
+            comparison = self.comparison_service.compare(query, project.description)
+        except Exception as error:
+            logger.warning("Comparison with project %s failed: %s", project.id, error)
+            return error
+        self._record(query, project, comparison)
+        return HorizonScopeResult(project=project, comparison=comparison)
+
+    async def _acompare(
+        self, query: str, project: Project, semaphore: asyncio.Semaphore
+    ) -> Union[HorizonScopeResult, Exception]:
+        """Asynchronously compare the query with a single project, isolating any failure.
+
+        Args:
+            query (str): The description of the query project.
+            project (Project): The project found by the vector search.
+            semaphore (asyncio.Semaphore): Semaphore bounding the number of concurrent comparisons.
+
+        Returns:
+            Union[HorizonScopeResult, Exception]: The result, or the raised exception if the comparison failed.
+        """
+        async with semaphore:
+            try:
+                if isinstance(self.comparison_service, AsyncComparisonService):
+                    comparison = await self.comparison_service.acompare(
+                        query, project.description
+                    )
+                else:
+                    comparison = await asyncio.to_thread(
+                        self.comparison_service.compare, query, project.description
+                    )
+            except Exception as error:
+                logger.warning(
+                    "Comparison with project %s failed: %s", project.id, error
+                )
+                return error
+        self._record(query, project, comparison)
+        return HorizonScopeResult(project=project, comparison=comparison)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 
 
 class Comparison(BaseModel):
@@ -37,3 +37,16 @@ class Comparison(BaseModel):
         ...,
         description="Thorough, evidence-based justification for the assigned similarity and confidence scores, referencing specific elements from both project descriptions.",
     )
+
+
+# A comparison without its summary, requested when the summary of the existing project is
+# precomputed. The fields are shared with Comparison so both schemas stay in sync.
+ComparisonAnalysis = create_model(
+    "ComparisonAnalysis",
+    __doc__="Represents a comparison between two projects, except for the summary.",
+    **{
+        name: (field.annotation, field)
+        for name, field in Comparison.model_fields.items()
+        if name != "summary"
+    },
+)
@@ -0,0 +1,53 @@
+from typing import List
+from pydantic import BaseModel, Field
+from horizon_scope.domain.entities.comparison import Comparison, ComparisonAnalysis
+
+
+class IndexedComparison(Comparison):
+    """Represents one comparison of a batch, tagged with the existing project it refers to.
+
+    Attributes:
+        index (int): Number of the existing project in the request, starting at 1.
+    """
+
+    index: int = Field(
+        ...,
+        description="Number of the existing project this comparison refers to, as given in the request.",
+    )
+
+
+class ComparisonBatch(BaseModel):
+    """Represents the comparisons of one input project with several existing projects.
+
+    Attributes:
+        comparisons (List[IndexedComparison]): One comparison per existing project.
+    """
+
+    comparisons: List[IndexedComparison] = Field(
+        ..., description="One comparison per existing project, in request order."
+    )
+
+
+class IndexedComparisonAnalysis(ComparisonAnalysis):
+    """Represents one comparison of a batch without its summary, tagged with its project.
+
+    Attributes:
+        index (int): Number of the existing project in the request, starting at 1.
+    """
+
+    index: int = Field(
+        ...,
+        description="Number of the existing project this comparison refers to, as given in the request.",
+    )
+
+
+class ComparisonAnalysisBatch(BaseModel):
+    """Represents the comparisons of one input project with several summarized projects.
+
+    Attributes:
+        comparisons (List[IndexedComparisonAnalysis]): One comparison per existing project.
+    """
+
+    comparisons: List[IndexedComparisonAnalysis] = Field(
+        ..., description="One comparison per existing project, in request order."
+    )
@@ -9,6 +9,7 @@ class HorizonScopeResult(BaseModel):
     Attributes:
         project (Project): The project that is being compared.
         comparison (Comparison): The result of the comparison, including similarity and analysis details.
+        estimated (bool): Whether the comparison was estimated from the vector similarity instead of computed by the comparison service. Defaults to False.
     """
 
     project: Project = Field(..., description="The project that is being compared.")
@@ -16,3 +17,7 @@ class HorizonScopeResult(BaseModel):
         ...,
         description="The result of the comparison, including similarity and analysis details.",
     )
+    estimated: bool = Field(
+        False,
+        description="Whether the comparison was estimated from the vector similarity instead of computed by the comparison service.",
+    )
@@ -0,0 +1,30 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class IndexingReport(BaseModel):
+    """Represents the progress and outcome of a bulk indexing run.
+
+    Attributes:
+        indexed (int): Number of projects embedded and upserted successfully.
+        failed_ids (List[str]): Identifiers of projects whose batch failed after all retries.
+        batches (int): Number of embedding batches processed, successful or not.
+        elapsed_seconds (float): Wall-clock time since the run started.
+    """
+
+    indexed: int = Field(0, description="Number of projects indexed successfully")
+    failed_ids: List[str] = Field(
+        default_factory=list,
+        description="Identifiers of projects whose batch failed after all retries",
+    )
+    batches: int = Field(0, description="Number of embedding batches processed")
+    elapsed_seconds: float = Field(
+        0.0, description="Wall-clock time since the run started"
+    )
+
+    @property
+    def throughput(self) -> float:
+        """float: Projects indexed per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.indexed / self.elapsed_seconds
@@ -0,0 +1,38 @@
+import uuid
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class IngestCheckpoint(BaseModel):
+    """Represents the resumable state of an ingestion run.
+
+    Attributes:
+        run_id (str): Identifier of the run, used to mark the projects it has seen.
+        sources (List[str]): The input files, in the order they are read.
+        rows_done (int): Number of input rows whose projects are stored in the index.
+        indexed (int): Number of projects embedded and stored successfully.
+        skipped (int): Number of rows dropped during cleaning, e.g. without an objective.
+        unchanged (int): Number of projects skipped because the index already holds their content.
+        deleted (int): Number of withdrawn projects removed from the index.
+        failed_ids (List[str]): Identifiers of projects whose batch failed after all retries.
+        completed (bool): Whether all input rows have been processed.
+    """
+
+    run_id: str = Field(
+        default_factory=lambda: uuid.uuid4().hex, description="Identifier of the run"
+    )
+    sources: List[str] = Field(
+        default_factory=list, description="Input files, in reading order"
+    )
+    rows_done: int = Field(0, description="Number of input rows stored in the index")
+    indexed: int = Field(0, description="Number of projects stored successfully")
+    skipped: int = Field(0, description="Number of rows dropped during cleaning")
+    unchanged: int = Field(
+        0, description="Number of projects whose content is already indexed"
+    )
+    deleted: int = Field(0, description="Number of withdrawn projects removed")
+    failed_ids: List[str] = Field(
+        default_factory=list,
+        description="Identifiers of projects whose batch failed after all retries",
+    )
+    completed: bool = Field(False, description="Whether all rows have been processed")
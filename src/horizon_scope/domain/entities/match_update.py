@@ -0,0 +1,24 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from horizon_scope.domain.entities.horizon_scope_result import HorizonScopeResult
+from horizon_scope.domain.entities.project import Project
+
+
+class MatchUpdate(BaseModel):
+    """Represents one step of a streamed match.
+
+    The first update of a match carries the search hits, and every later update carries one
+    finished result.
+
+    Attributes:
+        hits (List[Project]): The projects that are compared or estimated, set on the first update only.
+        result (Optional[HorizonScopeResult]): A finished result, set on every later update.
+    """
+
+    hits: List[Project] = Field(
+        default_factory=list,
+        description="The projects that are compared or estimated, set on the first update only.",
+    )
+    result: Optional[HorizonScopeResult] = Field(
+        None, description="A finished result, set on every later update."
+    )
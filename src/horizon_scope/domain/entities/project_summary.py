@@ -0,0 +1,45 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class ProjectSummary(BaseModel):
+    """Represents the precomputed summary and facets of an existing EU Horizon project.
+
+    Attributes:
+        summary (str): A concise, one-sentence summary of the project, highlighting its primary objectives and key innovations.
+        keywords (List[str]): The main research topics, methods and technologies of the project.
+    """
+
+    summary: str = Field(
+        ...,
+        description="Concise, one-sentence summary of the existing EU Horizon project, highlighting primary objectives and key innovations.",
+    )
+    keywords: List[str] = Field(
+        ...,
+        description="Three to eight short keywords naming the main research topics, methods and technologies of the project.",
+    )
+
+
+class IndexedProjectSummary(ProjectSummary):
+    """Represents one summary of a batch, tagged with the project it refers to.
+
+    Attributes:
+        index (int): Number of the project in the request, starting at 1.
+    """
+
+    index: int = Field(
+        ...,
+        description="Number of the project this summary refers to, as given in the request.",
+    )
+
+
+class ProjectSummaryBatch(BaseModel):
+    """Represents the summaries of several projects.
+
+    Attributes:
+        summaries (List[IndexedProjectSummary]): One summary per project.
+    """
+
+    summaries: List[IndexedProjectSummary] = Field(
+        ..., description="One summary per project, in request order."
+    )
@@ -0,0 +1,53 @@
+from bisect import bisect_right
+from typing import List, Tuple
+from pydantic import BaseModel, Field
+
+
+class ScoreCalibration(BaseModel):
+    """Represents a fitted mapping from vector similarity to the expected comparison result.
+
+    The mapping is piecewise linear between knots and constant beyond the first and last knot.
+    Scores and confidences are non-decreasing in the similarity.
+
+    Attributes:
+        similarities (List[float]): Vector similarities of the knots, in increasing order.
+        scores (List[float]): Expected comparison score at every knot.
+        confidences (List[float]): Expected comparison confidence at every knot.
+        n_samples (int): Number of logged comparisons the mapping was fitted on.
+    """
+
+    similarities: List[float] = Field(
+        ..., description="Vector similarities of the knots, in increasing order"
+    )
+    scores: List[float] = Field(
+        ..., description="Expected comparison score at every knot"
+    )
+    confidences: List[float] = Field(
+        ..., description="Expected comparison confidence at every knot"
+    )
+    n_samples: int = Field(
+        0, description="Number of logged comparisons the mapping was fitted on"
+    )
+
+    def estimate(self, similarity: float) -> Tuple[float, float]:
+        """Estimate the comparison score and confidence for a vector similarity.
+
+        Args:
+            similarity (float): The vector similarity of a search hit.
+
+        Returns:
+            Tuple[float, float]: The expected score and confidence.
+        """
+        knots = self.similarities
+        if similarity <= knots[0]:
+            return self.scores[0], self.confidences[0]
+        if similarity >= knots[-1]:
+            return self.scores[-1], self.confidences[-1]
+        right = bisect_right(knots, similarity)
+        left = right - 1
+        weight = (similarity - knots[left]) / (knots[right] - knots[left])
+        return (
+            self.scores[left] + weight * (self.scores[right] - self.scores[left]),
+            self.confidences[left]
+            + weight * (self.confidences[right] - self.confidences[left]),
+        )
@@ -0,0 +1,41 @@
+from __future__ import annotations
+from pydantic import BaseModel, Field
+
+
+class TokenUsage(BaseModel):
+    """Represents the token usage and cost of one or more LLM requests.
+
+    Attributes:
+        requests (int): Number of requests.
+        prompt_tokens (int): Input tokens, including cached ones.
+        cached_tokens (int): Input tokens served from the provider's prompt cache.
+        completion_tokens (int): Output tokens.
+        cost (float): Cost in USD, 0 if no prices are configured.
+    """
+
+    requests: int = Field(0, description="Number of requests")
+    prompt_tokens: int = Field(0, description="Input tokens, including cached ones")
+    cached_tokens: int = Field(
+        0, description="Input tokens served from the provider's prompt cache"
+    )
+    completion_tokens: int = Field(0, description="Output tokens")
+    cost: float = Field(0.0, description="Cost in USD")
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """float: Share of the input tokens served from the prompt cache."""
+        if self.prompt_tokens <= 0:
+            return 0.0
+        return self.cached_tokens / self.prompt_tokens
+
+    def add(self, other: TokenUsage) -> None:
+        """Add the usage of other to this usage in place.
+
+        Args:
+            other (TokenUsage): The usage to add.
+        """
+        self.requests += other.requests
+        self.prompt_tokens += other.prompt_tokens
+        self.cached_tokens += other.cached_tokens
+        self.completion_tokens += other.completion_tokens
+        self.cost += other.cost
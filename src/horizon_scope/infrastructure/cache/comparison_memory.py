@@ -0,0 +1,191 @@
+from __future__ import annotations
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+from horizon_scope.domain.entities.comparison import Comparison
+
+# Approximate bookkeeping bytes of an entry beyond its JSON size (key, node and object)
+ENTRY_OVERHEAD_BYTES = 512
+
+MemoryKey = Tuple[str, str]
+
+
+class ComparisonMemory:
+    """Thread-safe in-process memory of comparisons, shared by all sessions of a process.
+
+    Entries are keyed by a hash of the whitespace-normalized query and the project id, so
+    users asking about the same proposal reuse each other's comparisons. The entries are
+    kept in LRU order and the least recently used ones are evicted once their approximate
+    size exceeds max_bytes. Concurrent requests for a comparison that is being computed wait
+    for that computation instead of starting their own.
+
+    Attributes:
+        max_bytes (int): Upper bound of the approximate size of all entries.
+        size_bytes (int): Approximate size of all entries.
+        hits (int): Number of requests answered from memory.
+        misses (int): Number of requests that started a computation.
+        joined (int): Number of requests that waited for a computation already running.
+        evictions (int): Number of entries evicted to stay below max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        """Initialize ComparisonMemory.
+
+        Args:
+            max_bytes (int): Upper bound of the approximate size of all entries. Defaults to 32 MiB.
+        """
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.joined = 0
+        self.evictions = 0
+        self._entries: OrderedDict[MemoryKey, Tuple[Comparison, int]] = OrderedDict()
+        self._running: Dict[MemoryKey, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(query: str, project_id: str) -> MemoryKey:
+        """Build the key of a comparison.
+
+        Args:
+            query (str): The user's project description.
+            project_id (str): The id of the compared project.
+
+        Returns:
+            MemoryKey: The SHA-256 hex digest of the normalized query and the project id.
+        """
+        digest = hashlib.sha256(" ".join(query.split()).encode("utf-8")).hexdigest()
+        return digest, project_id
+
+    def get(self, query: str, project_id: str) -> Optional[Comparison]:
+        """Return a remembered comparison and mark it as recently used.
+
+        Lookups through get are not counted in the metrics.
+
+        Args:
+            query (str): The user's project description.
+            project_id (str): The id of the compared project.
+
+        Returns:
+            Optional[Comparison]: The comparison, or None if it is not remembered.
+        """
+        key = self.key(query, project_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, query: str, project_id: str, comparison: Comparison) -> None:
+        """Remember a comparison.
+
+        Args:
+            query (str): The user's project description.
+            project_id (str): The id of the compared project.
+            comparison (Comparison): The comparison.
+        """
+        key = self.key(query, project_id)
+        with self._lock:
+            self._remember(key, comparison)
+
+    def get_or_compute(
+        self, query: str, project_id: str, compute: Callable[[], Comparison]
+    ) -> Comparison:
+        """Return the remembered comparison, or compute it once for all concurrent callers.
+
+        If the computation fails or is interrupted, the waiting callers compute the
+        comparison themselves, so one aborted request does not fail the others.
+
+        Args:
+            query (str): The user's project description.
+            project_id (str): The id of the compared project.
+            compute (Callable[[], Comparison]): Computes the comparison on a miss.
+
+        Returns:
+            Comparison: The comparison.
+
+        Raises:
+            Exception: The error of the computation started by this call.
+        """
+        key = self.key(query, project_id)
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                future = self._running.get(key)
+                if future is None:
+                    self.misses += 1
+                    self._running[key] = Future()
+                    break
+                self.joined += 1
+            try:
+                return future.result()
+            except BaseException:
+                continue
+
+        try:
+            comparison = compute()
+        except BaseException as error:
+            with self._lock:
+                future = self._running.pop(key)
+            future.set_exception(error)
+            raise
+        with self._lock:
+            future = self._running.pop(key)
+            self._remember(key, comparison)
+        future.set_result(comparison)
+        return comparison
+
+    def stats(self) -> Dict[str, int]:
+        """Return the metrics of the memory.
+
+        Returns:
+            Dict[str, int]: Entries, approximate bytes, hits, misses, joined requests and evictions.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "joined": self.joined,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        """Remove all entries. Running computations are not affected."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def _remember(self, key: MemoryKey, comparison: Comparison) -> None:
+        """Store an entry and evict the least recently used ones beyond max_bytes.
+
+        Must be called with the lock held.
+
+        Args:
+            key (MemoryKey): The key of the comparison.
+            comparison (Comparison): The comparison.
+        """
+        size = len(comparison.model_dump_json()) + ENTRY_OVERHEAD_BYTES
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size_bytes -= previous[1]
+        self._entries[key] = (comparison, size)
+        self.size_bytes += size
+        # The newest entry is kept even if it exceeds max_bytes on its own
+        while self.size_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size_bytes -= evicted_size
+            self.evictions += 1
@@ -0,0 +1,217 @@
+from __future__ import annotations
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import List, Optional
+from horizon_scope.infrastructure.cache.sqlite_comparison_cache import RECOUNT_INTERVAL
+
+
+class EmbeddingCache:
+    """Two-level cache for text embeddings.
+
+    Embeddings are kept in an in-memory LRU and, if a path is given, in a SQLite file that
+    survives restarts. Entries are keyed by the embedding model and the whitespace-normalized
+    text, so the same description with different line breaks is only embedded once.
+
+    Once the SQLite file holds more than max_disk_entries rows, the least recently used ones
+    are evicted; rows are marked as used when they are written or read from disk. As in
+    SQLiteComparisonCache, the number of rows is tracked in memory and recounted every
+    RECOUNT_INTERVAL writes.
+
+    Attributes:
+        max_entries (int): Maximum number of embeddings kept in memory.
+        path (Optional[str]): Path of the SQLite file backing the cache, or None for memory only.
+        max_disk_entries (Optional[int]): Maximum number of embeddings kept on disk. None disables eviction.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that found no entry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+        max_disk_entries: Optional[int] = None,
+    ) -> None:
+        """Initialize EmbeddingCache.
+
+        Args:
+            max_entries (int): Maximum number of embeddings kept in memory. Defaults to 1024.
+            path (Optional[str]): Path of the SQLite file backing the cache. Defaults to None.
+            max_disk_entries (Optional[int]): Maximum number of embeddings kept on disk. Defaults to None.
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, List[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disk_entries = 0
+        self._disk_writes = 0
+        if path is not None:
+            if path != ":memory:" and os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._connection = sqlite3.connect(
+                path, check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, "
+                "value BLOB NOT NULL, accessed_at REAL NOT NULL DEFAULT 0)"
+            )
+            columns = [
+                row[1]
+                for row in self._connection.execute("PRAGMA table_info(embeddings)")
+            ]
+            if "accessed_at" not in columns:
+                # Caches written before disk eviction
+                self._connection.execute(
+                    "ALTER TABLE embeddings "
+                    "ADD COLUMN accessed_at REAL NOT NULL DEFAULT 0"
+                )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_accessed_at "
+                "ON embeddings (accessed_at)"
+            )
+            self._disk_entries = self._count()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize a text before it is used as a cache key.
+
+        Args:
+            text (str): The text to normalize.
+
+        Returns:
+            str: The text with surrounding whitespace stripped and inner whitespace collapsed.
+        """
+        return " ".join(text.split())
+
+    def key(self, text: str, model: str) -> str:
+        """Build the cache key for a text and embedding model.
+
+        Args:
+            text (str): The embedded text.
+            model (str): The embedding model.
+
+        Returns:
+            str: A SHA-256 hex digest identifying the embedding.
+        """
+        digest = hashlib.sha256(model.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(self.normalize(text).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, text: str, model: str) -> Optional[List[float]]:
+        """Retrieve a cached embedding.
+
+        Args:
+            text (str): The embedded text.
+            model (str): The embedding model.
+
+        Returns:
+            Optional[List[float]]: The cached embedding, or None if it is not cached.
+        """
+        key = self.key(text, model)
+        with self._lock:
+            embedding = self._memory.get(key)
+            if embedding is not None:
+                self._memory.move_to_end(key)
+            elif self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT value FROM embeddings WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    embedding = array("d", row[0]).tolist()
+                    self._remember(key, embedding)
+                    self._connection.execute(
+                        "UPDATE embeddings SET accessed_at = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+            if embedding is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return embedding
+
+    def set(self, text: str, model: str, embedding: List[float]) -> None:
+        """Store an embedding.
+
+        Args:
+            text (str): The embedded text.
+            model (str): The embedding model.
+            embedding (List[float]): The embedding of the text.
+        """
+        key = self.key(text, model)
+        with self._lock:
+            self._remember(key, embedding)
+            if self._connection is not None:
+                self._store(key, embedding)
+
+    def __len__(self) -> int:
+        """Return the number of embeddings on disk, or in memory without a SQLite file."""
+        with self._lock:
+            if self._connection is None:
+                return len(self._memory)
+            return self._count()
+
+    def _store(self, key: str, embedding: List[float]) -> None:
+        """Write an embedding to disk, evicting the least recently used rows if needed.
+
+        Args:
+            key (str): The cache key.
+            embedding (List[float]): The embedding to store.
+        """
+        now = time.time()
+        value = array("d", embedding).tobytes()
+        inserted = self._connection.execute(
+            "INSERT OR IGNORE INTO embeddings (key, value, accessed_at) "
+            "VALUES (?, ?, ?)",
+            (key, value, now),
+        ).rowcount
+        if inserted:
+            self._disk_entries += 1
+        else:
+            self._connection.execute(
+                "UPDATE embeddings SET value = ?, accessed_at = ? WHERE key = ?",
+                (value, now, key),
+            )
+        self._disk_writes += 1
+        if self._disk_writes % RECOUNT_INTERVAL == 0:
+            self._disk_entries = self._count()
+        if (
+            self.max_disk_entries is not None
+            and self._disk_entries > self.max_disk_entries
+        ):
+            self._disk_entries -= self._connection.execute(
+                "DELETE FROM embeddings WHERE key IN ("
+                "SELECT key FROM embeddings ORDER BY accessed_at ASC, rowid ASC "
+                "LIMIT ?)",
+                (self._disk_entries - self.max_disk_entries,),
+            ).rowcount
+
+    def _count(self) -> int:
+        """Count the embeddings in the SQLite file.
+
+        Returns:
+            int: The number of rows of the table.
+        """
+        row = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return row[0]
+
+    def _remember(self, key: str, embedding: List[float]) -> None:
+        """Put an embedding into the in-memory LRU, evicting the oldest entry if needed.
+
+        Args:
+            key (str): The cache key.
+            embedding (List[float]): The embedding to keep.
+        """
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from horizon_scope.application.interfaces.comparison_cache import ComparisonCache
+from horizon_scope.domain.entities.comparison import Comparison
+
+# Writes between two recounts of the stored entries, to pick up other processes' writes
+RECOUNT_INTERVAL = 1000
+
+
+class SQLiteComparisonCache(ComparisonCache):
+    """Comparison cache persisted in a SQLite file.
+
+    Entries survive process restarts and can be shared by several processes on the same host.
+    Entries older than the TTL are treated as misses, and once the cache holds more than
+    max_entries rows the least recently used ones are evicted. The number of rows is tracked
+    in memory, so writes do not count the table; it is recounted every RECOUNT_INTERVAL
+    writes to follow other processes sharing the file.
+
+    Attributes:
+        path (str): Path of the SQLite database file.
+        ttl_seconds (Optional[float]): Maximum age of an entry in seconds. None disables expiry.
+        max_entries (Optional[int]): Maximum number of stored entries. None disables eviction.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that found no valid entry.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """Initialize SQLiteComparisonCache and create the table if needed.
+
+        Args:
+            path (str): Path of the SQLite database file, or ":memory:".
+            ttl_seconds (Optional[float]): Maximum age of an entry in seconds. Defaults to None.
+            max_entries (Optional[int]): Maximum number of stored entries. Defaults to None.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS comparisons ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS comparisons_accessed_at "
+            "ON comparisons (accessed_at)"
+        )
+        self._entries = self._count()
+        self._writes = 0
+
+    def get(self, key: str) -> Optional[Comparison]:
+        """Retrieve a cached comparison and mark it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Comparison]: The cached comparison, or None if the key is missing or expired.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, created_at FROM comparisons WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self._is_expired(row[1], now):
+                deleted = self._connection.execute(
+                    "DELETE FROM comparisons WHERE key = ?", (key,)
+                ).rowcount
+                self._entries = max(self._entries - deleted, 0)
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE comparisons SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+        return Comparison.model_validate_json(row[0])
+
+    def set(self, key: str, comparison: Comparison) -> None:
+        """Store a comparison, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (str): The cache key.
+            comparison (Comparison): The comparison to store.
+        """
+        now = time.time()
+        value = comparison.model_dump_json()
+        with self._lock:
+            inserted = self._connection.execute(
+                "INSERT OR IGNORE INTO comparisons (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            ).rowcount
+            if inserted:
+                self._entries += 1
+            else:
+                self._connection.execute(
+                    "UPDATE comparisons SET value = ?, created_at = ?, accessed_at = ? "
+                    "WHERE key = ?",
+                    (value, now, now, key),
+                )
+            self._writes += 1
+            if self._writes % RECOUNT_INTERVAL == 0:
+                self._entries = self._count()
+            if self.max_entries is not None and self._entries > self.max_entries:
+                self._entries -= self._connection.execute(
+                    "DELETE FROM comparisons WHERE key IN ("
+                    "SELECT key FROM comparisons ORDER BY accessed_at ASC, rowid ASC "
+                    "LIMIT ?)",
+                    (self._entries - self.max_entries,),
+                ).rowcount
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._connection.execute("DELETE FROM comparisons")
+            self._entries = 0
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones not yet purged."""
+        with self._lock:
+            return self._count()
+
+    def _count(self) -> int:
+        """Count the stored entries.
+
+        Returns:
+            int: The number of rows of the table.
+        """
+        row = self._connection.execute("SELECT COUNT(*) FROM comparisons").fetchone()
+        return row[0]
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        """Check whether an entry created at the given time has outlived the TTL.
+
+        Args:
+            created_at (float): Creation timestamp of the entry.
+            now (float): The current timestamp.
+
+        Returns:
+            bool: True if the entry is expired, otherwise False.
+        """
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
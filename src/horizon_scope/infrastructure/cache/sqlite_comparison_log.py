@@ -0,0 +1,121 @@
+from __future__ import annotations
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+from horizon_scope.application.interfaces.comparison_log import ComparisonLog
+from horizon_scope.domain.entities.comparison import Comparison
+from horizon_scope.infrastructure.cache.sqlite_comparison_cache import RECOUNT_INTERVAL
+
+
+class SQLiteComparisonLog(ComparisonLog):
+    """Comparison log persisted in a SQLite file.
+
+    Only the numbers needed for calibration are stored, so the log stays small even with many
+    comparisons. A sample with the key of an already recorded pair is ignored. The number of
+    samples is tracked in memory, so writes do not count the table; it is recounted every
+    RECOUNT_INTERVAL writes to follow other processes sharing the file.
+
+    Attributes:
+        path (str): Path of the SQLite database file.
+        max_entries (Optional[int]): Maximum number of stored samples; the oldest are dropped. None keeps all.
+    """
+
+    def __init__(self, path: str, max_entries: Optional[int] = None) -> None:
+        """Initialize SQLiteComparisonLog and create the table if needed.
+
+        Args:
+            path (str): Path of the SQLite database file, or ":memory:".
+            max_entries (Optional[int]): Maximum number of stored samples. Defaults to None.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS comparison_log ("
+            "similarity REAL NOT NULL, score REAL NOT NULL, "
+            "confidence REAL NOT NULL, created_at REAL NOT NULL, key TEXT)"
+        )
+        columns = [
+            row[1]
+            for row in self._connection.execute("PRAGMA table_info(comparison_log)")
+        ]
+        if "key" not in columns:
+            # Logs written before samples had keys
+            self._connection.execute("ALTER TABLE comparison_log ADD COLUMN key TEXT")
+        self._connection.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS comparison_log_key "
+            "ON comparison_log (key)"
+        )
+        self._entries = self._count()
+        self._writes = 0
+
+    def record(
+        self, similarity: float, comparison: Comparison, key: Optional[str] = None
+    ) -> None:
+        """Record a comparison, dropping the oldest samples if the log is full.
+
+        Args:
+            similarity (float): The vector similarity of the compared search hit.
+            comparison (Comparison): The comparison result.
+            key (Optional[str]): Identifies the compared pair; a recorded key is not recorded again. Defaults to None.
+        """
+        with self._lock:
+            self._entries += self._connection.execute(
+                "INSERT OR IGNORE INTO comparison_log "
+                "(similarity, score, confidence, created_at, key) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (similarity, comparison.score, comparison.confidence, time.time(), key),
+            ).rowcount
+            self._writes += 1
+            if self._writes % RECOUNT_INTERVAL == 0:
+                self._entries = self._count()
+            if self.max_entries is not None and self._entries > self.max_entries:
+                self._entries -= self._connection.execute(
+                    "DELETE FROM comparison_log WHERE rowid IN ("
+                    "SELECT rowid FROM comparison_log ORDER BY rowid ASC LIMIT ?)",
+                    (self._entries - self.max_entries,),
+                ).rowcount
+
+    def samples(self, limit: Optional[int] = None) -> List[Tuple[float, float, float]]:
+        """Return recorded samples, most recent first.
+
+        Args:
+            limit (Optional[int]): The maximum number of samples. Defaults to None (all).
+
+        Returns:
+            List[Tuple[float, float, float]]: Similarity, score and confidence of every sample.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT similarity, score, confidence FROM comparison_log "
+                "ORDER BY rowid DESC LIMIT ?",
+                (-1 if limit is None else limit,),
+            ).fetchall()
+        return [tuple(row) for row in rows]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored samples."""
+        with self._lock:
+            return self._count()
+
+    def _count(self) -> int:
+        """Count the stored samples.
+
+        Returns:
+            int: The number of rows of the table.
+        """
+        row = self._connection.execute("SELECT COUNT(*) FROM comparison_log").fetchone()
+        return row[0]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from horizon_scope.application.interfaces.project_summary_store import (
+    ProjectSummaryStore,
+)
+from horizon_scope.domain.entities.project_summary import ProjectSummary
+
+DEFAULT_SUMMARY_STORE_PATH = ".cache/project_summaries.sqlite"
+
+
+def summary_key(description: str) -> str:
+    """Hash a project description, ignoring differences in whitespace.
+
+    The CORDIS exports and the vector stores do not always preserve line breaks and repeated
+    spaces, so the description is normalized before hashing.
+
+    Args:
+        description (str): The description of the project.
+
+    Returns:
+        str: A SHA-256 hex digest of the normalized description.
+    """
+    return hashlib.sha256(" ".join(description.split()).encode("utf-8")).hexdigest()
+
+
+class SQLiteProjectSummaryStore(ProjectSummaryStore):
+    """Project summary store persisted in a SQLite file.
+
+    Summaries are written by the offline summarization job and read on every comparison, so
+    entries never expire; a project whose description changes simply gets a new entry.
+
+    Attributes:
+        path (str): Path of the SQLite database file.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize SQLiteProjectSummaryStore and create the table if needed.
+
+        Args:
+            path (str): Path of the SQLite database file, or ":memory:".
+        """
+        self.path = path
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "key TEXT PRIMARY KEY, project_id TEXT, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+
+    def get(self, description: str) -> Optional[ProjectSummary]:
+        """Retrieve the summary of a project description.
+
+        Args:
+            description (str): The description of the existing project.
+
+        Returns:
+            Optional[ProjectSummary]: The stored summary, or None if there is none.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM summaries WHERE key = ?",
+                (summary_key(description),),
+            ).fetchone()
+        if row is None:
+            return None
+        return ProjectSummary.model_validate_json(row[0])
+
+    def set(
+        self,
+        description: str,
+        summary: ProjectSummary,
+        project_id: Optional[str] = None,
+    ) -> None:
+        """Store the summary of a project description, replacing an existing one.
+
+        Args:
+            description (str): The description of the existing project.
+            summary (ProjectSummary): The summary to store.
+            project_id (Optional[str]): The project identifier, for reference. Defaults to None.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO summaries (key, project_id, value, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    summary_key(description),
+                    project_id,
+                    summary.model_dump_json(),
+                    time.time(),
+                ),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored summaries."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM summaries"
+            ).fetchone()[0]
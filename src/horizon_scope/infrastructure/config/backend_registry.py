@@ -0,0 +1,109 @@
+from __future__ import annotations
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+
+if TYPE_CHECKING:
+    from horizon_scope.application.interfaces.embedding_service import (
+        EmbeddingService,
+    )
+    from horizon_scope.infrastructure.services.http_transport import HttpTransport
+    from horizon_scope.infrastructure.services.rate_limiter import RateLimiter
+
+# Implementations by kind and configured type, as "module:attribute". A backend and its
+# dependencies (openai, pinecone, numpy, ...) are only imported once it is resolved.
+BACKENDS: Dict[str, Dict[str, str]] = {
+    "store": {
+        "pinecone": "horizon_scope.infrastructure.services.pinecone_search_service:PineconeSearchService",
+        "local": "horizon_scope.infrastructure.services.local_vector_search_service:LocalVectorSearchService",
+    },
+    "lexical": {
+        "bm25": "horizon_scope.infrastructure.services.bm25_search_service:BM25SearchService",
+    },
+    "embeddings": {
+        "openai": "horizon_scope.infrastructure.services.openai_embedding_service:OpenAIEmbeddingService",
+    },
+    "comparison-service": {
+        "openai": "horizon_scope.infrastructure.services.openai_comparison_service:OpenAIComparisonService",
+    },
+    "comparison-cache": {
+        "sqlite": "horizon_scope.infrastructure.cache.sqlite_comparison_cache:SQLiteComparisonCache",
+    },
+    "reranker": {
+        "cross-encoder": "horizon_scope.infrastructure.services.cross_encoder_reranker:CrossEncoderReranker",
+        "embedding": "horizon_scope.infrastructure.services.embedding_reranker:EmbeddingReranker",
+    },
+}
+# Names of the kinds in error messages
+BACKEND_LABELS = {
+    "store": "vector store",
+    "lexical": "lexical index",
+    "embeddings": "embedding service",
+    "comparison-service": "comparison service",
+    "comparison-cache": "comparison cache",
+    "reranker": "reranker",
+}
+
+
+def register_backend(kind: str, name: str, target: str) -> None:
+    """Register an implementation, e.g. a third-party vector store.
+
+    Args:
+        kind (str): The kind of backend, e.g. "store".
+        name (str): The type name used in the configuration.
+        target (str): The implementation as "module:attribute"; it is imported on first use.
+    """
+    BACKENDS.setdefault(kind, {})[name] = target
+
+
+def resolve_backend(kind: str, name: str) -> Any:
+    """Import and return the implementation registered for a configured type.
+
+    The module is looked up on every call, so patching the attribute of an already imported
+    module takes effect.
+
+    Args:
+        kind (str): The kind of backend, e.g. "store".
+        name (str): The type name used in the configuration.
+
+    Returns:
+        Any: The registered class or factory.
+
+    Raises:
+        ValueError: If no implementation is registered for the type.
+    """
+    target = BACKENDS.get(kind, {}).get(name)
+    if target is None:
+        raise ValueError(f"Unsupported {BACKEND_LABELS.get(kind, kind)} type: {name}")
+    module_name, _, attribute = target.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def create_embedding_service(
+    config: ConfigManager,
+    rate_limiter: Optional[RateLimiter] = None,
+    transport: Optional[HttpTransport] = None,
+) -> EmbeddingService:
+    """Create the embedding service selected by vector-search-service.embeddings.type.
+
+    Args:
+        config (ConfigManager): Configuration manager to read the settings from.
+        rate_limiter (Optional[RateLimiter]): Rate limiter shared with other services. Defaults to None.
+        transport (Optional[HttpTransport]): Pooled transport shared with other services. Defaults to None.
+
+    Returns:
+        EmbeddingService: The embedding service.
+
+    Raises:
+        ValueError: If the configured embedding type is not supported.
+    """
+    embedding_type = config.get(
+        "horizon-scope",
+        "vector-search-service",
+        "embeddings",
+        "type",
+        default="openai",
+    )
+    return resolve_backend("embeddings", embedding_type)(
+        config, rate_limiter, transport
+    )
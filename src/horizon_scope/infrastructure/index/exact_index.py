@@ -0,0 +1,43 @@
+from __future__ import annotations
+from typing import Tuple
+import numpy as np
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the positions of the k highest scores, best first.
+
+    Uses argpartition so that only the selected k entries are fully sorted.
+
+    Args:
+        scores (np.ndarray): One-dimensional array of scores.
+        k (int): The number of positions to return.
+
+    Returns:
+        np.ndarray: Positions into scores, ordered by descending score.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        top = np.argpartition(scores, -k)[-k:]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(scores[top])[::-1]]
+
+
+def exact_search(
+    embeddings: np.ndarray, query_vector: np.ndarray, k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Score every row against a query and return the k best rows.
+
+    Args:
+        embeddings (np.ndarray): The (n, d) matrix of unit-length rows.
+        query_vector (np.ndarray): The unit-length query vector.
+        k (int): The number of rows to return.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The row positions and their cosine similarities, best first.
+    """
+    scores = embeddings @ query_vector
+    positions = top_k(scores, k)
+    return positions, scores[positions]
@@ -0,0 +1,231 @@
+from __future__ import annotations
+import hashlib
+from typing import Iterable, Optional, Tuple
+import numpy as np
+from horizon_scope.infrastructure.index.exact_index import top_k
+
+# Rows scored per matrix product while assigning rows to centroids, to bound peak memory
+ASSIGNMENT_CHUNK_SIZE = 8192
+
+
+def fingerprint(ids: Iterable[str], embeddings: np.ndarray) -> str:
+    """Identify a corpus by its ordered project ids and their embeddings.
+
+    The embeddings are part of the fingerprint, so re-embedding the corpus (with another
+    model, chunking or text) under the same ids invalidates an index built on the old vectors.
+
+    Args:
+        ids (Iterable[str]): The project ids, in row order.
+        embeddings (np.ndarray): The (n, d) embedding matrix, aligned with the ids.
+
+    Returns:
+        str: A SHA-256 hex digest of the ids and the shape, dtype and bytes of the embeddings.
+    """
+    digest = hashlib.sha256()
+    for project_id in ids:
+        digest.update(project_id.encode("utf-8"))
+        digest.update(b"\n")
+    matrix = np.ascontiguousarray(embeddings)
+    digest.update(f"{matrix.shape}:{matrix.dtype.str}\n".encode("utf-8"))
+    digest.update(matrix.reshape(-1).view(np.uint8))
+    return digest.hexdigest()
+
+
+def _assign(embeddings: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Assign each row to the centroid with the highest cosine similarity.
+
+    Args:
+        embeddings (np.ndarray): The (n, d) matrix of unit-length rows.
+        centroids (np.ndarray): The (n_lists, d) matrix of unit-length centroids.
+
+    Returns:
+        np.ndarray: The list number of every row.
+    """
+    assignments = np.empty(len(embeddings), dtype=np.int64)
+    for start in range(0, len(embeddings), ASSIGNMENT_CHUNK_SIZE):
+        chunk = embeddings[start : start + ASSIGNMENT_CHUNK_SIZE]
+        assignments[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignments
+
+
+class IVFIndex:
+    """Inverted-file index for approximate cosine search over unit-length vectors.
+
+    Rows are clustered with spherical k-means. Each cluster is an inverted list, stored as a
+    slice of a single position array (CSR layout). A query only scores the rows of the nprobe
+    lists whose centroids are closest to it, so the cost grows with nprobe / n_lists of the
+    corpus instead of the whole corpus. The index holds row positions, not vectors: the
+    embedding matrix is passed to search.
+
+    Rows appended to the matrix after the index was built (positions >= n_indexed) are always
+    scored exactly until the index is rebuilt.
+
+    Attributes:
+        centroids (np.ndarray): The (n_lists, d) float32 matrix of unit-length centroids.
+        positions (np.ndarray): Row positions grouped by list.
+        offsets (np.ndarray): List l holds positions[offsets[l]:offsets[l + 1]].
+        nprobe (int): Default number of lists scanned per query.
+        fingerprint (str): Fingerprint of the corpus the index was built for.
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        positions: np.ndarray,
+        offsets: np.ndarray,
+        nprobe: int = 8,
+        fingerprint: str = "",
+    ) -> None:
+        """Initialize IVFIndex from its arrays.
+
+        Args:
+            centroids (np.ndarray): The (n_lists, d) matrix of unit-length centroids.
+            positions (np.ndarray): Row positions grouped by list.
+            offsets (np.ndarray): Start offset of every list in positions, plus the total length.
+            nprobe (int): Default number of lists scanned per query. Defaults to 8.
+            fingerprint (str): Fingerprint of the corpus the index was built for. Defaults to "".
+        """
+        self.centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+        self.positions = np.asarray(positions, dtype=np.int64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.nprobe = nprobe
+        self.fingerprint = fingerprint
+
+    @property
+    def n_lists(self) -> int:
+        """int: The number of inverted lists."""
+        return len(self.centroids)
+
+    @property
+    def n_indexed(self) -> int:
+        """int: The number of rows covered by the inverted lists."""
+        return len(self.positions)
+
+    @classmethod
+    def build(
+        cls,
+        embeddings: np.ndarray,
+        n_lists: Optional[int] = None,
+        nprobe: int = 8,
+        n_iter: int = 10,
+        max_training_points: int = 128,
+        seed: int = 0,
+        fingerprint: str = "",
+    ) -> IVFIndex:
+        """Cluster the rows with spherical k-means and build the inverted lists.
+
+        Centroids are trained on a random sample of at most max_training_points rows per
+        list; all rows are then assigned to their nearest centroid.
+
+        Args:
+            embeddings (np.ndarray): The (n, d) matrix of unit-length rows.
+            n_lists (Optional[int]): Number of lists. Defaults to about 4 * sqrt(n).
+            nprobe (int): Default number of lists scanned per query. Defaults to 8.
+            n_iter (int): Number of k-means iterations. Defaults to 10.
+            max_training_points (int): Training sample size per list. Defaults to 128.
+            seed (int): Seed of the random generator. Defaults to 0.
+            fingerprint (str): Fingerprint of the corpus, stored with the index. Defaults to "".
+
+        Returns:
+            IVFIndex: The built index.
+
+        Raises:
+            ValueError: If the matrix is empty.
+        """
+        n = len(embeddings)
+        if n == 0:
+            raise ValueError("Cannot build an IVF index over an empty matrix")
+        if n_lists is None:
+            n_lists = int(4 * np.sqrt(n))
+        n_lists = max(1, min(n_lists, n))
+        rng = np.random.default_rng(seed)
+
+        sample_size = min(n, n_lists * max_training_points)
+        sample = embeddings[np.sort(rng.choice(n, size=sample_size, replace=False))]
+        centroids = sample[rng.choice(sample_size, size=n_lists, replace=False)].copy()
+
+        for _ in range(n_iter):
+            assignments = _assign(sample, centroids)
+            order = np.argsort(assignments, kind="stable")
+            counts = np.bincount(assignments, minlength=n_lists)
+            empty = counts == 0
+            starts = (np.cumsum(counts) - counts)[~empty]
+            sums = np.zeros_like(centroids)
+            sums[~empty] = np.add.reduceat(sample[order], starts, axis=0)
+            # Re-seed empty lists with random sample rows
+            sums[empty] = sample[rng.choice(sample_size, size=int(empty.sum()))]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+
+        assignments = _assign(embeddings, centroids)
+        positions = np.argsort(assignments, kind="stable")
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=n_lists), out=offsets[1:])
+        return cls(centroids, positions, offsets, nprobe=nprobe, fingerprint=fingerprint)
+
+    def search(
+        self,
+        embeddings: np.ndarray,
+        query_vector: np.ndarray,
+        k: int,
+        nprobe: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximately find the k rows with the highest cosine similarity to a query.
+
+        Args:
+            embeddings (np.ndarray): The (n, d) matrix of unit-length rows the index was built on.
+            query_vector (np.ndarray): The unit-length query vector.
+            k (int): The number of rows to return.
+            nprobe (Optional[int]): Number of lists to scan. Defaults to the index's nprobe.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The row positions and their cosine similarities, best first.
+        """
+        nprobe = min(nprobe or self.nprobe, self.n_lists)
+        probed = top_k(self.centroids @ query_vector, nprobe)
+        candidates = [
+            self.positions[self.offsets[list_number] : self.offsets[list_number + 1]]
+            for list_number in probed
+        ]
+        if len(embeddings) > self.n_indexed:
+            candidates.append(np.arange(self.n_indexed, len(embeddings)))
+        candidates = np.concatenate(candidates)
+
+        scores = embeddings[candidates] @ query_vector
+        best = top_k(scores, k)
+        return candidates[best], scores[best]
+
+    def save(self, path: str) -> None:
+        """Save the index as an .npz archive.
+
+        Args:
+            path (str): Destination path of the archive.
+        """
+        np.savez(
+            path,
+            centroids=self.centroids,
+            positions=self.positions,
+            offsets=self.offsets,
+            nprobe=np.asarray(self.nprobe),
+            fingerprint=np.asarray(self.fingerprint),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> IVFIndex:
+        """Load an index saved with save.
+
+        Args:
+            path (str): Path of the archive.
+
+        Returns:
+            IVFIndex: The loaded index.
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            return cls(
+                archive["centroids"],
+                archive["positions"],
+                archive["offsets"],
+                nprobe=int(archive["nprobe"]),
+                fingerprint=str(archive["fingerprint"]),
+            )
@@ -0,0 +1,68 @@
+from __future__ import annotations
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+from horizon_scope.infrastructure.services.token_counter import count_tokens
+
+T = TypeVar("T")
+
+# OpenAI accepts at most 2048 inputs and 300k tokens per embeddings request; stay below the latter
+EMBEDDING_BATCH_MAX_INPUTS = 2048
+EMBEDDING_BATCH_MAX_TOKENS = 250_000
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of at most size items without materializing it.
+
+    Args:
+        items (Iterable[T]): The items to split.
+        size (int): The maximum batch size.
+
+    Yields:
+        List[T]: Consecutive batches of items.
+    """
+    batch: List[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def token_batches(
+    items: Iterable[T],
+    max_tokens: int = EMBEDDING_BATCH_MAX_TOKENS,
+    max_items: int = EMBEDDING_BATCH_MAX_INPUTS,
+    model: Optional[str] = None,
+    count: Optional[Callable[[T], int]] = None,
+) -> Iterator[List[T]]:
+    """Group items into embedding batches that respect the request token budget.
+
+    An item larger than the budget on its own is emitted as a single-item batch.
+
+    Args:
+        items (Iterable[T]): The items to group, consumed lazily.
+        max_tokens (int): Maximum total tokens of a batch.
+        max_items (int): Maximum number of items in a batch.
+        model (Optional[str]): Embedding model used to count tokens. Defaults to None.
+        count (Optional[Callable[[T], int]]): Returns the tokens of an item. Defaults to counting the description of a Project.
+
+    Yields:
+        List[T]: Consecutive batches of items.
+    """
+    if count is None:
+        count = lambda project: count_tokens(project.description, model)  # noqa: E731
+    batch: List[T] = []
+    batch_tokens = 0
+    for item in items:
+        tokens = count(item)
+        if batch and (
+            batch_tokens + tokens > max_tokens or len(batch) >= max_items
+        ):
+            yield batch
+            batch = []
+            batch_tokens = 0
+        batch.append(item)
+        batch_tokens += tokens
+    if batch:
+        yield batch
@@ -0,0 +1,223 @@
+from __future__ import annotations
+import os
+import threading
+from typing import Dict, List, Optional
+import numpy as np
+from horizon_scope.application.interfaces.async_vector_search_service import (
+    AsyncVectorSearchService,
+)
+from horizon_scope.application.interfaces.vector_index_writer import (
+    VectorIndexWriter,
+)
+from horizon_scope.application.interfaces.vector_search_service import (
+    VectorSearchService,
+)
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.index.bm25_index import BM25Index
+from horizon_scope.infrastructure.services.chunking import split_chunk_id
+from horizon_scope.infrastructure.services.local_vector_search_service import (
+    load_project_metadata,
+)
+
+DEFAULT_BM25_INDEX_PATH = ".cache/bm25_index.npz"
+DEFAULT_BM25_SOURCE_PATH = "data/horizon_projects.pkl"
+
+
+class BM25SearchService(
+    VectorSearchService, AsyncVectorSearchService, VectorIndexWriter
+):
+    """Service for lexical search over project titles and objectives with BM25.
+
+    Exact terms such as acronyms, grant numbers and project codes are matched literally,
+    which dense embeddings tend to blur. The index is loaded from lexical.path, or built from
+    the project file at lexical.source and saved there on first use.
+
+    As a VectorIndexWriter it follows the ingest pipeline: upserted and deleted projects are
+    queued, and flush rebuilds the index (the IDF weights depend on the whole corpus) and saves
+    it to lexical.path. Searches see the previous index until then.
+
+    Attributes:
+        config (ConfigManager): Configuration manager for accessing the index settings.
+        path (str): Path of the .npz archive holding the index and the project metadata.
+        index (BM25Index): The inverted index; document positions are rows of the lists below.
+        ids (List[str]): Project identifiers.
+        titles (List[str]): Project titles.
+        objectives (List[str]): Project objectives.
+        dates (List[str]): Project content update dates.
+    """
+
+    def __init__(self, config: ConfigManager) -> None:
+        """Initialize BM25SearchService, building the index if it is not on disk yet.
+
+        Args:
+            config (ConfigManager): Configuration manager for the service.
+        """
+        self.config = config
+        self._pending: Dict[str, Optional[Project]] = {}
+        self._lock = threading.Lock()
+        lexical_config = (
+            self.config.get(
+                "horizon-scope", "vector-search-service", "lexical", default=None
+            )
+            or {}
+        )
+        self.path = lexical_config.get("path", DEFAULT_BM25_INDEX_PATH)
+        if os.path.exists(self.path):
+            self._load(self.path)
+        else:
+            data = load_project_metadata(
+                lexical_config.get("source", DEFAULT_BM25_SOURCE_PATH)
+            )
+            self.ids: List[str] = data["ids"]
+            self.titles: List[str] = data["titles"]
+            self.objectives: List[str] = data["objectives"]
+            self.dates: List[str] = data["dates"]
+            self.index = BM25Index.build(
+                (
+                    f"{title} {objective}"
+                    for title, objective in zip(self.titles, self.objectives)
+                ),
+                k1=lexical_config.get("k1", 1.5),
+                b=lexical_config.get("b", 0.75),
+            )
+            self.save(self.path)
+
+    def search(self, query: str, k: int) -> List[Project]:
+        """Search for projects that share the most informative terms with the query.
+
+        Args:
+            query (str): The query string to search for.
+            k (int): The number of top results to return.
+
+        Returns:
+            List[Project]: The best matching projects. Their similarity is left empty, as BM25
+            scores are not comparable to cosine similarities.
+        """
+        with self._lock:
+            index, ids, titles, objectives, dates = (
+                self.index,
+                self.ids,
+                self.titles,
+                self.objectives,
+                self.dates,
+            )
+        positions, _ = index.search(query, k)
+        return [
+            Project(
+                id=ids[position],
+                title=titles[position],
+                description=objectives[position],
+                content_update_date=dates[position],
+            )
+            for position in positions
+        ]
+
+    async def asearch(self, query: str, k: int) -> List[Project]:
+        """Asynchronously search for projects, see search.
+
+        Scoring is in-process and fast, so it runs on the event loop.
+
+        Args:
+            query (str): The query string to search for.
+            k (int): The number of top results to return.
+
+        Returns:
+            List[Project]: The best matching projects.
+        """
+        return self.search(query, k)
+
+    def upsert_embeddings(
+        self, projects: List[Project], embeddings: List[List[float]]
+    ) -> None:
+        """Queue projects to be added or replaced by the next flush.
+
+        The embeddings are ignored; of a chunked project only the first chunk, which carries
+        the whole description, is used.
+
+        Args:
+            projects (List[Project]): The projects, one per chunk.
+            embeddings (List[List[float]]): The embeddings, aligned with the projects.
+        """
+        with self._lock:
+            for project in projects:
+                if split_chunk_id(project.id)[1] == 0:
+                    self._pending[project.id] = project
+
+    def delete(self, project_ids: List[str]) -> None:
+        """Queue projects to be removed by the next flush. Unknown ids are ignored.
+
+        Args:
+            project_ids (List[str]): The ids of the projects to remove.
+        """
+        with self._lock:
+            for project_id in project_ids:
+                self._pending[project_id] = None
+
+    def flush(self) -> None:
+        """Apply the queued changes, rebuild the index and save it to the configured path."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            documents = {
+                project_id: (title, objective, date)
+                for project_id, title, objective, date in zip(
+                    self.ids, self.titles, self.objectives, self.dates
+                )
+            }
+            k1, b = self.index.k1, self.index.b
+        if not pending:
+            return
+        for project_id, project in pending.items():
+            if project is None:
+                documents.pop(project_id, None)
+            else:
+                documents[project_id] = (
+                    project.title or "",
+                    project.description,
+                    project.content_update_date or "",
+                )
+        ids = list(documents)
+        titles = [documents[project_id][0] for project_id in ids]
+        objectives = [documents[project_id][1] for project_id in ids]
+        index = BM25Index.build(
+            (f"{title} {objective}" for title, objective in zip(titles, objectives)),
+            k1=k1,
+            b=b,
+        )
+        with self._lock:
+            self.ids = ids
+            self.titles = titles
+            self.objectives = objectives
+            self.dates = [documents[project_id][2] for project_id in ids]
+            self.index = index
+        self.save(self.path)
+
+    def save(self, path: str) -> None:
+        """Save the index and the project metadata as an .npz archive.
+
+        Args:
+            path (str): Destination path of the archive.
+        """
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez(
+            path,
+            ids=np.asarray(self.ids, dtype=str),
+            titles=np.asarray(self.titles, dtype=str),
+            objectives=np.asarray(self.objectives, dtype=str),
+            dates=np.asarray(self.dates, dtype=str),
+            **self.index.to_arrays(),
+        )
+
+    def _load(self, path: str) -> None:
+        """Load an archive written by save.
+
+        Args:
+            path (str): Path of the archive.
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            self.ids = archive["ids"].tolist()
+            self.titles = archive["titles"].tolist()
+            self.objectives = archive["objectives"].tolist()
+            self.dates = archive["dates"].tolist()
+            self.index = BM25Index.from_arrays(archive)
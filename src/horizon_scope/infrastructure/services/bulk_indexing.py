@@ -0,0 +1,73 @@
+from __future__ import annotations
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional
+from horizon_scope.domain.entities.indexing_report import IndexingReport
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.services.batching import (
+    EMBEDDING_BATCH_MAX_INPUTS,
+    EMBEDDING_BATCH_MAX_TOKENS,
+    token_batches,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def run_bulk_indexing(
+    projects: Iterable[Project],
+    index_batch: Callable[[List[Project]], None],
+    max_concurrency: int = 4,
+    progress: Optional[Callable[[IndexingReport], None]] = None,
+    max_tokens: int = EMBEDDING_BATCH_MAX_TOKENS,
+    max_items: int = EMBEDDING_BATCH_MAX_INPUTS,
+    model: Optional[str] = None,
+) -> IndexingReport:
+    """Stream projects through token-budgeted batches indexed concurrently.
+
+    At most max_concurrency batches are in flight, so memory stays bounded regardless of the
+    input size. Transient errors are retried by the RateLimiter that index_batch calls through,
+    so a batch is not retried again here: a failed batch is recorded in the report and the run
+    continues with the next batch.
+
+    Args:
+        projects (Iterable[Project]): The projects to index, consumed lazily.
+        index_batch (Callable[[List[Project]], None]): Embeds and stores one batch of projects.
+        max_concurrency (int): Maximum number of batches processed at once. Defaults to 4.
+        progress (Optional[Callable[[IndexingReport], None]]): Called after every finished batch. Defaults to None.
+        max_tokens (int): Maximum description tokens per batch.
+        max_items (int): Maximum projects per batch.
+        model (Optional[str]): Embedding model used to count tokens. Defaults to None.
+
+    Returns:
+        IndexingReport: Counts, failed project ids and timing of the run.
+    """
+    report = IndexingReport()
+    start = time.perf_counter()
+    in_flight: Dict[Future, List[Project]] = {}
+
+    def collect(done: Iterable[Future]) -> None:
+        for future in done:
+            batch = in_flight.pop(future)
+            try:
+                future.result()
+                report.indexed += len(batch)
+            except Exception as error:
+                logger.error("Indexing a batch of %d projects failed: %s", len(batch), error)
+                report.failed_ids.extend(project.id for project in batch)
+            report.batches += 1
+            report.elapsed_seconds = time.perf_counter() - start
+            if progress is not None:
+                progress(report)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for batch in token_batches(projects, max_tokens, max_items, model):
+            if len(in_flight) >= max_concurrency:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            future = executor.submit(index_batch, batch)
+            in_flight[future] = batch
+        collect(list(wait(in_flight).done))
+
+    report.elapsed_seconds = time.perf_counter() - start
+    return report
@@ -0,0 +1,280 @@
+from __future__ import annotations
+import asyncio
+import hashlib
+from typing import List, Optional
+from horizon_scope.application.interfaces.async_batch_comparison_service import (
+    AsyncBatchComparisonService,
+)
+from horizon_scope.application.interfaces.async_comparison_service import (
+    AsyncComparisonService,
+)
+from horizon_scope.application.interfaces.async_streaming_comparison_service import (
+    AsyncStreamingComparisonService,
+)
+from horizon_scope.application.interfaces.batch_comparison_service import (
+    BatchComparisonService,
+)
+from horizon_scope.application.interfaces.comparison_cache import ComparisonCache
+from horizon_scope.application.interfaces.comparison_service import ComparisonService
+from horizon_scope.application.interfaces.streaming_comparison_service import (
+    ComparisonUpdateCallback,
+    StreamingComparisonService,
+)
+from horizon_scope.domain.entities.comparison import Comparison
+
+
+class CachedComparisonService(
+    ComparisonService,
+    AsyncComparisonService,
+    BatchComparisonService,
+    AsyncBatchComparisonService,
+    StreamingComparisonService,
+    AsyncStreamingComparisonService,
+):
+    """Comparison service decorator that serves repeated comparisons from a cache.
+
+    The cache key is a hash of both project descriptions, the model name, the prompt version
+    and the input token budget, so changing the model, the prompt template or the truncation
+    of the descriptions never returns stale results.
+    compare_many only forwards the cache misses, batched if the wrapped service supports it.
+    compare_streaming reports a cached comparison as a single complete update.
+
+    Attributes:
+        service (ComparisonService): The wrapped comparison service.
+        cache (ComparisonCache): The cache storing comparison results.
+        model (str): Model name included in the cache key.
+        prompt_version (str): Prompt template version included in the cache key.
+        max_input_tokens (Optional[int]): Input token budget of the descriptions included in the cache key.
+    """
+
+    def __init__(
+        self,
+        service: ComparisonService,
+        cache: ComparisonCache,
+        model: Optional[str] = None,
+        prompt_version: Optional[str] = None,
+        max_input_tokens: Optional[int] = None,
+    ) -> None:
+        """Initialize CachedComparisonService.
+
+        Args:
+            service (ComparisonService): The comparison service to wrap.
+            cache (ComparisonCache): The cache storing comparison results.
+            model (Optional[str]): Model name for the cache key. Defaults to the wrapped service's model attribute.
+            prompt_version (Optional[str]): Prompt version for the cache key. Defaults to the wrapped service's prompt_version attribute.
+            max_input_tokens (Optional[int]): Input token budget for the cache key. Defaults to the wrapped service's max_input_tokens attribute.
+        """
+        self.service = service
+        self.cache = cache
+        self.model = model or getattr(service, "model", "") or ""
+        self.prompt_version = (
+            prompt_version or getattr(service, "prompt_version", "") or ""
+        )
+        if max_input_tokens is None:
+            budget = getattr(service, "max_input_tokens", None)
+            max_input_tokens = budget if isinstance(budget, int) else None
+        self.max_input_tokens = max_input_tokens
+
+    def compare(self, my_project: str, existing_project: str) -> Comparison:
+        """Compare two project descriptions, using the cached result when available.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_project (str): Description of the existing project.
+
+        Returns:
+            Comparison: A Comparison object containing the results of the comparison.
+        """
+        key = self.cache_key(my_project, existing_project)
+        comparison = self.cache.get(key)
+        if comparison is None:
+            comparison = self.service.compare(my_project, existing_project)
+            self.cache.set(key, comparison)
+        return comparison
+
+    async def acompare(self, my_project: str, existing_project: str) -> Comparison:
+        """Asynchronously compare two project descriptions, using the cached result when available.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_project (str): Description of the existing project.
+
+        Returns:
+            Comparison: A Comparison object containing the results of the comparison.
+        """
+        key = self.cache_key(my_project, existing_project)
+        comparison = self.cache.get(key)
+        if comparison is None:
+            if isinstance(self.service, AsyncComparisonService):
+                comparison = await self.service.acompare(my_project, existing_project)
+            else:
+                comparison = await asyncio.to_thread(
+                    self.service.compare, my_project, existing_project
+                )
+            self.cache.set(key, comparison)
+        return comparison
+
+    def compare_streaming(
+        self,
+        my_project: str,
+        existing_project: str,
+        on_update: ComparisonUpdateCallback,
+    ) -> Comparison:
+        """Compare two project descriptions, reporting partial results of a cache miss.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_project (str): Description of the existing project.
+            on_update (ComparisonUpdateCallback): Called with the fields generated so far whenever they change.
+
+        Returns:
+            Comparison: A Comparison object containing the results of the comparison.
+        """
+        key = self.cache_key(my_project, existing_project)
+        comparison = self.cache.get(key)
+        if comparison is None and isinstance(self.service, StreamingComparisonService):
+            comparison = self.service.compare_streaming(
+                my_project, existing_project, on_update
+            )
+            self.cache.set(key, comparison)
+            return comparison
+        if comparison is None:
+            comparison = self.service.compare(my_project, existing_project)
+            self.cache.set(key, comparison)
+        on_update(comparison.model_dump())
+        return comparison
+
+    async def acompare_streaming(
+        self,
+        my_project: str,
+        existing_project: str,
+        on_update: ComparisonUpdateCallback,
+    ) -> Comparison:
+        """Asynchronously compare two project descriptions, reporting partial results of a cache miss.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_project (str): Description of the existing project.
+            on_update (ComparisonUpdateCallback): Called with the fields generated so far whenever they change.
+
+        Returns:
+            Comparison: A Comparison object containing the results of the comparison.
+        """
+        key = self.cache_key(my_project, existing_project)
+        comparison = self.cache.get(key)
+        if comparison is None and isinstance(
+            self.service, AsyncStreamingComparisonService
+        ):
+            comparison = await self.service.acompare_streaming(
+                my_project, existing_project, on_update
+            )
+            self.cache.set(key, comparison)
+            return comparison
+        if comparison is None:
+            comparison = await self.acompare(my_project, existing_project)
+        on_update(comparison.model_dump())
+        return comparison
+
+    def compare_many(
+        self, my_project: str, existing_projects: List[str]
+    ) -> List[Comparison]:
+        """Compare a project with several existing projects, using cached results when available.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_projects (List[str]): Descriptions of the existing projects.
+
+        Returns:
+            List[Comparison]: One comparison per existing project, in the same order.
+        """
+        keys = [self.cache_key(my_project, existing) for existing in existing_projects]
+        comparisons = [self.cache.get(key) for key in keys]
+        misses = [i for i, comparison in enumerate(comparisons) if comparison is None]
+        if misses:
+            missing_projects = [existing_projects[i] for i in misses]
+            if isinstance(self.service, BatchComparisonService):
+                fresh = self.service.compare_many(my_project, missing_projects)
+            else:
+                fresh = [
+                    self.service.compare(my_project, existing)
+                    for existing in missing_projects
+                ]
+            self._store(keys, comparisons, misses, fresh)
+        return comparisons
+
+    async def acompare_many(
+        self, my_project: str, existing_projects: List[str]
+    ) -> List[Comparison]:
+        """Asynchronously compare a project with several existing projects, using cached results when available.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_projects (List[str]): Descriptions of the existing projects.
+
+        Returns:
+            List[Comparison]: One comparison per existing project, in the same order.
+        """
+        keys = [self.cache_key(my_project, existing) for existing in existing_projects]
+        comparisons = [self.cache.get(key) for key in keys]
+        misses = [i for i, comparison in enumerate(comparisons) if comparison is None]
+        if misses:
+            missing_projects = [existing_projects[i] for i in misses]
+            if isinstance(self.service, AsyncBatchComparisonService):
+                fresh = await self.service.acompare_many(my_project, missing_projects)
+            elif isinstance(self.service, BatchComparisonService):
+                fresh = await asyncio.to_thread(
+                    self.service.compare_many, my_project, missing_projects
+                )
+            elif isinstance(self.service, AsyncComparisonService):
+                fresh = await asyncio.gather(
+                    *(
+                        self.service.acompare(my_project, existing)
+                        for existing in missing_projects
+                    )
+                )
+            else:
+                fresh = [
+                    await asyncio.to_thread(self.service.compare, my_project, existing)
+                    for existing in missing_projects
+                ]
+            self._store(keys, comparisons, misses, fresh)
+        return comparisons
+
+    def _store(
+        self,
+        keys: List[str],
+        comparisons: List[Optional[Comparison]],
+        misses: List[int],
+        fresh: List[Comparison],
+    ) -> None:
+        """Cache freshly computed comparisons and fill them into the result list.
+
+        Args:
+            keys (List[str]): The cache key of every requested comparison.
+            comparisons (List[Optional[Comparison]]): The results, with None for every miss; filled in place.
+            misses (List[int]): Positions of the cache misses.
+            fresh (List[Comparison]): The computed comparisons, one per miss.
+        """
+        for position, comparison in zip(misses, fresh):
+            self.cache.set(keys[position], comparison)
+            comparisons[position] = comparison
+
+    def cache_key(self, my_project: str, existing_project: str) -> str:
+        """Build the cache key for a pair of project descriptions.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_project (str): Description of the existing project.
+
+        Returns:
+            str: A SHA-256 hex digest identifying the comparison.
+        """
+        digest = hashlib.sha256()
+        budget = "" if self.max_input_tokens is None else str(self.max_input_tokens)
+        parts = (self.prompt_version, self.model, budget, my_project, existing_project)
+        for part in parts:
+            encoded = part.encode("utf-8")
+            # Length-prefix each part so that no two different tuples hash the same input
+            digest.update(f"{len(encoded)}:".encode("ascii"))
+            digest.update(encoded)
+        return digest.hexdigest()
@@ -0,0 +1,238 @@
+from __future__ import annotations
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.token_counter import split_by_tokens
+
+T = TypeVar("T")
+
+# Separates the project id from the chunk number in vector ids
+CHUNK_SEPARATOR = "#"
+# Input limit of the OpenAI embedding models
+MAX_EMBEDDING_TOKENS = 8191
+POOLING_METHODS = ("max", "sum")
+
+
+def chunk_id(project_id: str, chunk: int) -> str:
+    """Build the vector id of a chunk.
+
+    The first chunk keeps the plain project id, so indexes built before chunking stay valid.
+
+    Args:
+        project_id (str): The project id.
+        chunk (int): The chunk number, starting at 0.
+
+    Returns:
+        str: The project id for chunk 0, otherwise "<id>#<chunk>".
+    """
+    if chunk == 0:
+        return project_id
+    return f"{project_id}{CHUNK_SEPARATOR}{chunk}"
+
+
+def split_chunk_id(vector_id: str) -> Tuple[str, int]:
+    """Split a vector id into the project id and the chunk number.
+
+    Args:
+        vector_id (str): The vector id.
+
+    Returns:
+        Tuple[str, int]: The project id and the chunk number.
+    """
+    project_id, separator, chunk = vector_id.rpartition(CHUNK_SEPARATOR)
+    if separator and chunk.isdigit():
+        return project_id, int(chunk)
+    return vector_id, 0
+
+
+def chunk_projects(project: Project, n_chunks: int) -> List[Project]:
+    """Copy a project once per chunk, with the vector id of the chunk as id.
+
+    Args:
+        project (Project): The project.
+        n_chunks (int): The number of chunks.
+
+    Returns:
+        List[Project]: The copies, in chunk order.
+    """
+    if n_chunks == 1:
+        return [project]
+    return [
+        project.model_copy(update={"id": chunk_id(project.id, chunk)})
+        for chunk in range(n_chunks)
+    ]
+
+
+class TextChunker:
+    """Splits long texts into token windows and pools chunk hits back into projects.
+
+    Texts longer than the embedding input limit are embedded as several vectors, one per
+    window. Searches return chunk hits, which are grouped by project with max pooling (the
+    best chunk) or sum pooling (favouring projects with several matching chunks).
+
+    Attributes:
+        max_tokens (int): The maximum number of tokens per chunk.
+        overlap (int): The number of tokens shared by consecutive chunks.
+        max_chunks (int): The maximum number of chunks per text; the rest is dropped.
+        pooling (str): How chunk similarities are combined, "max" or "sum".
+        model (Optional[str]): The embedding model used to count tokens.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = MAX_EMBEDDING_TOKENS,
+        overlap: int = 200,
+        max_chunks: int = 8,
+        pooling: str = "max",
+        model: Optional[str] = None,
+    ) -> None:
+        """Initialize TextChunker.
+
+        Args:
+            max_tokens (int): The maximum number of tokens per chunk. Defaults to 8191.
+            overlap (int): The number of tokens shared by consecutive chunks. Defaults to 200.
+            max_chunks (int): The maximum number of chunks per text. Defaults to 8.
+            pooling (str): How chunk similarities are combined, "max" or "sum". Defaults to "max".
+            model (Optional[str]): The embedding model used to count tokens. Defaults to None.
+
+        Raises:
+            ValueError: If the pooling method is not supported or overlap is not smaller than max_tokens.
+        """
+        if pooling not in POOLING_METHODS:
+            raise ValueError(f"Unsupported pooling method: {pooling}")
+        if not 0 <= overlap < max_tokens:
+            raise ValueError("overlap must be at least 0 and smaller than max_tokens")
+        self.max_tokens = max_tokens
+        self.overlap = overlap
+        self.max_chunks = max_chunks
+        self.pooling = pooling
+        self.model = model
+
+    @classmethod
+    def from_config(
+        cls, config: ConfigManager, model: Optional[str] = None
+    ) -> TextChunker:
+        """Create a TextChunker from vector-search-service.chunking.
+
+        Args:
+            config (ConfigManager): The configuration manager.
+            model (Optional[str]): The embedding model used to count tokens. Defaults to None.
+
+        Returns:
+            TextChunker: The configured chunker.
+        """
+        chunking_config = (
+            config.get("horizon-scope", "vector-search-service", "chunking", default=None)
+            or {}
+        )
+        return cls(
+            max_tokens=chunking_config.get("max_tokens", MAX_EMBEDDING_TOKENS),
+            overlap=chunking_config.get("overlap", 200),
+            max_chunks=chunking_config.get("max_chunks", 8),
+            pooling=chunking_config.get("pooling", "max"),
+            model=model,
+        )
+
+    def split(self, text: str) -> List[str]:
+        """Split a text into at most max_chunks chunks of at most max_tokens tokens.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            List[str]: The chunks. A text that fits is the only chunk.
+        """
+        return split_by_tokens(text, self.max_tokens, self.overlap, self.model)[
+            : self.max_chunks
+        ]
+
+    def split_projects(
+        self, projects: Iterable[Project]
+    ) -> Tuple[List[Project], List[str]]:
+        """Split the descriptions of projects into chunks.
+
+        Args:
+            projects (Iterable[Project]): The projects.
+
+        Returns:
+            Tuple[List[Project], List[str]]: One project per chunk, with the chunk's vector id, and the chunk texts.
+        """
+        chunked: List[Project] = []
+        texts: List[str] = []
+        for project in projects:
+            chunks = self.split(project.description)
+            chunked.extend(chunk_projects(project, len(chunks)))
+            texts.extend(chunks)
+        return chunked, texts
+
+    def stale_chunk_ids(self, projects: Iterable[Project]) -> List[str]:
+        """List the vector ids of chunks that a new version of projects no longer has.
+
+        Args:
+            projects (Iterable[Project]): One project per chunk, as returned by chunk_projects, with all chunks of each project.
+
+        Returns:
+            List[str]: The ids of the chunks after the last given chunk of each project, up to max_chunks.
+        """
+        n_chunks: Dict[str, int] = {}
+        for project in projects:
+            project_id, chunk = split_chunk_id(project.id)
+            n_chunks[project_id] = max(n_chunks.get(project_id, 0), chunk + 1)
+        return [
+            chunk_id(project_id, chunk)
+            for project_id, count in n_chunks.items()
+            for chunk in range(count, self.max_chunks)
+        ]
+
+    def pool(self, hits: Iterable[Tuple[str, float, T]]) -> List[Tuple[str, float, T]]:
+        """Group chunk hits by project.
+
+        Args:
+            hits (Iterable[Tuple[str, float, T]]): Vector id, similarity and payload of every hit, best first.
+
+        Returns:
+            List[Tuple[str, float, T]]: Project id, pooled similarity and the payload of the
+            project's best hit, most similar first.
+        """
+        pooled: Dict[str, Tuple[float, T]] = {}
+        for vector_id, score, payload in hits:
+            project_id, _ = split_chunk_id(vector_id)
+            if project_id not in pooled:
+                pooled[project_id] = (score, payload)
+            elif self.pooling == "sum":
+                pooled[project_id] = (pooled[project_id][0] + score, pooled[project_id][1])
+        ranked = [
+            (project_id, score, payload)
+            for project_id, (score, payload) in pooled.items()
+        ]
+        ranked.sort(key=lambda hit: hit[1], reverse=True)
+        return ranked
+
+    def search(
+        self,
+        fetch: Callable[[int], List[Tuple[str, float, T]]],
+        k: int,
+        max_hits: int,
+    ) -> List[Tuple[str, float, T]]:
+        """Fetch chunk hits until they cover k distinct projects.
+
+        The first request asks for k hits. While the hits belong to fewer than k projects and
+        more hits are available, the number of requested hits is doubled.
+
+        Args:
+            fetch (Callable[[int], List[Tuple[str, float, T]]]): Returns the given number of best hits.
+            k (int): The number of projects to return.
+            max_hits (int): The largest number of hits that may be requested.
+
+        Returns:
+            List[Tuple[str, float, T]]: The k best projects, as returned by pool.
+        """
+        if k <= 0 or max_hits <= 0:
+            return []
+        n_hits = min(k, max_hits)
+        while True:
+            hits = fetch(n_hits)
+            pooled = self.pool(hits)
+            if len(pooled) >= k or len(hits) < n_hits or n_hits >= max_hits:
+                return pooled[:k]
+            n_hits = min(n_hits * 2, max_hits)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+from typing import Any, List, Optional, Tuple
+from horizon_scope.application.interfaces.reranker import Reranker
+from horizon_scope.domain.entities.project import Project
+
+DEFAULT_CROSS_ENCODER_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+
+class CrossEncoderReranker(Reranker):
+    """Reranker that scores (query, description) pairs with a local cross-encoder.
+
+    A cross-encoder reads the query and the candidate together, which ranks far better than
+    comparing independently computed embeddings, and runs locally without API cost. The model
+    is loaded with sentence-transformers on first use, so the dependency is only needed when
+    this reranker is configured.
+
+    Attributes:
+        model_name (str): Name or path of the sentence-transformers cross-encoder.
+        batch_size (int): Number of pairs scored per forward pass.
+        max_length (Optional[int]): Maximum number of tokens per pair; longer pairs are truncated.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_CROSS_ENCODER_MODEL,
+        batch_size: int = 32,
+        max_length: Optional[int] = 512,
+    ) -> None:
+        """Initialize CrossEncoderReranker.
+
+        Args:
+            model_name (str): Name or path of the cross-encoder. Defaults to "cross-encoder/ms-marco-MiniLM-L-6-v2".
+            batch_size (int): Number of pairs scored per forward pass. Defaults to 32.
+            max_length (Optional[int]): Maximum number of tokens per pair. Defaults to 512.
+        """
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self._model: Any = None
+
+    @property
+    def model(self) -> Any:
+        """Any: The sentence-transformers CrossEncoder, loaded on first access.
+
+        Raises:
+            ImportError: If sentence-transformers is not installed.
+        """
+        if self._model is None:
+            try:
+                from sentence_transformers import CrossEncoder
+            except ImportError as error:
+                raise ImportError(
+                    "sentence-transformers is required for the cross-encoder reranker"
+                ) from error
+            self._model = CrossEncoder(self.model_name, max_length=self.max_length)
+        return self._model
+
+    def rerank(self, query: str, projects: List[Project]) -> List[Tuple[Project, float]]:
+        """Score the candidates against the query with the cross-encoder.
+
+        Args:
+            query (str): The project description or search query.
+            projects (List[Project]): The candidates found by the vector search.
+
+        Returns:
+            List[Tuple[Project, float]]: Every candidate with its cross-encoder score, highest score first.
+        """
+        if not projects:
+            return []
+        scores = self.model.predict(
+            [(query, project.description) for project in projects],
+            batch_size=self.batch_size,
+            show_progress_bar=False,
+        )
+        ranked = [(project, float(score)) for project, score in zip(projects, scores)]
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked
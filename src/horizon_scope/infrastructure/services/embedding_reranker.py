@@ -0,0 +1,68 @@
+from __future__ import annotations
+from typing import List, Tuple
+import numpy as np
+from horizon_scope.application.interfaces.embedding_service import EmbeddingService
+from horizon_scope.application.interfaces.reranker import Reranker
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.services.batching import token_batches
+from horizon_scope.infrastructure.services.chunking import MAX_EMBEDDING_TOKENS
+from horizon_scope.infrastructure.services.token_counter import truncate_to_tokens
+
+
+class EmbeddingReranker(Reranker):
+    """Reranker that scores candidates by the cosine similarity of fresh embeddings.
+
+    The candidates are re-embedded as a whole, with one batched request, and compared to the
+    query embedding. This gives one comparable score to every candidate, including hits that
+    only a lexical retriever found or that were scored chunk by chunk, without loading a local
+    model.
+
+    Attributes:
+        embedding_service (EmbeddingService): Service used to embed the query and the candidates.
+        max_tokens (int): Candidate descriptions are truncated to this number of tokens.
+    """
+
+    def __init__(
+        self, embedding_service: EmbeddingService, max_tokens: int = MAX_EMBEDDING_TOKENS
+    ) -> None:
+        """Initialize EmbeddingReranker.
+
+        Args:
+            embedding_service (EmbeddingService): Service used to embed the query and the candidates.
+            max_tokens (int): Maximum number of tokens embedded per candidate. Defaults to 8191.
+        """
+        self.embedding_service = embedding_service
+        self.max_tokens = max_tokens
+
+    def rerank(self, query: str, projects: List[Project]) -> List[Tuple[Project, float]]:
+        """Score the candidates by cosine similarity to the query.
+
+        Args:
+            query (str): The project description or search query.
+            projects (List[Project]): The candidates found by the vector search.
+
+        Returns:
+            List[Tuple[Project, float]]: Every candidate with its cosine similarity, highest first.
+        """
+        if not projects:
+            return []
+        model = getattr(self.embedding_service, "model", None)
+        texts = [
+            truncate_to_tokens(project.description, self.max_tokens, model)
+            for project in projects
+        ]
+        embeddings: List[List[float]] = []
+        for batch in token_batches(texts, count=lambda text: text[1]):
+            embeddings.extend(
+                self.embedding_service.embed_many([text for text, _ in batch])
+            )
+
+        candidates = np.asarray(embeddings, dtype=np.float32)
+        candidates /= np.maximum(np.linalg.norm(candidates, axis=1, keepdims=True), 1e-12)
+        query_embedding = np.asarray(self.embedding_service.embed(query), dtype=np.float32)
+        query_embedding /= max(float(np.linalg.norm(query_embedding)), 1e-12)
+        scores = candidates @ query_embedding
+
+        ranked = [(project, float(score)) for project, score in zip(projects, scores)]
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked
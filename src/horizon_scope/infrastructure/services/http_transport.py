@@ -0,0 +1,244 @@
+from __future__ import annotations
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# httpcore trace event of a newly opened connection
+CONNECTION_OPENED = "connection.connect_tcp.complete"
+
+# Base URL of the OpenAI clients without a configured one
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+
+class HttpTransport:
+    """Pooled HTTP transport shared by all OpenAI clients of a HorizonScopeClient.
+
+    All OpenAI clients share one synchronous and one asynchronous httpx client, whatever
+    their API key, so requests to the same base URL reuse kept-alive connections (and their
+    TLS sessions) instead of each service opening its own pool. The rate limiter observes
+    every response through the event hooks of the pools. httpx and openai are only imported
+    once the first pool is requested.
+
+    Attributes:
+        rate_limiter (RateLimiter): Rate limiter observing the rate-limit headers of every response.
+        http2 (bool): Whether HTTP/2 is negotiated; needs the h2 package (pip install "httpx[http2]").
+        max_connections (int): Maximum number of open connections per pool.
+        max_keepalive_connections (int): Maximum number of idle connections kept alive per pool.
+        keepalive_expiry (float): Seconds an idle connection is kept alive.
+        connect_timeout (float): Seconds to wait for a connection.
+        read_timeout (float): Seconds to wait for response data, e.g. the next streamed chunk.
+        requests (int): Number of responses received.
+        connections (int): Number of connections opened.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 600.0,
+    ) -> None:
+        """Initialize HttpTransport.
+
+        Args:
+            rate_limiter (Optional[RateLimiter]): Rate limiter observing the responses. Defaults to a new one.
+            http2 (bool): Whether HTTP/2 is negotiated. Defaults to False.
+            max_connections (int): Maximum number of open connections per pool. Defaults to 100.
+            max_keepalive_connections (int): Maximum number of idle connections kept alive per pool. Defaults to 20.
+            keepalive_expiry (float): Seconds an idle connection is kept alive. Defaults to 30.
+            connect_timeout (float): Seconds to wait for a connection. Defaults to 5.
+            read_timeout (float): Seconds to wait for response data. Defaults to 600, the OpenAI default.
+        """
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.requests = 0
+        self.connections = 0
+        self._http_client: Optional[httpx.Client] = None
+        self._async_http_client: Optional[httpx.AsyncClient] = None
+        self._base_urls: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls, config: ConfigManager, rate_limiter: Optional[RateLimiter] = None
+    ) -> HttpTransport:
+        """Create a transport from the horizon-scope.http settings.
+
+        Args:
+            config (ConfigManager): Configuration manager to read the settings from.
+            rate_limiter (Optional[RateLimiter]): Rate limiter observing the responses. Defaults to a new one.
+
+        Returns:
+            HttpTransport: The transport.
+        """
+        settings = config.get("horizon-scope", "http", default=None) or {}
+        return cls(
+            rate_limiter,
+            http2=settings.get("http2", False),
+            max_connections=settings.get("max_connections", 100),
+            max_keepalive_connections=settings.get("max_keepalive_connections", 20),
+            keepalive_expiry=settings.get("keepalive_expiry", 30.0),
+            connect_timeout=settings.get("connect_timeout", 5.0),
+            read_timeout=settings.get("read_timeout", 600.0),
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        """httpx.Timeout: The connect and read timeouts, to pass to the OpenAI clients as well."""
+        import httpx
+
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+    def http_client(self, base_url: Optional[str] = None) -> httpx.Client:
+        """Return the synchronous pool, to pass as http_client to an OpenAI client.
+
+        Args:
+            base_url (Optional[str]): The base URL the pool will serve, opened by warm_up. Defaults to None, i.e. the OpenAI API.
+
+        Returns:
+            httpx.Client: The pool shared by all synchronous clients.
+        """
+        from openai import DefaultHttpxClient
+
+        with self._lock:
+            self._base_urls.add(base_url or DEFAULT_BASE_URL)
+            if self._http_client is None:
+
+                def trace(event: str, info: Dict[str, Any]) -> None:
+                    if event == CONNECTION_OPENED:
+                        self._count(connections=1)
+
+                def add_trace(request: httpx.Request) -> None:
+                    request.extensions["trace"] = trace
+
+                def count_response(response: httpx.Response) -> None:
+                    self._count(requests=1)
+
+                hooks = self.rate_limiter.event_hooks("openai")
+                self._http_client = DefaultHttpxClient(
+                    http2=self.http2,
+                    limits=self._limits(),
+                    timeout=self.timeout,
+                    event_hooks={
+                        "request": [add_trace],
+                        "response": hooks["response"] + [count_response],
+                    },
+                )
+            return self._http_client
+
+    def async_http_client(self) -> httpx.AsyncClient:
+        """Return the asynchronous pool, to pass as http_client to an AsyncOpenAI client.
+
+        Returns:
+            httpx.AsyncClient: The pool shared by all asynchronous clients.
+        """
+        from openai import DefaultAsyncHttpxClient
+
+        with self._lock:
+            if self._async_http_client is None:
+
+                async def trace(event: str, info: Dict[str, Any]) -> None:
+                    if event == CONNECTION_OPENED:
+                        self._count(connections=1)
+
+                async def add_trace(request: httpx.Request) -> None:
+                    request.extensions["trace"] = trace
+
+                async def count_response(response: httpx.Response) -> None:
+                    self._count(requests=1)
+
+                hooks = self.rate_limiter.async_event_hooks("openai")
+                self._async_http_client = DefaultAsyncHttpxClient(
+                    http2=self.http2,
+                    limits=self._limits(),
+                    timeout=self.timeout,
+                    event_hooks={
+                        "request": [add_trace],
+                        "response": hooks["response"] + [count_response],
+                    },
+                )
+            return self._async_http_client
+
+    def warm_up(self) -> int:
+        """Open a connection of the synchronous pool to every base URL it serves.
+
+        The first request of a match then skips the TCP and TLS handshakes. Failures are
+        logged and ignored, since the requests themselves will report them.
+
+        Returns:
+            int: The number of base URLs that answered.
+        """
+        with self._lock:
+            http_client = self._http_client
+            base_urls = sorted(self._base_urls)
+        if http_client is None:
+            return 0
+        warmed = 0
+        for base_url in base_urls:
+            try:
+                http_client.head(base_url)
+                warmed += 1
+            except Exception as error:
+                logger.warning("Could not warm up %s: %s", base_url, error)
+        return warmed
+
+    def stats(self) -> Dict[str, int]:
+        """Return the connection reuse metrics.
+
+        Returns:
+            Dict[str, int]: Responses received, connections opened and requests sent on a reused connection.
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections": self.connections,
+                "reused": max(self.requests - self.connections, 0),
+            }
+
+    def close(self) -> None:
+        """Close the pools; later calls of http_client open new ones.
+
+        The asynchronous pool is closed when it is garbage collected, as closing it needs the
+        event loop it was used on.
+        """
+        with self._lock:
+            if self._http_client is not None:
+                self._http_client.close()
+            self._http_client = None
+            self._async_http_client = None
+
+    def _limits(self) -> httpx.Limits:
+        """Return the connection limits of the pools."""
+        import httpx
+
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def _count(self, requests: int = 0, connections: int = 0) -> None:
+        """Add to the connection reuse metrics.
+
+        Args:
+            requests (int): Number of responses received. Defaults to 0.
+            connections (int): Number of connections opened. Defaults to 0.
+        """
+        with self._lock:
+            self.requests += requests
+            self.connections += connections
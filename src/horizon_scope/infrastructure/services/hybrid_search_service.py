@@ -0,0 +1,205 @@
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Sequence
+from horizon_scope.application.interfaces.async_vector_search_service import (
+    AsyncVectorSearchService,
+)
+from horizon_scope.application.interfaces.vector_index_writer import (
+    VectorIndexWriter,
+)
+from horizon_scope.application.interfaces.vector_search_service import (
+    VectorSearchService,
+)
+from horizon_scope.domain.entities.indexing_report import IndexingReport
+from horizon_scope.domain.entities.project import Project
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Project]], rrf_k: int = 60
+) -> List[Project]:
+    """Merge ranked result lists with reciprocal rank fusion.
+
+    A project scores 1 / (rrf_k + rank) in every list it appears in, with ranks starting at 1.
+    Only ranks are used, so lists with incomparable scores (cosine similarity and BM25) can be
+    merged without calibration.
+
+    Args:
+        rankings (Sequence[Sequence[Project]]): The result lists, best first.
+        rrf_k (int): Damping constant; larger values flatten the rank contributions. Defaults to 60.
+
+    Returns:
+        List[Project]: Every project once, highest fused score first. A project found by
+        several lists is taken from the first list that contains it.
+    """
+    scores: Dict[str, float] = {}
+    projects: Dict[str, Project] = {}
+    for ranking in rankings:
+        for rank, project in enumerate(ranking, start=1):
+            scores[project.id] = scores.get(project.id, 0.0) + 1.0 / (rrf_k + rank)
+            projects.setdefault(project.id, project)
+    ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+    return [projects[project_id] for project_id in ranked]
+
+
+class HybridSearchService(
+    VectorSearchService, AsyncVectorSearchService, VectorIndexWriter
+):
+    """Service that fuses dense vector search with lexical search.
+
+    Both retrievers fetch a candidate list for the query concurrently, and the lists are merged
+    with reciprocal rank fusion. Dense hits keep their cosine similarity. Projects found only by
+    the lexical retriever keep an empty similarity, so similarity-based gating passes them on
+    instead of mistaking exact term matches (acronyms, grant numbers) for weak dense hits.
+
+    index_project and index_projects write to the dense service only. Precomputed embeddings
+    written by the ingest pipeline go to both services, so a lexical index that is a
+    VectorIndexWriter (such as BM25SearchService) follows delta syncs.
+
+    Attributes:
+        dense (VectorSearchService): The embedding-based search service.
+        lexical (VectorSearchService): The term-based search service.
+        candidates (int): The number of candidates fetched from each retriever.
+        rrf_k (int): Damping constant of the rank fusion.
+    """
+
+    def __init__(
+        self,
+        dense: VectorSearchService,
+        lexical: VectorSearchService,
+        candidates: int = 50,
+        rrf_k: int = 60,
+    ) -> None:
+        """Initialize HybridSearchService.
+
+        Args:
+            dense (VectorSearchService): The embedding-based search service.
+            lexical (VectorSearchService): The term-based search service.
+            candidates (int): The number of candidates fetched from each retriever. Defaults to 50.
+            rrf_k (int): Damping constant of the rank fusion. Defaults to 60.
+        """
+        self.dense = dense
+        self.lexical = lexical
+        self.candidates = candidates
+        self.rrf_k = rrf_k
+
+    def search(self, query: str, k: int) -> List[Project]:
+        """Search both retrievers concurrently and fuse their rankings.
+
+        Args:
+            query (str): The query string to search for.
+            k (int): The number of top results to return.
+
+        Returns:
+            List[Project]: The k best projects by fused rank.
+        """
+        n_candidates = max(k, self.candidates)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dense_future = executor.submit(self.dense.search, query, n_candidates)
+            lexical_future = executor.submit(self.lexical.search, query, n_candidates)
+            dense_hits = dense_future.result()
+            lexical_hits = lexical_future.result()
+        return self._fuse(dense_hits, lexical_hits, k)
+
+    async def asearch(self, query: str, k: int) -> List[Project]:
+        """Asynchronously search both retrievers and fuse their rankings.
+
+        Retrievers without an asyncio interface run in a worker thread.
+
+        Args:
+            query (str): The query string to search for.
+            k (int): The number of top results to return.
+
+        Returns:
+            List[Project]: The k best projects by fused rank.
+        """
+        n_candidates = max(k, self.candidates)
+        dense_hits, lexical_hits = await asyncio.gather(
+            self._asearch(self.dense, query, n_candidates),
+            self._asearch(self.lexical, query, n_candidates),
+        )
+        return self._fuse(dense_hits, lexical_hits, k)
+
+    def index_project(self, project: Project) -> None:
+        """Index a project into the dense service.
+
+        Args:
+            project (Project): The project to index.
+        """
+        self.dense.index_project(project)
+
+    def index_projects(
+        self, projects: Iterable[Project], **kwargs: Any
+    ) -> IndexingReport:
+        """Index many projects into the dense service, see its index_projects.
+
+        Args:
+            projects (Iterable[Project]): The projects to index, consumed lazily.
+            **kwargs: Batching and progress options of the dense service.
+
+        Returns:
+            IndexingReport: Counts, failed project ids and timing of the run.
+        """
+        return self.dense.index_projects(projects, **kwargs)
+
+    def upsert_embeddings(
+        self, projects: List[Project], embeddings: List[List[float]]
+    ) -> None:
+        """Add or replace projects in the dense and, if it accepts writes, the lexical service.
+
+        Args:
+            projects (List[Project]): The projects to store, one per chunk, with all chunks of each project.
+            embeddings (List[List[float]]): The embeddings, aligned with the projects.
+        """
+        self.dense.upsert_embeddings(projects, embeddings)
+        if isinstance(self.lexical, VectorIndexWriter):
+            self.lexical.upsert_embeddings(projects, embeddings)
+
+    def delete(self, project_ids: List[str]) -> None:
+        """Remove projects from both services.
+
+        Args:
+            project_ids (List[str]): The ids of the projects to remove.
+        """
+        self.dense.delete(project_ids)
+        if isinstance(self.lexical, VectorIndexWriter):
+            self.lexical.delete(project_ids)
+
+    def flush(self) -> None:
+        """Persist the changes of both services."""
+        self.dense.flush()
+        if isinstance(self.lexical, VectorIndexWriter):
+            self.lexical.flush()
+
+    @staticmethod
+    async def _asearch(
+        service: VectorSearchService, query: str, k: int
+    ) -> List[Project]:
+        """Search a service without blocking the event loop.
+
+        Args:
+            service (VectorSearchService): The service to search.
+            query (str): The query string to search for.
+            k (int): The number of results to return.
+
+        Returns:
+            List[Project]: The results of the service.
+        """
+        if isinstance(service, AsyncVectorSearchService):
+            return await service.asearch(query, k)
+        return await asyncio.to_thread(service.search, query, k)
+
+    def _fuse(
+        self, dense_hits: List[Project], lexical_hits: List[Project], k: int
+    ) -> List[Project]:
+        """Fuse the candidate lists.
+
+        Args:
+            dense_hits (List[Project]): Dense candidates, best first.
+            lexical_hits (List[Project]): Lexical candidates, best first.
+            k (int): The number of results to return.
+
+        Returns:
+            List[Project]: The k best projects by fused rank.
+        """
+        return reciprocal_rank_fusion([dense_hits, lexical_hits], self.rrf_k)[:k]
@@ -0,0 +1,501 @@
+from __future__ import annotations
+import os
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from horizon_scope.application.interfaces.async_vector_search_service import (
+    AsyncVectorSearchService,
+)
+from horizon_scope.application.interfaces.vector_index_writer import (
+    VectorIndexWriter,
+)
+from horizon_scope.application.interfaces.vector_search_service import (
+    VectorSearchService,
+)
+from horizon_scope.domain.entities.indexing_report import IndexingReport
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.config.backend_registry import (
+    create_embedding_service,
+)
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.index.exact_index import exact_search
+from horizon_scope.infrastructure.index.ivf_index import IVFIndex, fingerprint
+from horizon_scope.infrastructure.services.bulk_indexing import run_bulk_indexing
+from horizon_scope.infrastructure.services.chunking import (
+    TextChunker,
+    chunk_projects,
+    split_chunk_id,
+)
+from horizon_scope.infrastructure.services.http_transport import HttpTransport
+from horizon_scope.infrastructure.services.rate_limiter import RateLimiter
+
+DEFAULT_EMBEDDINGS_PATH = "data/horizon_projects_embeddings.pkl"
+
+
+def load_project_metadata(path: str) -> Dict[str, List[str]]:
+    """Load project ids, titles, objectives and dates from disk.
+
+    Accepts the pickled DataFrames written by the notebooks (columns id, title, objective and
+    contentUpdateDate), which require pandas, and the .npz archive written by
+    LocalVectorSearchService.save, which does not.
+
+    Args:
+        path (str): Path of the .pkl or .npz file.
+
+    Returns:
+        Dict[str, List[str]]: The lists "ids", "titles", "objectives" and "dates".
+
+    Raises:
+        ImportError: If a .pkl file is given and pandas is not installed.
+    """
+    return _load(path, with_embeddings=False)
+
+
+def load_project_embeddings(path: str) -> Dict[str, Any]:
+    """Load project metadata and embeddings from disk.
+
+    Two formats are supported: the pickled DataFrame written by the embeddings notebook
+    (columns id, title, objective, contentUpdateDate and ada_embedding), which requires pandas,
+    and the .npz archive written by LocalVectorSearchService.save, which does not.
+
+    Args:
+        path (str): Path of the .pkl or .npz file.
+
+    Returns:
+        Dict[str, Any]: The lists "ids", "titles", "objectives" and "dates" and the (n, d) array "embeddings".
+
+    Raises:
+        ImportError: If a .pkl file is given and pandas is not installed.
+    """
+    return _load(path, with_embeddings=True)
+
+
+def _load(path: str, with_embeddings: bool) -> Dict[str, Any]:
+    """Load a project file, see load_project_embeddings.
+
+    Args:
+        path (str): Path of the .pkl or .npz file.
+        with_embeddings (bool): Whether the "embeddings" array is loaded as well.
+
+    Returns:
+        Dict[str, Any]: The project lists, and the embeddings if requested.
+
+    Raises:
+        ImportError: If a .pkl file is given and pandas is not installed.
+    """
+    if path.endswith(".npz"):
+        with np.load(path, allow_pickle=False) as archive:
+            data = {
+                "ids": archive["ids"].tolist(),
+                "titles": archive["titles"].tolist(),
+                "objectives": archive["objectives"].tolist(),
+                "dates": archive["dates"].tolist(),
+            }
+            if with_embeddings:
+                data["embeddings"] = archive["embeddings"]
+            return data
+
+    try:
+        import pandas as pd
+    except ImportError as error:
+        raise ImportError(
+            "pandas is required to load pickled project data"
+        ) from error
+
+    df = pd.read_pickle(path)
+    dates = pd.to_datetime(df["contentUpdateDate"], errors="coerce")
+    data = {
+        "ids": df["id"].astype(str).tolist(),
+        "titles": df["title"].fillna("").astype(str).tolist(),
+        "objectives": df["objective"].fillna("").astype(str).tolist(),
+        "dates": dates.dt.strftime("%Y-%m-%dT%H:%M:%S").fillna("").tolist(),
+    }
+    if with_embeddings:
+        data["embeddings"] = np.stack(df["ada_embedding"].to_numpy())
+    return data
+
+
+def normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """Return a contiguous float32 copy of the embeddings with unit-length rows.
+
+    Args:
+        embeddings (np.ndarray): The (n, d) embedding matrix.
+
+    Returns:
+        np.ndarray: The normalized matrix. Zero rows are left as zeros.
+    """
+    matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(embeddings), -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class LocalVectorSearchService(
+    VectorSearchService, AsyncVectorSearchService, VectorIndexWriter
+):
+    """Service for in-process vector search over the project embeddings.
+
+    The full embedding matrix is held in memory as a contiguous float32 array with unit-length
+    rows, so cosine similarity is a single matrix-vector product. Only the query embedding
+    requires a network call. For larger corpora an approximate IVF index can be enabled with
+    vector-search-service.store.ann; it is built on first use and cached at ann.path.
+    Long descriptions are stored as one row per chunk ("<id>#<chunk>"), and search results
+    are pooled back into one project each.
+
+    Attributes:
+        config (ConfigManager): Configuration manager for accessing the store path and embedding settings.
+        embedding_service (EmbeddingService): Service for generating (cached) query embeddings.
+        chunker (TextChunker): Splits long descriptions and pools chunk hits.
+        ids (List[str]): Vector identifiers (project ids or chunk ids), aligned with the rows of embeddings.
+        titles (List[str]): Project titles, aligned with the rows of embeddings.
+        objectives (List[str]): Project objectives, aligned with the rows of embeddings.
+        dates (List[str]): Project content update dates, aligned with the rows of embeddings.
+        embeddings (np.ndarray): The (n, d) float32 matrix of normalized project embeddings.
+        ann_index (Optional[IVFIndex]): Approximate index, or None for exact search.
+    """
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[HttpTransport] = None,
+    ) -> None:
+        """Initialize LocalVectorSearchService and load the embeddings from disk.
+
+        Args:
+            config (ConfigManager): Configuration manager for the service.
+            rate_limiter (Optional[RateLimiter]): Rate limiter of the embedding requests, shared with other services. Defaults to None (a limiter of its own).
+            transport (Optional[HttpTransport]): Pooled transport of the embedding requests, shared with other services. Defaults to None (a transport of its own).
+        """
+        self.config = config
+        self.path = self.config.get(
+            "horizon-scope",
+            "vector-search-service",
+            "store",
+            "path",
+            default=DEFAULT_EMBEDDINGS_PATH,
+        )
+        self.embedding_service = create_embedding_service(config, rate_limiter, transport)
+        self.chunker = TextChunker.from_config(
+            config, model=self.embedding_service.model
+        )
+        self._lock = threading.Lock()
+
+        if self.path.endswith(".npz") and not os.path.exists(self.path):
+            # Start an empty index that ingestion can fill and flush to path
+            data = {
+                "ids": [],
+                "titles": [],
+                "objectives": [],
+                "dates": [],
+                "embeddings": np.zeros((0, 0), dtype=np.float32),
+            }
+        else:
+            data = load_project_embeddings(self.path)
+        self.ids: List[str] = data["ids"]
+        self.titles: List[str] = data["titles"]
+        self.objectives: List[str] = data["objectives"]
+        self.dates: List[str] = data["dates"]
+        self.embeddings = normalize_rows(data["embeddings"])
+        self._positions = {project_id: i for i, project_id in enumerate(self.ids)}
+        self.ann_index = self._load_ann_index()
+
+    def search(self, query: str, k: int) -> List[Project]:
+        """Search for projects matching the query.
+
+        Args:
+            query (str): The query string to search for.
+            k (int): The number of top results to return.
+
+        Returns:
+            List[Project]: A list of projects matching the query.
+        """
+        query_embedding = self.embedding_service.embed(query)
+        return self.search_by_vector(query_embedding, k)
+
+    async def asearch(self, query: str, k: int) -> List[Project]:
+        """Asynchronously search for projects matching the query.
+
+        Only the query embedding is awaited; scoring is fast enough to run on the event loop.
+
+        Args:
+            query (str): The query string to search for.
+            k (int): The number of top results to return.
+
+        Returns:
+            List[Project]: A list of projects matching the query.
+        """
+        query_embedding = await self.embedding_service.aembed(query)
+        return self.search_by_vector(query_embedding, k)
+
+    def search_by_vector(self, query_embedding: List[float], k: int) -> List[Project]:
+        """Return the k projects whose embeddings have the highest cosine similarity to a vector.
+
+        Args:
+            query_embedding (List[float]): The query embedding.
+            k (int): The number of top results to return.
+
+        Returns:
+            List[Project]: The best matching projects, most similar first.
+        """
+        embeddings = self.embeddings
+        if k <= 0 or len(embeddings) == 0:
+            return []
+
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query_vector)
+        if norm > 0:
+            query_vector = query_vector / norm
+
+        def fetch(n_hits: int) -> List[Tuple[str, float, int]]:
+            if self.ann_index is not None:
+                positions, scores = self.ann_index.search(
+                    embeddings, query_vector, n_hits
+                )
+            else:
+                positions, scores = exact_search(embeddings, query_vector, n_hits)
+            return [
+                (self.ids[position], float(score), int(position))
+                for position, score in zip(positions, scores)
+            ]
+
+        return [
+            self._to_project(position, similarity)
+            for _, similarity, position in self.chunker.search(
+                fetch, k, len(embeddings)
+            )
+        ]
+
+    def index_project(self, project: Project) -> None:
+        """Add or replace a project in the in-memory index.
+
+        The change is not written back to disk; call save to persist it. With an IVF index,
+        new projects are scored exactly and replaced projects keep their inverted list until
+        the index is rebuilt.
+
+        Args:
+            project (Project): The project to be indexed.
+        """
+        chunks = self.chunker.split(project.description)
+        if len(chunks) == 1:
+            embeddings = [self.embedding_service.embed(chunks[0])]
+        else:
+            embeddings = self.embedding_service.embed_many(chunks)
+        self.upsert_embeddings(chunk_projects(project, len(chunks)), embeddings)
+
+    def index_projects(
+        self,
+        projects: Iterable[Project],
+        max_concurrency: int = 4,
+        progress: Optional[Callable[[IndexingReport], None]] = None,
+    ) -> IndexingReport:
+        """Add or replace many projects with batched embedding requests.
+
+        Projects are consumed lazily and grouped into embedding requests that respect the
+        OpenAI token limit; every batch is added to the matrix in a single copy. As with
+        index_project, call save to persist the result.
+
+        Args:
+            projects (Iterable[Project]): The projects to be indexed.
+            max_concurrency (int): Maximum number of embedding requests in flight. Defaults to 4.
+            progress (Optional[Callable[[IndexingReport], None]]): Called after every finished batch. Defaults to None.
+
+        Returns:
+            IndexingReport: Counts, failed project ids and timing of the run.
+        """
+
+        def index_batch(batch: List[Project]) -> None:
+            chunked, texts = self.chunker.split_projects(batch)
+            embeddings = self.embedding_service.embed_many(texts)
+            self.upsert_embeddings(chunked, embeddings)
+
+        return run_bulk_indexing(
+            projects,
+            index_batch,
+            max_concurrency=max_concurrency,
+            progress=progress,
+            model=self.embedding_service.model,
+        )
+
+    def upsert_embeddings(
+        self, projects: List[Project], embeddings: List[List[float]]
+    ) -> None:
+        """Add or replace projects with precomputed embeddings in the in-memory index.
+
+        The rows of chunks that a longer previous version of a project had are removed, which
+        rebuilds an IVF index.
+
+        Args:
+            projects (List[Project]): The projects, one per chunk, with all chunks of each project.
+            embeddings (List[List[float]]): The embeddings of the project descriptions.
+        """
+        rows = normalize_rows(np.asarray(embeddings))
+        now = datetime.now().isoformat()
+        stale_ids = self.chunker.stale_chunk_ids(projects)
+        with self._lock:
+            self._remove_rows(
+                [
+                    self._positions[vector_id]
+                    for vector_id in stale_ids
+                    if vector_id in self._positions
+                ]
+            )
+            n_rows = len(self.embeddings)
+            appended: List[np.ndarray] = []
+            replaced: Dict[int, np.ndarray] = {}
+            for project, row in zip(projects, rows):
+                position = self._positions.get(project.id)
+                if position is None:
+                    position = len(self.ids)
+                    self._positions[project.id] = position
+                    self.ids.append(project.id)
+                    self.titles.append("")
+                    self.objectives.append("")
+                    self.dates.append("")
+                    appended.append(row)
+                elif position >= n_rows:
+                    appended[position - n_rows] = row
+                else:
+                    replaced[position] = row
+                self.titles[position] = project.title or ""
+                self.objectives[position] = project.description
+                self.dates[position] = project.content_update_date or now
+
+            # Swap in a new matrix so that concurrent searches see a consistent array
+            matrix = self.embeddings
+            if n_rows == 0:
+                matrix = np.empty((0, rows.shape[1]), dtype=np.float32)
+            if replaced:
+                matrix = matrix.copy()
+                matrix[list(replaced)] = np.asarray(list(replaced.values()))
+            if appended:
+                matrix = np.concatenate([matrix, np.asarray(appended)])
+            self.embeddings = matrix
+
+    def save(self, path: str) -> None:
+        """Save the index as an .npz archive that loads without pandas.
+
+        Args:
+            path (str): Destination path of the archive.
+        """
+        with self._lock:
+            np.savez(
+                path,
+                ids=np.asarray(self.ids, dtype=str),
+                titles=np.asarray(self.titles, dtype=str),
+                objectives=np.asarray(self.objectives, dtype=str),
+                dates=np.asarray(self.dates, dtype=str),
+                embeddings=self.embeddings,
+            )
+
+    def delete(self, project_ids: List[str]) -> None:
+        """Remove projects, including all their chunks, from the in-memory index.
+
+        Rows shift when projects are removed, so an IVF index is rebuilt afterwards. Do not
+        delete while searches are running.
+
+        Args:
+            project_ids (List[str]): The ids of the projects to remove.
+        """
+        removed = set(project_ids)
+        with self._lock:
+            self._remove_rows(
+                [
+                    position
+                    for position, vector_id in enumerate(self.ids)
+                    if split_chunk_id(vector_id)[0] in removed
+                ]
+            )
+
+    def _remove_rows(self, positions: List[int]) -> None:
+        """Remove rows from the index and rebuild an IVF index; the caller holds the lock.
+
+        Args:
+            positions (List[int]): The rows to remove.
+        """
+        if not positions:
+            return
+        keep = np.ones(len(self.ids), dtype=bool)
+        keep[positions] = False
+        self.embeddings = self.embeddings[keep]
+        self.ids = [value for value, kept in zip(self.ids, keep) if kept]
+        self.titles = [value for value, kept in zip(self.titles, keep) if kept]
+        self.objectives = [value for value, kept in zip(self.objectives, keep) if kept]
+        self.dates = [value for value, kept in zip(self.dates, keep) if kept]
+        self._positions = {project_id: i for i, project_id in enumerate(self.ids)}
+        if self.ann_index is not None:
+            self.ann_index = self._load_ann_index()
+
+    def flush(self) -> None:
+        """Save the index to the configured store path.
+
+        Raises:
+            ValueError: If the store path is not an .npz archive.
+        """
+        if not self.path.endswith(".npz"):
+            raise ValueError(
+                f"Cannot write the index to {self.path}; configure an .npz store path"
+            )
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.save(self.path)
+
+    def _load_ann_index(self) -> Optional[IVFIndex]:
+        """Load the configured approximate index, building and saving it if it is missing or stale.
+
+        Returns:
+            Optional[IVFIndex]: The index, or None if no approximate index is configured.
+
+        Raises:
+            ValueError: If the configured index type is not supported.
+        """
+        ann_config = self.config.get(
+            "horizon-scope", "vector-search-service", "store", "ann", default=None
+        )
+        if not ann_config or len(self.embeddings) == 0:
+            return None
+        ann_type = ann_config.get("type", "ivf")
+        if ann_type != "ivf":
+            raise ValueError(f"Unsupported approximate index type: {ann_type}")
+
+        corpus_fingerprint = fingerprint(self.ids, self.embeddings)
+        nprobe = ann_config.get("nprobe", 8)
+        path = ann_config.get("path")
+        if path and os.path.exists(path):
+            index = IVFIndex.load(path)
+            if index.fingerprint == corpus_fingerprint:
+                index.nprobe = nprobe
+                return index
+
+        index = IVFIndex.build(
+            self.embeddings,
+            n_lists=ann_config.get("n_lists"),
+            nprobe=nprobe,
+            fingerprint=corpus_fingerprint,
+        )
+        if path:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            index.save(path)
+        return index
+
+    def _to_project(self, position: int, similarity: float) -> Project:
+        """Build the Project stored at a row of the index.
+
+        Args:
+            position (int): Row of the project in the index.
+            similarity (float): Cosine similarity of the project to the query.
+
+        Returns:
+            Project: The project with its similarity filled in.
+        """
+        return Project(
+            id=split_chunk_id(self.ids[position])[0],
+            title=self.titles[position],
+            description=self.objectives[position],
+            content_update_date=self.dates[position],
+            similarity=similarity,
+        )
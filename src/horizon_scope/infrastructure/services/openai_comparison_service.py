@@ -1,37 +1,271 @@
 from __future__ import annotations
-from typing import List, Dict
-from openai import OpenAI
+import asyncio
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, NamedTuple, Optional, Tuple
+import jiter
+from openai import AsyncOpenAI, OpenAI
+from horizon_scope.application.interfaces.async_batch_comparison_service import (
+    AsyncBatchComparisonService,
+)
+from horizon_scope.application.interfaces.async_comparison_service import (
+    AsyncComparisonService,
+)
+from horizon_scope.application.interfaces.batch_comparison_service import (
+    BatchComparisonService,
+)
+from horizon_scope.application.interfaces.async_streaming_comparison_service import (
+    AsyncStreamingComparisonService,
+)
 from horizon_scope.application.interfaces.comparison_service import ComparisonService
-from horizon_scope.domain.entities.comparison import Comparison
+from horizon_scope.application.interfaces.streaming_comparison_service import (
+    ComparisonUpdateCallback,
+    StreamingComparisonService,
+)
+from horizon_scope.application.interfaces.project_summary_store import (
+    ProjectSummaryStore,
+)
+from horizon_scope.domain.entities.comparison import Comparison, ComparisonAnalysis
+from horizon_scope.domain.entities.comparison_batch import (
+    ComparisonAnalysisBatch,
+    ComparisonBatch,
+)
+from horizon_scope.domain.entities.project_summary import ProjectSummary
 from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.batching import token_batches
+from horizon_scope.infrastructure.services.http_transport import HttpTransport
+from horizon_scope.infrastructure.services.rate_limiter import RateLimiter
+from horizon_scope.infrastructure.services.token_counter import (
+    count_message_tokens,
+    count_tokens,
+    fit_to_tokens,
+    split_token_budget,
+)
+from horizon_scope.infrastructure.services.usage_tracker import UsageTracker
+
+logger = logging.getLogger(__name__)
+
+# Tokens shared by the two descriptions of a comparison
+DEFAULT_MAX_INPUT_TOKENS = 3000
+# Bump whenever the comparison prompt changes so that cached comparisons are invalidated
+PROMPT_VERSION = "2"
+PROMPT_ID = f"horizon-scope-comparison@{PROMPT_VERSION}"
+SYSTEM_PROMPT = "You are a highly experienced academic research assistant specializing in EU Horizon projects. Your task is to conduct a thorough, scholarly comparison between two project descriptions, providing a structured and detailed analysis with an emphasis on their similarities and differences."
+INSTRUCTIONS_HEADER = "The user provides an **Input Project** and one or more **Existing EU Horizon Projects**. Conduct an in-depth, academic-level comparison of the input project with each existing project, independently of any other existing project. Structure each analysis as follows:"
+SUMMARY_SECTION = """**Summary**:  
+   Provide a concise, one-sentence summary of the existing EU Horizon project, focusing on its primary goals, innovative elements, and alignment with Horizon objectives."""
+ANALYSIS_SECTIONS = [
+    """**Commonalities**:  
+   Discuss the significant similarities between the two projects, focusing on aspects such as:
+   - **Research Objectives**: Shared ambitions and overarching goals.
+   - **Methodological Approaches**: Similarities in research strategies or methods used.
+   - **Technological Innovations**: Identify overlapping innovations or technologies.
+   - **Potential Social or Economic Impacts**: Common expected societal or economic effects.
+   - **Beneficiaries/Stakeholders**: Alignment in terms of intended beneficiaries or stakeholders.""",
+    """**Key Differences**:  
+   Highlight and analyze the main differences between the projects, considering:
+   - **Scope and Scale of Research**: Compare the scope and depth of research activities.
+   - **Unique Methodologies/Technologies**: Specific differences in methods or technologies used.
+   - **Innovative Contributions**: Identify distinctive breakthroughs or novel approaches.
+   - **Geographical or Demographic Focus**: Explore differences in the regional or demographic focus.
+   - **Alignment with EU Horizon Objectives**: How each project aligns with Horizon Europe’s specific priorities.""",
+    """**Similarity Score** (0 to 1 scale):  
+   Assign a similarity score between 0 and 1, where 0 represents no similarity and 1 represents nearly identical projects.  
+   **Instructions**:
+   - **Weighting Factors**: Give more weight to core aspects like research objectives, while factors like geographic focus or stakeholder groups can receive less weight.
+   - **Balancing**: Balance similarities and differences to ensure the final score reflects the overall resemblance between the projects.""",
+    """**Confidence Score** (0 to 1 scale):  
+   Assign a confidence score using the following formula:
+
+   Confidence Score = (Input Quality * 0.25) + (Comparative Clarity * 0.20) + (Domain Knowledge Alignment * 0.20) + (Consistency * 0.15) + (Quantifiability * 0.20)
+
+   - **Input Quality** (0.25): Rate from 0-1 based on the clarity, completeness, and specificity of both project descriptions.
+   - **Comparative Clarity** (0.20): How clear and discernible are the similarities and differences between the two projects?
+   - **Domain Knowledge Alignment** (0.20): How well do the projects align with EU Horizon’s overall goals and research focus?
+   - **Consistency** (0.15): Are both project descriptions internally consistent and coherent?
+   - **Quantifiability** (0.20): How many aspects of the comparison are measurable or objective?
 
-MAX_PROJECT_LENGTH = 5000
+   Round the final confidence score to two decimal places.""",
+    """**Justification**:  
+   Provide a thorough explanation for the assigned similarity and confidence scores, referring to specific elements from both project descriptions to justify your assessment.""",
+]
+INSTRUCTIONS_FOOTER = "Ensure your analysis remains objective, precise, and scholarly throughout, focusing on the comparative aspects while maintaining a formal academic tone.\n"
 
 
-class OpenAIComparisonService(ComparisonService):
+def build_instructions(sections: List[str]) -> str:
+    """Number the sections of an analysis and wrap them in the shared header and footer.
+
+    Args:
+        sections (List[str]): The sections, in order.
+
+    Returns:
+        str: The instructions of the comparison prompt.
+    """
+    numbered = "\n\n".join(
+        f"{number}. {section}" for number, section in enumerate(sections, start=1)
+    )
+    return f"{INSTRUCTIONS_HEADER}\n\n{numbered}\n\n{INSTRUCTIONS_FOOTER}"
+
+
+COMPARISON_INSTRUCTIONS = build_instructions([SUMMARY_SECTION, *ANALYSIS_SECTIONS])
+# Used when the summary of every existing project is precomputed
+ANALYSIS_INSTRUCTIONS = build_instructions(ANALYSIS_SECTIONS)
+# Identical for every request, so the provider can serve it from its prompt cache
+STATIC_PROMPT = f"{SYSTEM_PROMPT}\n\n{COMPARISON_INSTRUCTIONS}"
+ANALYSIS_PROMPT = f"{SYSTEM_PROMPT}\n\n{ANALYSIS_INSTRUCTIONS}"
+
+
+def parse_partial_json(snapshot: str) -> Dict[str, Any]:
+    """Parse the beginning of a streamed JSON object.
+
+    Incomplete strings are returned as far as they are received, so long text fields can be
+    displayed while they are generated. jiter is installed with the openai client, which uses
+    it for the same purpose.
+
+    Args:
+        snapshot (str): The JSON text received so far.
+
+    Returns:
+        Dict[str, Any]: The fields parsed so far, or an empty dict if there are none yet.
+    """
+    try:
+        parsed = jiter.from_json(
+            snapshot.encode("utf-8"), partial_mode="trailing-strings"
+        )
+    except ValueError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+class ExistingProject(NamedTuple):
+    """An existing project prepared for a comparison request."""
+
+    description: str
+    summary: Optional[ProjectSummary]
+
+
+class OpenAIComparisonService(
+    ComparisonService,
+    AsyncComparisonService,
+    BatchComparisonService,
+    AsyncBatchComparisonService,
+    StreamingComparisonService,
+    AsyncStreamingComparisonService,
+):
     """Service for comparing project descriptions using OpenAI's language model.
 
     This service uses OpenAI to generate detailed comparisons between two project descriptions,
-    providing insights into their similarities and differences.
+    providing insights into their similarities and differences. Comparisons can be requested
+    both synchronously and from an asyncio event loop.
+
+    compare_many sends up to batch_max_items existing projects per request, within a budget of
+    batch_max_tokens description tokens, so the instructions and the user's project are sent
+    once per batch instead of once per project. Every comparison of a batch is validated on its
+    own; projects the model skipped are compared individually.
+
+    Every prompt starts with the same static system message (STATIC_PROMPT) and only the user
+    message holds the projects, so the provider's prefix cache can reuse the instructions. The
+    token usage of every response, including cached prompt tokens, is recorded in usage.
+
+    With a summary store, the one-sentence summary of an existing project is taken from its
+    precomputed entry and the model is asked for the rest of the analysis only (ANALYSIS_PROMPT),
+    which saves the output tokens of the summary on every comparison.
+
+    compare_streaming streams the structured output and reports the fields parsed so far after
+    every chunk, starting with the stored summary if there is one, and returns the validated
+    comparison at the end. The fields arrive in the order of the Comparison schema.
+
+    Descriptions are never rejected for their length. Both descriptions of a comparison share
+    max_input_tokens tokens (see split_token_budget) and longer ones are cut at a sentence
+    boundary, so every comparison runs with a bounded prompt size.
+
+    Requests go through a RateLimiter keyed by the model, which queues them within the quota
+    and retries rate limits and transient errors. A streamed comparison that fails midway is
+    restarted, so on_update may see the fields from the start again.
 
     Attributes:
         config (ConfigManager): Configuration manager for accessing API keys and model information.
         client (OpenAI): OpenAI client for generating comparisons.
+        async_client (AsyncOpenAI): Asynchronous OpenAI client for generating comparisons.
         model (str): The model used for generating the comparison.
+        prompt_version (str): Version of the comparison prompt template.
+        prompt_id (str): Identifier of the prompt template, including its version.
+        max_input_tokens (int): Tokens shared by the two descriptions of a comparison.
+        usage (UsageTracker): Token usage and cost of all requests.
+        batch_max_items (int): Maximum number of existing projects per batch request.
+        batch_max_tokens (int): Maximum number of existing-project tokens per batch request.
+        max_concurrency (int): Maximum number of batch requests in flight at once.
+        summaries (Optional[ProjectSummaryStore]): Precomputed summaries of existing projects.
+        rate_limiter (RateLimiter): Rate limiter and retry layer of the requests.
+        rate_limit_key (str): The rate limiter key of the model.
+        transport (HttpTransport): Pooled transport of the OpenAI clients.
     """
 
-    def __init__(self, config: ConfigManager) -> None:
+    def __init__(
+        self,
+        config: ConfigManager,
+        summaries: Optional[ProjectSummaryStore] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[HttpTransport] = None,
+    ) -> None:
         """Initialize OpenAIComparisonService with configuration settings.
 
         Args:
             config (ConfigManager): Configuration manager for the service.
+            summaries (Optional[ProjectSummaryStore]): Precomputed summaries of existing projects. Defaults to None.
+            rate_limiter (Optional[RateLimiter]): Rate limiter shared with other services. Defaults to None (a limiter of its own).
+            transport (Optional[HttpTransport]): Transport shared with other services. Defaults to None (a transport of its own).
         """
         self.config = config
+        self.summaries = summaries
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.transport = transport or HttpTransport(self.rate_limiter)
         openai_api_key = self.config.get(
             "horizon-scope", "comparison-service", "api_key"
         )
-        self.client = OpenAI(api_key=openai_api_key)
+        base_url = self.config.get("horizon-scope", "comparison-service", "base_url")
+        # Retries are left to the rate limiter, which also reads the rate-limit headers
+        self.client = OpenAI(
+            api_key=openai_api_key,
+            base_url=base_url,
+            max_retries=0,
+            timeout=self.transport.timeout,
+            http_client=self.transport.http_client(base_url),
+        )
+        self.async_client = AsyncOpenAI(
+            api_key=openai_api_key,
+            base_url=base_url,
+            max_retries=0,
+            timeout=self.transport.timeout,
+            http_client=self.transport.async_http_client(),
+        )
         self.model = self.config.get("horizon-scope", "comparison-service", "model")
+        self.rate_limit_key = f"openai:{self.model}"
+        self.prompt_version = PROMPT_VERSION
+        self.prompt_id = PROMPT_ID
+        self.max_input_tokens = self.config.get(
+            "horizon-scope",
+            "comparison-service",
+            "max_input_tokens",
+            default=DEFAULT_MAX_INPUT_TOKENS,
+        )
+        self.usage = UsageTracker(
+            self.config.get(
+                "horizon-scope", "comparison-service", "pricing", default=None
+            )
+        )
+        batch_config = (
+            self.config.get(
+                "horizon-scope", "comparison-service", "batch", default=None
+            )
+            or {}
+        )
+        self.batch_max_items = batch_config.get("max_items", 5)
+        self.batch_max_tokens = batch_config.get("max_tokens", 12000)
+        self.max_concurrency = self.config.get(
+            "horizon-scope", "comparison-service", "max_concurrency", default=1
+        )
 
     def compare(self, my_project: str, existing_project: str) -> Comparison:
         """Compare two project descriptions using OpenAI.
@@ -44,27 +278,544 @@ class OpenAIComparisonService(ComparisonService):
             Comparison: A Comparison object containing the results of the comparison.
 
         Raises:
-            ValueError: If either project description is empty or exceeds the maximum length.
+            ValueError: If either project description is empty.
         """
-        self._validate_input(my_project, "My project")
-        self._validate_input(existing_project, "Existing project")
+        return self._compare(*self._prepare_inputs(my_project, existing_project))
+
+    async def acompare(self, my_project: str, existing_project: str) -> Comparison:
+        """Asynchronously compare two project descriptions using OpenAI.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_project (str): Description of the existing project.
+
+        Returns:
+            Comparison: A Comparison object containing the results of the comparison.
+
+        Raises:
+            ValueError: If either project description is empty.
+        """
+        return await self._acompare(
+            *self._prepare_inputs(my_project, existing_project)
+        )
+
+    def compare_streaming(
+        self,
+        my_project: str,
+        existing_project: str,
+        on_update: ComparisonUpdateCallback,
+    ) -> Comparison:
+        """Compare two project descriptions and report the fields as they are generated.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_project (str): Description of the existing project.
+            on_update (ComparisonUpdateCallback): Called with the fields generated so far whenever they change.
+
+        Returns:
+            Comparison: The complete, validated comparison.
+
+        Raises:
+            ValueError: If either project description is empty.
+        """
+        my_project, existing_project, summary = self._prepare_inputs(
+            my_project, existing_project
+        )
+        initial = self._report_partial("", summary, {}, on_update)
+        messages = self._create_comparison_prompt(
+            my_project, existing_project, summarized=summary is not None
+        )
+
+        def stream_completion() -> Any:
+            fields = initial
+            with self.client.beta.chat.completions.stream(
+                model=self.model,
+                messages=messages,
+                response_format=Comparison if summary is None else ComparisonAnalysis,
+                stream_options={"include_usage": True},
+            ) as stream:
+                for event in stream:
+                    if event.type == "content.delta":
+                        fields = self._report_partial(
+                            event.snapshot, summary, fields, on_update
+                        )
+                return stream.get_final_completion()
+
+        completion = self.rate_limiter.call(
+            self.rate_limit_key,
+            stream_completion,
+            tokens=count_message_tokens(messages, self.model),
+        )
+        return self._parse_completion(completion, summary)
+
+    async def acompare_streaming(
+        self,
+        my_project: str,
+        existing_project: str,
+        on_update: ComparisonUpdateCallback,
+    ) -> Comparison:
+        """Asynchronously compare two project descriptions and report the fields as they are generated.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_project (str): Description of the existing project.
+            on_update (ComparisonUpdateCallback): Called with the fields generated so far whenever they change.
+
+        Returns:
+            Comparison: The complete, validated comparison.
+
+        Raises:
+            ValueError: If either project description is empty.
+        """
+        my_project, existing_project, summary = self._prepare_inputs(
+            my_project, existing_project
+        )
+        initial = self._report_partial("", summary, {}, on_update)
+        messages = self._create_comparison_prompt(
+            my_project, existing_project, summarized=summary is not None
+        )
+
+        async def stream_completion() -> Any:
+            fields = initial
+            async with self.async_client.beta.chat.completions.stream(
+                model=self.model,
+                messages=messages,
+                response_format=Comparison if summary is None else ComparisonAnalysis,
+                stream_options={"include_usage": True},
+            ) as stream:
+                async for event in stream:
+                    if event.type == "content.delta":
+                        fields = self._report_partial(
+                            event.snapshot, summary, fields, on_update
+                        )
+                return await stream.get_final_completion()
+
+        completion = await self.rate_limiter.acall(
+            self.rate_limit_key,
+            stream_completion,
+            tokens=count_message_tokens(messages, self.model),
+        )
+        return self._parse_completion(completion, summary)
+
+    def compare_many(
+        self, my_project: str, existing_projects: List[str]
+    ) -> List[Comparison]:
+        """Compare a project with several existing projects in batched requests.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_projects (List[str]): Descriptions of the existing projects.
+
+        Returns:
+            List[Comparison]: One comparison per existing project, in the same order.
+
+        Raises:
+            ValueError: If any project description is empty.
+        """
+        my_project, batches = self._prepare_batches(my_project, existing_projects)
+        workers = min(self.max_concurrency, len(batches))
+        if workers <= 1:
+            results = [self._compare_batch(my_project, batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Run every batch in a copy of the caller's context to keep usage scopes
+                results = list(
+                    executor.map(
+                        lambda batch, context: context.run(
+                            self._compare_batch, my_project, batch
+                        ),
+                        batches,
+                        [contextvars.copy_context() for _ in batches],
+                    )
+                )
+        return [comparison for result in results for comparison in result]
+
+    async def acompare_many(
+        self, my_project: str, existing_projects: List[str]
+    ) -> List[Comparison]:
+        """Asynchronously compare a project with several existing projects in batched requests.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_projects (List[str]): Descriptions of the existing projects.
+
+        Returns:
+            List[Comparison]: One comparison per existing project, in the same order.
+
+        Raises:
+            ValueError: If any project description is empty.
+        """
+        my_project, batches = self._prepare_batches(my_project, existing_projects)
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        async def compare_batch(batch: List[ExistingProject]) -> List[Comparison]:
+            async with semaphore:
+                return await self._acompare_batch(my_project, batch)
+
+        results = await asyncio.gather(*(compare_batch(batch) for batch in batches))
+        return [comparison for result in results for comparison in result]
+
+    def _compare(
+        self,
+        my_project: str,
+        existing_project: str,
+        summary: Optional[ProjectSummary] = None,
+    ) -> Comparison:
+        """Request a single comparison of two prepared descriptions.
+
+        Args:
+            my_project (str): Fitted description of the user's project.
+            existing_project (str): Fitted description of the existing project.
+            summary (Optional[ProjectSummary]): Precomputed summary of the existing project. Defaults to None.
+
+        Returns:
+            Comparison: The comparison, with the precomputed summary if one was given.
+        """
+        completion = self._parse_request(
+            messages=self._create_comparison_prompt(
+                my_project, existing_project, summarized=summary is not None
+            ),
+            response_format=Comparison if summary is None else ComparisonAnalysis,
+        )
+        return self._parse_completion(completion, summary)
+
+    async def _acompare(
+        self,
+        my_project: str,
+        existing_project: str,
+        summary: Optional[ProjectSummary] = None,
+    ) -> Comparison:
+        """Asynchronously request a single comparison of two prepared descriptions.
+
+        Args:
+            my_project (str): Fitted description of the user's project.
+            existing_project (str): Fitted description of the existing project.
+            summary (Optional[ProjectSummary]): Precomputed summary of the existing project. Defaults to None.
+
+        Returns:
+            Comparison: The comparison, with the precomputed summary if one was given.
+        """
+        completion = await self._aparse_request(
+            messages=self._create_comparison_prompt(
+                my_project, existing_project, summarized=summary is not None
+            ),
+            response_format=Comparison if summary is None else ComparisonAnalysis,
+        )
+        return self._parse_completion(completion, summary)
+
+    def _parse_request(self, messages: List[Dict[str, str]], **kwargs: Any) -> Any:
+        """Request a structured completion through the rate limiter.
+
+        Args:
+            messages (List[Dict[str, str]]): The chat messages.
+            **kwargs: Further arguments of the parse request, such as response_format.
+
+        Returns:
+            Any: The parsed completion.
+        """
+        return self.rate_limiter.call(
+            self.rate_limit_key,
+            self.client.beta.chat.completions.parse,
+            model=self.model,
+            messages=messages,
+            tokens=count_message_tokens(messages, self.model),
+            **kwargs,
+        )
 
-        messages = self._create_comparison_prompt(my_project, existing_project)
+    async def _aparse_request(
+        self, messages: List[Dict[str, str]], **kwargs: Any
+    ) -> Any:
+        """Asynchronously request a structured completion through the rate limiter.
+
+        Args:
+            messages (List[Dict[str, str]]): The chat messages.
+            **kwargs: Further arguments of the parse request, such as response_format.
 
-        # completion = self.client.chat.completions.create(
-        #     model=self.model,
-        #     messages=messages,
-        #     response_format={"type": "json_object"},
-        # )
-        completion = self.client.beta.chat.completions.parse(
+        Returns:
+            Any: The parsed completion.
+        """
+        return await self.rate_limiter.acall(
+            self.rate_limit_key,
+            self.async_client.beta.chat.completions.parse,
             model=self.model,
             messages=messages,
-            response_format=Comparison,
+            tokens=count_message_tokens(messages, self.model),
+            **kwargs,
+        )
+
+    def _prepare_batches(
+        self, my_project: str, existing_projects: List[str]
+    ) -> Tuple[str, List[List[ExistingProject]]]:
+        """Validate and fit all descriptions and group the existing projects into batches.
+
+        The user's project is fitted against the longest existing project, and every existing
+        project gets the rest of the input budget, so each pair fits max_input_tokens.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_projects (List[str]): Descriptions of the existing projects.
+
+        Returns:
+            Tuple[str, List[List[ExistingProject]]]: The fitted description of the user's
+            project and the fitted existing projects with their stored summaries, grouped in
+            order.
+
+        Raises:
+            ValueError: If any project description is empty.
+        """
+        self._validate_input(my_project, "My project")
+        for existing_project in existing_projects:
+            self._validate_input(existing_project, "Existing project")
+        existing_tokens = [
+            count_tokens(existing_project, self.model)
+            for existing_project in existing_projects
+        ]
+        my_budget, _ = split_token_budget(
+            count_tokens(my_project, self.model),
+            max(existing_tokens, default=0),
+            self.max_input_tokens,
+        )
+        my_project, my_tokens = fit_to_tokens(my_project, my_budget, self.model)
+        existing_budget = self.max_input_tokens - my_tokens
+        fitted = []
+        for existing_project, tokens in zip(existing_projects, existing_tokens):
+            summary = self._stored_summary(existing_project)
+            if tokens > existing_budget:
+                existing_project, tokens = fit_to_tokens(
+                    existing_project, existing_budget, self.model
+                )
+            fitted.append((ExistingProject(existing_project, summary), tokens))
+        batches = token_batches(
+            fitted,
+            max_tokens=self.batch_max_tokens,
+            max_items=max(self.batch_max_items, 1),
+            count=lambda item: item[1],
+        )
+        return my_project, [[project for project, _ in batch] for batch in batches]
+
+    def _compare_batch(
+        self, my_project: str, batch: List[ExistingProject]
+    ) -> List[Comparison]:
+        """Compare a project with one batch of existing projects.
+
+        Summaries are only left out of the request if all projects of the batch have one.
+
+        Args:
+            my_project (str): Fitted description of the user's project.
+            batch (List[ExistingProject]): Fitted existing projects and their stored summaries.
+
+        Returns:
+            List[Comparison]: One comparison per existing project, in the same order.
+        """
+        if len(batch) == 1:
+            return [self._compare(my_project, *batch[0])]
+        summarized = all(project.summary is not None for project in batch)
+        completion = self._parse_request(
+            messages=self._create_batch_comparison_prompt(
+                my_project,
+                [project.description for project in batch],
+                summarized=summarized,
+            ),
+            response_format=(
+                ComparisonAnalysisBatch if summarized else ComparisonBatch
+            ),
+        )
+        comparisons = self._parse_batch_completion(completion, batch, summarized)
+        return [
+            (
+                comparison
+                if comparison is not None
+                else self._compare(my_project, *existing_project)
+            )
+            for comparison, existing_project in zip(comparisons, batch)
+        ]
+
+    async def _acompare_batch(
+        self, my_project: str, batch: List[ExistingProject]
+    ) -> List[Comparison]:
+        """Asynchronously compare a project with one batch of existing projects.
+
+        Args:
+            my_project (str): Fitted description of the user's project.
+            batch (List[ExistingProject]): Fitted existing projects and their stored summaries.
+
+        Returns:
+            List[Comparison]: One comparison per existing project, in the same order.
+        """
+        if len(batch) == 1:
+            return [await self._acompare(my_project, *batch[0])]
+        summarized = all(project.summary is not None for project in batch)
+        completion = await self._aparse_request(
+            messages=self._create_batch_comparison_prompt(
+                my_project,
+                [project.description for project in batch],
+                summarized=summarized,
+            ),
+            response_format=(
+                ComparisonAnalysisBatch if summarized else ComparisonBatch
+            ),
+        )
+        comparisons = self._parse_batch_completion(completion, batch, summarized)
+        missing = [
+            self._acompare(my_project, *existing_project)
+            for comparison, existing_project in zip(comparisons, batch)
+            if comparison is None
+        ]
+        retried = iter(await asyncio.gather(*missing))
+        return [
+            comparison if comparison is not None else next(retried)
+            for comparison in comparisons
+        ]
+
+    def _parse_batch_completion(
+        self, completion: Any, batch: List[ExistingProject], summarized: bool = False
+    ) -> List[Optional[Comparison]]:
+        """Match the comparisons of a batch completion to the requested projects.
+
+        Comparisons with an index outside the batch and repeated indexes are ignored.
+
+        Args:
+            completion (Any): The completion returned by the OpenAI client.
+            batch (List[ExistingProject]): The existing projects of the batch.
+            summarized (bool): Whether the stored summaries were left out of the request. Defaults to False.
+
+        Returns:
+            List[Optional[Comparison]]: The comparison of every project, or None where the model returned none.
+        """
+        self.usage.record(getattr(completion, "usage", None))
+        parsed = completion.choices[0].message.parsed
+        size = len(batch)
+        comparisons: List[Optional[Comparison]] = [None] * size
+        for item in parsed.comparisons if parsed is not None else []:
+            position = item.index - 1
+            if 0 <= position < size and comparisons[position] is None:
+                fields = item.model_dump(exclude={"index"})
+                if summarized:
+                    fields["summary"] = batch[position].summary.summary
+                comparisons[position] = Comparison.model_validate(fields)
+        missing = comparisons.count(None)
+        if missing:
+            logger.warning(
+                "Batch comparison returned no result for %d of %d projects",
+                missing,
+                size,
+            )
+        return comparisons
+
+    @staticmethod
+    def _report_partial(
+        snapshot: str,
+        summary: Optional[ProjectSummary],
+        previous: Dict[str, Any],
+        on_update: ComparisonUpdateCallback,
+    ) -> Dict[str, Any]:
+        """Parse a streamed snapshot and report its fields if they changed.
+
+        Args:
+            snapshot (str): The JSON text received so far.
+            summary (Optional[ProjectSummary]): The stored summary the request left out, if any.
+            previous (Dict[str, Any]): The fields reported last.
+            on_update (ComparisonUpdateCallback): The callback to report the fields to.
+
+        Returns:
+            Dict[str, Any]: The fields reported last, including this snapshot.
+        """
+        fields = parse_partial_json(snapshot)
+        if summary is not None:
+            fields = {"summary": summary.summary, **fields}
+        if fields and fields != previous:
+            on_update(fields)
+            return fields
+        return previous
+
+    def _prepare_inputs(
+        self, my_project: str, existing_project: str
+    ) -> Tuple[str, str, Optional[ProjectSummary]]:
+        """Validate and fit both descriptions and look up the stored summary.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_project (str): Description of the existing project.
+
+        Returns:
+            Tuple[str, str, Optional[ProjectSummary]]: The fitted descriptions and the stored
+            summary of the existing project, if any.
+
+        Raises:
+            ValueError: If either project description is empty.
+        """
+        self._validate_input(my_project, "My project")
+        self._validate_input(existing_project, "Existing project")
+        summary = self._stored_summary(existing_project)
+        my_project, existing_project = self._fit_inputs(my_project, existing_project)
+        return my_project, existing_project, summary
+
+    def _stored_summary(self, existing_project: str) -> Optional[ProjectSummary]:
+        """Look up the precomputed summary of an existing project.
+
+        A failing store is logged and treated as a miss, so comparisons still run.
+
+        Args:
+            existing_project (str): The full description of the existing project.
+
+        Returns:
+            Optional[ProjectSummary]: The stored summary, or None.
+        """
+        if self.summaries is None:
+            return None
+        try:
+            return self.summaries.get(existing_project)
+        except Exception as error:
+            logger.warning("Project summary lookup failed: %s", error)
+            return None
+
+    def _fit_inputs(self, my_project: str, existing_project: str) -> Tuple[str, str]:
+        """Shorten two descriptions so that together they fit max_input_tokens.
+
+        Args:
+            my_project (str): Description of the user's project.
+            existing_project (str): Description of the existing project.
+
+        Returns:
+            Tuple[str, str]: The descriptions, cut at sentence boundaries where needed.
+        """
+        my_tokens = count_tokens(my_project, self.model)
+        existing_tokens = count_tokens(existing_project, self.model)
+        if my_tokens + existing_tokens <= self.max_input_tokens:
+            return my_project, existing_project
+        my_budget, existing_budget = split_token_budget(
+            my_tokens, existing_tokens, self.max_input_tokens
         )
+        logger.debug(
+            "Fitting descriptions of %d and %d tokens into %d and %d tokens",
+            my_tokens,
+            existing_tokens,
+            my_budget,
+            existing_budget,
+        )
+        my_project, _ = fit_to_tokens(my_project, my_budget, self.model)
+        existing_project, _ = fit_to_tokens(
+            existing_project, existing_budget, self.model
+        )
+        return my_project, existing_project
 
-        # response_content = completion.choices[0].message.content
-        # return Comparison.model_validate_json(response_content)
-        return completion.choices[0].message.parsed
+    def _parse_completion(
+        self, completion: Any, summary: Optional[ProjectSummary] = None
+    ) -> Comparison:
+        """Extract the parsed Comparison from a structured-output completion.
+
+        Args:
+            completion (Any): The completion returned by the OpenAI client.
+            summary (Optional[ProjectSummary]): The precomputed summary the request left out. Defaults to None.
+
+        Returns:
+            Comparison: The parsed comparison, completed with the precomputed summary.
+        """
+        self.usage.record(getattr(completion, "usage", None))
+        parsed = completion.choices[0].message.parsed
+        if summary is None:
+            return parsed
+        return Comparison(summary=summary.summary, **parsed.model_dump())
 
     def _validate_input(self, project: str, project_name: str) -> None:
         """Validate the project description input.
@@ -74,23 +825,23 @@ class OpenAIComparisonService(ComparisonService):
             project_name (str): The name of the project (for error messages).
 
         Raises:
-            ValueError: If the project description is empty or exceeds the maximum length.
+            ValueError: If the project description is empty.
         """
         if not project.strip():
             raise ValueError(f"{project_name} description cannot be empty")
-        if len(project) > MAX_PROJECT_LENGTH:
-            raise ValueError(
-                f"{project_name} description exceeds maximum length of {MAX_PROJECT_LENGTH} characters"
-            )
 
     def _create_comparison_prompt(
-        self, my_project: str, existing_project: str
+        self, my_project: str, existing_project: str, summarized: bool = False
     ) -> List[Dict[str, str]]:
         """Create the prompt for the comparison model.
 
+        The instructions form a static system message, and both projects follow in the user
+        message, so every request starts with the same cacheable prefix.
+
         Args:
             my_project (str): Description of the user's project.
             existing_project (str): Description of the existing project.
+            summarized (bool): Whether the summary section is left out. Defaults to False.
 
         Returns:
             List[Dict[str, str]]: A list of messages forming the prompt for the OpenAI model.
@@ -98,60 +849,50 @@ class OpenAIComparisonService(ComparisonService):
         return [
             {
                 "role": "system",
-                "content": "You are a highly experienced academic research assistant specializing in EU Horizon projects. Your task is to conduct a thorough, scholarly comparison between two project descriptions, providing a structured and detailed analysis with an emphasis on their similarities and differences.",
+                "content": ANALYSIS_PROMPT if summarized else STATIC_PROMPT,
             },
             {
                 "role": "user",
-                "content": f"""
-Conduct an in-depth, academic-level comparison of the following two project descriptions:
-
-1. **Input Project**: {my_project}
-2. **Existing EU Horizon Project**: {existing_project}
-
-Please structure your analysis as follows:
-
-1. **Summary**:  
-   Provide a concise, one-sentence summary of the existing EU Horizon project, focusing on its primary goals, innovative elements, and alignment with Horizon objectives.
+                "content": f"""**Input Project**: {my_project}
 
-2. **Commonalities**:  
-   Discuss the significant similarities between the two projects, focusing on aspects such as:
-   - **Research Objectives**: Shared ambitions and overarching goals.
-   - **Methodological Approaches**: Similarities in research strategies or methods used.
-   - **Technological Innovations**: Identify overlapping innovations or technologies.
-   - **Potential Social or Economic Impacts**: Common expected societal or economic effects.
-   - **Beneficiaries/Stakeholders**: Alignment in terms of intended beneficiaries or stakeholders.
-
-3. **Key Differences**:  
-   Highlight and analyze the main differences between the projects, considering:
-   - **Scope and Scale of Research**: Compare the scope and depth of research activities.
-   - **Unique Methodologies/Technologies**: Specific differences in methods or technologies used.
-   - **Innovative Contributions**: Identify distinctive breakthroughs or novel approaches.
-   - **Geographical or Demographic Focus**: Explore differences in the regional or demographic focus.
-   - **Alignment with EU Horizon Objectives**: How each project aligns with Horizon Europe’s specific priorities.
-
-4. **Similarity Score** (0 to 1 scale):  
-   Assign a similarity score between 0 and 1, where 0 represents no similarity and 1 represents nearly identical projects.  
-   **Instructions**:
-   - **Weighting Factors**: Give more weight to core aspects like research objectives, while factors like geographic focus or stakeholder groups can receive less weight.
-   - **Balancing**: Balance similarities and differences to ensure the final score reflects the overall resemblance between the projects.
+**Existing EU Horizon Project**: {existing_project}""",
+            },
+        ]
 
-5. **Confidence Score** (0 to 1 scale):  
-   Assign a confidence score using the following formula:
+    def _create_batch_comparison_prompt(
+        self,
+        my_project: str,
+        existing_projects: List[str],
+        summarized: bool = False,
+    ) -> List[Dict[str, str]]:
+        """Create the prompt comparing a project with several existing projects.
 
-   Confidence Score = (Input Quality * 0.25) + (Comparative Clarity * 0.20) + (Domain Knowledge Alignment * 0.20) + (Consistency * 0.15) + (Quantifiability * 0.20)
+        The system message is the same as for single comparisons. The existing projects are
+        numbered from 1, and the model returns the number of the project with every comparison.
 
-   - **Input Quality** (0.25): Rate from 0-1 based on the clarity, completeness, and specificity of both project descriptions.
-   - **Comparative Clarity** (0.20): How clear and discernible are the similarities and differences between the two projects?
-   - **Domain Knowledge Alignment** (0.20): How well do the projects align with EU Horizon’s overall goals and research focus?
-   - **Consistency** (0.15): Are both project descriptions internally consistent and coherent?
-   - **Quantifiability** (0.20): How many aspects of the comparison are measurable or objective?
+        Args:
+            my_project (str): Description of the user's project.
+            existing_projects (List[str]): Descriptions of the existing projects.
+            summarized (bool): Whether the summary section is left out. Defaults to False.
 
-   Round the final confidence score to two decimal places.
+        Returns:
+            List[Dict[str, str]]: A list of messages forming the prompt for the OpenAI model.
+        """
+        existing = "\n\n".join(
+            f"**Existing EU Horizon Project [{number}]**: {description}"
+            for number, description in enumerate(existing_projects, start=1)
+        )
+        return [
+            {
+                "role": "system",
+                "content": ANALYSIS_PROMPT if summarized else STATIC_PROMPT,
+            },
+            {
+                "role": "user",
+                "content": f"""**Input Project**: {my_project}
 
-6. **Justification**:  
-   Provide a thorough explanation for the assigned similarity and confidence scores, referring to specific elements from both project descriptions to justify your assessment.
+{existing}
 
-Ensure your analysis remains objective, precise, and scholarly throughout, focusing on the comparative aspects while maintaining a formal academic tone.
-""",
+Return one comparison per existing project, with its number as `index`.""",
             },
         ]
@@ -0,0 +1,153 @@
+from __future__ import annotations
+from openai import AsyncOpenAI, OpenAI
+from typing import List, Optional
+from horizon_scope.application.interfaces.embedding_service import EmbeddingService
+from horizon_scope.infrastructure.cache.embedding_cache import EmbeddingCache
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.http_transport import HttpTransport
+from horizon_scope.infrastructure.services.rate_limiter import RateLimiter
+from horizon_scope.infrastructure.services.token_counter import count_tokens
+
+
+class OpenAIEmbeddingService(EmbeddingService):
+    """Service for generating text embeddings using OpenAI.
+
+    Embeddings of previously seen texts are served from an EmbeddingCache. Requests go through
+    a RateLimiter keyed by the model, which also takes over the retries of the OpenAI client.
+    The clients come from an HttpTransport, whose connection pool they share with the other
+    services.
+
+    Attributes:
+        config (ConfigManager): Configuration manager for accessing API keys and model information.
+        client (OpenAI): OpenAI client for generating embeddings.
+        async_client (AsyncOpenAI): Asynchronous OpenAI client for generating embeddings.
+        model (str): The model used for generating embeddings.
+        cache (EmbeddingCache): Cache for embeddings of previously seen texts.
+        rate_limiter (RateLimiter): Rate limiter and retry layer of the requests.
+        rate_limit_key (str): The rate limiter key of the model.
+        transport (HttpTransport): Pooled transport of the OpenAI clients.
+    """
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[HttpTransport] = None,
+    ) -> None:
+        """Initialize OpenAIEmbeddingService with configuration settings.
+
+        Args:
+            config (ConfigManager): Configuration manager for the service.
+            rate_limiter (Optional[RateLimiter]): Rate limiter shared with other services. Defaults to None (a limiter of its own).
+            transport (Optional[HttpTransport]): Transport shared with other services. Defaults to None (a transport of its own).
+        """
+        self.config = config
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.transport = transport or HttpTransport(self.rate_limiter)
+        openai_api_key = self.config.get(
+            "horizon-scope", "vector-search-service", "embeddings", "api_key"
+        )
+        base_url = self.config.get(
+            "horizon-scope", "vector-search-service", "embeddings", "base_url"
+        )
+        self.client = OpenAI(
+            api_key=openai_api_key,
+            base_url=base_url,
+            max_retries=0,
+            timeout=self.transport.timeout,
+            http_client=self.transport.http_client(base_url),
+        )
+        self.async_client = AsyncOpenAI(
+            api_key=openai_api_key,
+            base_url=base_url,
+            max_retries=0,
+            timeout=self.transport.timeout,
+            http_client=self.transport.async_http_client(),
+        )
+        self.model = self.config.get(
+            "horizon-scope", "vector-search-service", "embeddings", "model"
+        )
+        self.rate_limit_key = f"openai:{self.model}"
+        cache_config = (
+            self.config.get(
+                "horizon-scope",
+                "vector-search-service",
+                "embeddings",
+                "cache",
+                default=None,
+            )
+            or {}
+        )
+        self.cache = EmbeddingCache(
+            max_entries=cache_config.get("max_entries", 1024),
+            path=cache_config.get("path"),
+            max_disk_entries=cache_config.get("max_disk_entries"),
+        )
+
+    def embed(self, text: str) -> List[float]:
+        """Embed a text, reusing the cached embedding if the text was seen before.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            List[float]: The embedding of the text.
+        """
+        embedding = self.cache.get(text, self.model)
+        if embedding is None:
+            embedding_response = self.rate_limiter.call(
+                self.rate_limit_key,
+                self.client.embeddings.create,
+                model=self.model,
+                input=text,
+                tokens=count_tokens(text, self.model),
+            )
+            embedding = embedding_response.data[0].embedding
+            self.cache.set(text, self.model, embedding)
+        return embedding
+
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts with a single API request.
+
+        Bulk embeddings bypass the cache, which is sized for repeated queries rather than
+        whole corpora.
+
+        Args:
+            texts (List[str]): The texts to embed.
+
+        Returns:
+            List[List[float]]: The embeddings, in the order of the texts.
+        """
+        if not texts:
+            return []
+        embedding_response = self.rate_limiter.call(
+            self.rate_limit_key,
+            self.client.embeddings.create,
+            model=self.model,
+            input=texts,
+            tokens=sum(count_tokens(text, self.model) for text in texts),
+        )
+        data = sorted(embedding_response.data, key=lambda item: item.index)
+        return [item.embedding for item in data]
+
+    async def aembed(self, text: str) -> List[float]:
+        """Asynchronously embed a text, reusing the cached embedding if the text was seen before.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            List[float]: The embedding of the text.
+        """
+        embedding = self.cache.get(text, self.model)
+        if embedding is None:
+            embedding_response = await self.rate_limiter.acall(
+                self.rate_limit_key,
+                self.async_client.embeddings.create,
+                model=self.model,
+                input=text,
+                tokens=count_tokens(text, self.model),
+            )
+            embedding = embedding_response.data[0].embedding
+            self.cache.set(text, self.model, embedding)
+        return embedding
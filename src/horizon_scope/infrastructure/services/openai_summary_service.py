@@ -0,0 +1,212 @@
+from __future__ import annotations
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from openai import OpenAI
+from horizon_scope.application.interfaces.summary_service import SummaryService
+from horizon_scope.domain.entities.project_summary import (
+    ProjectSummary,
+    ProjectSummaryBatch,
+)
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.batching import token_batches
+from horizon_scope.infrastructure.services.openai_comparison_service import (
+    SUMMARY_SECTION,
+)
+from horizon_scope.infrastructure.services.http_transport import HttpTransport
+from horizon_scope.infrastructure.services.rate_limiter import RateLimiter
+from horizon_scope.infrastructure.services.token_counter import (
+    count_message_tokens,
+    fit_to_tokens,
+)
+from horizon_scope.infrastructure.services.usage_tracker import UsageTracker
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PROMPT = f"""You are a highly experienced academic research assistant specializing in EU Horizon projects. The user provides one or more numbered **EU Horizon Projects**. For each project, independently of the others, write:
+
+1. {SUMMARY_SECTION}
+
+2. **Keywords**:  
+   List three to eight short keywords naming the main research topics, methods and technologies of the project.
+
+Return one summary per project, with its number as `index`.
+"""
+
+
+class OpenAISummaryService(SummaryService):
+    """Service for summarizing existing projects in bulk using OpenAI's language model.
+
+    The summary follows the same instructions as the summary section of a comparison, so a
+    precomputed summary can replace the generated one. Descriptions are sent in batches of up
+    to max_items projects within max_tokens description tokens, with up to max_concurrency
+    requests in flight. It reads the comparison-service settings (api key, model, pricing)
+    and the comparison-service.summaries block.
+
+    Attributes:
+        config (ConfigManager): Configuration manager for accessing API keys and model information.
+        client (OpenAI): OpenAI client for generating summaries.
+        model (str): The model used for generating the summaries.
+        usage (UsageTracker): Token usage and cost of all requests.
+        max_items (int): Maximum number of projects per request.
+        max_tokens (int): Maximum number of description tokens per request.
+        max_description_tokens (int): Longer descriptions are cut at a sentence boundary.
+        max_concurrency (int): Maximum number of requests in flight at once.
+        rate_limiter (RateLimiter): Rate limiter and retry layer of the requests.
+        rate_limit_key (str): The rate limiter key of the model.
+        transport (HttpTransport): Pooled transport of the OpenAI client.
+    """
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[HttpTransport] = None,
+    ) -> None:
+        """Initialize OpenAISummaryService with configuration settings.
+
+        Args:
+            config (ConfigManager): Configuration manager for the service.
+            rate_limiter (Optional[RateLimiter]): Rate limiter shared with other services. Defaults to None (a limiter of its own).
+            transport (Optional[HttpTransport]): Transport shared with other services. Defaults to None (a transport of its own).
+        """
+        self.config = config
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.transport = transport or HttpTransport(self.rate_limiter)
+        base_url = self.config.get("horizon-scope", "comparison-service", "base_url")
+        self.client = OpenAI(
+            api_key=self.config.get("horizon-scope", "comparison-service", "api_key"),
+            base_url=base_url,
+            max_retries=0,
+            timeout=self.transport.timeout,
+            http_client=self.transport.http_client(base_url),
+        )
+        self.model = self.config.get("horizon-scope", "comparison-service", "model")
+        self.rate_limit_key = f"openai:{self.model}"
+        self.usage = UsageTracker(
+            self.config.get(
+                "horizon-scope", "comparison-service", "pricing", default=None
+            )
+        )
+        summary_config = (
+            self.config.get(
+                "horizon-scope", "comparison-service", "summaries", default=None
+            )
+            or {}
+        )
+        self.max_items = summary_config.get("max_items", 10)
+        self.max_tokens = summary_config.get("max_tokens", 12000)
+        self.max_description_tokens = summary_config.get(
+            "max_description_tokens", 2000
+        )
+        self.max_concurrency = summary_config.get("max_concurrency", 4)
+
+    def summarize_many(self, descriptions: List[str]) -> List[Optional[ProjectSummary]]:
+        """Summarize several project descriptions in batched requests.
+
+        A failing request is logged and leaves the summaries of its batch empty, so that one
+        bad batch does not stop a bulk run.
+
+        Args:
+            descriptions (List[str]): The descriptions of the existing projects.
+
+        Returns:
+            List[Optional[ProjectSummary]]: One summary per description, in the same order, or None where no summary could be generated.
+        """
+        fitted = [
+            fit_to_tokens(description, self.max_description_tokens, self.model)
+            for description in descriptions
+        ]
+        batches = [
+            [description for description, _ in batch]
+            for batch in token_batches(
+                fitted,
+                max_tokens=self.max_tokens,
+                max_items=max(self.max_items, 1),
+                count=lambda item: item[1],
+            )
+        ]
+        workers = min(self.max_concurrency, len(batches))
+        if workers <= 1:
+            results = [self._summarize_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Run every batch in a copy of the caller's context to keep usage scopes
+                results = list(
+                    executor.map(
+                        lambda batch, context: context.run(
+                            self._summarize_batch, batch
+                        ),
+                        batches,
+                        [contextvars.copy_context() for _ in batches],
+                    )
+                )
+        return [summary for result in results for summary in result]
+
+    def _summarize_batch(self, batch: List[str]) -> List[Optional[ProjectSummary]]:
+        """Summarize one batch of project descriptions.
+
+        Args:
+            batch (List[str]): The fitted descriptions.
+
+        Returns:
+            List[Optional[ProjectSummary]]: One summary per description, or None where the model returned none.
+        """
+        messages = self._create_summary_prompt(batch)
+        try:
+            completion = self.rate_limiter.call(
+                self.rate_limit_key,
+                self.client.beta.chat.completions.parse,
+                model=self.model,
+                messages=messages,
+                response_format=ProjectSummaryBatch,
+                tokens=count_message_tokens(messages, self.model),
+            )
+        except Exception as error:
+            logger.warning("Summarizing %d projects failed: %s", len(batch), error)
+            return [None] * len(batch)
+        return self._parse_completion(completion, len(batch))
+
+    def _parse_completion(
+        self, completion: Any, size: int
+    ) -> List[Optional[ProjectSummary]]:
+        """Match the summaries of a completion to the requested projects.
+
+        Summaries with an index outside the batch and repeated indexes are ignored.
+
+        Args:
+            completion (Any): The completion returned by the OpenAI client.
+            size (int): The number of projects in the batch.
+
+        Returns:
+            List[Optional[ProjectSummary]]: The summary of every project, or None where the model returned none.
+        """
+        self.usage.record(getattr(completion, "usage", None))
+        batch = completion.choices[0].message.parsed
+        summaries: List[Optional[ProjectSummary]] = [None] * size
+        for item in batch.summaries if batch is not None else []:
+            position = item.index - 1
+            if 0 <= position < size and summaries[position] is None:
+                summaries[position] = ProjectSummary.model_validate(
+                    item.model_dump(exclude={"index"})
+                )
+        return summaries
+
+    def _create_summary_prompt(self, descriptions: List[str]) -> List[Dict[str, str]]:
+        """Create the prompt summarizing several projects.
+
+        Args:
+            descriptions (List[str]): The project descriptions, numbered from 1 in the prompt.
+
+        Returns:
+            List[Dict[str, str]]: A list of messages forming the prompt for the OpenAI model.
+        """
+        projects = "\n\n".join(
+            f"**EU Horizon Project [{number}]**: {description}"
+            for number, description in enumerate(descriptions, start=1)
+        )
+        return [
+            {"role": "system", "content": SUMMARY_PROMPT},
+            {"role": "user", "content": projects},
+        ]
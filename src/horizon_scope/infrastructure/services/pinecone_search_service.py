@@ -1,34 +1,77 @@
 from __future__ import annotations
+import asyncio
 from pinecone import Pinecone
-from openai import OpenAI
-from typing import List
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from datetime import datetime
+from horizon_scope.application.interfaces.async_vector_search_service import (
+    AsyncVectorSearchService,
+)
+from horizon_scope.application.interfaces.vector_index_writer import (
+    VectorIndexWriter,
+)
 from horizon_scope.application.interfaces.vector_search_service import (
     VectorSearchService,
 )
+from horizon_scope.domain.entities.indexing_report import IndexingReport
 from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.config.backend_registry import (
+    create_embedding_service,
+)
 from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.batching import batched
+from horizon_scope.infrastructure.services.bulk_indexing import run_bulk_indexing
+from horizon_scope.infrastructure.services.chunking import (
+    TextChunker,
+    chunk_id,
+    chunk_projects,
+    split_chunk_id,
+)
+from horizon_scope.infrastructure.services.http_transport import HttpTransport
+from horizon_scope.infrastructure.services.rate_limiter import RateLimiter
+
+# Maximum number of ids Pinecone accepts per delete request
+PINECONE_MAX_DELETE_IDS = 1000
+# Maximum top_k of a Pinecone query
+PINECONE_MAX_TOP_K = 10000
+# Bytes of the objective metadata; Pinecone allows 40 KB of metadata per vector
+MAX_OBJECTIVE_BYTES = 32 * 1024
 
 
-class PineconeSearchService(VectorSearchService):
+class PineconeSearchService(
+    VectorSearchService, AsyncVectorSearchService, VectorIndexWriter
+):
     """Service for searching and indexing projects using Pinecone and OpenAI.
 
     This service integrates Pinecone for vector-based search and OpenAI for generating embeddings.
+    Searches can be performed synchronously or from an asyncio event loop. Descriptions longer
+    than the embedding input limit are stored as several vectors ("<id>#<chunk>"), and search
+    results are pooled back into one project each. Index requests and embedding requests go
+    through the same RateLimiter, keyed by the index name and the embedding model.
 
     Attributes:
         config (ConfigManager): Configuration manager for accessing API keys and model information.
         index (Pinecone.Index): Pinecone index for storing and querying project embeddings.
-        openai_client (OpenAI): OpenAI client for generating embeddings.
-        embedding_model (str): The model used for generating embeddings.
+        embedding_service (EmbeddingService): Service for generating (cached) embeddings.
+        chunker (TextChunker): Splits long descriptions and pools chunk hits.
+        rate_limiter (RateLimiter): Rate limiter and retry layer of the requests.
+        rate_limit_key (str): The rate limiter key of the index.
     """
 
-    def __init__(self, config: ConfigManager) -> None:
+    def __init__(
+        self,
+        config: ConfigManager,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[HttpTransport] = None,
+    ) -> None:
         """Initialize PineconeSearchService with configuration settings.
 
         Args:
             config (ConfigManager): Configuration manager for the service.
+            rate_limiter (Optional[RateLimiter]): Rate limiter shared with other services. Defaults to None (a limiter of its own).
+            transport (Optional[HttpTransport]): Pooled transport of the embedding requests, shared with other services. Defaults to None (a transport of its own).
         """
         self.config = config
+        self.rate_limiter = rate_limiter or RateLimiter()
         # Initialize Pinecone
         pinecone_api_key = self.config.get(
             "horizon-scope", "vector-search-service", "store", "api_key"
@@ -38,13 +81,13 @@ class PineconeSearchService(VectorSearchService):
             "horizon-scope", "vector-search-service", "store", "index"
         )
         self.index = pc.Index(index_name)
-        # Initialize OpenAI client for embeddings
-        openai_api_key = self.config.get(
-            "horizon-scope", "vector-search-service", "embeddings", "api_key"
+        self.rate_limit_key = f"pinecone:{index_name}"
+        # Initialize OpenAI service for embeddings
+        self.embedding_service = create_embedding_service(
+            config, self.rate_limiter, transport
         )
-        self.openai_client = OpenAI(api_key=openai_api_key)
-        self.embedding_model = self.config.get(
-            "horizon-scope", "vector-search-service", "embeddings", "model"
+        self.chunker = TextChunker.from_config(
+            config, model=self.embedding_service.model
         )
 
     def search(self, query: str, k: int) -> List[Project]:
@@ -58,53 +101,250 @@ class PineconeSearchService(VectorSearchService):
             List[Project]: A list of projects matching the query.
         """
         # Generate embedding for the query
-        embedding_response = self.openai_client.embeddings.create(
-            model=self.embedding_model, input=query
-        )
-        query_embedding = embedding_response.data[0].embedding
+        query_embedding = self.embedding_service.embed(query)
 
         # Perform the search using Pinecone
-        search_results = self.index.query(
-            vector=query_embedding, top_k=k, include_metadata=True
-        )
+        return self._search_by_vector(query_embedding, k)
+
+    async def asearch(self, query: str, k: int) -> List[Project]:
+        """Asynchronously search for projects matching the query.
+
+        The embedding request uses the asynchronous OpenAI client. The Pinecone client has no
+        asyncio interface, so the index query runs in a worker thread.
+
+        Args:
+            query (str): The query string to search for.
+            k (int): The number of top results to return.
+
+        Returns:
+            List[Project]: A list of projects matching the query.
+        """
+        query_embedding = await self.embedding_service.aembed(query)
 
-        # Convert results to Project objects
-        projects = []
-        for match in search_results.matches:
-            project = Project(
-                id=match.id,
-                title=match.metadata.get("title", ""),
-                description=match.metadata.get("objective", ""),
-                content_update_date=match.metadata.get("contentUpdateDate", ""),
-                similarity=match.score,
+        return await asyncio.to_thread(self._search_by_vector, query_embedding, k)
+
+    def _search_by_vector(self, query_embedding: List[float], k: int) -> List[Project]:
+        """Return the k projects with the most similar chunks to an embedding.
+
+        Args:
+            query_embedding (List[float]): The query embedding.
+            k (int): The number of projects to return.
+
+        Returns:
+            List[Project]: The matched projects with their pooled similarity scores.
+        """
+        hits = self.chunker.search(
+            lambda top_k: [
+                (match.id, match.score, match)
+                for match in self._query_index(query_embedding, top_k).matches
+            ],
+            k,
+            PINECONE_MAX_TOP_K,
+        )
+        # Only the first chunk of a project carries its description
+        first_chunks = self._fetch_metadata(
+            [
+                project_id
+                for project_id, _, match in hits
+                if split_chunk_id(match.id)[1] > 0
+            ]
+        )
+        return [
+            self._to_project(
+                project_id, similarity, first_chunks.get(project_id, match.metadata)
             )
-            projects.append(project)
-        return projects
+            for project_id, similarity, match in hits
+        ]
+
+    def _fetch_metadata(self, vector_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the metadata of vectors by id.
+
+        Args:
+            vector_ids (List[str]): The ids of the vectors.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The metadata of the vectors that exist, by id.
+        """
+        if not vector_ids:
+            return {}
+        response = self.rate_limiter.call(
+            self.rate_limit_key, self.index.fetch, ids=vector_ids
+        )
+        return {
+            vector_id: vector.metadata or {}
+            for vector_id, vector in response.vectors.items()
+        }
+
+    def _query_index(self, query_embedding: List[float], k: int) -> Any:
+        """Query the Pinecone index with an embedding.
+
+        Args:
+            query_embedding (List[float]): The query embedding.
+            k (int): The number of top results to return.
+
+        Returns:
+            Any: The raw Pinecone query response.
+        """
+        return self.rate_limiter.call(
+            self.rate_limit_key,
+            self.index.query,
+            vector=query_embedding,
+            top_k=k,
+            include_metadata=True,
+        )
+
+    def _to_project(
+        self, project_id: str, similarity: float, metadata: Dict[str, Any]
+    ) -> Project:
+        """Convert the metadata of a project's first chunk to a Project.
+
+        Args:
+            project_id (str): The project id of the matched vector.
+            similarity (float): The pooled similarity of the project.
+            metadata (Dict[str, Any]): The metadata of the project's first chunk.
+
+        Returns:
+            Project: The matched project with its similarity score.
+        """
+        return Project(
+            id=project_id,
+            title=metadata.get("title", ""),
+            description=metadata.get("objective", ""),
+            content_update_date=metadata.get("contentUpdateDate", ""),
+            similarity=similarity,
+        )
 
     def index_project(self, project: Project) -> None:
         """Index a project in Pinecone.
 
+        A description longer than the chunk size is stored as one vector per chunk. Chunks
+        left over from a longer previous version of the project are removed.
+
         Args:
             project (Project): The project to be indexed.
         """
-        # Generate embedding for the project description
-        embedding_response = self.openai_client.embeddings.create(
-            model=self.embedding_model, input=project.description
-        )
-        project_embedding = embedding_response.data[0].embedding
+        # Generate embeddings for the project description
+        chunks = self.chunker.split(project.description)
+        if len(chunks) == 1:
+            embeddings = [self.embedding_service.embed(chunks[0])]
+        else:
+            embeddings = self.embedding_service.embed_many(chunks)
 
         # Index the project in Pinecone
-        self.index.upsert(
-            vectors=[
-                {
-                    "id": project.id,
-                    "values": project_embedding,
-                    "metadata": {
-                        "title": project.title,
-                        "objective": project.description,
-                        "contentUpdateDate": project.content_update_date
-                        or datetime.now().isoformat(),
-                    },
-                }
-            ]
+        self.upsert_embeddings(chunk_projects(project, len(chunks)), embeddings)
+
+    def index_projects(
+        self,
+        projects: Iterable[Project],
+        batch_size: int = 100,
+        max_concurrency: int = 4,
+        progress: Optional[Callable[[IndexingReport], None]] = None,
+    ) -> IndexingReport:
+        """Index many projects with batched embedding requests and batched upserts.
+
+        Projects are consumed lazily and grouped into embedding requests that respect the
+        OpenAI token limit. Each embedding batch is upserted in chunks of batch_size vectors.
+        Up to max_concurrency batches are processed at once. Requests are retried by the rate
+        limiter, and the project ids of a batch that still fails are reported as failed.
+
+        Args:
+            projects (Iterable[Project]): The projects to be indexed.
+            batch_size (int): Number of vectors per upsert request. Defaults to 100.
+            max_concurrency (int): Maximum number of batches processed at once. Defaults to 4.
+            progress (Optional[Callable[[IndexingReport], None]]): Called after every finished batch. Defaults to None.
+
+        Returns:
+            IndexingReport: Counts, failed project ids and timing of the run.
+        """
+
+        def index_batch(batch: List[Project]) -> None:
+            chunked, texts = self.chunker.split_projects(batch)
+            embeddings = self.embedding_service.embed_many(texts)
+            self.upsert_embeddings(chunked, embeddings, batch_size=batch_size)
+
+        return run_bulk_indexing(
+            projects,
+            index_batch,
+            max_concurrency=max_concurrency,
+            progress=progress,
+            model=self.embedding_service.model,
+        )
+
+    def upsert_embeddings(
+        self,
+        projects: List[Project],
+        embeddings: List[List[float]],
+        batch_size: int = 100,
+    ) -> None:
+        """Upsert projects with precomputed embeddings in chunks of batch_size vectors.
+
+        The chunks that a longer previous version of a project had are deleted first, so
+        searches no longer match text the project does not have.
+
+        Args:
+            projects (List[Project]): The projects to store, one per chunk, with all chunks of each project.
+            embeddings (List[List[float]]): The embeddings, aligned with the projects.
+            batch_size (int): Number of vectors per upsert request. Defaults to 100.
+        """
+        self._delete_vectors(self.chunker.stale_chunk_ids(projects))
+        vectors = [
+            self._to_vector(project, embedding)
+            for project, embedding in zip(projects, embeddings)
+        ]
+        for chunk in batched(vectors, batch_size):
+            self.rate_limiter.call(
+                self.rate_limit_key, self.index.upsert, vectors=chunk
+            )
+
+    def delete(self, project_ids: List[str]) -> None:
+        """Delete projects, including all their chunks, from the Pinecone index.
+
+        Pinecone ignores unknown ids, so the ids of all possible chunks are deleted.
+
+        Args:
+            project_ids (List[str]): The ids of the projects to remove.
+        """
+        self._delete_vectors(
+            chunk_id(project_id, chunk)
+            for project_id in project_ids
+            for chunk in range(self.chunker.max_chunks)
         )
+
+    def _delete_vectors(self, vector_ids: Iterable[str]) -> None:
+        """Delete vectors by id in requests of at most PINECONE_MAX_DELETE_IDS ids.
+
+        Args:
+            vector_ids (Iterable[str]): The ids of the vectors.
+        """
+        for ids in batched(vector_ids, PINECONE_MAX_DELETE_IDS):
+            self.rate_limiter.call(self.rate_limit_key, self.index.delete, ids=ids)
+
+    def flush(self) -> None:
+        """Do nothing, as Pinecone persists every acknowledged upsert."""
+
+    def _to_vector(self, project: Project, embedding: List[float]) -> Dict[str, Any]:
+        """Build the Pinecone vector record of a project.
+
+        Only the first chunk stores the description, cut to MAX_OBJECTIVE_BYTES, so the
+        metadata of every vector stays within the Pinecone limit. Comparisons use a bounded
+        prompt anyway, so the cut does not change them.
+
+        Args:
+            project (Project): The project.
+            embedding (List[float]): The embedding of the project description.
+
+        Returns:
+            Dict[str, Any]: The record with id, values and metadata.
+        """
+        metadata = {
+            "title": project.title,
+            "contentUpdateDate": project.content_update_date
+            or datetime.now().isoformat(),
+        }
+        if split_chunk_id(project.id)[1] == 0:
+            metadata["objective"] = (
+                project.description.encode("utf-8")[:MAX_OBJECTIVE_BYTES]
+                # Drop a character cut in half
+                .decode("utf-8", errors="ignore")
+            )
+        return {"id": project.id, "values": embedding, "metadata": metadata}
@@ -0,0 +1,685 @@
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Statuses worth retrying: timeouts, conflicts, rate limits and server errors
+RETRY_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504})
+TRANSIENT_ERRORS = (ConnectionError, TimeoutError)
+# Transient errors of client libraries, checked only once the library is imported
+TRANSIENT_LIBRARY_ERRORS = (
+    ("httpx", "TransportError"),
+    ("openai", "APIConnectionError"),
+)
+# Durations of the x-ratelimit-reset-* headers, e.g. "20ms", "1s" or "6m0s"
+DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+DURATION_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+_shared_lock = threading.Lock()
+_shared: Optional[RateLimiter] = None
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider that failed repeatedly."""
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse a rate-limit duration header.
+
+    Args:
+        value (Optional[str]): Seconds as a number, or a duration such as "6m0s" or "20ms".
+
+    Returns:
+        Optional[float]: The duration in seconds, or None if the value cannot be parsed.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    parts = DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(number) * DURATION_SECONDS[unit] for number, unit in parts)
+
+
+def _is_transient(error: Exception) -> bool:
+    """Check whether an error is a connection problem or timeout worth retrying.
+
+    The client libraries are not imported for the check: an error of a library that was
+    never imported cannot have been raised.
+
+    Args:
+        error (Exception): The error of a call.
+
+    Returns:
+        bool: True if the error is transient.
+    """
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+    for module_name, name in TRANSIENT_LIBRARY_ERRORS:
+        module = sys.modules.get(module_name)
+        if module is not None and isinstance(error, getattr(module, name)):
+            return True
+    return False
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    """Read a numeric header.
+
+    Args:
+        headers (Mapping[str, str]): The response headers.
+        name (str): The header name.
+
+    Returns:
+        Optional[float]: The value, or None if it is missing or not a number.
+    """
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Return the delay a rate-limited response asks for.
+
+    Args:
+        headers (Mapping[str, str]): The response headers.
+
+    Returns:
+        Optional[float]: The delay in seconds from retry-after-ms or retry-after, or None.
+    """
+    milliseconds = _header_number(headers, "retry-after-ms")
+    if milliseconds is not None:
+        return milliseconds / 1000
+    return _header_number(headers, "retry-after")
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """Return the HTTP status of an OpenAI or Pinecone API error.
+
+    Args:
+        error (BaseException): The error.
+
+    Returns:
+        Optional[int]: The status, or None if the error carries none.
+    """
+    for name in ("status_code", "status"):
+        value = getattr(error, name, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def _error_headers(error: BaseException) -> Mapping[str, str]:
+    """Return the response headers attached to an API error.
+
+    Args:
+        error (BaseException): The error.
+
+    Returns:
+        Mapping[str, str]: The headers, empty if the error carries none.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        headers = getattr(error, "headers", None)
+    return headers if isinstance(headers, Mapping) else {}
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at capacity per minute.
+
+    Reservations are taken immediately and may drive the level below zero; the caller then
+    waits until the debt is refilled. This queues concurrent callers in arrival order without
+    polling, and lets the request and token buckets of a call be reserved independently.
+
+    Attributes:
+        capacity (Optional[float]): Units per minute, or None while the limit is unknown.
+        level (float): Units currently available; negative while reservations are pending.
+        paused_until (float): time.monotonic() before which no reservation is granted.
+    """
+
+    def __init__(self, capacity: Optional[float] = None) -> None:
+        """Initialize TokenBucket.
+
+        Args:
+            capacity (Optional[float]): Units per minute. Defaults to None (unlimited until update sets a limit).
+        """
+        self.capacity = capacity
+        self.level = capacity or 0.0
+        self.paused_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Reserve units and return how long the caller has to wait before using them.
+
+        Args:
+            amount (float): The number of units, capped at the capacity. Defaults to 1.
+
+        Returns:
+            float: The wait in seconds, 0 if the units are available now.
+        """
+        with self._lock:
+            now = time.monotonic()
+            pause = max(self.paused_until - now, 0.0)
+            if not self.capacity:
+                return pause
+            self._refill(now)
+            self.level -= min(amount, self.capacity)
+            return max(pause, -self.level * 60.0 / self.capacity)
+
+    def update(
+        self,
+        limit: Optional[float] = None,
+        remaining: Optional[float] = None,
+        reset: Optional[float] = None,
+    ) -> None:
+        """Adjust the bucket to the quota reported by the provider.
+
+        The level only ever decreases, as the reservations of requests still in flight are
+        not yet reflected in the provider's remaining count.
+
+        Args:
+            limit (Optional[float]): Units per minute. Defaults to None (unchanged).
+            remaining (Optional[float]): Units left in the current window. Defaults to None.
+            reset (Optional[float]): Seconds until the window is fully replenished. Defaults to None.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if limit:
+                if not self.capacity:
+                    self.level = limit
+                self._refill(now)
+                self.capacity = limit
+            if remaining is not None and self.capacity:
+                self._refill(now)
+                self.level = min(self.level, remaining)
+            if remaining is not None and remaining < 1 and reset:
+                self.paused_until = max(self.paused_until, now + reset)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every reservation for a number of seconds.
+
+        Args:
+            seconds (float): The pause in seconds.
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def _refill(self, now: float) -> None:
+        """Add the units accrued since the last refill. Must be called with the lock held.
+
+        Args:
+            now (float): The current time.monotonic().
+        """
+        if self.capacity:
+            self.level = min(
+                self.capacity,
+                self.level + (now - self._updated) * self.capacity / 60.0,
+            )
+        self._updated = now
+
+
+class CircuitBreaker:
+    """Stops calls to a provider after consecutive failures.
+
+    After failure_threshold consecutive failures the circuit opens and calls fail fast with
+    CircuitOpenError. Once reset_timeout seconds have passed, calls are let through again;
+    the next failure reopens the circuit and a success closes it.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open.
+        failures (int): Current number of consecutive failures.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """Initialize CircuitBreaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit. Defaults to 5.
+            reset_timeout (float): Seconds the circuit stays open. Defaults to 30.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """bool: Whether calls are currently rejected."""
+        with self._lock:
+            return (
+                self._opened_at is not None
+                and time.monotonic() - self._opened_at < self.reset_timeout
+            )
+
+    def check(self, name: str) -> None:
+        """Raise if the circuit is open.
+
+        Args:
+            name (str): Name of the protected provider, used in the error message.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        if self.is_open:
+            raise CircuitOpenError(
+                f"{name} failed {self.failures} times in a row, "
+                f"not calling it for {self.reset_timeout:.0f}s"
+            )
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure and open the circuit at the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class RateLimit:
+    """Quota state of one provider and model (or index).
+
+    Attributes:
+        requests (TokenBucket): Requests per minute.
+        tokens (TokenBucket): Tokens per minute.
+        breaker (CircuitBreaker): Circuit breaker of the provider.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        """Initialize RateLimit.
+
+        Args:
+            requests_per_minute (Optional[float]): Initial request quota. Defaults to None (learned from the responses).
+            tokens_per_minute (Optional[float]): Initial token quota. Defaults to None (learned from the responses).
+            failure_threshold (int): Consecutive failures that open the circuit. Defaults to 5.
+            reset_timeout (float): Seconds the circuit stays open. Defaults to 30.
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+    def reserve(self, tokens: float = 0) -> float:
+        """Reserve one request and a number of tokens.
+
+        Args:
+            tokens (float): The estimated tokens of the request. Defaults to 0.
+
+        Returns:
+            float: The wait in seconds before the request may be sent.
+        """
+        wait = self.requests.reserve(1)
+        if tokens:
+            wait = max(wait, self.tokens.reserve(tokens))
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for a number of seconds.
+
+        Args:
+            seconds (float): The pause in seconds.
+        """
+        self.requests.pause(seconds)
+
+
+class RateLimiter:
+    """Process-wide rate limiter and retry layer for the OpenAI and Pinecone calls.
+
+    Every call is made through call or acall with a key such as "openai:gpt-4o-mini" or
+    "pinecone:<index>". The key's request and token buckets delay the call until the quota
+    allows it, so concurrent workers share the quota instead of racing into rate limits.
+    Limits start from the configuration and follow the x-ratelimit-* headers of the OpenAI
+    responses, observed through the httpx event hooks of event_hooks.
+
+    A rate-limited call pauses the whole key for the retry-after delay, so one 429 does not
+    become a retry storm. Other transient errors are retried with jittered exponential backoff
+    and count towards the key's circuit breaker. Other errors are raised unchanged. The OpenAI
+    clients should be created with max_retries=0 so that retries are not multiplied.
+
+    Attributes:
+        max_retries (int): Retries after the first attempt.
+        base_delay (float): Backoff before the first retry in seconds.
+        max_delay (float): Upper bound of the backoff in seconds.
+        failure_threshold (int): Consecutive failures that open a key's circuit.
+        reset_timeout (float): Seconds a circuit stays open.
+        limits (Dict[str, RateLimit]): Quota state of every key seen so far.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, Mapping[str, float]]] = None,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        """Initialize RateLimiter.
+
+        Args:
+            limits (Optional[Mapping[str, Mapping[str, float]]]): Initial requests_per_minute and tokens_per_minute per key. Defaults to None (learned from the responses).
+            max_retries (int): Retries after the first attempt. Defaults to 5.
+            base_delay (float): Backoff before the first retry in seconds. Defaults to 1.
+            max_delay (float): Upper bound of the backoff in seconds. Defaults to 60.
+            failure_threshold (int): Consecutive failures that open a key's circuit. Defaults to 5.
+            reset_timeout (float): Seconds a circuit stays open. Defaults to 30.
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.limits: Dict[str, RateLimit] = {}
+        self._lock = threading.Lock()
+        for key, quota in (limits or {}).items():
+            self.limits[key] = RateLimit(
+                quota.get("requests_per_minute"),
+                quota.get("tokens_per_minute"),
+                failure_threshold,
+                reset_timeout,
+            )
+
+    @classmethod
+    def from_config(cls, config: ConfigManager) -> RateLimiter:
+        """Create a RateLimiter from the rate-limits settings.
+
+        Args:
+            config (ConfigManager): Configuration manager to read the settings from.
+
+        Returns:
+            RateLimiter: The rate limiter.
+        """
+        limiter_config = config.get("horizon-scope", "rate-limits", default=None) or {}
+        limits = {
+            f"{provider}:{name}": quota
+            for provider, quotas in (limiter_config.get("limits") or {}).items()
+            for name, quota in (quotas or {}).items()
+        }
+        return cls(
+            limits,
+            max_retries=limiter_config.get("max_retries", 5),
+            base_delay=limiter_config.get("base_delay", 1.0),
+            max_delay=limiter_config.get("max_delay", 60.0),
+            failure_threshold=limiter_config.get("failure_threshold", 5),
+            reset_timeout=limiter_config.get("reset_timeout", 30.0),
+        )
+
+    def limit(self, key: str) -> RateLimit:
+        """Return the quota state of a key, creating it on first use.
+
+        Args:
+            key (str): The provider and model, e.g. "openai:gpt-4o-mini".
+
+        Returns:
+            RateLimit: The quota state.
+        """
+        with self._lock:
+            if key not in self.limits:
+                self.limits[key] = RateLimit(
+                    failure_threshold=self.failure_threshold,
+                    reset_timeout=self.reset_timeout,
+                )
+            return self.limits[key]
+
+    def call(
+        self, key: str, function: Callable[..., T], *args, tokens: float = 0, **kwargs
+    ) -> T:
+        """Call a provider function within the key's quota, retrying transient errors.
+
+        Args:
+            key (str): The provider and model, e.g. "openai:gpt-4o-mini".
+            function (Callable[..., T]): The function making the request.
+            *args: Positional arguments for the function.
+            tokens (float): The estimated tokens of the request. Defaults to 0.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            T: The function's return value.
+
+        Raises:
+            CircuitOpenError: If the key's circuit is open.
+            Exception: The function's error if it is not transient or every attempt failed.
+        """
+        limit = self.limit(key)
+        for attempt in range(self.max_retries + 1):
+            limit.breaker.check(key)
+            wait = limit.reserve(tokens)
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                result = function(*args, **kwargs)
+            except Exception as error:
+                delay = self._retry_delay(key, limit, error, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            else:
+                limit.breaker.record_success()
+                return result
+        raise AssertionError("unreachable")
+
+    async def acall(
+        self,
+        key: str,
+        function: Callable[..., Awaitable[T]],
+        *args,
+        tokens: float = 0,
+        **kwargs,
+    ) -> T:
+        """Asynchronously call a provider coroutine function, see call.
+
+        Args:
+            key (str): The provider and model, e.g. "openai:gpt-4o-mini".
+            function (Callable[..., Awaitable[T]]): The coroutine function making the request.
+            *args: Positional arguments for the function.
+            tokens (float): The estimated tokens of the request. Defaults to 0.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            T: The function's return value.
+
+        Raises:
+            CircuitOpenError: If the key's circuit is open.
+            Exception: The function's error if it is not transient or every attempt failed.
+        """
+        limit = self.limit(key)
+        for attempt in range(self.max_retries + 1):
+            limit.breaker.check(key)
+            wait = limit.reserve(tokens)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                result = await function(*args, **kwargs)
+            except Exception as error:
+                delay = self._retry_delay(key, limit, error, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            else:
+                limit.breaker.record_success()
+                return result
+        raise AssertionError("unreachable")
+
+    def observe(self, key: str, headers: Mapping[str, str]) -> None:
+        """Update a key's buckets from the x-ratelimit-* headers of a response.
+
+        Args:
+            key (str): The provider and model, e.g. "openai:gpt-4o-mini".
+            headers (Mapping[str, str]): The response headers.
+        """
+        limit = self.limit(key)
+        for name, bucket in (("requests", limit.requests), ("tokens", limit.tokens)):
+            bucket.update(
+                limit=_header_number(headers, f"x-ratelimit-limit-{name}"),
+                remaining=_header_number(headers, f"x-ratelimit-remaining-{name}"),
+                reset=parse_duration(headers.get(f"x-ratelimit-reset-{name}")),
+            )
+
+    def event_hooks(self, provider: str) -> Dict[str, List[Callable[..., Any]]]:
+        """Return httpx event hooks that observe the rate-limit headers of every response.
+
+        The key is the provider and the model of the JSON request body. Pass the hooks to the
+        httpx client of an OpenAI client, e.g. DefaultHttpxClient(event_hooks=...).
+
+        Args:
+            provider (str): The provider part of the key, e.g. "openai".
+
+        Returns:
+            Dict[str, List[Callable[..., Any]]]: The event hooks of a synchronous httpx client.
+        """
+
+        def observe_response(response: httpx.Response) -> None:
+            key = self._response_key(provider, response)
+            if key is not None:
+                self.observe(key, response.headers)
+
+        return {"response": [observe_response]}
+
+    def async_event_hooks(self, provider: str) -> Dict[str, List[Callable[..., Any]]]:
+        """Return the event hooks of event_hooks for an asynchronous httpx client.
+
+        Args:
+            provider (str): The provider part of the key, e.g. "openai".
+
+        Returns:
+            Dict[str, List[Callable[..., Any]]]: The event hooks of an httpx.AsyncClient.
+        """
+
+        async def observe_response(response: httpx.Response) -> None:
+            key = self._response_key(provider, response)
+            if key is not None:
+                self.observe(key, response.headers)
+
+        return {"response": [observe_response]}
+
+    @staticmethod
+    def _response_key(provider: str, response: httpx.Response) -> Optional[str]:
+        """Return the key of a response from the model of its JSON request body.
+
+        Args:
+            provider (str): The provider part of the key.
+            response (httpx.Response): The response.
+
+        Returns:
+            Optional[str]: The key, or None if the request names no model.
+        """
+        import httpx
+
+        try:
+            body = json.loads(response.request.content or b"null")
+        except (ValueError, httpx.RequestNotRead):
+            return None
+        model = body.get("model") if isinstance(body, dict) else None
+        return f"{provider}:{model}" if model else None
+
+    def _retry_delay(
+        self, key: str, limit: RateLimit, error: Exception, attempt: int
+    ) -> Optional[float]:
+        """Decide whether a failed call is retried and how long to wait first.
+
+        Args:
+            key (str): The key of the call.
+            limit (RateLimit): The key's quota state.
+            error (Exception): The error of the call.
+            attempt (int): The number of the failed attempt, starting at 0.
+
+        Returns:
+            Optional[float]: The delay in seconds, or None to raise the error.
+        """
+        status = _status_code(error)
+        if status == 429:
+            if getattr(error, "code", None) == "insufficient_quota":
+                return None
+            headers = _error_headers(error)
+            self.observe(key, headers)
+            delay = max(self._backoff(attempt), retry_after(headers) or 0.0)
+            # Pause every caller of the key, not just this one
+            limit.pause(delay)
+        elif status in RETRY_STATUSES or _is_transient(error):
+            limit.breaker.record_failure()
+            if limit.breaker.is_open:
+                return None
+            delay = self._backoff(attempt)
+        else:
+            return None
+        if attempt >= self.max_retries:
+            return None
+        logger.warning(
+            "%s attempt %d failed (%s), retrying in %.1fs",
+            key,
+            attempt + 1,
+            error,
+            delay,
+        )
+        return delay
+
+    def _backoff(self, attempt: int) -> float:
+        """Return the jittered exponential backoff of an attempt.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 0.
+
+        Returns:
+            float: The delay in seconds, at most max_delay.
+        """
+        return min(
+            self.max_delay, self.base_delay * 2**attempt * random.uniform(0.5, 1.5)
+        )
+
+
+def shared_rate_limiter(config: ConfigManager) -> RateLimiter:
+    """Return the process-wide rate limiter, creating it from the configuration on first use.
+
+    Quotas are per API key and not per client, so every client of the process shares one
+    limiter; the configuration of later calls is ignored.
+
+    Args:
+        config (ConfigManager): Configuration manager to read the settings from.
+
+    Returns:
+        RateLimiter: The shared rate limiter.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RateLimiter.from_config(config)
+        return _shared
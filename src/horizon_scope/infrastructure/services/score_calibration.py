@@ -0,0 +1,66 @@
+from __future__ import annotations
+from typing import List, Sequence, Tuple
+import numpy as np
+from horizon_scope.domain.entities.score_calibration import ScoreCalibration
+
+
+def isotonic(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Fit the closest non-decreasing sequence with the pool adjacent violators algorithm.
+
+    Args:
+        values (np.ndarray): The values to fit, in order.
+        weights (np.ndarray): The weight of every value.
+
+    Returns:
+        np.ndarray: The non-decreasing fit, one value per input value.
+    """
+    # Every block holds its weighted mean, total weight and number of merged values
+    means: List[float] = []
+    totals: List[float] = []
+    sizes: List[int] = []
+    for value, weight in zip(values.tolist(), weights.tolist()):
+        means.append(value)
+        totals.append(weight)
+        sizes.append(1)
+        while len(means) > 1 and means[-2] > means[-1]:
+            total = totals[-2] + totals[-1]
+            mean = (means[-2] * totals[-2] + means[-1] * totals[-1]) / total
+            size = sizes[-2] + sizes[-1]
+            del means[-1], totals[-1], sizes[-1]
+            means[-1], totals[-1], sizes[-1] = mean, total, size
+    return np.repeat(means, sizes)
+
+
+def fit_score_calibration(
+    samples: Sequence[Tuple[float, float, float]], n_bins: int = 20
+) -> ScoreCalibration:
+    """Fit a monotone mapping from vector similarity to comparison score and confidence.
+
+    The samples are sorted by similarity and split into bins of equal size. Every bin becomes a
+    knot at its mean similarity, and the mean scores and confidences of the bins are made
+    non-decreasing with isotonic regression, so a more similar hit is never expected to score
+    lower than a less similar one.
+
+    Args:
+        samples (Sequence[Tuple[float, float, float]]): Similarity, score and confidence of logged comparisons.
+        n_bins (int): The maximum number of knots. Defaults to 20.
+
+    Returns:
+        ScoreCalibration: The fitted mapping.
+
+    Raises:
+        ValueError: If there are no samples.
+    """
+    if not samples:
+        raise ValueError("At least one logged comparison is required to calibrate")
+    data = np.asarray(samples, dtype=np.float64)
+    data = data[np.argsort(data[:, 0], kind="stable")]
+    bins = [part for part in np.array_split(data, min(n_bins, len(data))) if len(part)]
+    means = np.asarray([part.mean(axis=0) for part in bins])
+    weights = np.asarray([len(part) for part in bins], dtype=np.float64)
+    return ScoreCalibration(
+        similarities=means[:, 0].tolist(),
+        scores=isotonic(means[:, 1], weights).tolist(),
+        confidences=isotonic(means[:, 2], weights).tolist(),
+        n_samples=len(data),
+    )
@@ -0,0 +1,198 @@
+from __future__ import annotations
+import logging
+import math
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+# Encoding used by text-embedding-3-small and text-embedding-3-large
+DEFAULT_ENCODING = "cl100k_base"
+# Conservative characters-per-token ratio used when no tiktoken encoding is available
+FALLBACK_CHARS_PER_TOKEN = 3
+# Tokens of the role and separators around every chat message
+MESSAGE_OVERHEAD_TOKENS = 4
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: Optional[str] = None) -> Optional[tiktoken.Encoding]:
+    """Return the tiktoken encoding for a model, falling back to cl100k_base.
+
+    tiktoken downloads its BPE files on first use. If that is not possible (e.g. in an offline
+    container), None is returned and callers fall back to a character-based estimate.
+
+    Args:
+        model (Optional[str]): The OpenAI model name. Defaults to None.
+
+    Returns:
+        Optional[tiktoken.Encoding]: The (cached) encoding, or None if it cannot be loaded.
+    """
+    try:
+        if model:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                pass
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as error:
+        logger.warning(
+            "tiktoken encoding unavailable, estimating token counts: %s", error
+        )
+        return None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Count the tokens of a text as seen by a model.
+
+    Args:
+        text (str): The text to count.
+        model (Optional[str]): The OpenAI model name. Defaults to None.
+
+    Returns:
+        int: The number of tokens, or a conservative estimate if no encoding is available.
+    """
+    encoding = get_encoding(model)
+    if encoding is None:
+        return math.ceil(len(text) / FALLBACK_CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(
+    messages: Sequence[Dict[str, str]], model: Optional[str] = None
+) -> int:
+    """Estimate the prompt tokens of a chat request.
+
+    Args:
+        messages (Sequence[Dict[str, str]]): The chat messages.
+        model (Optional[str]): The OpenAI model name. Defaults to None.
+
+    Returns:
+        int: The tokens of the message contents plus a fixed overhead per message.
+    """
+    return sum(
+        count_tokens(message.get("content") or "", model) + MESSAGE_OVERHEAD_TOKENS
+        for message in messages
+    )
+
+
+def truncate_to_tokens(
+    text: str, max_tokens: int, model: Optional[str] = None
+) -> Tuple[str, int]:
+    """Truncate a text to at most max_tokens tokens.
+
+    Args:
+        text (str): The text to truncate.
+        max_tokens (int): The maximum number of tokens to keep.
+        model (Optional[str]): The OpenAI model name. Defaults to None.
+
+    Returns:
+        Tuple[str, int]: The (possibly truncated) text and its number of tokens.
+    """
+    encoding = get_encoding(model)
+    if encoding is None:
+        text = text[: max_tokens * FALLBACK_CHARS_PER_TOKEN]
+        return text, math.ceil(len(text) / FALLBACK_CHARS_PER_TOKEN)
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text, len(tokens)
+    return encoding.decode(tokens[:max_tokens]), max_tokens
+
+
+def split_by_tokens(
+    text: str, max_tokens: int, overlap: int = 0, model: Optional[str] = None
+) -> List[str]:
+    """Split a text into windows of at most max_tokens tokens.
+
+    Consecutive windows share overlap tokens, so that a sentence cut at a window boundary is
+    still embedded as a whole in one of them.
+
+    Args:
+        text (str): The text to split.
+        max_tokens (int): The maximum number of tokens per window.
+        overlap (int): The number of tokens shared by consecutive windows. Defaults to 0.
+        model (Optional[str]): The OpenAI model name. Defaults to None.
+
+    Returns:
+        List[str]: The windows, in order. A text that fits is returned unchanged as the only window.
+
+    Raises:
+        ValueError: If overlap is not smaller than max_tokens.
+    """
+    if not 0 <= overlap < max_tokens:
+        raise ValueError("overlap must be at least 0 and smaller than max_tokens")
+    encoding = get_encoding(model)
+    if encoding is None:
+        size = max_tokens * FALLBACK_CHARS_PER_TOKEN
+        step = (max_tokens - overlap) * FALLBACK_CHARS_PER_TOKEN
+        if len(text) <= size:
+            return [text]
+        return [
+            text[start : start + size]
+            for start in range(0, len(text) - overlap * FALLBACK_CHARS_PER_TOKEN, step)
+        ]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return [text]
+    return [
+        encoding.decode(tokens[start : start + max_tokens])
+        for start in range(0, len(tokens) - overlap, max_tokens - overlap)
+    ]
+
+
+def fit_to_tokens(
+    text: str, max_tokens: int, model: Optional[str] = None
+) -> Tuple[str, int]:
+    """Shorten a text to at most max_tokens tokens, cutting at a sentence boundary.
+
+    Whole leading sentences are kept while they fit, so the model sees complete statements
+    instead of a description cut mid-word. If even the first sentence does not fit, the text is
+    cut at the token limit.
+
+    Args:
+        text (str): The text to shorten.
+        max_tokens (int): The maximum number of tokens to keep.
+        model (Optional[str]): The OpenAI model name. Defaults to None.
+
+    Returns:
+        Tuple[str, int]: The (possibly shortened) text and its number of tokens.
+    """
+    n_tokens = count_tokens(text, model)
+    if n_tokens <= max_tokens:
+        return text, n_tokens
+    kept: List[str] = []
+    for sentence in SENTENCE_BOUNDARY.split(text):
+        n_candidate = count_tokens(" ".join(kept + [sentence]), model)
+        if n_candidate > max_tokens:
+            break
+        kept.append(sentence)
+        n_tokens = n_candidate
+    if not kept:
+        return truncate_to_tokens(text, max_tokens, model)
+    return " ".join(kept), n_tokens
+
+
+def split_token_budget(first: int, second: int, budget: int) -> Tuple[int, int]:
+    """Share a token budget between two texts.
+
+    A text shorter than half the budget keeps its length and leaves the rest to the other one;
+    if both are longer, each gets half.
+
+    Args:
+        first (int): The number of tokens of the first text.
+        second (int): The number of tokens of the second text.
+        budget (int): The number of tokens available for both texts.
+
+    Returns:
+        Tuple[int, int]: The token budgets of the first and the second text.
+    """
+    if first + second <= budget:
+        return first, second
+    half = budget // 2
+    if first <= half:
+        return first, budget - first
+    if second <= budget - half:
+        return budget - second, second
+    return half, budget - half
@@ -0,0 +1,181 @@
+from __future__ import annotations
+import asyncio
+import contextvars
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple, TypeVar
+from horizon_scope.domain.entities.token_usage import TokenUsage
+
+# Usages collecting the requests of the current context, see track_usage
+_active_usages: ContextVar[Tuple[TokenUsage, ...]] = ContextVar(
+    "active_usages", default=()
+)
+_scope_lock = threading.Lock()
+
+T = TypeVar("T")
+
+
+@contextmanager
+def track_usage() -> Iterator[TokenUsage]:
+    """Collect the usage of all requests recorded while the block runs.
+
+    Scopes follow the context, so requests made from asyncio tasks and from threads started
+    with asyncio.to_thread or a copied context are included, while concurrent blocks in other
+    contexts are not. Scopes can be nested.
+
+    Yields:
+        TokenUsage: The usage, updated in place as requests are recorded.
+    """
+    usage = TokenUsage()
+    token = _active_usages.set(_active_usages.get() + (usage,))
+    try:
+        yield usage
+    finally:
+        _active_usages.reset(token)
+
+
+def _scoped_context(usage: TokenUsage) -> contextvars.Context:
+    """Return a copy of the current context in which usage collects the requests.
+
+    Args:
+        usage (TokenUsage): The usage to add the requests to.
+
+    Returns:
+        contextvars.Context: The copied context.
+    """
+    context = contextvars.copy_context()
+    context.run(lambda: _active_usages.set(_active_usages.get() + (usage,)))
+    return context
+
+
+def iter_with_usage(iterator: Iterator[T], usage: TokenUsage) -> Iterator[T]:
+    """Advance an iterator in a context of its own that adds its requests to usage.
+
+    Unlike a track_usage block around the loop, no scope stays active in the caller's
+    context while the iterator is paused, so requests made by the caller between two items
+    are not collected, and interleaved iterators cannot reset each other's scopes.
+
+    Args:
+        iterator (Iterator[T]): The iterator, e.g. a generator making requests.
+        usage (TokenUsage): The usage to add the requests of the iterator to.
+
+    Yields:
+        T: The items of the iterator.
+    """
+    context = _scoped_context(usage)
+    try:
+        while True:
+            try:
+                item = context.run(next, iterator)
+            except StopIteration:
+                return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            context.run(close)
+
+
+async def aiter_with_usage(
+    iterator: AsyncIterator[T], usage: TokenUsage
+) -> AsyncIterator[T]:
+    """Advance an asynchronous iterator in a context of its own that adds its requests to usage.
+
+    See iter_with_usage. Every step runs as a task in the scoped context.
+
+    Args:
+        iterator (AsyncIterator[T]): The asynchronous iterator, e.g. an async generator making requests.
+        usage (TokenUsage): The usage to add the requests of the iterator to.
+
+    Yields:
+        T: The items of the iterator.
+    """
+    context = _scoped_context(usage)
+
+    async def step() -> T:
+        return await iterator.__anext__()
+
+    try:
+        while True:
+            try:
+                item = await asyncio.create_task(step(), context=context)
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await asyncio.create_task(aclose(), context=context)
+
+
+def _token_count(usage: Any, name: str) -> int:
+    """Read a token count from a usage object, treating missing values as 0.
+
+    Args:
+        usage (Any): The usage object, or None.
+        name (str): The attribute name.
+
+    Returns:
+        int: The count.
+    """
+    value = getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+class UsageTracker:
+    """Accumulates the token usage reported by LLM responses.
+
+    Attributes:
+        prices (Dict[str, float]): USD per million tokens for "input", "cached_input" and "output".
+        total (TokenUsage): Usage of all recorded requests.
+    """
+
+    def __init__(self, prices: Optional[Dict[str, float]] = None) -> None:
+        """Initialize UsageTracker.
+
+        Args:
+            prices (Optional[Dict[str, float]]): USD per million tokens for "input", "cached_input" (defaults to the input price) and "output". Defaults to None (no cost).
+        """
+        self.prices = dict(prices or {})
+        self.total = TokenUsage()
+        self._lock = threading.Lock()
+
+    def record(self, usage: Any) -> TokenUsage:
+        """Record the usage object of an OpenAI response.
+
+        Args:
+            usage (Any): The response's usage, with prompt_tokens, completion_tokens and prompt_tokens_details.cached_tokens. None is counted as a request without usage.
+
+        Returns:
+            TokenUsage: The usage of this request.
+        """
+        prompt_tokens = _token_count(usage, "prompt_tokens")
+        cached_tokens = _token_count(
+            getattr(usage, "prompt_tokens_details", None), "cached_tokens"
+        )
+        completion_tokens = _token_count(usage, "completion_tokens")
+        input_price = self.prices.get("input", 0.0)
+        cost = (
+            (prompt_tokens - cached_tokens) * input_price
+            + cached_tokens * self.prices.get("cached_input", input_price)
+            + completion_tokens * self.prices.get("output", 0.0)
+        ) / 1_000_000
+        request_usage = TokenUsage(
+            requests=1,
+            prompt_tokens=prompt_tokens,
+            cached_tokens=cached_tokens,
+            completion_tokens=completion_tokens,
+            cost=cost,
+        )
+        with self._lock:
+            self.total.add(request_usage)
+        with _scope_lock:
+            for scope in _active_usages.get():
+                scope.add(request_usage)
+        return request_usage
+
+    def reset(self) -> None:
+        """Reset the total usage."""
+        with self._lock:
+            self.total = TokenUsage()
@@ -0,0 +1,81 @@
+"""
+Ingest CORDIS project CSV exports into the configured vector store.
+
+Replaces running notebooks 01-04 by hand. The run is checkpointed, so an interrupted
+ingestion continues where it stopped when the same command is run again. A manifest of the
+indexed content makes later runs incremental: only new or changed projects are embedded,
+and withdrawn projects are deleted from the store.
+
+Usage:
+    python -m horizon_scope.ingest data/projects_14_20.csv data/projects_21_27.csv
+"""
+
+import argparse
+import logging
+
+from horizon_scope.application.interfaces.vector_index_writer import (
+    VectorIndexWriter,
+)
+from horizon_scope.domain.entities.ingest_checkpoint import IngestCheckpoint
+from horizon_scope.ingest.manifest import SyncManifest
+from horizon_scope.ingest.pipeline import IngestionPipeline
+from horizon_scope.presentation.horizon_scope_client import HorizonScopeClient
+
+
+def report(checkpoint: IngestCheckpoint) -> None:
+    """Print the progress of the run."""
+    print(
+        f"rows {checkpoint.rows_done}: {checkpoint.indexed} indexed, "
+        f"{checkpoint.unchanged} unchanged, {checkpoint.skipped} skipped, "
+        f"{len(checkpoint.failed_ids)} failed, {checkpoint.deleted} deleted",
+        flush=True,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("paths", nargs="+", help="CORDIS project CSV files")
+    parser.add_argument("--config", default="config.yml")
+    parser.add_argument("--checkpoint", default=".cache/ingest_checkpoint.json")
+    parser.add_argument("--manifest", default=".cache/ingest_manifest.sqlite")
+    parser.add_argument(
+        "--full", action="store_true", help="re-embed projects that are unchanged"
+    )
+    parser.add_argument(
+        "--max-delete-fraction",
+        type=float,
+        default=0.2,
+        help="largest fraction of the indexed projects a run may delete",
+    )
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--checkpoint-every", type=int, default=10)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    client = HorizonScopeClient.from_config(args.config)
+    index = client.vector_search_service
+    # Hybrid search writes to its dense store and keeps its lexical index in sync
+    dense = getattr(index, "dense", index)
+    if not isinstance(dense, VectorIndexWriter):
+        parser.error(f"{type(dense).__name__} does not accept precomputed embeddings")
+
+    pipeline = IngestionPipeline(
+        index,
+        dense.embedding_service,
+        checkpoint_path=args.checkpoint,
+        model=dense.embedding_service.model,
+        chunker=dense.chunker,
+        max_concurrency=args.max_concurrency,
+        checkpoint_every=args.checkpoint_every,
+        manifest=SyncManifest(args.manifest),
+        skip_unchanged=not args.full,
+        max_delete_fraction=args.max_delete_fraction,
+    )
+    checkpoint = pipeline.run(args.paths, progress=report)
+    report(checkpoint)
+    if checkpoint.failed_ids:
+        print(f"Failed project ids: {', '.join(checkpoint.failed_ids)}")
+
+
+if __name__ == "__main__":
+    main()
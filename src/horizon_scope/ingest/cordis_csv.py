@@ -0,0 +1,80 @@
+from __future__ import annotations
+import csv
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, Optional
+from horizon_scope.domain.entities.project import Project
+
+# Columns of the CORDIS project exports that are kept
+FIELDS = ["id", "title", "objective", "contentUpdateDate"]
+# Objectives can exceed the default csv field size limit of 128 KiB
+MAX_FIELD_SIZE = 2**31 - 1
+
+
+def read_records(paths: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """Stream the rows of CORDIS project CSV exports, one file after the other.
+
+    The exports are semicolon-separated with backslash escapes. Only FIELDS are kept, so
+    memory use is bounded by a single row.
+
+    Args:
+        paths (Iterable[str]): Paths of the CSV files.
+
+    Yields:
+        Dict[str, str]: The selected fields of every row.
+    """
+    csv.field_size_limit(MAX_FIELD_SIZE)
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as csv_file:
+            reader = csv.DictReader(
+                csv_file, delimiter=";", quotechar='"', escapechar="\\"
+            )
+            for row in reader:
+                yield {field: row.get(field) or "" for field in FIELDS}
+
+
+def normalize_date(value: str) -> Optional[str]:
+    """Convert a CORDIS timestamp to the ISO format stored in the index.
+
+    Args:
+        value (str): A timestamp such as "2022-08-09 13:43:25".
+
+    Returns:
+        Optional[str]: The timestamp as "%Y-%m-%dT%H:%M:%S", or None if it cannot be parsed.
+    """
+    try:
+        return datetime.fromisoformat(value.strip()).strftime("%Y-%m-%dT%H:%M:%S")
+    except ValueError:
+        return None
+
+
+def to_project(record: Dict[str, str]) -> Optional[Project]:
+    """Clean a CSV record and convert it to a Project.
+
+    Args:
+        record (Dict[str, str]): The selected fields of a CSV row.
+
+    Returns:
+        Optional[Project]: The project, or None if the record has no id or no objective.
+    """
+    project_id = record["id"].strip()
+    objective = record["objective"].strip()
+    if not project_id or not objective:
+        return None
+    return Project(
+        id=project_id,
+        title=" ".join(record["title"].split()),
+        description=objective,
+        content_update_date=normalize_date(record["contentUpdateDate"]),
+    )
+
+
+def embedding_text(project: Project) -> str:
+    """Build the text that is embedded for a project: its title followed by its objective.
+
+    Args:
+        project (Project): The project.
+
+    Returns:
+        str: The title and objective on a single line.
+    """
+    return " ".join(f"{project.title or ''} {project.description}".split())
@@ -0,0 +1,141 @@
+from __future__ import annotations
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Iterable, List, NamedTuple, Optional
+
+
+def content_hash(text: str) -> str:
+    """Hash the text that is embedded for a project.
+
+    Args:
+        text (str): The embedding text.
+
+    Returns:
+        str: A SHA-256 hex digest of the text.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ManifestEntry(NamedTuple):
+    """The indexed state of a single project."""
+
+    project_id: str
+    content_hash: str
+    model: str
+    content_update_date: Optional[str]
+
+
+class SyncManifest:
+    """Record of what is stored in the vector index for every project, persisted in SQLite.
+
+    An ingestion run marks every project id it reads with its run id. Projects whose hash and
+    embedding model match their entry are not embedded again, and entries that were not marked
+    by a completed run belong to withdrawn projects.
+
+    Attributes:
+        path (str): Path of the SQLite database file.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize SyncManifest and create the table if needed.
+
+        Args:
+            path (str): Path of the SQLite database file, or ":memory:".
+        """
+        self.path = path
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS manifest ("
+                "id TEXT PRIMARY KEY, content_hash TEXT NOT NULL, model TEXT NOT NULL, "
+                "content_update_date TEXT, run_id TEXT NOT NULL)"
+            )
+
+    def is_current(self, project_id: str, content_hash: str, model: str) -> bool:
+        """Check whether the index holds this content of a project, embedded with this model.
+
+        Args:
+            project_id (str): The project id.
+            content_hash (str): Hash of the project's embedding text.
+            model (str): The embedding model.
+
+        Returns:
+            bool: True if the project does not need to be embedded again.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content_hash, model FROM manifest WHERE id = ?", (project_id,)
+            ).fetchone()
+        return row is not None and row[0] == content_hash and row[1] == model
+
+    def mark_seen(self, project_ids: Iterable[str], run_id: str) -> None:
+        """Mark projects as present in the input of a run.
+
+        Args:
+            project_ids (Iterable[str]): The project ids.
+            run_id (str): The run id.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "UPDATE manifest SET run_id = ? WHERE id = ?",
+                ((run_id, project_id) for project_id in project_ids),
+            )
+
+    def record(self, entries: Iterable[ManifestEntry], run_id: str) -> None:
+        """Record projects that were embedded and stored by a run.
+
+        Args:
+            entries (Iterable[ManifestEntry]): The stored projects.
+            run_id (str): The run id.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO manifest "
+                "(id, content_hash, model, content_update_date, run_id) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((*entry, run_id) for entry in entries),
+            )
+
+    def withdrawn(self, run_id: str) -> List[str]:
+        """List the projects that were not present in the input of a run.
+
+        Args:
+            run_id (str): The run id.
+
+        Returns:
+            List[str]: The ids of the withdrawn projects.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id FROM manifest WHERE run_id != ?", (run_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def delete(self, project_ids: Iterable[str]) -> None:
+        """Remove projects from the manifest.
+
+        Args:
+            project_ids (Iterable[str]): The project ids.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM manifest WHERE id = ?",
+                ((project_id,) for project_id in project_ids),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM manifest").fetchone()[
+                0
+            ]
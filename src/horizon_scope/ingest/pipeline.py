@@ -0,0 +1,390 @@
+from __future__ import annotations
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from horizon_scope.application.interfaces.embedding_service import EmbeddingService
+from horizon_scope.application.interfaces.vector_index_writer import (
+    VectorIndexWriter,
+)
+from horizon_scope.domain.entities.ingest_checkpoint import IngestCheckpoint
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.services.batching import (
+    EMBEDDING_BATCH_MAX_INPUTS,
+    EMBEDDING_BATCH_MAX_TOKENS,
+    token_batches,
+)
+from horizon_scope.infrastructure.services.chunking import TextChunker, chunk_projects
+from horizon_scope.infrastructure.services.token_counter import count_tokens
+from horizon_scope.ingest.cordis_csv import embedding_text, read_records, to_project
+from horizon_scope.ingest.manifest import ManifestEntry, SyncManifest, content_hash
+
+logger = logging.getLogger(__name__)
+
+
+class _Item(NamedTuple):
+    """A cleaned project on its way through the pipeline."""
+
+    row: int
+    project: Project
+    chunks: List[str]
+    content_hash: str
+    tokens: int
+    skipped_before: int
+    unchanged_before: int
+
+
+class _Reader:
+    """Counters of the rows read but not yet covered by a completed batch or checkpoint."""
+
+    def __init__(self, rows_read: int) -> None:
+        self.rows_read = rows_read
+        self.skipped = 0
+        self.unchanged = 0
+        self.seen: List[str] = []
+        self.stored: List[ManifestEntry] = []
+
+
+class IngestionPipeline:
+    """Resumable pipeline from CORDIS CSV exports to a vector index.
+
+    Rows are streamed from the CSV files and pass through the stages select/clean, token
+    counting (with chunking of texts above the embedding input limit), batched embedding and
+    upsert.
+    Reading, cleaning and counting run on the calling thread while up to max_concurrency
+    batches are embedded and upserted by worker threads, so memory is bounded by the batches
+    in flight rather than by the size of the dataset. Requests are retried by the rate limiter
+    of the embedding service and the store; a batch that still fails is listed in failed_ids.
+
+    Batches complete in input order. Every checkpoint_every batches the index is flushed and
+    the number of processed rows is written to the checkpoint file; a restarted run skips
+    those rows instead of embedding them again. Stored projects are only recorded in the
+    manifest once the index is flushed, so a crash never leaves the manifest listing
+    projects that are missing from the index.
+
+    With a SyncManifest the pipeline syncs incrementally: projects whose title and objective
+    are already indexed with the same embedding model are skipped, and once all rows are
+    processed, projects that are no longer in the input are deleted from the index.
+
+    Attributes:
+        index (VectorIndexWriter): The vector store the projects are written to.
+        embedding_service (EmbeddingService): Service for embedding batches of texts.
+        checkpoint_path (Optional[str]): Path of the JSON checkpoint file, or None to disable resuming.
+        model (Optional[str]): Embedding model used to count tokens.
+        chunker (TextChunker): Splits long texts into several vectors per project.
+        max_concurrency (int): Maximum number of batches embedded and upserted at once.
+        checkpoint_every (int): Number of completed batches between checkpoints.
+        max_batch_tokens (int): Maximum tokens per embedding request.
+        max_batch_items (int): Maximum inputs per embedding request.
+        manifest (Optional[SyncManifest]): Record of the indexed content, or None to ingest everything.
+        skip_unchanged (bool): Whether projects recorded in the manifest with the same content are skipped.
+        max_delete_fraction (float): Largest fraction of the manifest that a run may delete.
+    """
+
+    def __init__(
+        self,
+        index: VectorIndexWriter,
+        embedding_service: EmbeddingService,
+        checkpoint_path: Optional[str] = None,
+        model: Optional[str] = None,
+        chunker: Optional[TextChunker] = None,
+        max_concurrency: int = 4,
+        checkpoint_every: int = 10,
+        max_batch_tokens: int = EMBEDDING_BATCH_MAX_TOKENS,
+        max_batch_items: int = EMBEDDING_BATCH_MAX_INPUTS,
+        manifest: Optional[SyncManifest] = None,
+        skip_unchanged: bool = True,
+        max_delete_fraction: float = 0.2,
+    ) -> None:
+        """Initialize IngestionPipeline.
+
+        Args:
+            index (VectorIndexWriter): The vector store the projects are written to.
+            embedding_service (EmbeddingService): Service for embedding batches of texts.
+            checkpoint_path (Optional[str]): Path of the JSON checkpoint file. Defaults to None.
+            model (Optional[str]): Embedding model used to count tokens. Defaults to None.
+            chunker (Optional[TextChunker]): Splits long texts. Defaults to a TextChunker for model.
+            max_concurrency (int): Maximum number of batches processed at once. Defaults to 4.
+            checkpoint_every (int): Number of completed batches between checkpoints. Defaults to 10.
+            max_batch_tokens (int): Maximum tokens per embedding request.
+            max_batch_items (int): Maximum inputs per embedding request.
+            manifest (Optional[SyncManifest]): Record of the indexed content. Defaults to None.
+            skip_unchanged (bool): Whether unchanged projects are skipped. Defaults to True.
+            max_delete_fraction (float): Largest fraction of the manifest that a run may delete,
+                as a guard against truncated input files. Defaults to 0.2.
+
+        Raises:
+            ValueError: If max_concurrency or checkpoint_every is smaller than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        self.index = index
+        self.embedding_service = embedding_service
+        self.checkpoint_path = checkpoint_path
+        self.model = model
+        self.chunker = chunker or TextChunker(model=model)
+        self.max_concurrency = max_concurrency
+        self.checkpoint_every = checkpoint_every
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_items = max_batch_items
+        self.manifest = manifest
+        self.skip_unchanged = skip_unchanged
+        self.max_delete_fraction = max_delete_fraction
+
+    def run(
+        self,
+        paths: Sequence[str],
+        progress: Optional[Callable[[IngestCheckpoint], None]] = None,
+    ) -> IngestCheckpoint:
+        """Ingest the CSV files, resuming an interrupted run if there is a checkpoint.
+
+        Args:
+            paths (Sequence[str]): Paths of the CSV files.
+            progress (Optional[Callable[[IngestCheckpoint], None]]): Called after every completed batch. Defaults to None.
+
+        Returns:
+            IngestCheckpoint: The final state of the run.
+
+        Raises:
+            ValueError: If the checkpoint of an interrupted run was written for different input files.
+        """
+        checkpoint = self._load_checkpoint(paths)
+        reader = _Reader(checkpoint.rows_done)
+        items = self._prepare(read_records(paths), reader)
+        pending: Deque[Tuple[Future, List[_Item]]] = deque()
+        completed_batches = 0
+
+        def complete_oldest() -> None:
+            nonlocal completed_batches
+            future, batch = pending.popleft()
+            self._record(future, batch, checkpoint, reader)
+            completed_batches += 1
+            if completed_batches % self.checkpoint_every == 0:
+                self._save_checkpoint(checkpoint, reader)
+            if progress is not None:
+                progress(checkpoint)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for batch in token_batches(
+                items,
+                self.max_batch_tokens,
+                self.max_batch_items,
+                count=lambda item: item.tokens,
+            ):
+                if len(pending) >= self.max_concurrency:
+                    complete_oldest()
+                future = executor.submit(self._index_batch, batch)
+                pending.append((future, batch))
+            while pending:
+                complete_oldest()
+
+        # Rows after the last project do not belong to any batch
+        checkpoint.skipped += reader.skipped
+        checkpoint.unchanged += reader.unchanged
+        checkpoint.rows_done = reader.rows_read
+        withdrawn = self._delete_withdrawn(checkpoint, reader)
+        checkpoint.completed = True
+        self._save_checkpoint(checkpoint, reader)
+        if withdrawn:
+            # Only forget the projects once their deletion from the index is persisted
+            self.manifest.delete(withdrawn)
+        return checkpoint
+
+    def _prepare(
+        self, records: Iterable[Dict[str, str]], reader: _Reader
+    ) -> Iterator[_Item]:
+        """Select, clean and token-count the records that no previous run has processed.
+
+        Args:
+            records (Iterable[Dict[str, str]]): The CSV records.
+            reader (_Reader): Counters to update, starting after the processed rows.
+
+        Yields:
+            _Item: The cleaned projects with their embedding text and token count.
+        """
+        model = self.model or ""
+        for row, record in enumerate(records):
+            if row < reader.rows_read:
+                continue
+            reader.rows_read = row + 1
+            project = to_project(record)
+            if project is None:
+                reader.skipped += 1
+                continue
+            text = embedding_text(project)
+            text_hash = content_hash(text)
+            if self.manifest is not None:
+                reader.seen.append(project.id)
+                if self.skip_unchanged and self.manifest.is_current(
+                    project.id, text_hash, model
+                ):
+                    reader.unchanged += 1
+                    continue
+            chunks = self.chunker.split(text)
+            tokens = sum(count_tokens(chunk, self.model) for chunk in chunks)
+            yield _Item(
+                row, project, chunks, text_hash, tokens, reader.skipped, reader.unchanged
+            )
+            reader.skipped = 0
+            reader.unchanged = 0
+
+    def _index_batch(self, batch: List[_Item]) -> None:
+        """Embed the chunks of a batch with a single request and upsert them.
+
+        Args:
+            batch (List[_Item]): The batch.
+        """
+        embeddings = self.embedding_service.embed_many(
+            [chunk for item in batch for chunk in item.chunks]
+        )
+        self.index.upsert_embeddings(
+            [
+                chunk_project
+                for item in batch
+                for chunk_project in chunk_projects(item.project, len(item.chunks))
+            ],
+            embeddings,
+        )
+
+    def _record(
+        self,
+        future: Future,
+        batch: List[_Item],
+        checkpoint: IngestCheckpoint,
+        reader: _Reader,
+    ) -> None:
+        """Wait for a batch and record its outcome in the checkpoint.
+
+        The manifest entries of a stored batch are kept until the next checkpoint.
+
+        Args:
+            future (Future): The future of the batch.
+            batch (List[_Item]): The batch.
+            checkpoint (IngestCheckpoint): The checkpoint to update.
+            reader (_Reader): Counters holding the projects stored since the last checkpoint.
+        """
+        try:
+            future.result()
+        except Exception as error:
+            logger.error("Ingesting a batch of %d projects failed: %s", len(batch), error)
+            checkpoint.failed_ids.extend(item.project.id for item in batch)
+        else:
+            checkpoint.indexed += len(batch)
+            if self.manifest is not None:
+                reader.stored.extend(
+                    ManifestEntry(
+                        item.project.id,
+                        item.content_hash,
+                        self.model or "",
+                        item.project.content_update_date,
+                    )
+                    for item in batch
+                )
+        checkpoint.skipped += sum(item.skipped_before for item in batch)
+        checkpoint.unchanged += sum(item.unchanged_before for item in batch)
+        checkpoint.rows_done = batch[-1].row + 1
+
+    def _delete_withdrawn(
+        self, checkpoint: IngestCheckpoint, reader: _Reader
+    ) -> List[str]:
+        """Delete projects recorded in the manifest that were not in the input of this run.
+
+        Args:
+            checkpoint (IngestCheckpoint): The checkpoint of the finished run.
+            reader (_Reader): Counters holding the project ids seen since the last checkpoint.
+
+        Returns:
+            List[str]: The ids of the deleted projects.
+        """
+        if self.manifest is None:
+            return []
+        self.manifest.mark_seen(reader.seen, checkpoint.run_id)
+        reader.seen.clear()
+        withdrawn = self.manifest.withdrawn(checkpoint.run_id)
+        if not withdrawn:
+            return []
+        if len(withdrawn) > self.max_delete_fraction * len(self.manifest):
+            logger.warning(
+                "Not deleting %d of %d indexed projects that are missing from the input; "
+                "raise max_delete_fraction if they were withdrawn",
+                len(withdrawn),
+                len(self.manifest),
+            )
+            return []
+        self.index.delete(withdrawn)
+        checkpoint.deleted += len(withdrawn)
+        return withdrawn
+
+    def _load_checkpoint(self, paths: Sequence[str]) -> IngestCheckpoint:
+        """Load the checkpoint of an interrupted run, or start a new run.
+
+        Args:
+            paths (Sequence[str]): Paths of the CSV files.
+
+        Returns:
+            IngestCheckpoint: The checkpoint to continue from.
+
+        Raises:
+            ValueError: If the checkpoint of an interrupted run was written for different input files.
+        """
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return IngestCheckpoint(sources=list(paths))
+        with open(self.checkpoint_path, "r", encoding="utf-8") as checkpoint_file:
+            checkpoint = IngestCheckpoint.model_validate_json(checkpoint_file.read())
+        if checkpoint.completed:
+            return IngestCheckpoint(sources=list(paths))
+        if checkpoint.sources != list(paths):
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} was written for {checkpoint.sources}; "
+                "remove it to ingest different files"
+            )
+        logger.info("Resuming ingestion after %d rows", checkpoint.rows_done)
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint: IngestCheckpoint, reader: _Reader) -> None:
+        """Flush the index and the manifest, then atomically write the checkpoint file.
+
+        A failure to record the stored projects in the manifest is logged rather than raised:
+        the projects are in the index, and the next run merely embeds them again.
+
+        Args:
+            checkpoint (IngestCheckpoint): The checkpoint to write.
+            reader (_Reader): Counters holding the projects seen and stored since the last checkpoint.
+        """
+        self.index.flush()
+        if self.manifest is not None and reader.stored:
+            try:
+                self.manifest.record(reader.stored, checkpoint.run_id)
+            except Exception as error:
+                logger.error(
+                    "Recording %d stored projects in the manifest failed; "
+                    "the next run embeds them again: %s",
+                    len(reader.stored),
+                    error,
+                )
+            reader.stored.clear()
+        if self.manifest is not None and reader.seen:
+            self.manifest.mark_seen(reader.seen, checkpoint.run_id)
+            reader.seen.clear()
+        if not self.checkpoint_path:
+            return
+        if os.path.dirname(self.checkpoint_path):
+            os.makedirs(os.path.dirname(self.checkpoint_path), exist_ok=True)
+        temporary_path = f"{self.checkpoint_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as checkpoint_file:
+            checkpoint_file.write(checkpoint.model_dump_json(indent=2))
+        os.replace(temporary_path, self.checkpoint_path)
@@ -0,0 +1,141 @@
+"""
+Precompute the summaries of CORDIS projects for the comparison service.
+
+The comparison service takes the one-sentence summary of an existing project from the
+summary store instead of generating it for every comparison. Projects that already have a
+summary for their current objective are skipped, so an interrupted run continues where it
+stopped and later runs only summarize new or changed projects.
+
+Usage:
+    python -m horizon_scope.ingest.summaries data/projects_14_20.csv data/projects_21_27.csv
+"""
+
+from __future__ import annotations
+import argparse
+import logging
+from itertools import islice
+from typing import Callable, Iterable, List, NamedTuple, Optional
+from horizon_scope.application.interfaces.project_summary_store import (
+    ProjectSummaryStore,
+)
+from horizon_scope.application.interfaces.summary_service import SummaryService
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.cache.sqlite_project_summary_store import (
+    DEFAULT_SUMMARY_STORE_PATH,
+    SQLiteProjectSummaryStore,
+)
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.openai_summary_service import (
+    OpenAISummaryService,
+)
+from horizon_scope.infrastructure.services.http_transport import HttpTransport
+from horizon_scope.infrastructure.services.rate_limiter import shared_rate_limiter
+from horizon_scope.ingest.cordis_csv import read_records, to_project
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryRun(NamedTuple):
+    """Counts of a summarization run."""
+
+    summarized: int = 0
+    existing: int = 0
+    failed: int = 0
+
+
+def summarize_projects(
+    projects: Iterable[Project],
+    service: SummaryService,
+    store: ProjectSummaryStore,
+    chunk_size: int = 200,
+    progress: Optional[Callable[[SummaryRun], None]] = None,
+) -> SummaryRun:
+    """Summarize every project that has no stored summary yet.
+
+    The projects are consumed in chunks of chunk_size, so memory use does not grow with the
+    dataset, and the summaries of a chunk are stored before the next one is requested.
+
+    Args:
+        projects (Iterable[Project]): The projects to summarize, consumed lazily.
+        service (SummaryService): The service generating the summaries.
+        store (ProjectSummaryStore): The store the summaries are written to.
+        chunk_size (int): Number of projects passed to the service at once. Defaults to 200.
+        progress (Optional[Callable[[SummaryRun], None]]): Called with the counts after every chunk. Defaults to None.
+
+    Returns:
+        SummaryRun: The number of summarized, already summarized and failed projects.
+    """
+    run = SummaryRun()
+    iterator = iter(projects)
+    while chunk := list(islice(iterator, chunk_size)):
+        missing: List[Project] = [
+            project for project in chunk if store.get(project.description) is None
+        ]
+        summaries = (
+            service.summarize_many([project.description for project in missing])
+            if missing
+            else []
+        )
+        for project, summary in zip(missing, summaries):
+            if summary is not None:
+                store.set(project.description, summary, project_id=project.id)
+        failed = summaries.count(None)
+        run = SummaryRun(
+            summarized=run.summarized + len(missing) - failed,
+            existing=run.existing + len(chunk) - len(missing),
+            failed=run.failed + failed,
+        )
+        if progress is not None:
+            progress(run)
+    return run
+
+
+def report(run: SummaryRun) -> None:
+    """Print the progress of the run."""
+    print(
+        f"{run.summarized} summarized, {run.existing} already summarized, "
+        f"{run.failed} failed",
+        flush=True,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("paths", nargs="+", help="CORDIS project CSV files")
+    parser.add_argument("--config", default="config.yml")
+    parser.add_argument("--chunk-size", type=int, default=200)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    config = ConfigManager(args.config)
+    summary_config = (
+        config.get("horizon-scope", "comparison-service", "summaries", default=None)
+        or {}
+    )
+    store = SQLiteProjectSummaryStore(
+        summary_config.get("path", DEFAULT_SUMMARY_STORE_PATH)
+    )
+    rate_limiter = shared_rate_limiter(config)
+    service = OpenAISummaryService(
+        config,
+        rate_limiter=rate_limiter,
+        transport=HttpTransport.from_config(config, rate_limiter),
+    )
+    projects = (
+        project
+        for project in map(to_project, read_records(args.paths))
+        if project is not None
+    )
+    run = summarize_projects(
+        projects, service, store, chunk_size=args.chunk_size, progress=report
+    )
+    report(run)
+    usage = service.usage.total
+    print(
+        f"{usage.requests} requests, {usage.prompt_tokens} prompt tokens, "
+        f"{usage.completion_tokens} completion tokens, ${usage.cost:.4f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+from concurrent.futures import Executor, Future
+from typing import Callable, Dict, Optional, Sequence, Set
+from horizon_scope.domain.entities.comparison import Comparison
+from horizon_scope.domain.entities.project import Project
+
+
+class ComparisonPrefetcher:
+    """Starts the comparisons of the top search hits before the user asks for them.
+
+    Comparisons run on a shared executor and are kept as futures by project id, so a
+    comparison that is requested later is either ready or only has its remainder left.
+    Every project is prefetched at most once until cancel is called, and each prefetcher
+    starts at most budget comparisons over its lifetime, which bounds the cost of
+    comparisons nobody looks at.
+
+    Attributes:
+        compare (Callable[[str, Project], Comparison]): Compares the user's description with a project.
+        executor (Executor): Runs the comparisons in the background.
+        top_n (int): Number of leading search hits to prefetch.
+        budget (int): Maximum number of comparisons started in total.
+        started (int): Number of comparisons started so far.
+    """
+
+    def __init__(
+        self,
+        compare: Callable[[str, Project], Comparison],
+        executor: Executor,
+        top_n: int = 3,
+        budget: int = 20,
+    ) -> None:
+        """Initialize ComparisonPrefetcher.
+
+        Args:
+            compare (Callable[[str, Project], Comparison]): Compares the user's description with a project, e.g. through a ComparisonMemory.
+            executor (Executor): Runs the comparisons in the background.
+            top_n (int): Number of leading search hits to prefetch. Defaults to 3.
+            budget (int): Maximum number of comparisons started in total. Defaults to 20.
+        """
+        self.compare = compare
+        self.executor = executor
+        self.top_n = top_n
+        self.budget = budget
+        self.started = 0
+        self._futures: Dict[str, Future] = {}
+        self._prefetched: Set[str] = set()
+
+    @property
+    def remaining(self) -> int:
+        """int: The number of comparisons that may still be started."""
+        return max(self.budget - self.started, 0)
+
+    def prefetch(self, my_project: str, projects: Sequence[Project]) -> int:
+        """Start the comparisons of the top_n projects that were not prefetched yet.
+
+        Args:
+            my_project (str): Description of the user's project.
+            projects (Sequence[Project]): The search hits, best first.
+
+        Returns:
+            int: The number of comparisons started.
+        """
+        count = 0
+        for project in projects[: self.top_n]:
+            if project.id in self._prefetched:
+                continue
+            if not self.remaining:
+                break
+            self._futures[project.id] = self.executor.submit(
+                self.compare, my_project, project
+            )
+            self._prefetched.add(project.id)
+            self.started += 1
+            count += 1
+        return count
+
+    def pop(self, project_id: str) -> Optional[Future]:
+        """Take over the prefetched comparison of a project.
+
+        Args:
+            project_id (str): The id of the project.
+
+        Returns:
+            Optional[Future]: The future of the comparison, or None if it was not prefetched.
+        """
+        return self._futures.pop(project_id, None)
+
+    def cancel(self) -> None:
+        """Cancel all prefetched comparisons, e.g. when the user's description changes.
+
+        Comparisons that have not started yet are dropped; running ones finish in the
+        background and their results are discarded.
+        """
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._prefetched.clear()
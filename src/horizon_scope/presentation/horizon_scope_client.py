@@ -1,26 +1,76 @@
 from __future__ import annotations
-from typing import Any
+import logging
+import os
+import threading
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional
 from horizon_scope.application.use_cases.compare_projects import CompareProjects
 from horizon_scope.domain.entities.comparison import Comparison
 from horizon_scope.domain.entities.horizon_scope_result import HorizonScopeResult
-from horizon_scope.infrastructure.services.pinecone_search_service import (
-    PineconeSearchService,
+from horizon_scope.domain.entities.indexing_report import IndexingReport
+from horizon_scope.domain.entities.match_update import MatchUpdate
+from horizon_scope.domain.entities.score_calibration import ScoreCalibration
+from horizon_scope.domain.entities.token_usage import TokenUsage
+from horizon_scope.infrastructure.services.hybrid_search_service import (
+    HybridSearchService,
 )
-from horizon_scope.infrastructure.services.openai_comparison_service import (
-    OpenAIComparisonService,
+from horizon_scope.infrastructure.services.cached_comparison_service import (
+    CachedComparisonService,
+)
+from horizon_scope.infrastructure.cache.sqlite_project_summary_store import (
+    DEFAULT_SUMMARY_STORE_PATH,
+    SQLiteProjectSummaryStore,
+)
+from horizon_scope.infrastructure.cache.sqlite_comparison_log import (
+    SQLiteComparisonLog,
+)
+from horizon_scope.infrastructure.services.http_transport import HttpTransport
+from horizon_scope.infrastructure.services.rate_limiter import (
+    RateLimiter,
+    shared_rate_limiter,
+)
+from horizon_scope.infrastructure.services.usage_tracker import (
+    aiter_with_usage,
+    iter_with_usage,
+    track_usage,
+)
+from horizon_scope.application.interfaces.comparison_service import ComparisonService
+from horizon_scope.application.interfaces.project_summary_store import (
+    ProjectSummaryStore,
+)
+from horizon_scope.application.interfaces.reranker import Reranker
+from horizon_scope.application.interfaces.streaming_comparison_service import (
+    ComparisonUpdateCallback,
+    StreamingComparisonService,
+)
+from horizon_scope.application.interfaces.vector_search_service import (
+    VectorSearchService,
+)
+from horizon_scope.infrastructure.config.backend_registry import (
+    create_embedding_service,
+    resolve_backend,
 )
 from horizon_scope.infrastructure.config.config_manager import ConfigManager
 from horizon_scope.domain.entities.project import Project
 
+logger = logging.getLogger(__name__)
+
 
 class HorizonScopeClient:
     """Client for handling horizon scope operations.
 
+    The backends are resolved through the backend registry, so only the configured
+    implementations and their dependencies are imported.
+
     Attributes:
         config_manager (ConfigManager): Configuration manager for the client.
-        vector_search_service (PineconeSearchService): Service for vector-based search operations.
-        comparison_service (OpenAIComparisonService): Service for comparing results using OpenAI.
-        compare_projects_use_case (CompareProjects): Use case for comparing projects.
+        rate_limiter (RateLimiter): Process-wide rate limiter shared by all OpenAI and Pinecone requests.
+        transport (HttpTransport): Pooled HTTP transport shared by all OpenAI clients of the client.
+        vector_search_service (VectorSearchService): Service for vector-based search operations (Pinecone or local, optionally fused with BM25).
+        comparison_service (ComparisonService): Service for comparing results using OpenAI, optionally behind a result cache.
+        compare_projects_use_case (CompareProjects): Use case for comparing projects, optionally reranking the search results first.
+        match_usage (TokenUsage): LLM token usage and cost of all matches, including their prompt cache hits.
+        matches (int): Number of completed matches.
+        last_match_usage (Optional[TokenUsage]): LLM token usage and cost of the most recent match.
     """
 
     def __init__(self, config_manager: ConfigManager) -> None:
@@ -30,11 +80,54 @@ class HorizonScopeClient:
             config_manager (ConfigManager): The configuration manager to use for setting up services.
         """
         self.config_manager = config_manager
-        self.vector_search_service = PineconeSearchService(config_manager)
-        self.comparison_service = OpenAIComparisonService(config_manager)
+        self.match_usage = TokenUsage()
+        self.matches = 0
+        self.last_match_usage: Optional[TokenUsage] = None
+        self._usage_lock = threading.Lock()
+        self.rate_limiter = shared_rate_limiter(config_manager)
+        self.transport = HttpTransport.from_config(config_manager, self.rate_limiter)
+        self.vector_search_service = self._create_vector_search_service(
+            config_manager, self.rate_limiter, self.transport
+        )
+        self.comparison_service = self._create_comparison_service(
+            config_manager, self.rate_limiter, self.transport
+        )
+        reranker_config = (
+            config_manager.get("horizon-scope", "reranker", default=None) or {}
+        )
+        calibration_config = (
+            config_manager.get(
+                "horizon-scope", "comparison-service", "calibration", default=None
+            )
+            or {}
+        )
         self.compare_projects_use_case = CompareProjects(
-            self.vector_search_service, self.comparison_service
+            self.vector_search_service,
+            self.comparison_service,
+            max_workers=config_manager.get(
+                "horizon-scope", "comparison-service", "max_concurrency", default=1
+            ),
+            reranker=self._create_reranker(
+                config_manager, self.rate_limiter, self.transport
+            ),
+            candidates=reranker_config.get("candidates", 50),
+            min_rerank_score=reranker_config.get("min_score"),
+            max_rerank_gap=reranker_config.get("max_gap"),
+            comparison_log=(
+                SQLiteComparisonLog(
+                    calibration_config["log_path"],
+                    max_entries=calibration_config.get("log_max_entries"),
+                )
+                if calibration_config.get("log_path")
+                else None
+            ),
+            calibration=self._load_score_calibration(calibration_config.get("path")),
+            min_expected_score=calibration_config.get("min_expected_score"),
+            estimate_skipped=calibration_config.get("estimate_skipped", True),
         )
+        if config_manager.get("horizon-scope", "http", "warm_up", default=False):
+            # Open the connections in the background, so startup does not wait for them
+            threading.Thread(target=self.transport.warm_up, daemon=True).start()
 
     @classmethod
     def from_config(cls, config_path: str = "config.yml") -> HorizonScopeClient:
@@ -49,6 +142,166 @@ class HorizonScopeClient:
         config = ConfigManager(config_path)
         return cls(config)
 
+    @staticmethod
+    def _create_vector_search_service(
+        config_manager: ConfigManager,
+        rate_limiter: RateLimiter,
+        transport: HttpTransport,
+    ) -> VectorSearchService:
+        """Create the vector search service selected by vector-search-service.store.type.
+
+        If vector-search-service.lexical.type is "bm25", the store is fused with a BM25 index.
+
+        Args:
+            config_manager (ConfigManager): The configuration manager to read the settings from.
+            rate_limiter (RateLimiter): The rate limiter of the embedding and index requests.
+            transport (HttpTransport): The pooled transport of the embedding requests.
+
+        Returns:
+            VectorSearchService: The vector search service to use.
+
+        Raises:
+            ValueError: If the configured store or lexical index type is not supported.
+        """
+        store_type = config_manager.get(
+            "horizon-scope", "vector-search-service", "store", "type", default="pinecone"
+        )
+        dense_service: VectorSearchService = resolve_backend("store", store_type)(
+            config_manager, rate_limiter, transport
+        )
+
+        lexical_config = (
+            config_manager.get(
+                "horizon-scope", "vector-search-service", "lexical", default=None
+            )
+            or {}
+        )
+        lexical_type = lexical_config.get("type", "none")
+        if lexical_type == "none":
+            return dense_service
+        return HybridSearchService(
+            dense_service,
+            resolve_backend("lexical", lexical_type)(config_manager),
+            candidates=lexical_config.get("candidates", 50),
+            rrf_k=lexical_config.get("rrf_k", 60),
+        )
+
+    @staticmethod
+    def _create_reranker(
+        config_manager: ConfigManager,
+        rate_limiter: RateLimiter,
+        transport: HttpTransport,
+    ) -> Optional[Reranker]:
+        """Create the reranker selected by reranker.type.
+
+        Args:
+            config_manager (ConfigManager): The configuration manager to read the settings from.
+            rate_limiter (RateLimiter): The rate limiter of the embedding requests.
+            transport (HttpTransport): The pooled transport of the embedding requests.
+
+        Returns:
+            Optional[Reranker]: The reranker to use, or None if reranking is disabled.
+
+        Raises:
+            ValueError: If the configured reranker type is not supported.
+        """
+        reranker_config = (
+            config_manager.get("horizon-scope", "reranker", default=None) or {}
+        )
+        reranker_type = reranker_config.get("type", "none")
+        if reranker_type == "none":
+            return None
+        reranker_class = resolve_backend("reranker", reranker_type)
+        if reranker_type == "embedding":
+            return reranker_class(
+                create_embedding_service(config_manager, rate_limiter, transport)
+            )
+        options = {"batch_size": reranker_config.get("batch_size", 32)}
+        if reranker_config.get("model"):
+            options["model_name"] = reranker_config["model"]
+        return reranker_class(**options)
+
+    @staticmethod
+    def _load_score_calibration(path: Optional[str]) -> Optional[ScoreCalibration]:
+        """Load the score calibration written by calibrate.
+
+        Args:
+            path (Optional[str]): Path of the calibration JSON file, or None.
+
+        Returns:
+            Optional[ScoreCalibration]: The calibration, or None if no file exists yet.
+        """
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as file:
+            return ScoreCalibration.model_validate_json(file.read())
+
+    @staticmethod
+    def _create_comparison_service(
+        config_manager: ConfigManager,
+        rate_limiter: RateLimiter,
+        transport: HttpTransport,
+    ) -> ComparisonService:
+        """Create the comparison service selected by comparison-service.type.
+
+        The service is wrapped in a result cache if one is configured.
+
+        Args:
+            config_manager (ConfigManager): The configuration manager to read the settings from.
+            rate_limiter (RateLimiter): The rate limiter of the comparison requests.
+            transport (HttpTransport): The pooled transport of the comparison requests.
+
+        Returns:
+            ComparisonService: The comparison service to use.
+
+        Raises:
+            ValueError: If the configured service or cache type is not supported.
+        """
+        service_type = config_manager.get(
+            "horizon-scope", "comparison-service", "type", default="openai"
+        )
+        comparison_service = resolve_backend("comparison-service", service_type)(
+            config_manager,
+            summaries=HorizonScopeClient._create_summary_store(config_manager),
+            rate_limiter=rate_limiter,
+            transport=transport,
+        )
+        cache_config = config_manager.get(
+            "horizon-scope", "comparison-service", "cache", default=None
+        )
+        if not cache_config:
+            return comparison_service
+
+        cache = resolve_backend("comparison-cache", cache_config.get("type", "sqlite"))(
+            cache_config.get("path", ".cache/comparisons.sqlite"),
+            ttl_seconds=cache_config.get("ttl_seconds"),
+            max_entries=cache_config.get("max_entries"),
+        )
+        return CachedComparisonService(comparison_service, cache)
+
+    @staticmethod
+    def _create_summary_store(
+        config_manager: ConfigManager,
+    ) -> Optional[ProjectSummaryStore]:
+        """Open the store of precomputed project summaries, if one is configured.
+
+        The store is filled offline with python -m horizon_scope.ingest.summaries.
+
+        Args:
+            config_manager (ConfigManager): The configuration manager to read the settings from.
+
+        Returns:
+            Optional[ProjectSummaryStore]: The summary store, or None to generate every summary.
+        """
+        summary_config = config_manager.get(
+            "horizon-scope", "comparison-service", "summaries", default=None
+        )
+        if not summary_config:
+            return None
+        return SQLiteProjectSummaryStore(
+            summary_config.get("path", DEFAULT_SUMMARY_STORE_PATH)
+        )
+
     def match(self, query: str, k: int) -> list[HorizonScopeResult]:
         """Perform a match operation using the provided query.
 
@@ -59,7 +312,134 @@ class HorizonScopeClient:
         Returns:
             list[HorizonScopeResult]: A list of HorizonScopeResult objects matching the query.
         """
-        return self.compare_projects_use_case.execute(query, k)
+        with track_usage() as usage:
+            results = self.compare_projects_use_case.execute(query, k)
+        self._record_match_usage(usage)
+        return results
+
+    async def amatch(self, query: str, k: int) -> list[HorizonScopeResult]:
+        """Asynchronously perform a match operation using the provided query.
+
+        Args:
+            query (str): The query string to match against.
+            k (int): The number of results to return.
+
+        Returns:
+            list[HorizonScopeResult]: A list of HorizonScopeResult objects matching the query.
+        """
+        with track_usage() as usage:
+            results = await self.compare_projects_use_case.aexecute(query, k)
+        self._record_match_usage(usage)
+        return results
+
+    def match_iter(self, query: str, k: int) -> Iterator[MatchUpdate]:
+        """Perform a match operation and yield the results as the comparisons complete.
+
+        The first update carries the search hits, every later one a result; see
+        CompareProjects.execute_iter. Feed the updates to RankedResults for a sorted view.
+
+        Args:
+            query (str): The query string to match against.
+            k (int): The number of results to return.
+
+        Yields:
+            MatchUpdate: The search hits, then one result per update.
+        """
+        usage = TokenUsage()
+        yield from iter_with_usage(
+            self.compare_projects_use_case.execute_iter(query, k), usage
+        )
+        self._record_match_usage(usage)
+
+    async def amatch_iter(self, query: str, k: int) -> AsyncIterator[MatchUpdate]:
+        """Asynchronously perform a match operation and yield the results as they complete.
+
+        Args:
+            query (str): The query string to match against.
+            k (int): The number of results to return.
+
+        Yields:
+            MatchUpdate: The search hits, then one result per update.
+        """
+        usage = TokenUsage()
+        async for update in aiter_with_usage(
+            self.compare_projects_use_case.aexecute_iter(query, k), usage
+        ):
+            yield update
+        self._record_match_usage(usage)
+
+    @property
+    def cost_per_match(self) -> float:
+        """float: Average LLM cost of a match in USD."""
+        with self._usage_lock:
+            return self.match_usage.cost / self.matches if self.matches else 0.0
+
+    def _record_match_usage(self, usage: TokenUsage) -> None:
+        """Add the usage of a finished match to the aggregated counters.
+
+        Args:
+            usage (TokenUsage): The usage collected during the match.
+        """
+        with self._usage_lock:
+            self.match_usage.add(usage)
+            self.matches += 1
+            self.last_match_usage = usage
+        logger.info(
+            "Match used %d requests, %d prompt tokens (%.0f%% cached), "
+            "%d completion tokens, $%.4f",
+            usage.requests,
+            usage.prompt_tokens,
+            usage.cache_hit_ratio * 100,
+            usage.completion_tokens,
+            usage.cost,
+        )
+
+    def calibrate(self, n_bins: int = 20, min_samples: int = 50) -> ScoreCalibration:
+        """Fit the similarity to score calibration on the logged comparisons and save it.
+
+        The calibration is written to comparison-service.calibration.path and used for gating
+        by this client right away.
+
+        Args:
+            n_bins (int): The maximum number of knots of the mapping. Defaults to 20.
+            min_samples (int): The minimum number of logged comparisons. Defaults to 50.
+
+        Returns:
+            ScoreCalibration: The fitted calibration.
+
+        Raises:
+            ValueError: If no comparison log or calibration path is configured, or too few comparisons were logged.
+        """
+        comparison_log = self.compare_projects_use_case.comparison_log
+        path = self.config_manager.get(
+            "horizon-scope", "comparison-service", "calibration", "path", default=None
+        )
+        if comparison_log is None or not path:
+            raise ValueError(
+                "comparison-service.calibration needs log_path and path to calibrate"
+            )
+        samples = comparison_log.samples()
+        if len(samples) < min_samples:
+            raise ValueError(
+                f"{len(samples)} logged comparisons, at least {min_samples} are required"
+            )
+        # Imported here as fitting needs numpy, which matching does not
+        from horizon_scope.infrastructure.services.score_calibration import (
+            fit_score_calibration,
+        )
+
+        calibration = fit_score_calibration(samples, n_bins=n_bins)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(calibration.model_dump_json())
+        self.compare_projects_use_case.calibration = calibration
+        return calibration
+
+    @property
+    def saved_comparisons(self) -> int:
+        """int: Number of comparison calls skipped by the expected-score gate."""
+        return self.compare_projects_use_case.saved_calls
 
     def index_project(self, project: Project) -> None:
         """Index a project into the vector search service.
@@ -69,6 +449,26 @@ class HorizonScopeClient:
         """
         self.vector_search_service.index_project(project)
 
+    def index_projects(
+        self,
+        projects: Iterable[Project],
+        progress: Optional[Callable[[IndexingReport], None]] = None,
+        **kwargs: Any,
+    ) -> IndexingReport:
+        """Index many projects with batched embedding and storage requests.
+
+        Args:
+            projects (Iterable[Project]): The projects to index, consumed lazily.
+            progress (Optional[Callable[[IndexingReport], None]]): Called after every finished batch. Defaults to None.
+            **kwargs: Batching options of the vector search service, e.g. max_concurrency.
+
+        Returns:
+            IndexingReport: Counts, failed project ids and timing of the run.
+        """
+        return self.vector_search_service.index_projects(
+            projects, progress=progress, **kwargs
+        )
+
     def search_projects(self, query: str, k: int) -> list[Project]:
         """Search for projects based on the provided query.
 
@@ -81,6 +481,18 @@ class HorizonScopeClient:
         """
         return self.vector_search_service.search(query, k)
 
+    async def asearch_projects(self, query: str, k: int) -> list[Project]:
+        """Asynchronously search for projects based on the provided query.
+
+        Args:
+            query (str): The query string to search for.
+            k (int): The number of results to return.
+
+        Returns:
+            list[Project]: A list of Project objects matching the search query.
+        """
+        return await self.vector_search_service.asearch(query, k)
+
     def compare_projects(self, my_project: str, existing_project: str) -> Comparison:
         """Compare two projects.
 
@@ -93,6 +505,46 @@ class HorizonScopeClient:
         """
         return self.comparison_service.compare(my_project, existing_project)
 
+    async def acompare_projects(
+        self, my_project: str, existing_project: str
+    ) -> Comparison:
+        """Asynchronously compare two projects.
+
+        Args:
+            my_project (str): The description of my project.
+            existing_project (str): The description of the existing project.
+
+        Returns:
+            Comparison: The comparison result between the two projects.
+        """
+        return await self.comparison_service.acompare(my_project, existing_project)
+
+    def compare_projects_streaming(
+        self,
+        my_project: str,
+        existing_project: str,
+        on_update: ComparisonUpdateCallback,
+    ) -> Comparison:
+        """Compare two projects and report the comparison fields as they are generated.
+
+        Comparison services without streaming support report the complete comparison once.
+
+        Args:
+            my_project (str): The description of my project.
+            existing_project (str): The description of the existing project.
+            on_update (ComparisonUpdateCallback): Called with the fields generated so far whenever they change.
+
+        Returns:
+            Comparison: The comparison result between the two projects.
+        """
+        if isinstance(self.comparison_service, StreamingComparisonService):
+            return self.comparison_service.compare_streaming(
+                my_project, existing_project, on_update
+            )
+        comparison = self.comparison_service.compare(my_project, existing_project)
+        on_update(comparison.model_dump())
+        return comparison
+
     def get_config(self, *keys: str, default: Any = None) -> Any:
         """Retrieve configuration values based on the provided keys.
 
@@ -6,15 +6,165 @@ and display search results and project comparisons.
 """
 
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 import streamlit as st
 
+from horizon_scope.infrastructure.cache.comparison_memory import ComparisonMemory
 from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.presentation.comparison_prefetcher import ComparisonPrefetcher
 from horizon_scope.presentation.horizon_scope_client import HorizonScopeClient
 from horizon_scope.domain.entities.project import Project
 from horizon_scope.domain.entities.comparison import Comparison
 
+# Search results are shared by all sessions of the server process
+SEARCH_CACHE_TTL_SECONDS = 3600
+SEARCH_CACHE_MAX_ENTRIES = 256
+SEARCH_RESULTS = 20
+DEFAULT_COMPARISON_MEMORY_BYTES = 32 * 1024 * 1024
+
+
+@st.cache_resource(show_spinner=False)
+def load_config(config_path: str) -> ConfigManager:
+    """
+    Load the configuration once per server process.
+
+    Args:
+        config_path: Path to the configuration file.
+
+    Returns:
+        The configuration manager.
+    """
+    return ConfigManager(config_path)
+
+
+@st.cache_resource(show_spinner=False)
+def get_client(config_path: str) -> HorizonScopeClient:
+    """
+    Create the client once per server process.
+
+    All sessions and reruns share the client, so its OpenAI and Pinecone connections
+    are reused.
+
+    Args:
+        config_path: Path to the configuration file.
+
+    Returns:
+        The shared HorizonScopeClient instance.
+    """
+    return HorizonScopeClient(load_config(config_path))
+
+
+@st.cache_data(
+    ttl=SEARCH_CACHE_TTL_SECONDS,
+    max_entries=SEARCH_CACHE_MAX_ENTRIES,
+    show_spinner=False,
+)
+def search_projects(_client: HorizonScopeClient, query: str, k: int) -> List[Project]:
+    """
+    Search for similar projects, reusing the results of earlier identical searches.
+
+    Results are keyed by the description and k; the client is not part of the key.
+
+    Args:
+        _client: The HorizonScopeClient instance.
+        query: The user's project description.
+        k: The number of results to return.
+
+    Returns:
+        The matching projects.
+    """
+    return _client.search_projects(query=query, k=k)
+
+
+@st.cache_resource(show_spinner=False)
+def create_comparison_memory(max_bytes: int) -> ComparisonMemory:
+    """
+    Create the comparison memory, shared by all sessions.
+
+    Args:
+        max_bytes: Upper bound of the approximate size of the remembered comparisons.
+
+    Returns:
+        The shared comparison memory.
+    """
+    return ComparisonMemory(max_bytes=max_bytes)
+
+
+def get_comparison_memory(client: HorizonScopeClient) -> ComparisonMemory:
+    """
+    Return the comparison memory sized by streamlit.comparison_memory.max_bytes.
+
+    Args:
+        client: The HorizonScopeClient instance.
+
+    Returns:
+        The shared comparison memory.
+    """
+    memory_config = (
+        client.config_manager.get(
+            "horizon-scope", "streamlit", "comparison_memory", default=None
+        )
+        or {}
+    )
+    return create_comparison_memory(
+        memory_config.get("max_bytes", DEFAULT_COMPARISON_MEMORY_BYTES)
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_prefetch_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Create the executor for prefetched comparisons, shared by all sessions.
+
+    Args:
+        max_workers: The maximum number of comparisons prefetched at once.
+
+    Returns:
+        The shared executor.
+    """
+    return ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="comparison-prefetch"
+    )
+
+
+def get_prefetcher(client: HorizonScopeClient) -> Optional[ComparisonPrefetcher]:
+    """
+    Return the comparison prefetcher of the session, if prefetching is enabled.
+
+    Args:
+        client: The HorizonScopeClient instance.
+
+    Returns:
+        The session's prefetcher, or None if streamlit.prefetch.enabled is not set.
+    """
+    prefetch_config = (
+        client.config_manager.get(
+            "horizon-scope", "streamlit", "prefetch", default=None
+        )
+        or {}
+    )
+    if not prefetch_config.get("enabled", False):
+        return None
+    if "prefetcher" not in st.session_state:
+        memory = get_comparison_memory(client)
+
+        def compare(my_project: str, project: Project) -> Comparison:
+            return memory.get_or_compute(
+                my_project,
+                project.id,
+                lambda: client.compare_projects(my_project, project.description),
+            )
+
+        st.session_state.prefetcher = ComparisonPrefetcher(
+            compare,
+            get_prefetch_executor(prefetch_config.get("max_workers", 4)),
+            top_n=prefetch_config.get("top_n", 3),
+            budget=prefetch_config.get("max_comparisons", 20),
+        )
+    return st.session_state.prefetcher
+
 
 def initialize_session_state() -> None:
     """Initialize the Streamlit session state with default values."""
@@ -26,6 +176,8 @@ def initialize_session_state() -> None:
         st.session_state.project_description = ""
     if "k" not in st.session_state:
         st.session_state.k = 3
+    if "shown_comparisons" not in st.session_state:
+        st.session_state.shown_comparisons = set()
 
 
 def start_comparison():
@@ -57,7 +209,11 @@ def create_project_card(
     col1, col2, col3 = st.columns([1, 4, 1])
 
     with col1:
-        st.metric("Similarity", f"{project.similarity:.1%}")
+        if project.similarity is None:
+            # Found by keyword search only, which has no comparable similarity
+            st.metric("Similarity", "Keyword")
+        else:
+            st.metric("Similarity", f"{project.similarity:.1%}")
 
     with col2:
         st.subheader(project.title or "Untitled Project")
@@ -68,43 +224,57 @@ def create_project_card(
             "🔗 View on CORDIS", f"https://cordis.europa.eu/project/id/{project.id}"
         )
         if st.button("🤖 AI Compare", key=f"compare_button_{index}"):
-            st.session_state[f"show_comparison_{index}"] = True
+            st.session_state.shown_comparisons.add(project.id)
 
-    if st.session_state.get(f"show_comparison_{index}", False):
+    if project.id in st.session_state.shown_comparisons:
         with st.expander("Comparison Results", expanded=True):
             comparison = get_or_compute_comparison(
-                index, client, user_project_description, project.description
+                client, user_project_description, project
             )
             display_comparison_results(comparison)
 
 
 def get_or_compute_comparison(
-    index: int,
     client: HorizonScopeClient,
     user_project_description: str,
-    project_description: str,
+    project: Project,
 ) -> Comparison:
     """
-    Get the existing comparison or compute a new one if it doesn't exist.
+    Get the comparison from the shared memory or compute it if no session has yet.
+
+    If another session or a prefetch is already comparing the project, its result is
+    awaited instead of starting a second request. A prefetch that has not started yet is
+    cancelled, and the comparison is computed in the foreground with streamed fields.
 
     Args:
-        index: The index of the project in the search results.
         client: The HorizonScopeClient instance.
         user_project_description: The user's project description.
-        project_description: The description of the project to compare.
+        project: The project to compare.
 
     Returns:
         The comparison result.
     """
-    if f"comparison_{index}" not in st.session_state:
-        with st.spinner("Analyzing projects..."):
-            comparison = client.compare_projects(
-                user_project_description,
-                project_description,
-            )
-        st.session_state[f"comparison_{index}"] = comparison
-    else:
-        comparison = st.session_state[f"comparison_{index}"]
+    prefetcher = get_prefetcher(client)
+    future = prefetcher.pop(project.id) if prefetcher is not None else None
+    if future is not None:
+        future.cancel()
+
+    # Render the fields while they are generated, then hand over to the caller
+    placeholder = st.empty()
+
+    def render_partial(fields: Dict[str, Any]) -> None:
+        with placeholder.container():
+            display_comparison_fields(fields)
+
+    with st.spinner("Analyzing projects..."):
+        comparison = get_comparison_memory(client).get_or_compute(
+            user_project_description,
+            project.id,
+            lambda: client.compare_projects_streaming(
+                user_project_description, project.description, render_partial
+            ),
+        )
+    placeholder.empty()
     return comparison
 
 
@@ -115,36 +285,44 @@ def display_comparison_results(comparison: Comparison) -> None:
     Args:
         comparison: The comparison result to display.
     """
+    display_comparison_fields(comparison.model_dump())
+
+
+def display_comparison_fields(fields: Dict[str, Any]) -> None:
+    """
+    Display the fields of a complete or partially generated comparison.
+
+    Fields that have not been generated yet are left out.
+
+    Args:
+        fields: The comparison fields, keyed by name.
+    """
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("🤖 AI Similarity", f"{comparison.score:.1%}")
+        if isinstance(fields.get("score"), (int, float)):
+            st.metric("🤖 AI Similarity", f"{fields['score']:.1%}")
     with col2:
-        st.metric("🔒 Confidence", f"{comparison.confidence:.1%}")
+        if isinstance(fields.get("confidence"), (int, float)):
+            st.metric("🔒 Confidence", f"{fields['confidence']:.1%}")
 
     st.subheader("Summary")
-    st.write(comparison.summary)
+    st.write(fields.get("summary", ""))
 
     subcol1, subcol2 = st.columns(2)
     with subcol1:
         st.subheader("✅ Similarities")
-        st.write(comparison.similarity)
+        st.write(fields.get("similarity", ""))
     with subcol2:
         st.subheader("❌ Differences")
-        st.write(comparison.difference)
+        st.write(fields.get("difference", ""))
 
     st.subheader("🧐 Analysis")
-    st.write(comparison.reason)
+    st.write(fields.get("reason", ""))
 
 
 def clear_comparison_data() -> None:
-    """Clear all comparison-related data from the session state."""
-    keys_to_remove = [
-        key
-        for key in st.session_state.keys()
-        if key.startswith("comparison_") or key.startswith("show_comparison_")
-    ]
-    for key in keys_to_remove:
-        del st.session_state[key]
+    """Collapse all comparisons of the session; the shared memory keeps their results."""
+    st.session_state.shown_comparisons = set()
 
 
 def main() -> None:
@@ -157,14 +335,14 @@ def main() -> None:
     config_path = os.path.join(
         os.path.dirname(__file__), "..", "..", "..", "config.yml"
     )
-    config_manager = ConfigManager(config_path)
+    config_manager = load_config(config_path)
 
     if not config_manager.is_openai_api_key_set():
         handle_missing_api_key()
 
-    client = HorizonScopeClient.from_config(config_path)
+    client = get_client(config_path)
 
-    display_sidebar()
+    display_sidebar(client)
     display_main_content(client)
 
 
@@ -174,15 +352,31 @@ def handle_missing_api_key() -> None:
     api_key = st.text_input("OpenAI API key:", type="password")
     if api_key:
         os.environ["OPENAI_API_KEY"] = api_key
+        # Re-read the configuration, which resolves the key from the environment
+        load_config.clear()
         st.success("API key set. Please reload the page.")
         st.rerun()
     else:
         st.stop()
 
 
-def display_sidebar() -> None:
+def display_sidebar(client: HorizonScopeClient) -> None:
     """Display the sidebar content."""
     with st.sidebar:
+        stats = get_comparison_memory(client).stats()
+        with st.expander("📈 Shared comparisons"):
+            st.caption(
+                f"{stats['entries']} remembered ({stats['bytes'] / 2**20:.1f} MiB), "
+                f"{stats['hits']} hits, {stats['joined']} joined, "
+                f"{stats['misses']} computed, {stats['evictions']} evicted"
+            )
+        connections = client.transport.stats()
+        with st.expander("🔌 OpenAI connections"):
+            st.caption(
+                f"{connections['requests']} requests on "
+                f"{connections['connections']} connections, "
+                f"{connections['reused']} reused"
+            )
         st.markdown("### ℹ️ About")
         st.markdown("🌐 [GitHub Repository](https://github.com/turboflo/horizon-scope)")
         st.markdown(
@@ -209,6 +403,9 @@ def display_main_content(client: HorizonScopeClient) -> None:
 
     if submit_button:
         clear_comparison_data()  # Clear old comparison data
+        prefetcher = get_prefetcher(client)
+        if prefetcher is not None:
+            prefetcher.cancel()
         st.session_state.project_description = project_description
         st.session_state.searching = True
         st.rerun()
@@ -216,8 +413,8 @@ def display_main_content(client: HorizonScopeClient) -> None:
     if st.session_state.get("searching", False):
         if st.session_state.project_description:
             with st.spinner("Searching for similar projects..."):
-                search_results = client.search_projects(
-                    query=st.session_state.project_description, k=20
+                search_results = search_projects(
+                    client, st.session_state.project_description, SEARCH_RESULTS
                 )
 
             st.header("📊 Search Results")
@@ -227,6 +424,13 @@ def display_main_content(client: HorizonScopeClient) -> None:
                     project, i, client, st.session_state.project_description
                 )
 
+            prefetcher = get_prefetcher(client)
+            if prefetcher is not None:
+                # Compare the top hits while the user reads the results
+                prefetcher.prefetch(
+                    st.session_state.project_description, search_results
+                )
+
         else:
             st.warning("⚠️ Please enter a project description.")
             st.session_state.searching = False
@@ -0,0 +1,110 @@
+import re
+import subprocess
+import sys
+import pytest
+from unittest.mock import Mock, patch
+from horizon_scope.infrastructure.config import backend_registry
+from horizon_scope.infrastructure.config.backend_registry import (
+    create_embedding_service,
+    register_backend,
+    resolve_backend,
+)
+from horizon_scope.infrastructure.services.bm25_search_service import (
+    BM25SearchService,
+)
+
+# Cumulative import time of the client module; about 0.25s without the backends
+IMPORT_TIME_BUDGET_SECONDS = 0.75
+# Dependencies of the backends that importing the client must not load
+HEAVY_MODULES = ["openai", "pinecone", "numpy", "tiktoken", "httpx", "jiter"]
+CLIENT_MODULE = "horizon_scope.presentation.horizon_scope_client"
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    registered = {
+        kind: dict(names) for kind, names in backend_registry.BACKENDS.items()
+    }
+    monkeypatch.setattr(backend_registry, "BACKENDS", registered)
+    return registered
+
+
+def test_resolve_backend():
+    assert resolve_backend("lexical", "bm25") is BM25SearchService
+
+
+def test_resolve_backend_follows_patches():
+    with patch(
+        "horizon_scope.infrastructure.services.bm25_search_service.BM25SearchService"
+    ) as mock_service:
+        assert resolve_backend("lexical", "bm25") is mock_service
+
+
+def test_resolve_backend_with_unsupported_type():
+    with pytest.raises(ValueError, match="Unsupported vector store type: faiss"):
+        resolve_backend("store", "faiss")
+
+
+def test_register_backend(backends):
+    target = f"{BM25SearchService.__module__}:BM25SearchService"
+
+    register_backend("store", "bm25", target)
+
+    assert resolve_backend("store", "bm25") is BM25SearchService
+    assert backends["store"]["bm25"] == target
+
+
+@patch(
+    "horizon_scope.infrastructure.services.openai_embedding_service."
+    "OpenAIEmbeddingService"
+)
+def test_create_embedding_service(mock_service):
+    # Arrange
+    config = Mock()
+    config.get.side_effect = lambda *args, default=None: default
+    rate_limiter = Mock()
+    transport = Mock()
+
+    # Act
+    service = create_embedding_service(config, rate_limiter, transport)
+
+    # Assert
+    assert service is mock_service.return_value
+    mock_service.assert_called_once_with(config, rate_limiter, transport)
+
+
+def test_create_embedding_service_with_unsupported_type():
+    config = Mock()
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "vector-search-service", "embeddings", "type"): "cohere"
+    }.get(args, default)
+
+    with pytest.raises(ValueError, match="Unsupported embedding service type: cohere"):
+        create_embedding_service(config)
+
+
+def test_client_import_stays_within_budget():
+    # Arrange: a fresh interpreter, so nothing is imported yet
+    code = (
+        f"import sys, {CLIENT_MODULE}; "
+        f"print([name for name in {HEAVY_MODULES!r} if name in sys.modules])"
+    )
+
+    # Act
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Assert
+    assert result.stdout.strip() == "[]"
+    cumulative_us = next(
+        int(match.group(1))
+        for match in re.finditer(
+            r"^import time:\s+\d+ \|\s+(\d+) \| (\S+)$", result.stderr, re.MULTILINE
+        )
+        if match.group(2) == CLIENT_MODULE
+    )
+    assert cumulative_us / 1e6 < IMPORT_TIME_BUDGET_SECONDS
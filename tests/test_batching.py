@@ -0,0 +1,44 @@
+from unittest.mock import patch
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.services.batching import batched, token_batches
+
+
+def make_projects(n, description="word " * 10):
+    return [Project(id=str(i), description=description) for i in range(n)]
+
+
+def test_batched():
+    assert list(batched(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batched([], 2)) == []
+
+
+def test_token_batches_respects_token_budget():
+    projects = make_projects(5)
+
+    with patch(
+        "horizon_scope.infrastructure.services.batching.count_tokens",
+        return_value=10,
+    ):
+        batches = list(token_batches(iter(projects), max_tokens=25, max_items=100))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+def test_token_batches_respects_item_limit():
+    batches = list(token_batches(make_projects(5), max_tokens=10**6, max_items=3))
+
+    assert [len(batch) for batch in batches] == [3, 2]
+
+
+def test_token_batches_emits_oversized_project_alone():
+    with patch(
+        "horizon_scope.infrastructure.services.batching.count_tokens",
+        side_effect=[5, 100, 5],
+    ):
+        batches = list(token_batches(make_projects(3), max_tokens=50))
+
+    assert [[project.id for project in batch] for batch in batches] == [
+        ["0"],
+        ["1"],
+        ["2"],
+    ]
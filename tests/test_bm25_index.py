@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from horizon_scope.infrastructure.index.bm25_index import BM25Index, tokenize
+
+TEXTS = [
+    "Quantum sensors for gravitational wave detection",
+    "Gravitational lensing surveys of distant galaxies",
+    "Soil microbiome and crop resilience under drought",
+    "H2020-MSCA training network on quantum quantum optics",
+]
+
+
+def test_tokenize_lowercases_and_splits_codes():
+    assert tokenize("H2020-MSCA Grant 101034 (ERC)") == [
+        "h2020",
+        "msca",
+        "grant",
+        "101034",
+        "erc",
+    ]
+
+
+def test_build_groups_postings_by_term():
+    index = BM25Index.build(TEXTS)
+
+    term_id = index.vocabulary["gravitational"]
+    start, end = index.offsets[term_id], index.offsets[term_id + 1]
+    assert index.postings[start:end].tolist() == [0, 1]
+    assert index.offsets[-1] == len(index.postings)
+    assert index.n_docs == 4
+    assert index.doc_lengths.tolist() == [len(tokenize(text)) for text in TEXTS]
+
+
+def test_search_ranks_documents_with_query_terms():
+    index = BM25Index.build(TEXTS)
+
+    positions, scores = index.search("quantum gravitational", 10)
+
+    # Document 0 contains both terms, documents 1 and 3 one each, document 2 neither
+    assert positions[0] == 0
+    assert sorted(positions.tolist()) == [0, 1, 3]
+    assert np.all(np.diff(scores) <= 0)
+    assert np.all(scores > 0)
+
+
+def test_search_prefers_rare_terms():
+    index = BM25Index.build(TEXTS + ["Quantum computing"] * 4)
+
+    positions, _ = index.search("quantum msca", 1)
+
+    assert positions.tolist() == [3]
+
+
+def test_search_without_known_terms_returns_nothing():
+    index = BM25Index.build(TEXTS)
+
+    positions, scores = index.search("blockchain", 5)
+
+    assert positions.tolist() == []
+    assert scores.tolist() == []
+
+
+def test_build_empty_corpus():
+    index = BM25Index.build([])
+
+    positions, _ = index.search("quantum", 5)
+
+    assert index.n_docs == 0
+    assert positions.tolist() == []
+
+
+def test_arrays_round_trip(tmp_path):
+    index = BM25Index.build(TEXTS, k1=1.2, b=0.5)
+    path = str(tmp_path / "bm25.npz")
+
+    np.savez(path, **index.to_arrays())
+    with np.load(path, allow_pickle=False) as archive:
+        loaded = BM25Index.from_arrays(archive)
+
+    assert loaded.vocabulary == index.vocabulary
+    assert loaded.k1 == pytest.approx(1.2)
+    assert loaded.b == pytest.approx(0.5)
+    positions, scores = loaded.search("quantum optics", 4)
+    expected_positions, expected_scores = index.search("quantum optics", 4)
+    assert positions.tolist() == expected_positions.tolist()
+    np.testing.assert_allclose(scores, expected_scores)
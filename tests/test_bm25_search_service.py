@@ -0,0 +1,125 @@
+import asyncio
+import os
+import numpy as np
+import pytest
+from unittest.mock import Mock, patch
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.bm25_search_service import (
+    BM25SearchService,
+)
+
+
+@pytest.fixture
+def source_path(tmp_path):
+    path = str(tmp_path / "projects.npz")
+    np.savez(
+        path,
+        ids=np.asarray(["1", "2", "3"]),
+        titles=np.asarray(["QUANTA", "SOILHEALTH", "GRAVWAVE"]),
+        objectives=np.asarray(
+            [
+                "Quantum sensors for precision metrology",
+                "Soil microbiome and drought resilience",
+                "Gravitational wave detection with quantum optics",
+            ]
+        ),
+        dates=np.asarray(
+            ["2023-01-01T00:00:00", "2023-01-02T00:00:00", "2023-01-03T00:00:00"]
+        ),
+    )
+    return path
+
+
+@pytest.fixture
+def mock_config(source_path, tmp_path):
+    config = Mock(spec=ConfigManager)
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "vector-search-service", "lexical"): {
+            "path": str(tmp_path / "index" / "bm25.npz"),
+            "source": source_path,
+        },
+    }.get(args, default)
+    return config
+
+
+def test_initialization_builds_and_saves_index(mock_config, tmp_path):
+    service = BM25SearchService(mock_config)
+
+    assert os.path.exists(tmp_path / "index" / "bm25.npz")
+    assert service.ids == ["1", "2", "3"]
+    assert service.index.n_docs == 3
+
+
+def test_initialization_loads_saved_index(mock_config):
+    BM25SearchService(mock_config)
+
+    with patch(
+        "horizon_scope.infrastructure.services.bm25_search_service.load_project_metadata"
+    ) as mock_load:
+        service = BM25SearchService(mock_config)
+
+    mock_load.assert_not_called()
+    assert service.titles == ["QUANTA", "SOILHEALTH", "GRAVWAVE"]
+    assert [project.id for project in service.search("soil", 3)] == ["2"]
+
+
+def test_search_matches_titles_and_objectives(mock_config):
+    # Arrange
+    service = BM25SearchService(mock_config)
+
+    # Act
+    results = service.search("gravwave quantum", 3)
+
+    # Assert
+    assert [project.id for project in results] == ["3", "1"]
+    assert isinstance(results[0], Project)
+    assert results[0].title == "GRAVWAVE"
+    assert results[0].description == "Gravitational wave detection with quantum optics"
+    assert results[0].content_update_date == "2023-01-03T00:00:00"
+    assert results[0].similarity is None
+
+
+def test_asearch(mock_config):
+    service = BM25SearchService(mock_config)
+
+    results = asyncio.run(service.asearch("quanta", 2))
+
+    assert [project.id for project in results] == ["1"]
+
+
+def test_flush_applies_upserts_and_deletes(mock_config, tmp_path):
+    # Arrange
+    service = BM25SearchService(mock_config)
+    service.upsert_embeddings(
+        [
+            Project(id="4", title="NEWCROP", description="Drought tolerant crops"),
+            Project(id="4#1", title="NEWCROP", description="Second chunk"),
+            Project(id="2", title="SOILHEALTH", description="Soil carbon storage"),
+        ],
+        [[0.1], [0.2], [0.3]],
+    )
+    service.delete(["1", "unknown"])
+
+    # Act
+    before_flush = service.search("drought", 3)
+    service.flush()
+
+    # Assert
+    assert [project.id for project in before_flush] == ["2"]
+    assert service.ids == ["2", "3", "4"]
+    assert [project.id for project in service.search("drought", 3)] == ["4"]
+    assert service.search("quanta", 3) == []
+    assert service.search("carbon", 3)[0].description == "Soil carbon storage"
+    reloaded = BM25SearchService(mock_config)
+    assert reloaded.ids == ["2", "3", "4"]
+    assert [project.id for project in reloaded.search("newcrop", 3)] == ["4"]
+
+
+def test_flush_without_changes_does_not_save(mock_config):
+    service = BM25SearchService(mock_config)
+    service.save = Mock()
+
+    service.flush()
+
+    service.save.assert_not_called()
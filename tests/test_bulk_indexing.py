@@ -0,0 +1,76 @@
+import threading
+from unittest.mock import Mock
+from horizon_scope.domain.entities.indexing_report import IndexingReport
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.services.bulk_indexing import run_bulk_indexing
+from horizon_scope.infrastructure.services.rate_limiter import CircuitOpenError
+
+
+def make_projects(n, description="word " * 10):
+    return [Project(id=str(i), description=description) for i in range(n)]
+
+
+def test_run_bulk_indexing_reports_progress_and_failures():
+    # Arrange
+    def index_batch(batch):
+        if batch[0].id == "2":
+            raise Exception("batch failed")
+
+    reports = []
+
+    # Act
+    report = run_bulk_indexing(
+        make_projects(6),
+        index_batch,
+        max_concurrency=2,
+        progress=lambda report: reports.append(report.batches),
+        max_items=2,
+    )
+
+    # Assert
+    assert isinstance(report, IndexingReport)
+    assert report.indexed == 4
+    assert report.failed_ids == ["2", "3"]
+    assert report.batches == 3
+    assert reports == [1, 2, 3]
+    assert report.elapsed_seconds > 0
+
+
+def test_run_bulk_indexing_does_not_retry_failed_batches():
+    # The rate limiter has already retried what is worth retrying
+    index_batch = Mock(side_effect=CircuitOpenError("openai:text-embedding-3-small"))
+
+    report = run_bulk_indexing(make_projects(2), index_batch, max_items=1)
+
+    assert index_batch.call_count == 2
+    assert sorted(report.failed_ids) == ["0", "1"]
+
+
+def test_run_bulk_indexing_bounds_batches_in_flight():
+    # Arrange
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def index_batch(batch):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        threading.Event().wait(0.01)
+        with lock:
+            in_flight -= 1
+
+    # Act
+    report = run_bulk_indexing(
+        make_projects(20), index_batch, max_concurrency=3, max_items=1
+    )
+
+    # Assert
+    assert report.indexed == 20
+    assert peak <= 3
+
+
+def test_indexing_report_throughput():
+    assert IndexingReport(indexed=10, elapsed_seconds=2.0).throughput == 5.0
+    assert IndexingReport().throughput == 0.0
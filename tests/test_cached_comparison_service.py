@@ -0,0 +1,246 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from horizon_scope.application.interfaces.async_batch_comparison_service import (
+    AsyncBatchComparisonService,
+)
+from horizon_scope.application.interfaces.async_comparison_service import (
+    AsyncComparisonService,
+)
+from horizon_scope.application.interfaces.batch_comparison_service import (
+    BatchComparisonService,
+)
+from horizon_scope.application.interfaces.comparison_service import ComparisonService
+from horizon_scope.application.interfaces.streaming_comparison_service import (
+    StreamingComparisonService,
+)
+from horizon_scope.domain.entities.comparison import Comparison
+from horizon_scope.infrastructure.cache.sqlite_comparison_cache import (
+    SQLiteComparisonCache,
+)
+from horizon_scope.infrastructure.services.cached_comparison_service import (
+    CachedComparisonService,
+)
+
+
+@pytest.fixture
+def mock_comparison():
+    return Comparison(
+        summary="Test summary",
+        similarity="Test similarity",
+        difference="Test difference",
+        score=0.75,
+        confidence=0.9,
+        reason="Test reason",
+    )
+
+
+@pytest.fixture
+def mock_comparison_service(mock_comparison):
+    service = Mock(spec=ComparisonService)
+    service.model = "gpt-4o-mini"
+    service.prompt_version = "1"
+    service.compare.return_value = mock_comparison
+    return service
+
+
+@pytest.fixture
+def cache():
+    return SQLiteComparisonCache(":memory:")
+
+
+def test_compare_calls_service_once_per_pair(
+    mock_comparison_service, cache, mock_comparison
+):
+    service = CachedComparisonService(mock_comparison_service, cache)
+
+    first = service.compare("My project", "Existing project")
+    second = service.compare("My project", "Existing project")
+
+    assert first == mock_comparison
+    assert second == mock_comparison
+    mock_comparison_service.compare.assert_called_once_with(
+        "My project", "Existing project"
+    )
+    assert cache.hits == 1
+
+
+def test_compare_misses_for_different_projects(mock_comparison_service, cache):
+    service = CachedComparisonService(mock_comparison_service, cache)
+
+    service.compare("My project", "Existing project")
+    service.compare("My project", "Other project")
+
+    assert mock_comparison_service.compare.call_count == 2
+
+
+def test_cache_key_depends_on_model_and_prompt_version(mock_comparison_service, cache):
+    default = CachedComparisonService(mock_comparison_service, cache)
+    other_model = CachedComparisonService(mock_comparison_service, cache, model="gpt-4o")
+    other_prompt = CachedComparisonService(
+        mock_comparison_service, cache, prompt_version="2"
+    )
+
+    keys = {
+        service.cache_key("My project", "Existing project")
+        for service in (default, other_model, other_prompt)
+    }
+
+    assert default.model == "gpt-4o-mini"
+    assert default.prompt_version == "1"
+    assert len(keys) == 3
+
+
+def test_cache_key_depends_on_input_token_budget(mock_comparison_service, cache):
+    mock_comparison_service.max_input_tokens = 4000
+    default = CachedComparisonService(mock_comparison_service, cache)
+    other_budget = CachedComparisonService(
+        mock_comparison_service, cache, max_input_tokens=2000
+    )
+
+    assert default.max_input_tokens == 4000
+    assert default.cache_key("My project", "Existing project") != (
+        other_budget.cache_key("My project", "Existing project")
+    )
+
+
+def test_cache_key_separates_descriptions(mock_comparison_service, cache):
+    service = CachedComparisonService(mock_comparison_service, cache)
+
+    assert service.cache_key("ab", "c") != service.cache_key("a", "bc")
+
+
+def test_compare_does_not_cache_errors(mock_comparison_service, cache):
+    service = CachedComparisonService(mock_comparison_service, cache)
+    mock_comparison_service.compare.side_effect = Exception("API Error")
+
+    with pytest.raises(Exception, match="API Error"):
+        service.compare("My project", "Existing project")
+
+    assert len(cache) == 0
+
+
+def test_acompare_uses_async_service(cache, mock_comparison):
+    async_service = Mock(spec=AsyncComparisonService)
+    async_service.acompare = AsyncMock(return_value=mock_comparison)
+    service = CachedComparisonService(async_service, cache, model="gpt-4o-mini")
+
+    first = asyncio.run(service.acompare("My project", "Existing project"))
+    second = asyncio.run(service.acompare("My project", "Existing project"))
+
+    assert first == second == mock_comparison
+    async_service.acompare.assert_awaited_once_with("My project", "Existing project")
+
+
+def test_acompare_shares_cache_with_compare(mock_comparison_service, cache):
+    service = CachedComparisonService(mock_comparison_service, cache)
+
+    service.compare("My project", "Existing project")
+    asyncio.run(service.acompare("My project", "Existing project"))
+
+    mock_comparison_service.compare.assert_called_once()
+
+
+class BatchService(ComparisonService, BatchComparisonService):
+    pass
+
+
+def test_compare_many_forwards_only_misses(mock_comparison, cache):
+    # Arrange
+    service = Mock(spec=BatchService)
+    service.model = "gpt-4o-mini"
+    service.prompt_version = "1"
+    service.compare_many.return_value = [mock_comparison, mock_comparison]
+    cached_service = CachedComparisonService(service, cache)
+    cached = mock_comparison.model_copy(update={"score": 0.1})
+    cache.set(cached_service.cache_key("mine", "b"), cached)
+
+    # Act
+    results = cached_service.compare_many("mine", ["a", "b", "c"])
+
+    # Assert
+    service.compare_many.assert_called_once_with("mine", ["a", "c"])
+    assert results == [mock_comparison, cached, mock_comparison]
+    assert cache.get(cached_service.cache_key("mine", "c")) == mock_comparison
+
+
+def test_compare_many_without_batch_support(mock_comparison_service, cache):
+    cached_service = CachedComparisonService(mock_comparison_service, cache)
+
+    results = cached_service.compare_many("mine", ["a", "b"])
+    cached_service.compare_many("mine", ["a", "b"])
+
+    assert len(results) == 2
+    assert mock_comparison_service.compare.call_count == 2
+
+
+def test_acompare_many_uses_async_batches(mock_comparison, cache):
+    service = Mock(spec=AsyncBatchComparisonService)
+    service.acompare_many = AsyncMock(return_value=[mock_comparison])
+    cached_service = CachedComparisonService(service, cache, model="m")
+    cache.set(cached_service.cache_key("mine", "a"), mock_comparison)
+
+    results = asyncio.run(cached_service.acompare_many("mine", ["a", "b"]))
+
+    service.acompare_many.assert_awaited_once_with("mine", ["b"])
+    assert results == [mock_comparison, mock_comparison]
+
+
+class StreamingService(ComparisonService, StreamingComparisonService):
+    pass
+
+
+def test_compare_streaming_reports_cache_hit_once(
+    mock_comparison_service, cache, mock_comparison
+):
+    # Arrange
+    service = CachedComparisonService(mock_comparison_service, cache)
+    service.compare("My project", "Existing project")
+    updates = []
+
+    # Act
+    result = service.compare_streaming("My project", "Existing project", updates.append)
+
+    # Assert
+    assert result == mock_comparison
+    assert updates == [mock_comparison.model_dump()]
+    mock_comparison_service.compare.assert_called_once()
+
+
+def test_compare_streaming_streams_and_caches_misses(mock_comparison, cache):
+    # Arrange
+    streaming_service = Mock(spec=StreamingService)
+    streaming_service.model = "gpt-4o-mini"
+    streaming_service.prompt_version = "1"
+    streaming_service.compare_streaming.return_value = mock_comparison
+    service = CachedComparisonService(streaming_service, cache)
+    on_update = Mock()
+
+    # Act
+    first = service.compare_streaming("My project", "Existing project", on_update)
+    second = service.compare("My project", "Existing project")
+
+    # Assert
+    assert first == second == mock_comparison
+    streaming_service.compare_streaming.assert_called_once_with(
+        "My project", "Existing project", on_update
+    )
+    streaming_service.compare.assert_not_called()
+
+
+def test_acompare_streaming_without_streaming_support(cache, mock_comparison):
+    # Arrange
+    async_service = Mock(spec=AsyncComparisonService)
+    async_service.acompare = AsyncMock(return_value=mock_comparison)
+    service = CachedComparisonService(async_service, cache, model="gpt-4o-mini")
+    updates = []
+
+    # Act
+    result = asyncio.run(
+        service.acompare_streaming("My project", "Existing project", updates.append)
+    )
+
+    # Assert
+    assert result == mock_comparison
+    assert updates == [mock_comparison.model_dump()]
+    assert len(cache) == 1
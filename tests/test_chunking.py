@@ -0,0 +1,151 @@
+import pytest
+from unittest.mock import Mock, patch
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.chunking import (
+    TextChunker,
+    chunk_id,
+    chunk_projects,
+    split_chunk_id,
+)
+from horizon_scope.infrastructure.services.token_counter import (
+    fit_to_tokens,
+    split_by_tokens,
+    split_token_budget,
+)
+
+
+@pytest.fixture(autouse=True)
+def character_based_tokens():
+    # Count 3 characters per token, as without a downloadable tiktoken encoding
+    with patch(
+        "horizon_scope.infrastructure.services.token_counter.get_encoding",
+        return_value=None,
+    ):
+        yield
+
+
+def test_chunk_ids_round_trip():
+    assert chunk_id("123", 0) == "123"
+    assert chunk_id("123", 2) == "123#2"
+    assert split_chunk_id("123#2") == ("123", 2)
+    assert split_chunk_id("123") == ("123", 0)
+    assert split_chunk_id("a#b") == ("a#b", 0)
+
+
+def test_split_by_tokens_overlaps_windows():
+    chunks = split_by_tokens("abcdefghijklmnopqrstuvwxyz0123", 4, overlap=1)
+
+    assert chunks == ["abcdefghijkl", "jklmnopqrstu", "stuvwxyz0123"]
+
+
+def test_split_by_tokens_keeps_short_text():
+    assert split_by_tokens("short text", 100) == ["short text"]
+
+
+def test_split_by_tokens_with_invalid_overlap():
+    with pytest.raises(ValueError, match="overlap must be"):
+        split_by_tokens("text", 4, overlap=4)
+
+
+def test_fit_to_tokens_keeps_whole_sentences():
+    text = "First sentence. Second one! Third?"
+
+    assert fit_to_tokens(text, 100) == (text, 12)
+    assert fit_to_tokens(text, 10) == ("First sentence. Second one!", 9)
+
+
+def test_fit_to_tokens_cuts_long_first_sentence():
+    assert fit_to_tokens("abcdefghijkl. Second.", 2) == ("abcdef", 2)
+
+
+@pytest.mark.parametrize(
+    "first, second, expected",
+    [(10, 20, (10, 20)), (10, 200, (10, 90)), (200, 30, (70, 30)), (80, 90, (50, 50))],
+)
+def test_split_token_budget(first, second, expected):
+    assert split_token_budget(first, second, 100) == expected
+
+
+def test_split_caps_number_of_chunks():
+    chunker = TextChunker(max_tokens=2, overlap=0, max_chunks=2)
+
+    assert chunker.split("abcdefghijklmnop") == ["abcdef", "ghijkl"]
+
+
+def test_split_projects():
+    chunker = TextChunker(max_tokens=2, overlap=0)
+    projects = [
+        Project(id="1", title="Project 1", description="abcdefghi"),
+        Project(id="2", description="abc"),
+    ]
+
+    chunked, texts = chunker.split_projects(projects)
+
+    assert [project.id for project in chunked] == ["1", "1#1", "2"]
+    assert chunked[1].title == "Project 1"
+    assert texts == ["abcdef", "ghi", "abc"]
+
+
+def test_chunk_projects_keeps_single_chunk_project():
+    project = Project(id="1", description="Description")
+
+    assert chunk_projects(project, 1) == [project]
+
+
+@pytest.mark.parametrize(
+    "pooling, expected",
+    [("max", [("2", 0.8, "b"), ("1", 0.7, "a")]), ("sum", [("1", 1.2, "a"), ("2", 0.8, "b")])],
+)
+def test_pool(pooling, expected):
+    chunker = TextChunker(pooling=pooling)
+    hits = [("2", 0.8, "b"), ("1#1", 0.7, "a"), ("1", 0.5, "c")]
+
+    pooled = chunker.pool(hits)
+
+    assert [(project_id, pytest.approx(score), payload) for project_id, score, payload in pooled] == expected
+
+
+def test_search_fetches_more_hits_until_k_projects():
+    chunker = TextChunker()
+    hits = [("1", 0.9, 0), ("1#1", 0.8, 1), ("1#2", 0.7, 2), ("2", 0.6, 3)]
+    fetch = Mock(side_effect=lambda n_hits: hits[:n_hits])
+
+    results = chunker.search(fetch, 2, max_hits=10)
+
+    assert [project_id for project_id, _, _ in results] == ["1", "2"]
+    assert [call.args[0] for call in fetch.call_args_list] == [2, 4]
+
+
+def test_search_stops_when_hits_are_exhausted():
+    chunker = TextChunker()
+    fetch = Mock(return_value=[("1", 0.9, 0), ("1#1", 0.8, 1)])
+
+    results = chunker.search(fetch, 3, max_hits=100)
+
+    assert [project_id for project_id, _, _ in results] == ["1"]
+    fetch.assert_called_once_with(3)
+
+
+def test_from_config():
+    config = Mock(spec=ConfigManager)
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "vector-search-service", "chunking"): {
+            "max_tokens": 512,
+            "overlap": 64,
+            "pooling": "sum",
+        }
+    }.get(args, default)
+
+    chunker = TextChunker.from_config(config, model="text-embedding-3-small")
+
+    assert chunker.max_tokens == 512
+    assert chunker.overlap == 64
+    assert chunker.max_chunks == 8
+    assert chunker.pooling == "sum"
+    assert chunker.model == "text-embedding-3-small"
+
+
+def test_unsupported_pooling():
+    with pytest.raises(ValueError, match="Unsupported pooling method"):
+        TextChunker(pooling="mean")
@@ -1,15 +1,43 @@
+import asyncio
+import threading
+from types import SimpleNamespace
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
 from typing import List
 
 from horizon_scope.application.interfaces.vector_search_service import (
     VectorSearchService,
 )
 from horizon_scope.application.interfaces.comparison_service import ComparisonService
+from horizon_scope.application.interfaces.async_comparison_service import (
+    AsyncComparisonService,
+)
+from horizon_scope.application.interfaces.async_vector_search_service import (
+    AsyncVectorSearchService,
+)
 from horizon_scope.domain.entities.horizon_scope_result import HorizonScopeResult
-from horizon_scope.application.use_cases.compare_projects import CompareProjects
+from horizon_scope.application.interfaces.async_batch_comparison_service import (
+    AsyncBatchComparisonService,
+)
+from horizon_scope.application.interfaces.batch_comparison_service import (
+    BatchComparisonService,
+)
+from horizon_scope.application.interfaces.comparison_log import ComparisonLog
+from horizon_scope.application.interfaces.reranker import Reranker
+from horizon_scope.application.use_cases.compare_projects import (
+    CompareProjects,
+    RankedResults,
+    sample_key,
+    select_candidates,
+)
 from horizon_scope.domain.entities.comparison import Comparison
+from horizon_scope.domain.entities.match_update import MatchUpdate
 from horizon_scope.domain.entities.project import Project
+from horizon_scope.domain.entities.score_calibration import ScoreCalibration
+from horizon_scope.infrastructure.services.usage_tracker import (
+    UsageTracker,
+    track_usage,
+)
 
 
 class MockProject(Project):
@@ -137,3 +165,656 @@ def test_execute_uses_correct_arguments_for_comparison(
     comparison_service_mock.compare.assert_called_once_with(
         query, mock_project.description
     )
+
+
+def test_execute_runs_comparisons_concurrently(
+    vector_search_service_mock, comparison_service_mock
+):
+    # Arrange
+    k = 4
+    barrier = threading.Barrier(k, timeout=5)
+    vector_search_service_mock.search.return_value = [
+        MockProject(str(i), f"Project {i}") for i in range(k)
+    ]
+
+    def compare(query, description):
+        # Only returns once all k comparisons are in flight at the same time
+        barrier.wait()
+        return MockComparison(0.5)
+
+    comparison_service_mock.compare.side_effect = compare
+    compare_projects = CompareProjects(
+        vector_search_service_mock, comparison_service_mock, max_workers=k
+    )
+
+    # Act
+    results = compare_projects.execute("test query", k)
+
+    # Assert
+    assert len(results) == k
+
+
+def test_execute_isolates_failed_comparisons(
+    vector_search_service_mock, comparison_service_mock
+):
+    # Arrange
+    k = 3
+    vector_search_service_mock.search.return_value = [
+        MockProject(str(i), f"Project {i}") for i in range(k)
+    ]
+
+    def compare(query, description):
+        if description == "Project 1":
+            raise RuntimeError("API Error")
+        return MockComparison(0.5)
+
+    comparison_service_mock.compare.side_effect = compare
+    compare_projects = CompareProjects(
+        vector_search_service_mock, comparison_service_mock, max_workers=k
+    )
+
+    # Act
+    results = compare_projects.execute("test query", k)
+
+    # Assert
+    assert [result.project.id for result in results] == ["0", "2"]
+
+
+def test_execute_raises_when_all_comparisons_fail(
+    compare_projects, vector_search_service_mock, comparison_service_mock
+):
+    # Arrange
+    vector_search_service_mock.search.return_value = [MockProject("1", "Project 1")]
+    comparison_service_mock.compare.side_effect = RuntimeError("API Error")
+
+    # Act / Assert
+    with pytest.raises(RuntimeError, match="API Error"):
+        compare_projects.execute("test query", 1)
+
+
+def test_init_rejects_invalid_max_workers(
+    vector_search_service_mock, comparison_service_mock
+):
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        CompareProjects(
+            vector_search_service_mock, comparison_service_mock, max_workers=0
+        )
+
+
+def test_aexecute_runs_sync_services_in_threads(
+    compare_projects, vector_search_service_mock, comparison_service_mock
+):
+    # Arrange
+    query = "test query"
+    k = 3
+    mock_projects = [MockProject(str(i), f"Project {i}") for i in range(k)]
+    vector_search_service_mock.search.return_value = mock_projects
+    comparison_service_mock.compare.side_effect = [
+        MockComparison(0.3),
+        MockComparison(0.7),
+        MockComparison(0.5),
+    ]
+
+    # Act
+    results = asyncio.run(compare_projects.aexecute(query, k))
+
+    # Assert
+    assert [result.comparison.score for result in results] == [0.7, 0.5, 0.3]
+    vector_search_service_mock.search.assert_called_once_with(query, k)
+
+
+def test_aexecute_awaits_async_services():
+    # Arrange
+    query = "test query"
+    k = 2
+    vector_search_service = Mock(spec=AsyncVectorSearchService)
+    vector_search_service.asearch = AsyncMock(
+        return_value=[MockProject(str(i), f"Project {i}") for i in range(k)]
+    )
+    comparison_service = Mock(spec=AsyncComparisonService)
+    comparison_service.acompare = AsyncMock(
+        side_effect=[MockComparison(0.2), RuntimeError("API Error")]
+    )
+    compare_projects = CompareProjects(
+        vector_search_service, comparison_service, max_workers=k
+    )
+
+    # Act
+    results = asyncio.run(compare_projects.aexecute(query, k))
+
+    # Assert
+    assert len(results) == 1
+    assert results[0].comparison.score == 0.2
+    vector_search_service.asearch.assert_awaited_once_with(query, k)
+    comparison_service.acompare.assert_any_await(query, "Project 0")
+
+
+def ranked_projects(scores):
+    return [
+        (MockProject(str(i), f"Project {i}"), score) for i, score in enumerate(scores)
+    ]
+
+
+@pytest.fixture
+def reranker_mock():
+    return Mock(spec=Reranker)
+
+
+def test_select_candidates_stops_below_min_score():
+    ranked = ranked_projects([0.9, 0.6, 0.4, 0.3])
+
+    selected = select_candidates(ranked, 10, min_score=0.5)
+
+    assert [project.id for project in selected] == ["0", "1"]
+
+
+def test_select_candidates_stops_at_score_gap():
+    ranked = ranked_projects([8.0, 7.5, 2.0, 1.9])
+
+    selected = select_candidates(ranked, 10, max_gap=3.0)
+
+    assert [project.id for project in selected] == ["0", "1"]
+
+
+def test_select_candidates_keeps_best_and_respects_k():
+    ranked = ranked_projects([0.1, 0.09, 0.08])
+
+    assert [p.id for p in select_candidates(ranked, 10, min_score=0.5)] == ["0"]
+    assert [p.id for p in select_candidates(ranked, 2)] == ["0", "1"]
+    assert select_candidates([], 5) == []
+
+
+def test_execute_with_reranker_compares_selected_candidates(
+    vector_search_service_mock, comparison_service_mock, reranker_mock
+):
+    # Arrange
+    mock_projects = [MockProject(str(i), f"Project {i}") for i in range(20)]
+    vector_search_service_mock.search.return_value = mock_projects
+    reranker_mock.rerank.return_value = [
+        (mock_projects[7], 9.0),
+        (mock_projects[3], 8.5),
+        (mock_projects[0], 1.0),
+    ] + [(project, 0.5) for project in mock_projects[8:]]
+    comparison_service_mock.compare.return_value = MockComparison(0.5)
+    compare_projects = CompareProjects(
+        vector_search_service_mock,
+        comparison_service_mock,
+        reranker=reranker_mock,
+        candidates=20,
+        max_rerank_gap=2.0,
+    )
+
+    # Act
+    results = compare_projects.execute("test query", 5)
+
+    # Assert
+    vector_search_service_mock.search.assert_called_once_with("test query", 20)
+    reranker_mock.rerank.assert_called_once_with("test query", mock_projects)
+    assert [result.project.id for result in results] == ["7", "3"]
+    assert comparison_service_mock.compare.call_count == 2
+
+
+def test_execute_with_reranker_retrieves_at_least_k(
+    vector_search_service_mock, comparison_service_mock, reranker_mock
+):
+    vector_search_service_mock.search.return_value = []
+    compare_projects = CompareProjects(
+        vector_search_service_mock,
+        comparison_service_mock,
+        reranker=reranker_mock,
+        candidates=10,
+    )
+
+    assert compare_projects.execute("test query", 25) == []
+    vector_search_service_mock.search.assert_called_once_with("test query", 25)
+    reranker_mock.rerank.assert_not_called()
+
+
+def test_aexecute_with_reranker_compares_selected_candidates(
+    vector_search_service_mock, comparison_service_mock, reranker_mock
+):
+    # Arrange
+    mock_projects = [MockProject(str(i), f"Project {i}") for i in range(4)]
+    vector_search_service_mock.search.return_value = mock_projects
+    reranker_mock.rerank.return_value = [
+        (mock_projects[2], 0.9),
+        (mock_projects[1], 0.7),
+        (mock_projects[0], 0.2),
+        (mock_projects[3], 0.1),
+    ]
+    comparison_service_mock.compare.return_value = MockComparison(0.5)
+    compare_projects = CompareProjects(
+        vector_search_service_mock,
+        comparison_service_mock,
+        reranker=reranker_mock,
+        candidates=4,
+        min_rerank_score=0.5,
+    )
+
+    # Act
+    results = asyncio.run(compare_projects.aexecute("test query", 3))
+
+    # Assert
+    vector_search_service_mock.search.assert_called_once_with("test query", 4)
+    assert sorted(result.project.id for result in results) == ["1", "2"]
+
+
+@pytest.fixture
+def calibration():
+    return ScoreCalibration(
+        similarities=[0.2, 0.5], scores=[0.0, 0.6], confidences=[0.4, 0.8]
+    )
+
+
+def hits(similarities):
+    return [
+        Project(id=str(i), description=f"Project {i}", similarity=similarity)
+        for i, similarity in enumerate(similarities)
+    ]
+
+
+def test_execute_estimates_hits_below_expected_score(
+    vector_search_service_mock, comparison_service_mock, calibration
+):
+    # Arrange
+    vector_search_service_mock.search.return_value = hits([0.5, 0.45, 0.25, None])
+    comparison_service_mock.compare.return_value = MockComparison(0.7)
+    compare_projects = CompareProjects(
+        vector_search_service_mock,
+        comparison_service_mock,
+        calibration=calibration,
+        min_expected_score=0.3,
+    )
+
+    # Act
+    results = compare_projects.execute("test query", 4)
+
+    # Assert
+    compared = [call.args[1] for call in comparison_service_mock.compare.call_args_list]
+    assert compared == ["Project 0", "Project 1", "Project 3"]
+    assert compare_projects.saved_calls == 1
+    estimated = [result for result in results if result.estimated]
+    assert [result.project.id for result in estimated] == ["2"]
+    assert estimated[0].comparison.score == pytest.approx(0.1)
+    assert estimated[0].comparison.confidence == pytest.approx(0.47)
+    assert results[-1].estimated
+
+
+def test_execute_drops_skipped_hits_without_estimates(
+    vector_search_service_mock, comparison_service_mock, calibration
+):
+    vector_search_service_mock.search.return_value = hits([0.5, 0.2])
+    comparison_service_mock.compare.return_value = MockComparison(0.7)
+    compare_projects = CompareProjects(
+        vector_search_service_mock,
+        comparison_service_mock,
+        calibration=calibration,
+        min_expected_score=0.3,
+        estimate_skipped=False,
+    )
+
+    results = compare_projects.execute("test query", 2)
+
+    assert [result.project.id for result in results] == ["0"]
+    assert compare_projects.saved_calls == 1
+
+
+def test_execute_returns_estimates_when_every_hit_is_skipped(
+    vector_search_service_mock, comparison_service_mock, calibration
+):
+    vector_search_service_mock.search.return_value = hits([0.1, 0.2])
+    compare_projects = CompareProjects(
+        vector_search_service_mock,
+        comparison_service_mock,
+        calibration=calibration,
+        min_expected_score=0.3,
+    )
+
+    results = compare_projects.execute("test query", 2)
+
+    comparison_service_mock.compare.assert_not_called()
+    assert all(result.estimated for result in results)
+    assert compare_projects.saved_calls == 2
+
+
+def test_execute_records_comparisons_in_log(
+    vector_search_service_mock, comparison_service_mock
+):
+    comparison_log = Mock(spec=ComparisonLog)
+    vector_search_service_mock.search.return_value = hits([0.5, None])
+    comparison = MockComparison(0.7)
+    comparison_service_mock.compare.return_value = comparison
+    compare_projects = CompareProjects(
+        vector_search_service_mock,
+        comparison_service_mock,
+        comparison_log=comparison_log,
+    )
+
+    compare_projects.execute("test query", 2)
+
+    comparison_log.record.assert_called_once_with(
+        0.5, comparison, key=sample_key("test query", "0")
+    )
+
+
+def test_execute_ignores_log_failures(
+    vector_search_service_mock, comparison_service_mock
+):
+    comparison_log = Mock(spec=ComparisonLog)
+    comparison_log.record.side_effect = RuntimeError("disk full")
+    vector_search_service_mock.search.return_value = hits([0.5])
+    comparison_service_mock.compare.return_value = MockComparison(0.7)
+    compare_projects = CompareProjects(
+        vector_search_service_mock,
+        comparison_service_mock,
+        comparison_log=comparison_log,
+    )
+
+    assert len(compare_projects.execute("test query", 1)) == 1
+
+
+def test_aexecute_gates_and_records(
+    vector_search_service_mock, comparison_service_mock, calibration
+):
+    comparison_log = Mock(spec=ComparisonLog)
+    vector_search_service_mock.search.return_value = hits([0.5, 0.1])
+    comparison = MockComparison(0.7)
+    comparison_service_mock.compare.return_value = comparison
+    compare_projects = CompareProjects(
+        vector_search_service_mock,
+        comparison_service_mock,
+        comparison_log=comparison_log,
+        calibration=calibration,
+        min_expected_score=0.3,
+    )
+
+    results = asyncio.run(compare_projects.aexecute("test query", 2))
+
+    assert [(r.project.id, r.estimated) for r in results] == [("0", False), ("1", True)]
+    comparison_service_mock.compare.assert_called_once_with("test query", "Project 0")
+    comparison_log.record.assert_called_once_with(
+        0.5, comparison, key=sample_key("test query", "0")
+    )
+    assert compare_projects.saved_calls == 1
+
+
+class BatchService(ComparisonService, BatchComparisonService):
+    pass
+
+
+class AsyncBatchService(
+    ComparisonService, AsyncComparisonService, AsyncBatchComparisonService
+):
+    pass
+
+
+def test_execute_compares_hits_in_one_batch(vector_search_service_mock):
+    # Arrange
+    comparison_service = Mock(spec=BatchService)
+    comparison_log = Mock(spec=ComparisonLog)
+    vector_search_service_mock.search.return_value = hits([0.5, 0.4, 0.3])
+    comparison_service.compare_many.return_value = [
+        MockComparison(0.2),
+        MockComparison(0.9),
+        MockComparison(0.5),
+    ]
+    compare_projects = CompareProjects(
+        vector_search_service_mock, comparison_service, comparison_log=comparison_log
+    )
+
+    # Act
+    results = compare_projects.execute("test query", 3)
+
+    # Assert
+    comparison_service.compare_many.assert_called_once_with(
+        "test query", ["Project 0", "Project 1", "Project 2"]
+    )
+    comparison_service.compare.assert_not_called()
+    assert [result.project.id for result in results] == ["1", "2", "0"]
+    assert comparison_log.record.call_count == 3
+
+
+def test_execute_falls_back_to_single_comparisons(vector_search_service_mock):
+    comparison_service = Mock(spec=BatchService)
+    vector_search_service_mock.search.return_value = hits([0.5, 0.4])
+    comparison_service.compare_many.side_effect = ValueError("too long")
+    comparison_service.compare.side_effect = [MockComparison(0.3), ValueError("bad")]
+    compare_projects = CompareProjects(vector_search_service_mock, comparison_service)
+
+    results = compare_projects.execute("test query", 2)
+
+    assert [result.project.id for result in results] == ["0"]
+    assert comparison_service.compare.call_count == 2
+
+
+def test_execute_compares_single_hit_without_batch(vector_search_service_mock):
+    comparison_service = Mock(spec=BatchService)
+    vector_search_service_mock.search.return_value = hits([0.5])
+    comparison_service.compare.return_value = MockComparison(0.3)
+    compare_projects = CompareProjects(vector_search_service_mock, comparison_service)
+
+    compare_projects.execute("test query", 1)
+
+    comparison_service.compare_many.assert_not_called()
+
+
+def test_aexecute_awaits_async_batches(vector_search_service_mock):
+    comparison_service = Mock(spec=AsyncBatchService)
+    comparison_service.acompare_many = AsyncMock(
+        return_value=[MockComparison(0.2), MockComparison(0.9)]
+    )
+    vector_search_service_mock.search.return_value = hits([0.5, 0.4])
+    compare_projects = CompareProjects(vector_search_service_mock, comparison_service)
+
+    results = asyncio.run(compare_projects.aexecute("test query", 2))
+
+    comparison_service.acompare_many.assert_awaited_once_with(
+        "test query", ["Project 0", "Project 1"]
+    )
+    assert [result.project.id for result in results] == ["1", "0"]
+
+
+def test_aexecute_runs_sync_batches_in_a_thread(vector_search_service_mock):
+    comparison_service = Mock(spec=BatchService)
+    comparison_service.compare_many.return_value = [
+        MockComparison(0.2),
+        MockComparison(0.9),
+    ]
+    vector_search_service_mock.search.return_value = hits([0.5, 0.4])
+    compare_projects = CompareProjects(vector_search_service_mock, comparison_service)
+
+    results = asyncio.run(compare_projects.aexecute("test query", 2))
+
+    comparison_service.compare_many.assert_called_once()
+    assert [result.project.id for result in results] == ["1", "0"]
+
+
+def test_execute_keeps_usage_scope_in_worker_threads(
+    vector_search_service_mock, comparison_service_mock
+):
+    tracker = UsageTracker()
+    vector_search_service_mock.search.return_value = hits([0.5, 0.4, 0.3])
+
+    def compare(query, description):
+        tracker.record(SimpleNamespace(prompt_tokens=10, completion_tokens=1))
+        return MockComparison(0.5)
+
+    comparison_service_mock.compare.side_effect = compare
+    compare_projects = CompareProjects(
+        vector_search_service_mock, comparison_service_mock, max_workers=3
+    )
+
+    with track_usage() as usage:
+        compare_projects.execute("test query", 3)
+
+    assert usage.requests == 3
+
+
+def test_execute_iter_yields_hits_then_results_in_completion_order(
+    vector_search_service_mock, comparison_service_mock
+):
+    # Arrange
+    vector_search_service_mock.search.return_value = hits([0.9, 0.8, 0.7])
+    released = {str(i): threading.Event() for i in range(3)}
+
+    def compare(query, description):
+        project_id = description.split()[-1]
+        released[project_id].wait(timeout=5)
+        return MockComparison(0.1 * (int(project_id) + 1))
+
+    comparison_service_mock.compare.side_effect = compare
+    compare_projects = CompareProjects(
+        vector_search_service_mock, comparison_service_mock, max_workers=3
+    )
+
+    # Act
+    updates = compare_projects.execute_iter("test query", 3)
+    first = next(updates)
+    released["2"].set()
+    second = next(updates)
+    released["0"].set()
+    released["1"].set()
+    rest = list(updates)
+
+    # Assert
+    assert [project.id for project in first.hits] == ["0", "1", "2"]
+    assert first.result is None
+    assert second.result.project.id == "2"
+    assert sorted(update.result.project.id for update in rest) == ["0", "1"]
+
+
+def test_execute_iter_yields_hits_before_comparing(
+    compare_projects, vector_search_service_mock, comparison_service_mock
+):
+    vector_search_service_mock.search.return_value = hits([0.9])
+
+    first = next(compare_projects.execute_iter("test query", 1))
+
+    assert [project.id for project in first.hits] == ["0"]
+    comparison_service_mock.compare.assert_not_called()
+
+
+def test_execute_iter_skips_failed_comparisons(
+    vector_search_service_mock, comparison_service_mock
+):
+    vector_search_service_mock.search.return_value = hits([0.9, 0.8])
+    comparison_service_mock.compare.side_effect = [
+        RuntimeError("API Error"),
+        MockComparison(0.5),
+    ]
+    compare_projects = CompareProjects(
+        vector_search_service_mock, comparison_service_mock
+    )
+
+    updates = list(compare_projects.execute_iter("test query", 2))
+
+    assert len(updates) == 2
+    assert updates[1].result.project.id == "1"
+
+
+def test_execute_iter_raises_when_all_comparisons_fail(
+    compare_projects, vector_search_service_mock, comparison_service_mock
+):
+    vector_search_service_mock.search.return_value = hits([0.9])
+    comparison_service_mock.compare.side_effect = RuntimeError("API Error")
+
+    with pytest.raises(RuntimeError, match="API Error"):
+        list(compare_projects.execute_iter("test query", 1))
+
+
+def test_execute_iter_yields_estimated_results_first(
+    vector_search_service_mock, comparison_service_mock, calibration
+):
+    vector_search_service_mock.search.return_value = hits([0.5, 0.25])
+    comparison_service_mock.compare.return_value = MockComparison(0.7)
+    compare_projects = CompareProjects(
+        vector_search_service_mock,
+        comparison_service_mock,
+        calibration=calibration,
+        min_expected_score=0.3,
+    )
+
+    updates = list(compare_projects.execute_iter("test query", 2))
+
+    assert [project.id for project in updates[0].hits] == ["0", "1"]
+    assert updates[1].result.estimated
+    assert updates[1].result.project.id == "1"
+    assert not updates[2].result.estimated
+
+
+def test_execute_iter_with_empty_search_results(
+    compare_projects, vector_search_service_mock
+):
+    vector_search_service_mock.search.return_value = []
+
+    assert list(compare_projects.execute_iter("test query", 3)) == [MatchUpdate()]
+
+
+def test_aexecute_iter_yields_hits_then_results():
+    # Arrange
+    vector_search_service = Mock(spec=AsyncVectorSearchService)
+    vector_search_service.asearch = AsyncMock(return_value=hits([0.9, 0.8, 0.7]))
+    comparison_service = Mock(spec=AsyncComparisonService)
+
+    async def acompare(query, description):
+        project_id = int(description.split()[-1])
+        # The last project finishes first
+        await asyncio.sleep(0.01 * (3 - project_id))
+        return MockComparison(0.1 * project_id)
+
+    comparison_service.acompare = acompare
+    compare_projects = CompareProjects(
+        vector_search_service, comparison_service, max_workers=3
+    )
+
+    async def collect():
+        return [
+            update async for update in compare_projects.aexecute_iter("test query", 3)
+        ]
+
+    # Act
+    updates = asyncio.run(collect())
+
+    # Assert
+    assert len(updates[0].hits) == 3
+    assert [update.result.project.id for update in updates[1:]] == ["2", "1", "0"]
+
+
+def test_aexecute_iter_raises_when_all_comparisons_fail():
+    vector_search_service = Mock(spec=AsyncVectorSearchService)
+    vector_search_service.asearch = AsyncMock(return_value=hits([0.9]))
+    comparison_service = Mock(spec=AsyncComparisonService)
+    comparison_service.acompare = AsyncMock(side_effect=RuntimeError("API Error"))
+    compare_projects = CompareProjects(vector_search_service, comparison_service)
+
+    async def collect():
+        return [
+            update async for update in compare_projects.aexecute_iter("test query", 1)
+        ]
+
+    with pytest.raises(RuntimeError, match="API Error"):
+        asyncio.run(collect())
+
+
+def test_ranked_results_keeps_results_sorted():
+    # Arrange
+    projects = hits([0.9, 0.8, 0.7])
+    ranked = RankedResults()
+
+    # Act
+    ranked.update(MatchUpdate(hits=projects))
+    for project, score in zip(projects, [0.2, 0.6, 0.2]):
+        ranked.update(
+            MatchUpdate(
+                result=HorizonScopeResult(
+                    project=project, comparison=MockComparison(score)
+                )
+            )
+        )
+        if project.id == "0":
+            pending = [project.id for project in ranked.pending]
+
+    # Assert
+    assert pending == ["1", "2"]
+    assert [result.project.id for result in ranked.results] == ["1", "0", "2"]
+    assert ranked.pending == []
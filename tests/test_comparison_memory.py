@@ -0,0 +1,111 @@
+import threading
+import pytest
+from unittest.mock import Mock
+from horizon_scope.domain.entities.comparison import Comparison
+from horizon_scope.infrastructure.cache.comparison_memory import (
+    ENTRY_OVERHEAD_BYTES,
+    ComparisonMemory,
+)
+
+
+def make_comparison(reason="Test reason"):
+    return Comparison(
+        summary="Test summary",
+        similarity="Test similarity",
+        difference="Test difference",
+        score=0.75,
+        confidence=0.9,
+        reason=reason,
+    )
+
+
+def entry_size(comparison):
+    return len(comparison.model_dump_json()) + ENTRY_OVERHEAD_BYTES
+
+
+def test_get_or_compute_computes_once_per_query_and_project():
+    # Arrange
+    memory = ComparisonMemory()
+    compute = Mock(return_value=make_comparison())
+
+    # Act
+    first = memory.get_or_compute("My  project", "1", compute)
+    second = memory.get_or_compute(" My project\n", "1", compute)
+    memory.get_or_compute("My project", "2", compute)
+
+    # Assert
+    assert first == second
+    assert compute.call_count == 2
+    assert memory.stats() == {
+        "entries": 2,
+        "bytes": 2 * entry_size(first),
+        "hits": 1,
+        "misses": 2,
+        "joined": 0,
+        "evictions": 0,
+    }
+
+
+def test_evicts_least_recently_used_entries_beyond_max_bytes():
+    # Arrange
+    comparison = make_comparison()
+    memory = ComparisonMemory(max_bytes=2 * entry_size(comparison))
+    memory.set("My project", "1", comparison)
+    memory.set("My project", "2", comparison)
+
+    # Act
+    memory.get("My project", "1")
+    memory.set("My project", "3", comparison)
+
+    # Assert
+    assert memory.get("My project", "2") is None
+    assert memory.get("My project", "1") == comparison
+    assert memory.get("My project", "3") == comparison
+    assert memory.evictions == 1
+    assert memory.size_bytes == 2 * entry_size(comparison)
+
+
+def test_concurrent_callers_share_one_computation():
+    # Arrange
+    memory = ComparisonMemory()
+    started = threading.Event()
+    release = threading.Event()
+    comparison = make_comparison()
+
+    def compute():
+        started.set()
+        release.wait(5)
+        return comparison
+
+    results = []
+    owner = threading.Thread(
+        target=lambda: results.append(memory.get_or_compute("Query", "1", compute))
+    )
+    owner.start()
+    started.wait(5)
+    waiter = threading.Thread(
+        target=lambda: results.append(memory.get_or_compute("Query", "1", Mock()))
+    )
+
+    # Act
+    waiter.start()
+    while memory.joined == 0:
+        pass
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+
+    # Assert
+    assert results == [comparison, comparison]
+    assert memory.misses == 1
+    assert memory.joined == 1
+
+
+def test_failed_computation_is_not_remembered():
+    memory = ComparisonMemory()
+
+    with pytest.raises(ValueError):
+        memory.get_or_compute("Query", "1", Mock(side_effect=ValueError("API Error")))
+
+    assert len(memory) == 0
+    assert memory.get_or_compute("Query", "1", lambda: make_comparison()).score == 0.75
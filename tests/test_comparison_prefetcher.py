@@ -0,0 +1,81 @@
+import pytest
+from concurrent.futures import Future
+from unittest.mock import Mock
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.presentation.comparison_prefetcher import ComparisonPrefetcher
+
+
+def make_project(i):
+    return Project(
+        id=str(i),
+        title=f"Project {i}",
+        description=f"Description {i}",
+        content_update_date="2024-01-01",
+    )
+
+
+@pytest.fixture
+def executor():
+    # Keep the submitted futures pending so that the tests control their outcome
+    executor = Mock()
+    executor.submit.side_effect = lambda *args: Future()
+    return executor
+
+
+def test_prefetch_starts_top_n_once(executor):
+    # Arrange
+    compare = Mock()
+    prefetcher = ComparisonPrefetcher(compare, executor, top_n=2)
+    projects = [make_project(i) for i in range(5)]
+
+    # Act
+    started = prefetcher.prefetch("My project", projects)
+    restarted = prefetcher.prefetch("My project", projects)
+
+    # Assert
+    assert started == 2
+    assert restarted == 0
+    executor.submit.assert_any_call(compare, "My project", projects[0])
+    executor.submit.assert_any_call(compare, "My project", projects[1])
+    assert executor.submit.call_count == 2
+
+
+def test_prefetch_respects_budget(executor):
+    prefetcher = ComparisonPrefetcher(Mock(), executor, top_n=3, budget=4)
+
+    assert prefetcher.prefetch("First", [make_project(i) for i in range(3)]) == 3
+    prefetcher.cancel()
+    assert prefetcher.prefetch("Second", [make_project(i) for i in range(3)]) == 1
+    assert prefetcher.remaining == 0
+
+
+def test_pop_hands_over_future_once(executor):
+    # Arrange
+    prefetcher = ComparisonPrefetcher(Mock(), executor, top_n=1)
+    prefetcher.prefetch("My project", [make_project(1)])
+
+    # Act
+    future = prefetcher.pop("1")
+
+    # Assert
+    assert isinstance(future, Future)
+    assert prefetcher.pop("1") is None
+    assert prefetcher.prefetch("My project", [make_project(1)]) == 0
+
+
+def test_cancel_drops_pending_comparisons(executor):
+    # Arrange
+    futures = []
+    executor.submit.side_effect = lambda *args: futures.append(Future()) or futures[-1]
+    prefetcher = ComparisonPrefetcher(Mock(), executor, top_n=2)
+    prefetcher.prefetch("My project", [make_project(1), make_project(2)])
+
+    # Act
+    taken = prefetcher.pop("1")
+    prefetcher.cancel()
+
+    # Assert
+    assert taken is futures[0] and not taken.cancelled()
+    assert futures[1].cancelled()
+    assert prefetcher.pop("2") is None
+    assert prefetcher.prefetch("New project", [make_project(2)]) == 1
@@ -0,0 +1,95 @@
+import sqlite3
+from horizon_scope.infrastructure.cache.embedding_cache import EmbeddingCache
+
+
+def test_get_returns_stored_embedding():
+    cache = EmbeddingCache()
+
+    cache.set("some text", "model", [0.1, 0.2])
+
+    assert cache.get("some text", "model") == [0.1, 0.2]
+    assert cache.hits == 1
+    assert cache.misses == 0
+
+
+def test_keys_ignore_whitespace_differences():
+    cache = EmbeddingCache()
+
+    cache.set("some  text\n", "model", [0.1, 0.2])
+
+    assert cache.get(" some text", "model") == [0.1, 0.2]
+
+
+def test_keys_depend_on_model():
+    cache = EmbeddingCache()
+
+    cache.set("some text", "model-a", [0.1, 0.2])
+
+    assert cache.get("some text", "model-b") is None
+    assert cache.misses == 1
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = EmbeddingCache(max_entries=2)
+    cache.set("a", "model", [1.0])
+    cache.set("b", "model", [2.0])
+    cache.get("a", "model")
+
+    cache.set("c", "model", [3.0])
+
+    assert cache.get("b", "model") is None
+    assert cache.get("a", "model") == [1.0]
+    assert cache.get("c", "model") == [3.0]
+
+
+def test_disk_store_survives_restart_and_memory_eviction(tmp_path):
+    path = str(tmp_path / "cache" / "embeddings.sqlite")
+    cache = EmbeddingCache(max_entries=1, path=path)
+    cache.set("a", "model", [0.123456789, -1.5])
+    cache.set("b", "model", [2.0])
+
+    assert cache.get("a", "model") == [0.123456789, -1.5]
+
+    reopened = EmbeddingCache(path=path)
+
+    assert reopened.get("b", "model") == [2.0]
+    assert reopened.hits == 1
+
+
+def test_disk_store_evicts_least_recently_used_entries(tmp_path):
+    # Arrange
+    path = str(tmp_path / "embeddings.sqlite")
+    cache = EmbeddingCache(max_entries=1, path=path, max_disk_entries=2)
+    cache.set("a", "model", [1.0])
+    cache.set("b", "model", [2.0])
+    cache.get("a", "model")
+
+    # Act
+    cache.set("c", "model", [3.0])
+
+    # Assert
+    reopened = EmbeddingCache(path=path)
+    assert len(reopened) == 2
+    assert reopened.get("b", "model") is None
+    assert reopened.get("a", "model") == [1.0]
+    assert reopened.get("c", "model") == [3.0]
+
+
+def test_disk_store_of_older_versions_is_migrated(tmp_path):
+    # Arrange: a cache file written before disk eviction
+    path = str(tmp_path / "embeddings.sqlite")
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE embeddings (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+    )
+    connection.commit()
+    connection.close()
+
+    # Act
+    cache = EmbeddingCache(path=path, max_disk_entries=1)
+    cache.set("a", "model", [1.0])
+    cache.set("b", "model", [2.0])
+
+    # Assert
+    assert len(cache) == 1
+    assert EmbeddingCache(path=path).get("b", "model") == [2.0]
@@ -1,10 +1,22 @@
+import asyncio
+import threading
+from types import SimpleNamespace
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from horizon_scope.presentation.horizon_scope_client import HorizonScopeClient
 from horizon_scope.domain.entities.project import Project
+from horizon_scope.application.interfaces.comparison_service import ComparisonService
 from horizon_scope.domain.entities.comparison import Comparison
 from horizon_scope.domain.entities.horizon_scope_result import HorizonScopeResult
 from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.usage_tracker import (
+    UsageTracker,
+    _active_usages,
+)
+from horizon_scope.domain.entities.match_update import MatchUpdate
+from horizon_scope.infrastructure.cache.sqlite_project_summary_store import (
+    SQLiteProjectSummaryStore,
+)
 from horizon_scope.infrastructure.services.pinecone_search_service import (
     PineconeSearchService,
 )
@@ -12,11 +24,16 @@ from horizon_scope.infrastructure.services.openai_comparison_service import (
     OpenAIComparisonService,
 )
 from horizon_scope.application.use_cases.compare_projects import CompareProjects
+from horizon_scope.infrastructure.services.cached_comparison_service import (
+    CachedComparisonService,
+)
 
 
 @pytest.fixture
 def mock_config_manager():
-    return Mock(spec=ConfigManager)
+    config_manager = Mock(spec=ConfigManager)
+    config_manager.get.side_effect = lambda *keys, default=None: default
+    return config_manager
 
 
 @pytest.fixture
@@ -42,34 +59,82 @@ def horizon_scope_client(
     mock_compare_projects,
 ):
     with patch(
-        "horizon_scope.presentation.horizon_scope_client.PineconeSearchService",
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService",
         return_value=mock_vector_search_service,
     ), patch(
-        "horizon_scope.presentation.horizon_scope_client.OpenAIComparisonService",
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService",
         return_value=mock_comparison_service,
     ), patch(
         "horizon_scope.presentation.horizon_scope_client.CompareProjects",
         return_value=mock_compare_projects,
     ):
-        return HorizonScopeClient(mock_config_manager)
+        client = HorizonScopeClient(mock_config_manager)
+    mock_config_manager.reset_mock(side_effect=True)
+    return client
 
 
 def test_initialization(mock_config_manager):
     with patch(
-        "horizon_scope.presentation.horizon_scope_client.PineconeSearchService"
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
     ) as mock_pinecone, patch(
-        "horizon_scope.presentation.horizon_scope_client.OpenAIComparisonService"
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
     ) as mock_openai, patch(
         "horizon_scope.presentation.horizon_scope_client.CompareProjects"
     ) as mock_compare_projects:
 
         client = HorizonScopeClient(mock_config_manager)
 
-        mock_pinecone.assert_called_once_with(mock_config_manager)
-        mock_openai.assert_called_once_with(mock_config_manager)
+        mock_pinecone.assert_called_once_with(
+            mock_config_manager, client.rate_limiter, client.transport
+        )
+        mock_openai.assert_called_once_with(
+            mock_config_manager,
+            summaries=None,
+            rate_limiter=client.rate_limiter,
+            transport=client.transport,
+        )
         mock_compare_projects.assert_called_once()
 
 
+def test_initialization_with_comparison_cache(mock_config_manager, tmp_path):
+    cache_path = str(tmp_path / "comparisons.sqlite")
+    mock_config_manager.get.side_effect = lambda *keys, default=None: (
+        {"type": "sqlite", "path": cache_path, "max_entries": 10}
+        if keys == ("horizon-scope", "comparison-service", "cache")
+        else default
+    )
+    with patch(
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
+    ), patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
+    ) as mock_openai, patch(
+        "horizon_scope.presentation.horizon_scope_client.CompareProjects"
+    ):
+        client = HorizonScopeClient(mock_config_manager)
+
+    assert isinstance(client.comparison_service, CachedComparisonService)
+    assert client.comparison_service.service is mock_openai.return_value
+    assert client.comparison_service.cache.path == cache_path
+    assert client.comparison_service.cache.max_entries == 10
+
+
+def test_initialization_with_unsupported_comparison_cache(mock_config_manager):
+    mock_config_manager.get.side_effect = lambda *keys, default=None: (
+        {"type": "redis"}
+        if keys == ("horizon-scope", "comparison-service", "cache")
+        else default
+    )
+    with patch(
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
+    ), patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
+    ), patch(
+        "horizon_scope.presentation.horizon_scope_client.CompareProjects"
+    ):
+        with pytest.raises(ValueError, match="Unsupported comparison cache type"):
+            HorizonScopeClient(mock_config_manager)
+
+
 def test_from_config():
     with patch(
         "horizon_scope.presentation.horizon_scope_client.ConfigManager"
@@ -96,6 +161,18 @@ def test_match(horizon_scope_client, mock_compare_projects):
     assert results == mock_results
 
 
+def test_amatch(horizon_scope_client, mock_compare_projects):
+    query = "test query"
+    k = 5
+    mock_results = [Mock(spec=HorizonScopeResult) for _ in range(k)]
+    mock_compare_projects.aexecute = AsyncMock(return_value=mock_results)
+
+    results = asyncio.run(horizon_scope_client.amatch(query, k))
+
+    mock_compare_projects.aexecute.assert_awaited_once_with(query, k)
+    assert results == mock_results
+
+
 def test_index_project(horizon_scope_client, mock_vector_search_service):
     project = Mock(spec=Project)
 
@@ -116,6 +193,103 @@ def test_search_projects(horizon_scope_client, mock_vector_search_service):
     assert results == mock_projects
 
 
+def test_asearch_projects(horizon_scope_client, mock_vector_search_service):
+    query = "test query"
+    k = 5
+    mock_projects = [Mock(spec=Project) for _ in range(k)]
+    mock_vector_search_service.asearch = AsyncMock(return_value=mock_projects)
+
+    results = asyncio.run(horizon_scope_client.asearch_projects(query, k))
+
+    mock_vector_search_service.asearch.assert_awaited_once_with(query, k)
+    assert results == mock_projects
+
+
+def test_acompare_projects(horizon_scope_client, mock_comparison_service):
+    mock_comparison = Mock(spec=Comparison)
+    mock_comparison_service.acompare = AsyncMock(return_value=mock_comparison)
+
+    result = asyncio.run(
+        horizon_scope_client.acompare_projects("my project", "existing project")
+    )
+
+    mock_comparison_service.acompare.assert_awaited_once_with(
+        "my project", "existing project"
+    )
+    assert result == mock_comparison
+
+
+def test_clients_share_rate_limiter(mock_config_manager):
+    with patch(
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
+    ), patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
+    ):
+        first = HorizonScopeClient(mock_config_manager)
+        second = HorizonScopeClient(mock_config_manager)
+
+    assert first.rate_limiter is second.rate_limiter
+
+
+def test_initialization_warms_up_transport(mock_config_manager):
+    # Arrange
+    mock_config_manager.get.side_effect = lambda *keys, default=None: (
+        True if keys == ("horizon-scope", "http", "warm_up") else default
+    )
+    warmed = threading.Event()
+
+    # Act
+    with patch(
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
+    ), patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
+    ), patch(
+        "horizon_scope.infrastructure.services.http_transport.HttpTransport.warm_up",
+        side_effect=warmed.set,
+    ):
+        client = HorizonScopeClient(mock_config_manager)
+
+        # Assert
+        assert warmed.wait(timeout=5)
+    assert client.transport.rate_limiter is client.rate_limiter
+
+
+def test_compare_projects_streaming(horizon_scope_client, mock_comparison_service):
+    # Arrange
+    mock_comparison = Mock(spec=Comparison)
+    mock_comparison_service.compare_streaming.return_value = mock_comparison
+    on_update = Mock()
+
+    # Act
+    result = horizon_scope_client.compare_projects_streaming(
+        "my project", "existing project", on_update
+    )
+
+    # Assert
+    mock_comparison_service.compare_streaming.assert_called_once_with(
+        "my project", "existing project", on_update
+    )
+    assert result == mock_comparison
+
+
+def test_compare_projects_streaming_without_streaming_support(horizon_scope_client):
+    # Arrange
+    mock_comparison = Mock(spec=Comparison)
+    mock_comparison.model_dump.return_value = {"score": 0.5}
+    horizon_scope_client.comparison_service = Mock(spec=ComparisonService)
+    horizon_scope_client.comparison_service.compare.return_value = mock_comparison
+    updates = []
+
+    # Act
+    result = horizon_scope_client.compare_projects_streaming(
+        "my project", "existing project", updates.append
+    )
+
+    # Assert
+    assert result == mock_comparison
+    assert updates == [{"score": 0.5}]
+
+
 def test_get_config(horizon_scope_client, mock_config_manager):
     keys = ["test", "key"]
     default_value = "default"
@@ -130,14 +304,15 @@ def test_get_config(horizon_scope_client, mock_config_manager):
 
 def test_integration(mock_config_manager):
     with patch(
-        "horizon_scope.presentation.horizon_scope_client.PineconeSearchService"
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
     ) as mock_pinecone, patch(
-        "horizon_scope.presentation.horizon_scope_client.OpenAIComparisonService"
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
     ) as mock_openai, patch(
         "horizon_scope.presentation.horizon_scope_client.CompareProjects"
     ) as mock_compare_projects:
 
         client = HorizonScopeClient(mock_config_manager)
+        mock_config_manager.reset_mock(side_effect=True)
 
         # Test match
         query = "test query"
@@ -163,3 +338,326 @@ def test_integration(mock_config_manager):
         # Test get_config
         client.get_config("test", "key")
         mock_config_manager.get.assert_called_once_with("test", "key", default=None)
+
+
+def test_initialization_with_local_store(mock_config_manager):
+    mock_config_manager.get.side_effect = lambda *keys, default=None: (
+        "local"
+        if keys == ("horizon-scope", "vector-search-service", "store", "type")
+        else default
+    )
+    with patch(
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
+    ) as mock_pinecone, patch(
+        "horizon_scope.infrastructure.services.local_vector_search_service.LocalVectorSearchService"
+    ) as mock_local, patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
+    ), patch(
+        "horizon_scope.presentation.horizon_scope_client.CompareProjects"
+    ):
+        client = HorizonScopeClient(mock_config_manager)
+
+    mock_pinecone.assert_not_called()
+    mock_local.assert_called_once_with(
+        mock_config_manager, client.rate_limiter, client.transport
+    )
+    assert client.vector_search_service is mock_local.return_value
+
+
+def test_initialization_with_unsupported_store(mock_config_manager):
+    mock_config_manager.get.side_effect = lambda *keys, default=None: (
+        "faiss"
+        if keys == ("horizon-scope", "vector-search-service", "store", "type")
+        else default
+    )
+    with patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
+    ), patch("horizon_scope.presentation.horizon_scope_client.CompareProjects"):
+        with pytest.raises(ValueError, match="Unsupported vector store type"):
+            HorizonScopeClient(mock_config_manager)
+
+
+def test_index_projects(horizon_scope_client, mock_vector_search_service):
+    projects = [Mock(spec=Project) for _ in range(3)]
+    progress = Mock()
+
+    report = horizon_scope_client.index_projects(
+        projects, progress=progress, max_concurrency=2
+    )
+
+    mock_vector_search_service.index_projects.assert_called_once_with(
+        projects, progress=progress, max_concurrency=2
+    )
+    assert report == mock_vector_search_service.index_projects.return_value
+
+
+def test_initialization_with_bm25_lexical_index(mock_config_manager):
+    mock_config_manager.get.side_effect = lambda *keys, default=None: (
+        {"type": "bm25", "candidates": 30, "rrf_k": 10}
+        if keys == ("horizon-scope", "vector-search-service", "lexical")
+        else default
+    )
+    with patch(
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
+    ) as mock_pinecone, patch(
+        "horizon_scope.infrastructure.services.bm25_search_service.BM25SearchService"
+    ) as mock_bm25, patch(
+        "horizon_scope.presentation.horizon_scope_client.HybridSearchService"
+    ) as mock_hybrid, patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
+    ), patch(
+        "horizon_scope.presentation.horizon_scope_client.CompareProjects"
+    ):
+        client = HorizonScopeClient(mock_config_manager)
+
+    mock_bm25.assert_called_once_with(mock_config_manager)
+    mock_hybrid.assert_called_once_with(
+        mock_pinecone.return_value, mock_bm25.return_value, candidates=30, rrf_k=10
+    )
+    assert client.vector_search_service is mock_hybrid.return_value
+
+
+def test_initialization_with_unsupported_lexical_index(mock_config_manager):
+    mock_config_manager.get.side_effect = lambda *keys, default=None: (
+        {"type": "splade"}
+        if keys == ("horizon-scope", "vector-search-service", "lexical")
+        else default
+    )
+    with patch(
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
+    ), patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
+    ), patch("horizon_scope.presentation.horizon_scope_client.CompareProjects"):
+        with pytest.raises(ValueError, match="Unsupported lexical index type"):
+            HorizonScopeClient(mock_config_manager)
+
+
+def test_initialization_with_cross_encoder_reranker(mock_config_manager):
+    mock_config_manager.get.side_effect = lambda *keys, default=None: (
+        {"type": "cross-encoder", "model": "test-model", "candidates": 40, "max_gap": 2.0}
+        if keys == ("horizon-scope", "reranker")
+        else default
+    )
+    with patch(
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
+    ), patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
+    ), patch(
+        "horizon_scope.infrastructure.services.cross_encoder_reranker.CrossEncoderReranker"
+    ) as mock_reranker, patch(
+        "horizon_scope.presentation.horizon_scope_client.CompareProjects"
+    ) as mock_compare_projects:
+        HorizonScopeClient(mock_config_manager)
+
+    mock_reranker.assert_called_once_with(model_name="test-model", batch_size=32)
+    kwargs = mock_compare_projects.call_args.kwargs
+    assert kwargs["reranker"] is mock_reranker.return_value
+    assert kwargs["candidates"] == 40
+    assert kwargs["min_rerank_score"] is None
+    assert kwargs["max_rerank_gap"] == 2.0
+
+
+def test_initialization_with_unsupported_reranker(mock_config_manager):
+    mock_config_manager.get.side_effect = lambda *keys, default=None: (
+        {"type": "colbert"} if keys == ("horizon-scope", "reranker") else default
+    )
+    with patch(
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
+    ), patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
+    ), patch("horizon_scope.presentation.horizon_scope_client.CompareProjects"):
+        with pytest.raises(ValueError, match="Unsupported reranker type"):
+            HorizonScopeClient(mock_config_manager)
+
+
+def test_calibrate_fits_and_saves_calibration(
+    horizon_scope_client, mock_config_manager, mock_compare_projects, tmp_path
+):
+    # Arrange
+    path = str(tmp_path / "calibration" / "score_calibration.json")
+    mock_config_manager.get.side_effect = lambda *keys, default=None: (
+        path
+        if keys == ("horizon-scope", "comparison-service", "calibration", "path")
+        else default
+    )
+    mock_compare_projects.comparison_log = Mock()
+    mock_compare_projects.comparison_log.samples.return_value = [
+        (0.1 * i, 0.1 * i, 0.9) for i in range(10)
+    ]
+
+    # Act
+    calibration = horizon_scope_client.calibrate(n_bins=5, min_samples=10)
+
+    # Assert
+    assert calibration.n_samples == 10
+    assert len(calibration.similarities) == 5
+    assert mock_compare_projects.calibration is calibration
+    assert HorizonScopeClient._load_score_calibration(path) == calibration
+
+
+def test_calibrate_requires_enough_samples(
+    horizon_scope_client, mock_config_manager, mock_compare_projects
+):
+    mock_config_manager.get.side_effect = lambda *keys, default=None: "calibration.json"
+    mock_compare_projects.comparison_log = Mock()
+    mock_compare_projects.comparison_log.samples.return_value = [(0.5, 0.5, 0.9)]
+
+    with pytest.raises(ValueError, match="at least 50"):
+        horizon_scope_client.calibrate()
+
+
+def test_saved_comparisons(horizon_scope_client, mock_compare_projects):
+    mock_compare_projects.saved_calls = 7
+
+    assert horizon_scope_client.saved_comparisons == 7
+
+
+def test_match_records_usage(horizon_scope_client, mock_compare_projects):
+    # Arrange
+    tracker = UsageTracker({"input": 1.0, "output": 2.0})
+    usage = SimpleNamespace(prompt_tokens=1000, completion_tokens=500)
+
+    def execute(query, k):
+        tracker.record(usage)
+        return []
+
+    mock_compare_projects.execute.side_effect = execute
+
+    # Act
+    horizon_scope_client.match("query", 3)
+    horizon_scope_client.match("query", 3)
+
+    # Assert
+    assert horizon_scope_client.matches == 2
+    assert horizon_scope_client.last_match_usage.prompt_tokens == 1000
+    assert horizon_scope_client.match_usage.requests == 2
+    assert horizon_scope_client.cost_per_match == pytest.approx(0.002)
+
+
+def test_amatch_records_usage(horizon_scope_client, mock_compare_projects):
+    tracker = UsageTracker()
+
+    async def aexecute(query, k):
+        await asyncio.to_thread(
+            tracker.record, SimpleNamespace(prompt_tokens=10, completion_tokens=1)
+        )
+        return []
+
+    mock_compare_projects.aexecute = aexecute
+
+    asyncio.run(horizon_scope_client.amatch("query", 3))
+
+    assert horizon_scope_client.last_match_usage.prompt_tokens == 10
+    assert horizon_scope_client.matches == 1
+
+
+def test_initialization_with_summary_store(mock_config_manager, tmp_path):
+    store_path = str(tmp_path / "summaries.sqlite")
+    mock_config_manager.get.side_effect = lambda *keys, default=None: (
+        {"path": store_path}
+        if keys == ("horizon-scope", "comparison-service", "summaries")
+        else default
+    )
+    with patch(
+        "horizon_scope.infrastructure.services.pinecone_search_service.PineconeSearchService"
+    ), patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.OpenAIComparisonService"
+    ) as mock_openai, patch(
+        "horizon_scope.presentation.horizon_scope_client.CompareProjects"
+    ):
+        HorizonScopeClient(mock_config_manager)
+
+    store = mock_openai.call_args.kwargs["summaries"]
+    assert isinstance(store, SQLiteProjectSummaryStore)
+    assert store.path == store_path
+
+
+def test_match_iter_streams_updates(horizon_scope_client, mock_compare_projects):
+    # Arrange
+    tracker = UsageTracker()
+    updates = [MatchUpdate(), MatchUpdate()]
+
+    def execute_iter(query, k):
+        tracker.record(SimpleNamespace(prompt_tokens=10, completion_tokens=1))
+        yield from updates
+
+    mock_compare_projects.execute_iter = execute_iter
+
+    # Act
+    streamed = list(horizon_scope_client.match_iter("query", 3))
+
+    # Assert
+    assert streamed == updates
+    assert horizon_scope_client.matches == 1
+    assert horizon_scope_client.last_match_usage.prompt_tokens == 10
+
+
+def test_amatch_iter_streams_updates(horizon_scope_client, mock_compare_projects):
+    updates = [MatchUpdate(), MatchUpdate()]
+
+    async def aexecute_iter(query, k):
+        for update in updates:
+            yield update
+
+    mock_compare_projects.aexecute_iter = aexecute_iter
+
+    async def collect():
+        return [update async for update in horizon_scope_client.amatch_iter("q", 3)]
+
+    assert asyncio.run(collect()) == updates
+    assert horizon_scope_client.matches == 1
+
+
+def test_interleaved_match_iter_keeps_usage_scopes_apart(
+    horizon_scope_client, mock_compare_projects
+):
+    # Arrange
+    tracker = UsageTracker()
+
+    def execute_iter(query, k):
+        for _ in range(2):
+            tracker.record(SimpleNamespace(prompt_tokens=k, completion_tokens=1))
+            yield MatchUpdate()
+
+    mock_compare_projects.execute_iter = execute_iter
+    first = horizon_scope_client.match_iter("first", 10)
+    second = horizon_scope_client.match_iter("second", 100)
+
+    # Act: alternate the generators and record a request of the caller in between
+    next(first)
+    next(second)
+    tracker.record(SimpleNamespace(prompt_tokens=1000, completion_tokens=1))
+    list(first)
+    list(second)
+
+    # Assert
+    assert _active_usages.get() == ()
+    assert horizon_scope_client.matches == 2
+    assert horizon_scope_client.match_usage.prompt_tokens == 220
+    assert horizon_scope_client.last_match_usage.prompt_tokens == 200
+
+
+def test_interleaved_amatch_iter_keeps_usage_scopes_apart(
+    horizon_scope_client, mock_compare_projects
+):
+    tracker = UsageTracker()
+
+    async def aexecute_iter(query, k):
+        for _ in range(2):
+            tracker.record(SimpleNamespace(prompt_tokens=k, completion_tokens=1))
+            yield MatchUpdate()
+
+    mock_compare_projects.aexecute_iter = aexecute_iter
+
+    async def interleave():
+        first = horizon_scope_client.amatch_iter("first", 10)
+        second = horizon_scope_client.amatch_iter("second", 100)
+        await first.__anext__()
+        await second.__anext__()
+        tracker.record(SimpleNamespace(prompt_tokens=1000, completion_tokens=1))
+        [update async for update in first]
+        [update async for update in second]
+        return _active_usages.get()
+
+    assert asyncio.run(interleave()) == ()
+    assert horizon_scope_client.match_usage.prompt_tokens == 220
@@ -0,0 +1,148 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import openai
+import pytest
+from unittest.mock import Mock
+from horizon_scope.infrastructure.services.http_transport import HttpTransport
+from horizon_scope.infrastructure.services.rate_limiter import RateLimiter
+
+EMBEDDING_RESPONSE = {
+    "object": "list",
+    "data": [{"object": "embedding", "index": 0, "embedding": [0.1]}],
+    "model": "text-embedding-3-small",
+    "usage": {"prompt_tokens": 2, "total_tokens": 2},
+}
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Keep-alive fake of the embeddings endpoint."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps(EMBEDDING_RESPONSE).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("x-ratelimit-limit-requests", "3000")
+        self.send_header("x-ratelimit-remaining-requests", "2999")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOpenAIHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+def create_client(transport, api_key, base_url):
+    return openai.OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        max_retries=0,
+        timeout=transport.timeout,
+        http_client=transport.http_client(base_url),
+    )
+
+
+def test_from_config():
+    # Arrange
+    config = Mock()
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "http"): {
+            "max_connections": 10,
+            "max_keepalive_connections": 5,
+            "keepalive_expiry": 15,
+            "connect_timeout": 2,
+            "read_timeout": 30,
+        }
+    }.get(args, default)
+    rate_limiter = RateLimiter()
+
+    # Act
+    transport = HttpTransport.from_config(config, rate_limiter)
+
+    # Assert
+    assert transport.rate_limiter is rate_limiter
+    assert transport.http2 is False
+    assert transport.max_connections == 10
+    assert transport.max_keepalive_connections == 5
+    assert transport.keepalive_expiry == 15
+    assert transport.timeout.connect == 2
+    assert transport.timeout.read == 30
+
+
+def test_pools_are_shared():
+    transport = HttpTransport()
+
+    assert transport.http_client() is transport.http_client("http://other.local/v1")
+    assert transport.async_http_client() is transport.async_http_client()
+
+
+def test_clients_reuse_connections(base_url):
+    # Arrange: two clients with different keys, as the embedding and comparison services
+    rate_limiter = RateLimiter()
+    transport = HttpTransport(rate_limiter)
+    clients = [
+        create_client(transport, "embedding-key", base_url),
+        create_client(transport, "comparison-key", base_url),
+    ]
+
+    # Act
+    for client in clients + clients:
+        client.embeddings.create(model="text-embedding-3-small", input="query")
+
+    # Assert
+    assert transport.stats() == {"requests": 4, "connections": 1, "reused": 3}
+    limit = rate_limiter.limit("openai:text-embedding-3-small")
+    assert limit.requests.capacity == 3000
+
+
+def test_warm_up_opens_connection_for_first_request(base_url):
+    # Arrange
+    transport = HttpTransport()
+    client = create_client(transport, "key", base_url)
+
+    # Act
+    warmed = transport.warm_up()
+    client.embeddings.create(model="text-embedding-3-small", input="query")
+
+    # Assert
+    assert warmed == 1
+    assert transport.stats() == {"requests": 2, "connections": 1, "reused": 1}
+
+
+def test_warm_up_ignores_unreachable_base_urls():
+    transport = HttpTransport(connect_timeout=0.5)
+    transport.http_client("http://127.0.0.1:9/v1")
+
+    assert transport.warm_up() == 0
+
+
+def test_warm_up_without_clients():
+    assert HttpTransport().warm_up() == 0
+
+
+def test_close_opens_new_pool_on_next_use():
+    transport = HttpTransport()
+    pool = transport.http_client()
+
+    transport.close()
+
+    assert pool.is_closed
+    assert transport.http_client() is not pool
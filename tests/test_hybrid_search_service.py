@@ -0,0 +1,195 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from horizon_scope.application.interfaces.comparison_service import ComparisonService
+from horizon_scope.application.interfaces.vector_search_service import (
+    VectorSearchService,
+)
+from horizon_scope.application.use_cases.compare_projects import CompareProjects
+from horizon_scope.domain.entities.comparison import Comparison
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.domain.entities.score_calibration import ScoreCalibration
+from horizon_scope.infrastructure.services.bm25_search_service import (
+    BM25SearchService,
+)
+from horizon_scope.infrastructure.services.hybrid_search_service import (
+    HybridSearchService,
+    reciprocal_rank_fusion,
+)
+from horizon_scope.infrastructure.services.pinecone_search_service import (
+    PineconeSearchService,
+)
+
+
+def project(project_id, similarity=None):
+    return Project(
+        id=project_id, description=f"Description {project_id}", similarity=similarity
+    )
+
+
+@pytest.fixture
+def dense_hits():
+    return [project("1", 0.9), project("2", 0.8), project("3", 0.7)]
+
+
+@pytest.fixture
+def lexical_hits():
+    return [project("3"), project("4"), project("1")]
+
+
+@pytest.fixture
+def mock_dense(dense_hits):
+    dense = Mock(spec=PineconeSearchService)
+    dense.search.return_value = dense_hits
+    dense.asearch = AsyncMock(return_value=dense_hits)
+    return dense
+
+
+@pytest.fixture
+def mock_lexical(lexical_hits):
+    lexical = Mock(spec=BM25SearchService)
+    lexical.search.return_value = lexical_hits
+    lexical.asearch = AsyncMock(return_value=lexical_hits)
+    return lexical
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion(
+        [[project("a"), project("b"), project("c")], [project("c"), project("d")]],
+        rrf_k=60,
+    )
+
+    # c: 1/63 + 1/61 beats a: 1/61, which beats d: 1/62 and b: 1/62 (first seen wins ties)
+    assert [p.id for p in fused] == ["c", "a", "b", "d"]
+
+
+def test_search_fuses_both_retrievers(mock_dense, mock_lexical):
+    # Arrange
+    service = HybridSearchService(mock_dense, mock_lexical, candidates=20)
+
+    # Act
+    results = service.search("query", 3)
+
+    # Assert
+    mock_dense.search.assert_called_once_with("query", 20)
+    mock_lexical.search.assert_called_once_with("query", 20)
+    assert [p.id for p in results] == ["1", "3", "2"]
+    assert [p.similarity for p in results] == [0.9, 0.7, 0.8]
+
+
+def test_search_leaves_similarity_of_lexical_only_hits_empty(mock_dense, mock_lexical):
+    service = HybridSearchService(mock_dense, mock_lexical)
+
+    results = service.search("query", 4)
+
+    assert results[-1].id == "4"
+    assert results[-1].similarity is None
+
+
+def test_lexical_only_hits_survive_calibration_gating(mock_dense, mock_lexical):
+    # Arrange: the weakest dense hit maps to an expected score below the cutoff
+    mock_dense.search.return_value = [project("1", 0.9), project("3", 0.2)]
+    comparison_service = Mock(spec=ComparisonService)
+    comparison_service.compare.return_value = Comparison(
+        summary="Summary",
+        similarity="Similarity",
+        difference="Difference",
+        score=0.8,
+        confidence=0.9,
+        reason="Reason",
+    )
+    compare_projects = CompareProjects(
+        HybridSearchService(mock_dense, mock_lexical),
+        comparison_service,
+        calibration=ScoreCalibration(
+            similarities=[0.2, 0.5], scores=[0.0, 0.6], confidences=[0.4, 0.8]
+        ),
+        min_expected_score=0.3,
+        estimate_skipped=False,
+    )
+
+    # Act
+    results = compare_projects.execute("query", 3)
+
+    # Assert
+    assert sorted(result.project.id for result in results) == ["1", "4"]
+    assert compare_projects.saved_calls == 1
+
+
+def test_search_fetches_at_least_k_candidates(mock_dense, mock_lexical):
+    service = HybridSearchService(mock_dense, mock_lexical, candidates=5)
+
+    service.search("query", 30)
+
+    mock_dense.search.assert_called_once_with("query", 30)
+    mock_lexical.search.assert_called_once_with("query", 30)
+
+
+def test_search_without_dense_hits(mock_dense, mock_lexical):
+    mock_dense.search.return_value = []
+    service = HybridSearchService(mock_dense, mock_lexical)
+
+    results = service.search("query", 2)
+
+    assert [p.id for p in results] == ["3", "4"]
+    assert [p.similarity for p in results] == [None, None]
+
+
+def test_asearch_uses_async_retrievers(mock_dense, mock_lexical):
+    service = HybridSearchService(mock_dense, mock_lexical, candidates=20)
+
+    results = asyncio.run(service.asearch("query", 3))
+
+    mock_dense.asearch.assert_awaited_once_with("query", 20)
+    mock_lexical.asearch.assert_awaited_once_with("query", 20)
+    mock_dense.search.assert_not_called()
+    assert [p.id for p in results] == ["1", "3", "2"]
+
+
+def test_asearch_runs_sync_retrievers_in_a_thread(mock_dense, lexical_hits):
+    lexical = Mock(spec=VectorSearchService)
+    lexical.search.return_value = lexical_hits
+    service = HybridSearchService(mock_dense, lexical, candidates=20)
+
+    results = asyncio.run(service.asearch("query", 4))
+
+    lexical.search.assert_called_once_with("query", 20)
+    assert [p.id for p in results] == ["1", "3", "2", "4"]
+
+
+def test_index_operations_go_to_the_dense_service(mock_dense, mock_lexical):
+    service = HybridSearchService(mock_dense, mock_lexical)
+    new_project = project("5")
+
+    service.index_project(new_project)
+    report = service.index_projects([new_project], max_concurrency=2)
+
+    mock_dense.index_project.assert_called_once_with(new_project)
+    mock_dense.index_projects.assert_called_once_with([new_project], max_concurrency=2)
+    assert report == mock_dense.index_projects.return_value
+
+
+def test_writes_go_to_both_services(mock_dense, mock_lexical):
+    service = HybridSearchService(mock_dense, mock_lexical)
+    projects = [project("5")]
+
+    service.upsert_embeddings(projects, [[0.1]])
+    service.delete(["1"])
+    service.flush()
+
+    mock_dense.upsert_embeddings.assert_called_once_with(projects, [[0.1]])
+    mock_lexical.upsert_embeddings.assert_called_once_with(projects, [[0.1]])
+    mock_dense.delete.assert_called_once_with(["1"])
+    mock_lexical.delete.assert_called_once_with(["1"])
+    mock_dense.flush.assert_called_once_with()
+    mock_lexical.flush.assert_called_once_with()
+
+
+def test_writes_skip_read_only_lexical_service(mock_dense):
+    lexical = Mock(spec=VectorSearchService)
+    service = HybridSearchService(mock_dense, lexical)
+
+    service.upsert_embeddings([project("5")], [[0.1]])
+    service.flush()
+
+    mock_dense.flush.assert_called_once_with()
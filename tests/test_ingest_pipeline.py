@@ -0,0 +1,415 @@
+import json
+import numpy as np
+import pytest
+from unittest.mock import Mock
+from horizon_scope.application.interfaces.embedding_service import EmbeddingService
+from horizon_scope.application.interfaces.vector_index_writer import (
+    VectorIndexWriter,
+)
+from horizon_scope.ingest.cordis_csv import (
+    embedding_text,
+    normalize_date,
+    read_records,
+    to_project,
+)
+from horizon_scope.domain.entities.ingest_checkpoint import IngestCheckpoint
+from horizon_scope.ingest.manifest import SyncManifest, content_hash
+from horizon_scope.ingest.pipeline import IngestionPipeline
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.bm25_search_service import (
+    BM25SearchService,
+)
+from horizon_scope.infrastructure.services.chunking import TextChunker
+from horizon_scope.infrastructure.services.hybrid_search_service import (
+    HybridSearchService,
+)
+
+HEADER = '"id";"acronym";"title";"objective";"contentUpdateDate"\n'
+
+
+class Crash(BaseException):
+    pass
+
+
+def write_csv(path, rows):
+    lines = [
+        f'"{id}";"ACR";"{title}";"{objective}";"{date}"\n'
+        for id, title, objective, date in rows
+    ]
+    path.write_text(HEADER + "".join(lines), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def csv_paths(tmp_path):
+    first = write_csv(
+        tmp_path / "projects_14_20.csv",
+        [
+            ("1", "Project 1", "Objective 1", "2022-08-09 13:43:25"),
+            ("2", "Project 2", "", "2022-08-09 13:43:25"),
+            ("3", "Project 3", 'Objective \\"3\\"\nsecond line', "2022-08-10 09:00:00"),
+        ],
+    )
+    second = write_csv(
+        tmp_path / "projects_21_27.csv",
+        [
+            ("4", "Project 4", "Objective 4", "not a date"),
+            ("5", "Project 5", "Objective 5", "2023-01-01 00:00:00"),
+        ],
+    )
+    return [first, second]
+
+
+@pytest.fixture
+def mock_index():
+    return Mock(spec=VectorIndexWriter)
+
+
+@pytest.fixture
+def mock_embedding_service():
+    service = Mock(spec=EmbeddingService)
+    service.embed_many.side_effect = lambda texts: [[0.1, 0.2] for _ in texts]
+    return service
+
+
+def upserted_ids(mock_index):
+    return [
+        project.id
+        for call in mock_index.upsert_embeddings.call_args_list
+        for project in call.args[0]
+    ]
+
+
+def test_read_records_streams_selected_fields(csv_paths):
+    records = list(read_records(csv_paths))
+
+    assert len(records) == 5
+    assert set(records[0]) == {"id", "title", "objective", "contentUpdateDate"}
+    assert records[2]["objective"] == 'Objective "3"\nsecond line'
+
+
+def test_to_project_cleans_records():
+    project = to_project(
+        {
+            "id": " 1 ",
+            "title": "Project\n 1",
+            "objective": " Objective 1 ",
+            "contentUpdateDate": "2022-08-09 13:43:25",
+        }
+    )
+
+    assert project.id == "1"
+    assert project.title == "Project 1"
+    assert project.description == "Objective 1"
+    assert project.content_update_date == "2022-08-09T13:43:25"
+    assert embedding_text(project) == "Project 1 Objective 1"
+
+
+def test_to_project_skips_records_without_objective():
+    record = {"id": "1", "title": "Project 1", "objective": " ", "contentUpdateDate": ""}
+
+    assert to_project(record) is None
+
+
+def test_normalize_date_with_invalid_date():
+    assert normalize_date("not a date") is None
+
+
+def test_run_ingests_all_files(
+    csv_paths, mock_index, mock_embedding_service, tmp_path
+):
+    # Arrange
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    pipeline = IngestionPipeline(
+        mock_index,
+        mock_embedding_service,
+        checkpoint_path=checkpoint_path,
+        max_batch_items=2,
+    )
+    progress = Mock()
+
+    # Act
+    checkpoint = pipeline.run(csv_paths, progress=progress)
+
+    # Assert
+    assert upserted_ids(mock_index) == ["1", "3", "4", "5"]
+    assert mock_embedding_service.embed_many.call_count == 2
+    assert mock_embedding_service.embed_many.call_args_list[0].args[0] == [
+        "Project 1 Objective 1",
+        'Project 3 Objective "3" second line',
+    ]
+    assert checkpoint.indexed == 4
+    assert checkpoint.skipped == 1
+    assert checkpoint.rows_done == 5
+    assert checkpoint.completed
+    assert progress.call_count == 2
+    mock_index.flush.assert_called()
+    with open(checkpoint_path) as checkpoint_file:
+        assert json.load(checkpoint_file)["rows_done"] == 5
+
+
+def test_run_resumes_after_crash(
+    csv_paths, mock_index, mock_embedding_service, tmp_path
+):
+    # Arrange
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    def make_pipeline():
+        return IngestionPipeline(
+            mock_index,
+            mock_embedding_service,
+            checkpoint_path=checkpoint_path,
+            max_concurrency=1,
+            checkpoint_every=1,
+            max_batch_items=2,
+        )
+
+    mock_index.upsert_embeddings.side_effect = [None, Crash()]
+    with pytest.raises(Crash):
+        make_pipeline().run(csv_paths)
+    mock_index.upsert_embeddings.reset_mock(side_effect=True)
+    mock_embedding_service.embed_many.reset_mock()
+
+    # Act
+    checkpoint = make_pipeline().run(csv_paths)
+
+    # Assert
+    assert upserted_ids(mock_index) == ["4", "5"]
+    mock_embedding_service.embed_many.assert_called_once_with(
+        ["Project 4 Objective 4", "Project 5 Objective 5"]
+    )
+    assert checkpoint.indexed == 4
+    assert checkpoint.skipped == 1
+    assert checkpoint.completed
+
+
+def test_run_records_failed_batches(csv_paths, mock_index, mock_embedding_service):
+    mock_embedding_service.embed_many.side_effect = Exception("API error")
+    pipeline = IngestionPipeline(mock_index, mock_embedding_service)
+
+    checkpoint = pipeline.run(csv_paths)
+
+    assert checkpoint.indexed == 0
+    assert checkpoint.failed_ids == ["1", "3", "4", "5"]
+    assert checkpoint.completed
+    mock_index.upsert_embeddings.assert_not_called()
+
+
+def test_run_rejects_checkpoint_of_other_files(
+    csv_paths, mock_index, mock_embedding_service, tmp_path
+):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    checkpoint_path.write_text(
+        IngestCheckpoint(sources=csv_paths[:1], rows_done=2).model_dump_json()
+    )
+
+    with pytest.raises(ValueError, match="was written for"):
+        IngestionPipeline(
+            mock_index, mock_embedding_service, checkpoint_path=str(checkpoint_path)
+        ).run(csv_paths)
+
+
+def test_run_starts_over_after_completed_run(
+    csv_paths, mock_index, mock_embedding_service, tmp_path
+):
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    pipeline = IngestionPipeline(
+        mock_index, mock_embedding_service, checkpoint_path=checkpoint_path
+    )
+    first = pipeline.run(csv_paths)
+
+    second = pipeline.run(csv_paths)
+
+    assert second.run_id != first.run_id
+    assert second.indexed == 4
+    assert upserted_ids(mock_index) == ["1", "3", "4", "5"] * 2
+
+
+def test_sync_skips_unchanged_and_deletes_withdrawn_projects(
+    csv_paths, mock_index, mock_embedding_service, tmp_path
+):
+    # Arrange
+    manifest = SyncManifest(str(tmp_path / "manifest.sqlite"))
+
+    def make_pipeline():
+        return IngestionPipeline(
+            mock_index,
+            mock_embedding_service,
+            model="text-embedding-3-small",
+            manifest=manifest,
+            max_delete_fraction=0.5,
+        )
+
+    make_pipeline().run(csv_paths)
+    mock_index.reset_mock()
+    mock_embedding_service.embed_many.reset_mock()
+    refreshed = write_csv(
+        tmp_path / "projects_21_27.csv",
+        [
+            ("4", "Project 4", "Objective 4 revised", "2023-02-01 00:00:00"),
+            ("6", "Project 6", "Objective 6", "2023-02-01 00:00:00"),
+        ],
+    )
+
+    # Act
+    checkpoint = make_pipeline().run([csv_paths[0], refreshed])
+
+    # Assert
+    assert upserted_ids(mock_index) == ["4", "6"]
+    assert checkpoint.indexed == 2
+    assert checkpoint.unchanged == 2
+    assert checkpoint.deleted == 1
+    mock_index.delete.assert_called_once_with(["5"])
+    assert len(manifest) == 4
+    assert manifest.is_current(
+        "4",
+        content_hash("Project 4 Objective 4 revised"),
+        "text-embedding-3-small",
+    )
+
+
+def test_sync_reembeds_projects_of_another_model(
+    csv_paths, mock_index, mock_embedding_service, tmp_path
+):
+    manifest = SyncManifest(str(tmp_path / "manifest.sqlite"))
+    IngestionPipeline(
+        mock_index, mock_embedding_service, model="old-model", manifest=manifest
+    ).run(csv_paths)
+
+    checkpoint = IngestionPipeline(
+        mock_index, mock_embedding_service, model="new-model", manifest=manifest
+    ).run(csv_paths)
+
+    assert checkpoint.indexed == 4
+    assert checkpoint.unchanged == 0
+
+
+def test_sync_does_not_delete_most_of_the_index(
+    csv_paths, mock_index, mock_embedding_service, tmp_path
+):
+    manifest = SyncManifest(str(tmp_path / "manifest.sqlite"))
+    IngestionPipeline(mock_index, mock_embedding_service, manifest=manifest).run(
+        csv_paths
+    )
+
+    checkpoint = IngestionPipeline(
+        mock_index, mock_embedding_service, manifest=manifest
+    ).run(csv_paths[1:])
+
+    assert checkpoint.deleted == 0
+    mock_index.delete.assert_not_called()
+    assert len(manifest) == 4
+
+
+def test_initialization_with_invalid_concurrency(mock_index, mock_embedding_service):
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        IngestionPipeline(mock_index, mock_embedding_service, max_concurrency=0)
+
+
+def test_run_embeds_long_projects_as_chunks(
+    csv_paths, mock_index, mock_embedding_service
+):
+    # Arrange
+    chunker = TextChunker(max_tokens=8, overlap=0)
+    chunker.split = lambda text: [text] if len(text) < 30 else [text[:20], text[20:]]
+    pipeline = IngestionPipeline(mock_index, mock_embedding_service, chunker=chunker)
+
+    # Act
+    checkpoint = pipeline.run(csv_paths)
+
+    # Assert
+    assert upserted_ids(mock_index) == ["1", "3", "3#1", "4", "5"]
+    texts = mock_embedding_service.embed_many.call_args.args[0]
+    assert texts[1:3] == ["Project 3 Objective ", '"3" second line']
+    assert checkpoint.indexed == 4
+
+
+def test_sync_records_projects_only_once_the_index_is_flushed(
+    csv_paths, mock_index, mock_embedding_service, tmp_path
+):
+    # Arrange: the first batch is stored, but the run crashes before a checkpoint
+    manifest = SyncManifest(str(tmp_path / "manifest.sqlite"))
+    pipeline = IngestionPipeline(
+        mock_index,
+        mock_embedding_service,
+        manifest=manifest,
+        max_concurrency=1,
+        max_batch_items=2,
+    )
+    mock_index.upsert_embeddings.side_effect = [None, Crash()]
+
+    # Act
+    with pytest.raises(Crash):
+        pipeline.run(csv_paths)
+
+    # Assert
+    mock_index.flush.assert_not_called()
+    assert len(manifest) == 0
+
+
+def test_sync_does_not_fail_stored_batches_when_the_manifest_fails(
+    csv_paths, mock_index, mock_embedding_service, tmp_path
+):
+    # Arrange
+    manifest = SyncManifest(str(tmp_path / "manifest.sqlite"))
+    manifest.record = Mock(side_effect=Exception("database is locked"))
+    pipeline = IngestionPipeline(mock_index, mock_embedding_service, manifest=manifest)
+
+    # Act
+    checkpoint = pipeline.run(csv_paths)
+
+    # Assert
+    assert checkpoint.indexed == 4
+    assert checkpoint.failed_ids == []
+    assert checkpoint.completed
+    manifest.record.assert_called_once()
+
+
+def test_sync_keeps_the_lexical_index_of_hybrid_search_current(
+    csv_paths, mock_index, mock_embedding_service, tmp_path
+):
+    # Arrange: an empty BM25 index behind hybrid search
+    source_path = str(tmp_path / "source.npz")
+    np.savez(
+        source_path,
+        ids=np.asarray([], dtype=str),
+        titles=np.asarray([], dtype=str),
+        objectives=np.asarray([], dtype=str),
+        dates=np.asarray([], dtype=str),
+    )
+    config = Mock(spec=ConfigManager)
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "vector-search-service", "lexical"): {
+            "path": str(tmp_path / "bm25.npz"),
+            "source": source_path,
+        },
+    }.get(args, default)
+    lexical = BM25SearchService(config)
+    manifest = SyncManifest(str(tmp_path / "manifest.sqlite"))
+
+    def make_pipeline():
+        return IngestionPipeline(
+            HybridSearchService(mock_index, lexical),
+            mock_embedding_service,
+            manifest=manifest,
+            max_delete_fraction=0.5,
+        )
+
+    make_pipeline().run(csv_paths)
+    refreshed = write_csv(
+        tmp_path / "projects_21_27.csv",
+        [
+            ("4", "Project 4", "Objective 4 revised", "2023-02-01 00:00:00"),
+            ("6", "Project 6", "Objective 6", "2023-02-01 00:00:00"),
+        ],
+    )
+
+    # Act
+    make_pipeline().run([csv_paths[0], refreshed])
+
+    # Assert
+    assert sorted(lexical.ids) == ["1", "3", "4", "6"]
+    assert [project.id for project in lexical.search("6", 2)] == ["6"]
+    assert lexical.search("5", 2) == []
+    assert lexical.search("revised", 2)[0].id == "4"
+    assert BM25SearchService(config).ids == lexical.ids
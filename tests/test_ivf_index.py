@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from horizon_scope.infrastructure.index.exact_index import exact_search, top_k
+from horizon_scope.infrastructure.index.ivf_index import IVFIndex, fingerprint
+
+
+@pytest.fixture
+def corpus():
+    rng = np.random.default_rng(0)
+    topics = rng.standard_normal((20, 32))
+    vectors = topics[rng.integers(0, 20, 2000)] + 0.3 * rng.standard_normal((2000, 32))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def test_top_k_orders_best_first():
+    scores = np.asarray([0.1, 0.9, 0.5, 0.7])
+
+    assert top_k(scores, 2).tolist() == [1, 3]
+    assert top_k(scores, 10).tolist() == [1, 3, 2, 0]
+    assert top_k(scores, 0).tolist() == []
+
+
+def test_build_covers_every_row_once(corpus):
+    index = IVFIndex.build(corpus, n_lists=16)
+
+    assert index.n_lists == 16
+    assert index.n_indexed == len(corpus)
+    assert sorted(index.positions.tolist()) == list(range(len(corpus)))
+    assert index.offsets[0] == 0
+    assert index.offsets[-1] == len(corpus)
+    np.testing.assert_allclose(np.linalg.norm(index.centroids, axis=1), 1.0, rtol=1e-5)
+
+
+def test_search_with_all_lists_matches_exact_search(corpus):
+    index = IVFIndex.build(corpus, n_lists=16)
+    query = corpus[7]
+
+    positions, scores = index.search(corpus, query, 5, nprobe=16)
+    exact_positions, exact_scores = exact_search(corpus, query, 5)
+
+    assert positions.tolist() == exact_positions.tolist()
+    np.testing.assert_allclose(scores, exact_scores)
+
+
+def test_search_recall_on_clustered_data(corpus):
+    index = IVFIndex.build(corpus, n_lists=32, nprobe=4)
+    recalls = []
+    for query in corpus[:50]:
+        positions, _ = index.search(corpus, query, 10)
+        exact_positions, _ = exact_search(corpus, query, 10)
+        recalls.append(len(set(positions) & set(exact_positions)) / 10)
+
+    assert np.mean(recalls) > 0.9
+
+
+def test_search_scores_rows_added_after_build(corpus):
+    index = IVFIndex.build(corpus[:-1], n_lists=16)
+
+    positions, _ = index.search(corpus, corpus[-1], 1, nprobe=1)
+
+    assert positions.tolist() == [len(corpus) - 1]
+
+
+def test_save_and_load(corpus, tmp_path):
+    index = IVFIndex.build(corpus, n_lists=8, nprobe=3, fingerprint="abc")
+    path = str(tmp_path / "ivf.npz")
+
+    index.save(path)
+    loaded = IVFIndex.load(path)
+
+    assert loaded.nprobe == 3
+    assert loaded.fingerprint == "abc"
+    np.testing.assert_array_equal(loaded.centroids, index.centroids)
+    np.testing.assert_array_equal(loaded.positions, index.positions)
+    np.testing.assert_array_equal(loaded.offsets, index.offsets)
+
+
+def test_build_rejects_empty_matrix():
+    with pytest.raises(ValueError, match="empty matrix"):
+        IVFIndex.build(np.empty((0, 4), dtype=np.float32))
+
+
+def test_fingerprint_depends_on_order():
+    embeddings = np.eye(2, dtype=np.float32)
+
+    assert fingerprint(["1", "2"], embeddings) != fingerprint(["2", "1"], embeddings)
+
+
+def test_fingerprint_depends_on_embeddings():
+    embeddings = np.eye(2, dtype=np.float32)
+
+    assert fingerprint(["1", "2"], embeddings) != fingerprint(
+        ["1", "2"], embeddings[::-1]
+    )
+    assert fingerprint(["1", "2"], embeddings) != fingerprint(
+        ["1", "2"], embeddings.astype(np.float64)
+    )
@@ -0,0 +1,358 @@
+import asyncio
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.index.ivf_index import IVFIndex
+from horizon_scope.infrastructure.services.local_vector_search_service import (
+    LocalVectorSearchService,
+    load_project_embeddings,
+)
+
+
+@pytest.fixture
+def embeddings_path(tmp_path):
+    path = str(tmp_path / "embeddings.npz")
+    np.savez(
+        path,
+        ids=np.asarray(["1", "2", "3"]),
+        titles=np.asarray(["Project 1", "Project 2", "Project 3"]),
+        objectives=np.asarray(["Description 1", "Description 2", "Description 3"]),
+        dates=np.asarray(
+            ["2023-01-01T00:00:00", "2023-01-02T00:00:00", "2023-01-03T00:00:00"]
+        ),
+        embeddings=np.asarray(
+            [[1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [3.0, 3.0, 0.0]], dtype=np.float64
+        ),
+    )
+    return path
+
+
+@pytest.fixture
+def mock_config(embeddings_path):
+    config = Mock(spec=ConfigManager)
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "vector-search-service", "store", "path"): embeddings_path,
+    }.get(args, default)
+    return config
+
+
+@pytest.fixture
+def mock_embedding_service():
+    return Mock()
+
+
+@pytest.fixture
+def local_search_service(mock_config, mock_embedding_service):
+    with patch(
+        "horizon_scope.infrastructure.services.openai_embedding_service.OpenAIEmbeddingService",
+        return_value=mock_embedding_service,
+    ):
+        return LocalVectorSearchService(mock_config)
+
+
+def test_initialization_normalizes_embeddings(local_search_service):
+    embeddings = local_search_service.embeddings
+
+    assert embeddings.dtype == np.float32
+    assert embeddings.flags["C_CONTIGUOUS"]
+    np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, rtol=1e-6)
+    assert local_search_service.ids == ["1", "2", "3"]
+
+
+def test_search_returns_top_k_by_cosine_similarity(
+    local_search_service, mock_embedding_service
+):
+    # Arrange
+    mock_embedding_service.embed.return_value = [2.0, 0.0, 0.0]
+
+    # Act
+    results = local_search_service.search("test query", 2)
+
+    # Assert
+    mock_embedding_service.embed.assert_called_once_with("test query")
+    assert [project.id for project in results] == ["1", "3"]
+    assert isinstance(results[0], Project)
+    assert results[0].title == "Project 1"
+    assert results[0].description == "Description 1"
+    assert results[0].content_update_date == "2023-01-01T00:00:00"
+    assert results[0].similarity == pytest.approx(1.0)
+    assert results[1].similarity == pytest.approx(np.sqrt(0.5))
+
+
+def test_search_with_k_larger_than_corpus(local_search_service, mock_embedding_service):
+    mock_embedding_service.embed.return_value = [0.0, 1.0, 0.0]
+
+    results = local_search_service.search("test query", 10)
+
+    assert [project.id for project in results] == ["2", "3", "1"]
+
+
+def test_asearch(local_search_service, mock_embedding_service):
+    mock_embedding_service.aembed = AsyncMock(return_value=[0.0, 1.0, 0.0])
+
+    results = asyncio.run(local_search_service.asearch("test query", 1))
+
+    mock_embedding_service.aembed.assert_awaited_once_with("test query")
+    assert [project.id for project in results] == ["2"]
+
+
+def test_index_project_adds_and_replaces_projects(
+    local_search_service, mock_embedding_service
+):
+    # Arrange
+    mock_embedding_service.embed.return_value = [0.0, 0.0, 5.0]
+    project = Project(
+        id="4",
+        title="Project 4",
+        description="Description 4",
+        content_update_date="2023-01-04T00:00:00",
+    )
+
+    # Act
+    local_search_service.index_project(project)
+    local_search_service.index_project(project)
+    results = local_search_service.search("test query", 4)
+
+    # Assert
+    assert len(local_search_service.ids) == 4
+    assert local_search_service.embeddings.shape == (4, 3)
+    assert results[0].id == "4"
+    assert results[0].similarity == pytest.approx(1.0)
+
+
+def test_save_round_trip(local_search_service, tmp_path):
+    path = str(tmp_path / "saved.npz")
+
+    local_search_service.save(path)
+    data = load_project_embeddings(path)
+
+    assert data["ids"] == ["1", "2", "3"]
+    assert data["titles"][2] == "Project 3"
+    np.testing.assert_allclose(data["embeddings"], local_search_service.embeddings)
+
+
+def test_load_project_embeddings_from_notebook_pickle(tmp_path):
+    pd = pytest.importorskip("pandas")
+    path = str(tmp_path / "horizon_projects_embeddings.pkl")
+    pd.DataFrame(
+        {
+            "id": [101, 102],
+            "title": ["Project 1", None],
+            "objective": ["Description 1", "Description 2"],
+            "contentUpdateDate": pd.to_datetime(["2023-01-01 10:00:00", None]),
+            "ada_embedding": [[0.1, 0.2], [0.3, 0.4]],
+        }
+    ).to_pickle(path)
+
+    data = load_project_embeddings(path)
+
+    assert data["ids"] == ["101", "102"]
+    assert data["titles"] == ["Project 1", ""]
+    assert data["dates"] == ["2023-01-01T10:00:00", ""]
+    assert data["embeddings"].shape == (2, 2)
+
+
+def test_ann_index_is_built_saved_and_reused(embeddings_path, tmp_path):
+    # Arrange
+    ann_path = str(tmp_path / "ann" / "ivf.npz")
+    config = Mock(spec=ConfigManager)
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "vector-search-service", "store", "path"): embeddings_path,
+        ("horizon-scope", "vector-search-service", "store", "ann"): {
+            "type": "ivf",
+            "n_lists": 2,
+            "nprobe": 2,
+            "path": ann_path,
+        },
+    }.get(args, default)
+    embedding_service = Mock()
+    embedding_service.embed.return_value = [0.0, 1.0, 0.0]
+
+    # Act
+    with patch(
+        "horizon_scope.infrastructure.services.openai_embedding_service.OpenAIEmbeddingService",
+        return_value=embedding_service,
+    ), patch(
+        "horizon_scope.infrastructure.services.local_vector_search_service.IVFIndex.build",
+        wraps=IVFIndex.build,
+    ) as mock_build:
+        first = LocalVectorSearchService(config)
+        second = LocalVectorSearchService(config)
+    results = second.search("test query", 2)
+
+    # Assert
+    mock_build.assert_called_once()
+    assert first.ann_index.n_lists == 2
+    assert second.ann_index.n_indexed == 3
+    assert [project.id for project in results] == ["2", "3"]
+
+
+def test_ann_index_is_rebuilt_after_reembedding(embeddings_path, tmp_path):
+    # Arrange
+    ann_path = str(tmp_path / "ivf.npz")
+    config = Mock(spec=ConfigManager)
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "vector-search-service", "store", "path"): embeddings_path,
+        ("horizon-scope", "vector-search-service", "store", "ann"): {
+            "n_lists": 2,
+            "path": ann_path,
+        },
+    }.get(args, default)
+    with patch(
+        "horizon_scope.infrastructure.services.openai_embedding_service.OpenAIEmbeddingService"
+    ):
+        first = LocalVectorSearchService(config)
+        # Re-embed the corpus with another model, keeping the ids
+        first.embeddings = np.asarray(
+            [[0.0, 0.0, 1.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float32
+        )
+        first.flush()
+
+        # Act
+        with patch(
+            "horizon_scope.infrastructure.services.local_vector_search_service.IVFIndex.build",
+            wraps=IVFIndex.build,
+        ) as mock_build:
+            second = LocalVectorSearchService(config)
+
+    # Assert
+    mock_build.assert_called_once()
+    assert second.ann_index.fingerprint != first.ann_index.fingerprint
+    assert IVFIndex.load(ann_path).fingerprint == second.ann_index.fingerprint
+
+
+def test_unsupported_ann_type(embeddings_path):
+    config = Mock(spec=ConfigManager)
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "vector-search-service", "store", "path"): embeddings_path,
+        ("horizon-scope", "vector-search-service", "store", "ann"): {"type": "hnsw"},
+    }.get(args, default)
+
+    with patch(
+        "horizon_scope.infrastructure.services.openai_embedding_service.OpenAIEmbeddingService"
+    ):
+        with pytest.raises(ValueError, match="Unsupported approximate index type"):
+            LocalVectorSearchService(config)
+
+
+def test_index_projects_adds_and_replaces_projects(
+    local_search_service, mock_embedding_service
+):
+    # Arrange
+    mock_embedding_service.model = "text-embedding-3-small"
+    mock_embedding_service.embed_many.side_effect = lambda texts: [
+        [0.0, 0.0, float(i + 1)] for i in range(len(texts))
+    ]
+    projects = [
+        Project(id="1", title="Updated 1", description="Updated description 1"),
+        Project(id="4", title="Project 4", description="Description 4"),
+        Project(id="4", title="Project 4 again", description="Description 4 again"),
+    ]
+    progress = Mock()
+
+    # Act
+    report = local_search_service.index_projects(iter(projects), progress=progress)
+
+    # Assert
+    assert report.indexed == 3
+    assert report.failed_ids == []
+    assert local_search_service.ids == ["1", "2", "3", "4"]
+    assert local_search_service.titles[0] == "Updated 1"
+    assert local_search_service.titles[3] == "Project 4 again"
+    assert local_search_service.embeddings.shape == (4, 3)
+    np.testing.assert_allclose(local_search_service.embeddings[0], [0.0, 0.0, 1.0])
+    progress.assert_called_with(report)
+
+
+def test_upsert_embeddings_into_empty_store_and_flush(tmp_path, mock_embedding_service):
+    # Arrange
+    path = str(tmp_path / "store" / "index.npz")
+    config = Mock(spec=ConfigManager)
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "vector-search-service", "store", "path"): path,
+    }.get(args, default)
+    with patch(
+        "horizon_scope.infrastructure.services.openai_embedding_service.OpenAIEmbeddingService",
+        return_value=mock_embedding_service,
+    ):
+        service = LocalVectorSearchService(config)
+        projects = [Project(id="1", title="Project 1", description="Description 1")]
+
+        # Act
+        service.upsert_embeddings(projects, [[3.0, 4.0]])
+        service.flush()
+        reloaded = LocalVectorSearchService(config)
+
+    # Assert
+    assert reloaded.ids == ["1"]
+    np.testing.assert_allclose(reloaded.embeddings, [[0.6, 0.8]], rtol=1e-6)
+
+
+def test_flush_requires_npz_store(local_search_service):
+    local_search_service.path = "data/horizon_projects_embeddings.pkl"
+
+    with pytest.raises(ValueError, match="configure an .npz store path"):
+        local_search_service.flush()
+
+
+def test_delete_removes_projects(local_search_service, mock_embedding_service):
+    # Arrange
+    mock_embedding_service.embed.return_value = [1.0, 0.5, 0.0]
+
+    # Act
+    local_search_service.delete(["3", "unknown"])
+    results = local_search_service.search("test query", 3)
+
+    # Assert
+    assert local_search_service.ids == ["1", "2"]
+    assert local_search_service.embeddings.shape == (2, 3)
+    assert [project.id for project in results] == ["1", "2"]
+
+
+def test_index_project_with_long_description_is_pooled(
+    local_search_service, mock_embedding_service
+):
+    # Arrange
+    local_search_service.chunker.split = Mock(return_value=["part 1", "part 2"])
+    mock_embedding_service.embed_many.return_value = [[0.0, 0.0, 1.0], [0.0, 0.1, 1.0]]
+    mock_embedding_service.embed.return_value = [0.0, 0.3, 1.0]
+    project = Project(id="4", title="Project 4", description="Long description")
+
+    # Act
+    local_search_service.index_project(project)
+    results = local_search_service.search("test query", 2)
+
+    # Assert
+    assert local_search_service.ids[3:] == ["4", "4#1"]
+    assert [result.id for result in results] == ["4", "2"]
+    assert results[0].description == "Long description"
+
+    # Act
+    local_search_service.delete(["4"])
+
+    # Assert
+    assert local_search_service.ids == ["1", "2", "3"]
+
+
+def test_index_project_with_fewer_chunks_removes_leftover_chunks(
+    local_search_service, mock_embedding_service
+):
+    # Arrange
+    local_search_service.chunker.split = Mock(
+        return_value=["part 1", "part 2", "part 3"]
+    )
+    mock_embedding_service.embed_many.return_value = [[0.0, 0.0, 1.0]] * 3
+    local_search_service.index_project(Project(id="4", description="Long"))
+    local_search_service.chunker.split = Mock(return_value=["part 1"])
+    mock_embedding_service.embed.side_effect = [[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+
+    # Act
+    local_search_service.index_project(Project(id="4", description="Short"))
+    results = local_search_service.search("test query", 4)
+
+    # Assert: the query matches the old chunks, which are gone
+    assert local_search_service.ids == ["1", "2", "3", "4"]
+    assert local_search_service.embeddings.shape == (4, 3)
+    assert max(result.similarity for result in results) == pytest.approx(0.0)
@@ -1,21 +1,38 @@
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import json
+from types import SimpleNamespace
 from horizon_scope.infrastructure.services.openai_comparison_service import (
     OpenAIComparisonService,
-    MAX_PROJECT_LENGTH,
+    DEFAULT_MAX_INPUT_TOKENS,
+    ANALYSIS_PROMPT,
+    PROMPT_VERSION,
+    STATIC_PROMPT,
+    parse_partial_json,
+)
+from horizon_scope.infrastructure.services.usage_tracker import track_usage
+from horizon_scope.domain.entities.comparison import Comparison, ComparisonAnalysis
+from horizon_scope.domain.entities.comparison_batch import (
+    ComparisonAnalysisBatch,
+    ComparisonBatch,
+    IndexedComparison,
+    IndexedComparisonAnalysis,
+)
+from horizon_scope.domain.entities.project_summary import ProjectSummary
+from horizon_scope.infrastructure.cache.sqlite_project_summary_store import (
+    SQLiteProjectSummaryStore,
 )
-from horizon_scope.domain.entities.comparison import Comparison
 from horizon_scope.infrastructure.config.config_manager import ConfigManager
 
 
 @pytest.fixture
 def mock_config():
     config = Mock(spec=ConfigManager)
-    config.get.side_effect = lambda *args: {
+    config.get.side_effect = lambda *args, default=None: {
         ("horizon-scope", "comparison-service", "api_key"): "test_openai_api_key",
         ("horizon-scope", "comparison-service", "model"): "gpt-4",
-    }[args]
+    }.get(args, default)
     return config
 
 
@@ -25,24 +42,49 @@ def mock_openai_client():
 
 
 @pytest.fixture
-def comparison_service(mock_config, mock_openai_client):
+def mock_async_openai_client():
+    return Mock()
+
+
+@pytest.fixture
+def comparison_service(mock_config, mock_openai_client, mock_async_openai_client):
     with patch(
         "horizon_scope.infrastructure.services.openai_comparison_service.OpenAI"
-    ) as mock_openai:
+    ) as mock_openai, patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.AsyncOpenAI"
+    ) as mock_async_openai:
         mock_openai.return_value = mock_openai_client
+        mock_async_openai.return_value = mock_async_openai_client
         return OpenAIComparisonService(mock_config)
 
 
 def test_initialization(mock_config):
     with patch(
         "horizon_scope.infrastructure.services.openai_comparison_service.OpenAI"
-    ) as mock_openai:
+    ) as mock_openai, patch(
+        "horizon_scope.infrastructure.services.openai_comparison_service.AsyncOpenAI"
+    ) as mock_async_openai:
         service = OpenAIComparisonService(mock_config)
 
     mock_config.get.assert_any_call("horizon-scope", "comparison-service", "api_key")
     mock_config.get.assert_any_call("horizon-scope", "comparison-service", "model")
-    mock_openai.assert_called_once_with(api_key="test_openai_api_key")
+    transport = service.transport
+    mock_openai.assert_called_once_with(
+        api_key="test_openai_api_key",
+        base_url=None,
+        max_retries=0,
+        timeout=transport.timeout,
+        http_client=transport.http_client(),
+    )
+    mock_async_openai.assert_called_once_with(
+        api_key="test_openai_api_key",
+        base_url=None,
+        max_retries=0,
+        timeout=transport.timeout,
+        http_client=transport.async_http_client(),
+    )
     assert service.model == "gpt-4"
+    assert service.rate_limit_key == "openai:gpt-4"
 
 
 def test_create_comparison_prompt(comparison_service):
@@ -82,7 +124,7 @@ def test_compare(comparison_service, mock_openai_client):
     assert isinstance(result, Comparison)
     assert result == mock_comparison
     mock_openai_client.beta.chat.completions.parse.assert_called_once_with(
-        model=comparison_service.,
+        model=comparison_service.model,
         messages=comparison_service._create_comparison_prompt(
             my_project, existing_project
         ),
@@ -94,12 +136,50 @@ def test_compare_error_handling(comparison_service, mock_openai_client):
     my_project = "My project description"
     existing_project = "Existing project description"
 
-    mock_openai_client.chat.completions.create.side_effect = Exception("API Error")
+    mock_openai_client.beta.chat.completions.parse.side_effect = Exception(
+        "API Error"
+    )
 
     with pytest.raises(Exception, match="API Error"):
         comparison_service.compare(my_project, existing_project)
 
 
+def test_acompare(comparison_service, mock_async_openai_client):
+    my_project = "My project description"
+    existing_project = "Existing project description"
+
+    mock_comparison = Comparison(
+        summary="Test summary",
+        similarity="Test similarity",
+        difference="Test difference",
+        score=0.75,
+        confidence=0.9,
+        reason="Test reason",
+    )
+
+    mock_response = Mock()
+    mock_response.choices = [Mock(message=Mock(parsed=mock_comparison))]
+    mock_async_openai_client.beta.chat.completions.parse = AsyncMock(
+        return_value=mock_response
+    )
+
+    result = asyncio.run(comparison_service.acompare(my_project, existing_project))
+
+    assert result == mock_comparison
+    mock_async_openai_client.beta.chat.completions.parse.assert_awaited_once_with(
+        model=comparison_service.model,
+        messages=comparison_service._create_comparison_prompt(
+            my_project, existing_project
+        ),
+        response_format=Comparison,
+    )
+
+
+def test_acompare_with_empty_input(comparison_service):
+    with pytest.raises(ValueError, match="My project description cannot be empty"):
+        asyncio.run(comparison_service.acompare("", "Existing project"))
+
+
 def test_compare_with_empty_input(comparison_service):
     with pytest.raises(ValueError, match="My project description cannot be empty"):
         comparison_service.compare("", "Existing project")
@@ -110,17 +190,474 @@ def test_compare_with_empty_input(comparison_service):
         comparison_service.compare("My project", "")
 
 
-def test_compare_with_long_input(comparison_service):
-    long_project = "a" * (MAX_PROJECT_LENGTH + 1)
-
-    with pytest.raises(
-        ValueError,
-        match=f"My project description exceeds maximum length of {MAX_PROJECT_LENGTH} characters",
+@pytest.fixture
+def character_based_tokens():
+    # Count 3 characters per token, as without a downloadable tiktoken encoding
+    with patch(
+        "horizon_scope.infrastructure.services.token_counter.get_encoding",
+        return_value=None,
     ):
-        comparison_service.compare(long_project, "Existing project")
+        yield
 
-    with pytest.raises(
-        ValueError,
-        match=f"Existing project description exceeds maximum length of {MAX_PROJECT_LENGTH} characters",
-    ):
-        comparison_service.compare("My project", long_project)
+
+def sentences(n):
+    return " ".join(f"Sentence {i:03d} of the objective." for i in range(n))
+
+
+def test_compare_with_long_input(
+    comparison_service, mock_openai_client, character_based_tokens
+):
+    # Arrange
+    assert comparison_service.max_input_tokens == DEFAULT_MAX_INPUT_TOKENS
+    comparison_service.max_input_tokens = 300
+    long_project = sentences(200)
+    mock_openai_client.beta.chat.completions.parse.return_value = Mock(
+        choices=[Mock(message=Mock(parsed=make_comparison(0.5)))]
+    )
+
+    # Act
+    comparison_service.compare("My project.", long_project)
+
+    # Assert
+    messages = mock_openai_client.beta.chat.completions.parse.call_args.kwargs[
+        "messages"
+    ]
+    existing = messages[1]["content"].split("**Existing EU Horizon Project**: ")[1]
+    assert len(existing) <= (300 - 4) * 3
+    assert existing.endswith("of the objective.")
+    assert long_project.startswith(existing)
+
+
+def test_compare_shares_budget_between_long_inputs(
+    comparison_service, character_based_tokens
+):
+    comparison_service.max_input_tokens = 300
+
+    my_project, existing, summary = comparison_service._prepare_inputs(
+        sentences(100), sentences(100)
+    )
+
+    assert len(my_project) <= 150 * 3
+    assert len(existing) <= 150 * 3
+    assert summary is None
+
+
+def test_compare_many_fits_long_inputs(comparison_service, character_based_tokens):
+    comparison_service.max_input_tokens = 300
+    comparison_service.batch_max_tokens = 400
+
+    my_project, batches = comparison_service._prepare_batches(
+        "My project.", [sentences(100), "Short project.", sentences(100)]
+    )
+
+    assert my_project == "My project."
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[0][1] == ("Short project.", None)
+    for project in (batches[0][0], batches[1][0]):
+        assert len(project.description) <= (300 - 4) * 3
+
+
+def make_comparison(score):
+    return Comparison(
+        summary="Test summary",
+        similarity="Test similarity",
+        difference="Test difference",
+        score=score,
+        confidence=0.9,
+        reason="Test reason",
+    )
+
+
+def batch_response(*indexed_scores):
+    batch = ComparisonBatch(
+        comparisons=[
+            IndexedComparison(index=index, **make_comparison(score).model_dump())
+            for index, score in indexed_scores
+        ]
+    )
+    return Mock(choices=[Mock(message=Mock(parsed=batch))])
+
+
+def test_create_batch_comparison_prompt(comparison_service):
+    prompt = comparison_service._create_batch_comparison_prompt(
+        "My project", ["First project", "Second project"]
+    )
+
+    assert prompt[0] == comparison_service._create_comparison_prompt("a", "b")[0]
+    assert "My project" in prompt[1]["content"]
+    assert "**Existing EU Horizon Project [1]**: First project" in prompt[1]["content"]
+    assert "**Existing EU Horizon Project [2]**: Second project" in prompt[1]["content"]
+
+
+def test_compare_many_batches_projects(comparison_service, mock_openai_client):
+    # Arrange
+    comparison_service.batch_max_items = 2
+    mock_openai_client.beta.chat.completions.parse.side_effect = [
+        batch_response((2, 0.2), (1, 0.1)),
+        Mock(choices=[Mock(message=Mock(parsed=make_comparison(0.3)))]),
+    ]
+
+    # Act
+    results = comparison_service.compare_many(
+        "My project", ["Project 1", "Project 2", "Project 3"]
+    )
+
+    # Assert
+    assert [result.score for result in results] == [0.1, 0.2, 0.3]
+    assert all(type(result) is Comparison for result in results)
+    calls = mock_openai_client.beta.chat.completions.parse.call_args_list
+    assert len(calls) == 2
+    assert calls[0].kwargs["response_format"] is ComparisonBatch
+    assert calls[0].kwargs["messages"] == (
+        comparison_service._create_batch_comparison_prompt(
+            "My project", ["Project 1", "Project 2"]
+        )
+    )
+    assert calls[1].kwargs["response_format"] is Comparison
+
+
+def test_compare_many_respects_token_budget(comparison_service, mock_openai_client):
+    comparison_service.batch_max_tokens = 10
+    mock_openai_client.beta.chat.completions.parse.return_value = Mock(
+        choices=[Mock(message=Mock(parsed=make_comparison(0.5)))]
+    )
+
+    results = comparison_service.compare_many(
+        "My project", ["word " * 20, "word " * 20]
+    )
+
+    assert len(results) == 2
+    calls = mock_openai_client.beta.chat.completions.parse.call_args_list
+    assert [call.kwargs["response_format"] for call in calls] == [Comparison] * 2
+
+
+def test_compare_many_retries_missing_items(comparison_service, mock_openai_client):
+    # Arrange
+    mock_openai_client.beta.chat.completions.parse.side_effect = [
+        # Index 3 is out of range and index 1 is repeated; project 2 gets no result
+        batch_response((1, 0.1), (1, 0.9), (3, 0.3)),
+        Mock(choices=[Mock(message=Mock(parsed=make_comparison(0.2)))]),
+    ]
+
+    # Act
+    results = comparison_service.compare_many("My project", ["Project 1", "Project 2"])
+
+    # Assert
+    assert [result.score for result in results] == [0.1, 0.2]
+    retry = mock_openai_client.beta.chat.completions.parse.call_args_list[1]
+    assert retry.kwargs["messages"] == comparison_service._create_comparison_prompt(
+        "My project", "Project 2"
+    )
+
+
+def test_compare_many_validates_every_description(
+    comparison_service, mock_openai_client
+):
+    with pytest.raises(ValueError, match="Existing project description cannot be empty"):
+        comparison_service.compare_many("My project", ["Project 1", " "])
+
+    mock_openai_client.beta.chat.completions.parse.assert_not_called()
+
+
+def test_acompare_many(comparison_service, mock_async_openai_client):
+    # Arrange
+    comparison_service.batch_max_items = 2
+    mock_async_openai_client.beta.chat.completions.parse = AsyncMock(
+        side_effect=[
+            batch_response((1, 0.1)),
+            Mock(choices=[Mock(message=Mock(parsed=make_comparison(0.3)))]),
+            Mock(choices=[Mock(message=Mock(parsed=make_comparison(0.2)))]),
+        ]
+    )
+
+    # Act
+    results = asyncio.run(
+        comparison_service.acompare_many(
+            "My project", ["Project 1", "Project 2", "Project 3"]
+        )
+    )
+
+    # Assert
+    assert sorted(result.score for result in results) == [0.1, 0.2, 0.3]
+    assert results[0].score == 0.1
+    assert mock_async_openai_client.beta.chat.completions.parse.await_count == 3
+
+
+def test_prompts_share_a_static_prefix(comparison_service):
+    first = comparison_service._create_comparison_prompt("Mine", "First")
+    second = comparison_service._create_comparison_prompt("Other", "Second")
+    batch = comparison_service._create_batch_comparison_prompt("Mine", ["A", "B"])
+
+    assert first[0] == second[0] == batch[0]
+    assert first[0]["content"] == STATIC_PROMPT
+    assert "Mine" not in first[0]["content"]
+    assert comparison_service.prompt_id == f"horizon-scope-comparison@{PROMPT_VERSION}"
+
+
+def test_compare_records_usage(comparison_service, mock_openai_client):
+    # Arrange
+    usage = SimpleNamespace(
+        prompt_tokens=1200,
+        completion_tokens=300,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=1024),
+    )
+    mock_openai_client.beta.chat.completions.parse.return_value = Mock(
+        choices=[Mock(message=Mock(parsed=make_comparison(0.5)))], usage=usage
+    )
+
+    # Act
+    comparison_service.compare("My project", "Existing project")
+    comparison_service.compare("My project", "Another project")
+
+    # Assert
+    total = comparison_service.usage.total
+    assert total.requests == 2
+    assert total.prompt_tokens == 2400
+    assert total.cached_tokens == 2048
+    assert total.completion_tokens == 600
+
+
+def test_compare_many_records_usage_in_caller_scope(
+    comparison_service, mock_openai_client
+):
+    comparison_service.batch_max_items = 1
+    comparison_service.max_concurrency = 2
+    mock_openai_client.beta.chat.completions.parse.return_value = Mock(
+        choices=[Mock(message=Mock(parsed=make_comparison(0.5)))],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=1),
+    )
+
+    with track_usage() as usage:
+        comparison_service.compare_many("My project", ["A", "B", "C"])
+
+    assert usage.requests == 3
+    assert usage.prompt_tokens == 30
+
+
+def make_analysis(score):
+    return ComparisonAnalysis(
+        **make_comparison(score).model_dump(exclude={"summary"})
+    )
+
+
+@pytest.fixture
+def summary_store():
+    store = SQLiteProjectSummaryStore(":memory:")
+    for name in ("Project 1", "Project 2"):
+        store.set(name, ProjectSummary(summary=f"{name} summary.", keywords=[]))
+    return store
+
+
+def test_compare_uses_stored_summary(
+    comparison_service, mock_openai_client, summary_store
+):
+    # Arrange
+    comparison_service.summaries = summary_store
+    mock_openai_client.beta.chat.completions.parse.return_value = Mock(
+        choices=[Mock(message=Mock(parsed=make_analysis(0.4)))]
+    )
+
+    # Act
+    result = comparison_service.compare("My project", "Project 1")
+
+    # Assert
+    assert result == make_comparison(0.4).model_copy(
+        update={"summary": "Project 1 summary."}
+    )
+    call = mock_openai_client.beta.chat.completions.parse.call_args
+    assert call.kwargs["response_format"] is ComparisonAnalysis
+    assert call.kwargs["messages"][0]["content"] == ANALYSIS_PROMPT
+    assert "**Summary**" not in ANALYSIS_PROMPT
+    assert "1. **Commonalities**" in ANALYSIS_PROMPT
+
+
+def test_acompare_uses_stored_summary(
+    comparison_service, mock_async_openai_client, summary_store
+):
+    comparison_service.summaries = summary_store
+    mock_async_openai_client.beta.chat.completions.parse = AsyncMock(
+        return_value=Mock(choices=[Mock(message=Mock(parsed=make_analysis(0.4)))])
+    )
+
+    result = asyncio.run(comparison_service.acompare("My project", "Project 2"))
+
+    assert result.summary == "Project 2 summary."
+    assert result.score == 0.4
+
+
+def test_compare_without_stored_summary(
+    comparison_service, mock_openai_client, summary_store
+):
+    comparison_service.summaries = summary_store
+    mock_openai_client.beta.chat.completions.parse.return_value = Mock(
+        choices=[Mock(message=Mock(parsed=make_comparison(0.4)))]
+    )
+
+    result = comparison_service.compare("My project", "Project 3")
+
+    assert result == make_comparison(0.4)
+    call = mock_openai_client.beta.chat.completions.parse.call_args
+    assert call.kwargs["response_format"] is Comparison
+    assert call.kwargs["messages"][0]["content"] == STATIC_PROMPT
+
+
+def test_compare_when_summary_store_fails(comparison_service, mock_openai_client):
+    comparison_service.summaries = Mock()
+    comparison_service.summaries.get.side_effect = Exception("database is locked")
+    mock_openai_client.beta.chat.completions.parse.return_value = Mock(
+        choices=[Mock(message=Mock(parsed=make_comparison(0.4)))]
+    )
+
+    assert comparison_service.compare("My project", "Project 1") == make_comparison(
+        0.4
+    )
+
+
+def test_compare_many_uses_stored_summaries(
+    comparison_service, mock_openai_client, summary_store
+):
+    # Arrange
+    comparison_service.summaries = summary_store
+    comparison_service.batch_max_items = 2
+    analyses = ComparisonAnalysisBatch(
+        comparisons=[
+            IndexedComparisonAnalysis(index=index, **make_analysis(score).model_dump())
+            for index, score in ((1, 0.1), (2, 0.2))
+        ]
+    )
+    mock_openai_client.beta.chat.completions.parse.side_effect = [
+        Mock(choices=[Mock(message=Mock(parsed=analyses))]),
+        batch_response((1, 0.3), (2, 0.4)),
+    ]
+
+    # Act
+    results = comparison_service.compare_many(
+        "My project", ["Project 1", "Project 2", "Project 1", "Project 3"]
+    )
+
+    # Assert
+    assert [result.summary for result in results] == [
+        "Project 1 summary.",
+        "Project 2 summary.",
+        "Test summary",
+        "Test summary",
+    ]
+    assert [result.score for result in results] == [0.1, 0.2, 0.3, 0.4]
+    calls = mock_openai_client.beta.chat.completions.parse.call_args_list
+    assert calls[0].kwargs["response_format"] is ComparisonAnalysisBatch
+    assert calls[0].kwargs["messages"][0]["content"] == ANALYSIS_PROMPT
+    # A batch with any project lacking a summary requests full comparisons
+    assert calls[1].kwargs["response_format"] is ComparisonBatch
+
+
+def stream_events(payload):
+    # One content.delta event per 20 characters, as the OpenAI client emits them
+    return [
+        SimpleNamespace(type="content.delta", snapshot=payload[:end])
+        for end in range(20, len(payload) + 20, 20)
+    ] + [SimpleNamespace(type="content.done")]
+
+
+def make_stream(events, completion):
+    stream = MagicMock()
+    stream.__iter__.return_value = iter(events)
+    stream.get_final_completion.return_value = completion
+    manager = MagicMock()
+    manager.__enter__.return_value = stream
+    return manager
+
+
+def test_parse_partial_json():
+    assert parse_partial_json("") == {}
+    assert parse_partial_json('{"summary": "A pro') == {"summary": "A pro"}
+    assert parse_partial_json('{"summary": "A", "score": 0.75') == {
+        "summary": "A",
+        "score": 0.75,
+    }
+
+
+def test_compare_streaming_reports_partial_fields(
+    comparison_service, mock_openai_client
+):
+    # Arrange
+    comparison = make_comparison(0.5)
+    completion = Mock(choices=[Mock(message=Mock(parsed=comparison))])
+    mock_openai_client.beta.chat.completions.stream.return_value = make_stream(
+        stream_events(comparison.model_dump_json()), completion
+    )
+    updates = []
+
+    # Act
+    result = comparison_service.compare_streaming(
+        "My project", "Existing project", updates.append
+    )
+
+    # Assert
+    assert result == comparison
+    assert list(updates[0]) == ["summary"]
+    assert updates[-1] == comparison.model_dump()
+    assert all(earlier != later for earlier, later in zip(updates, updates[1:]))
+    call = mock_openai_client.beta.chat.completions.stream.call_args
+    assert call.kwargs["response_format"] is Comparison
+    assert call.kwargs["stream_options"] == {"include_usage": True}
+
+
+def test_compare_streaming_reports_stored_summary_first(
+    comparison_service, mock_openai_client, summary_store
+):
+    # Arrange
+    comparison_service.summaries = summary_store
+    analysis = make_analysis(0.5)
+    completion = Mock(choices=[Mock(message=Mock(parsed=analysis))])
+    mock_openai_client.beta.chat.completions.stream.return_value = make_stream(
+        stream_events(analysis.model_dump_json()), completion
+    )
+    updates = []
+
+    # Act
+    result = comparison_service.compare_streaming(
+        "My project", "Project 1", updates.append
+    )
+
+    # Assert
+    assert updates[0] == {"summary": "Project 1 summary."}
+    assert result.summary == "Project 1 summary."
+    assert updates[-1] == result.model_dump()
+    call = mock_openai_client.beta.chat.completions.stream.call_args
+    assert call.kwargs["response_format"] is ComparisonAnalysis
+
+
+def test_acompare_streaming_reports_partial_fields(
+    comparison_service, mock_async_openai_client
+):
+    # Arrange
+    comparison = make_comparison(0.5)
+    completion = Mock(choices=[Mock(message=Mock(parsed=comparison))])
+    events = stream_events(comparison.model_dump_json())
+
+    class Stream:
+        def __aiter__(self):
+            return self.events()
+
+        async def events(self):
+            for event in events:
+                yield event
+
+        async def get_final_completion(self):
+            return completion
+
+    manager = MagicMock()
+    manager.__aenter__.return_value = Stream()
+    mock_async_openai_client.beta.chat.completions.stream.return_value = manager
+    updates = []
+
+    # Act
+    result = asyncio.run(
+        comparison_service.acompare_streaming(
+            "My project", "Existing project", updates.append
+        )
+    )
+
+    # Assert
+    assert result == comparison
+    assert updates[-1] == comparison.model_dump()
@@ -0,0 +1,106 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.openai_embedding_service import (
+    OpenAIEmbeddingService,
+)
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    config = Mock(spec=ConfigManager)
+    config.get.side_effect = lambda *args, default=None: {
+        (
+            "horizon-scope",
+            "vector-search-service",
+            "embeddings",
+            "api_key",
+        ): "test_openai_api_key",
+        (
+            "horizon-scope",
+            "vector-search-service",
+            "embeddings",
+            "model",
+        ): "text-embedding-3-small",
+        ("horizon-scope", "vector-search-service", "embeddings", "cache"): {
+            "max_entries": 8,
+            "path": str(tmp_path / "embeddings.sqlite"),
+        },
+    }.get(args, default)
+    return config
+
+
+@pytest.fixture
+def mock_openai_client():
+    client = Mock()
+    client.embeddings.create.return_value.data = [Mock(embedding=[0.1, 0.2, 0.3])]
+    return client
+
+
+@pytest.fixture
+def mock_async_openai_client():
+    client = Mock()
+    response = Mock()
+    response.data = [Mock(embedding=[0.4, 0.5, 0.6])]
+    client.embeddings.create = AsyncMock(return_value=response)
+    return client
+
+
+@pytest.fixture
+def embedding_service(mock_config, mock_openai_client, mock_async_openai_client):
+    with patch(
+        "horizon_scope.infrastructure.services.openai_embedding_service.OpenAI",
+        return_value=mock_openai_client,
+    ), patch(
+        "horizon_scope.infrastructure.services.openai_embedding_service.AsyncOpenAI",
+        return_value=mock_async_openai_client,
+    ):
+        return OpenAIEmbeddingService(mock_config)
+
+
+def test_initialization(embedding_service, tmp_path):
+    assert embedding_service.model == "text-embedding-3-small"
+    assert embedding_service.cache.max_entries == 8
+    assert embedding_service.cache.path == str(tmp_path / "embeddings.sqlite")
+
+
+def test_embed_uses_cache(embedding_service, mock_openai_client):
+    first = embedding_service.embed("test text")
+    second = embedding_service.embed("test text")
+
+    assert first == second == [0.1, 0.2, 0.3]
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        model="text-embedding-3-small", input="test text"
+    )
+
+
+def test_aembed_uses_cache(embedding_service, mock_async_openai_client):
+    first = asyncio.run(embedding_service.aembed("test text"))
+    second = asyncio.run(embedding_service.aembed("test text"))
+
+    assert first == second == [0.4, 0.5, 0.6]
+    mock_async_openai_client.embeddings.create.assert_awaited_once_with(
+        model="text-embedding-3-small", input="test text"
+    )
+
+
+def test_embed_many_returns_embeddings_in_input_order(
+    embedding_service, mock_openai_client
+):
+    mock_openai_client.embeddings.create.return_value.data = [
+        Mock(index=1, embedding=[0.4, 0.5, 0.6]),
+        Mock(index=0, embedding=[0.1, 0.2, 0.3]),
+    ]
+
+    embeddings = embedding_service.embed_many(["first", "second"])
+
+    assert embeddings == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        model="text-embedding-3-small", input=["first", "second"]
+    )
+
+
+def test_embed_many_without_texts(embedding_service, mock_openai_client):
+    assert embedding_service.embed_many([]) == []
+    mock_openai_client.embeddings.create.assert_not_called()
@@ -0,0 +1,95 @@
+import pytest
+from unittest.mock import Mock, patch
+from horizon_scope.domain.entities.project_summary import (
+    IndexedProjectSummary,
+    ProjectSummary,
+    ProjectSummaryBatch,
+)
+from horizon_scope.infrastructure.config.config_manager import ConfigManager
+from horizon_scope.infrastructure.services.openai_summary_service import (
+    SUMMARY_PROMPT,
+    OpenAISummaryService,
+)
+
+
+@pytest.fixture
+def mock_openai_client():
+    return Mock()
+
+
+@pytest.fixture
+def summary_service(mock_openai_client):
+    config = Mock(spec=ConfigManager)
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "comparison-service", "api_key"): "test_openai_api_key",
+        ("horizon-scope", "comparison-service", "model"): "gpt-4",
+        ("horizon-scope", "comparison-service", "summaries"): {
+            "max_items": 2,
+            "max_concurrency": 1,
+        },
+    }.get(args, default)
+    with patch(
+        "horizon_scope.infrastructure.services.openai_summary_service.OpenAI",
+        return_value=mock_openai_client,
+    ):
+        return OpenAISummaryService(config)
+
+
+def summary_response(*indexes):
+    batch = ProjectSummaryBatch(
+        summaries=[
+            IndexedProjectSummary(index=index, summary=f"Summary {index}.", keywords=[])
+            for index in indexes
+        ]
+    )
+    return Mock(choices=[Mock(message=Mock(parsed=batch))])
+
+
+def test_summarize_many_batches_projects(summary_service, mock_openai_client):
+    # Arrange
+    mock_openai_client.beta.chat.completions.parse.side_effect = [
+        summary_response(2, 1),
+        summary_response(1),
+    ]
+
+    # Act
+    summaries = summary_service.summarize_many(["First.", "Second.", "Third."])
+
+    # Assert
+    assert [summary.summary for summary in summaries] == [
+        "Summary 1.",
+        "Summary 2.",
+        "Summary 1.",
+    ]
+    assert all(type(summary) is ProjectSummary for summary in summaries)
+    calls = mock_openai_client.beta.chat.completions.parse.call_args_list
+    assert len(calls) == 2
+    assert calls[0].kwargs["response_format"] is ProjectSummaryBatch
+    assert calls[0].kwargs["messages"] == [
+        {"role": "system", "content": SUMMARY_PROMPT},
+        {
+            "role": "user",
+            "content": "**EU Horizon Project [1]**: First.\n\n"
+            "**EU Horizon Project [2]**: Second.",
+        },
+    ]
+
+
+def test_summarize_many_leaves_missing_summaries_empty(
+    summary_service, mock_openai_client
+):
+    mock_openai_client.beta.chat.completions.parse.side_effect = [
+        summary_response(2, 2, 5),
+        Exception("API Error"),
+    ]
+
+    summaries = summary_service.summarize_many(["First.", "Second.", "Third."])
+
+    assert summaries[0] is None
+    assert summaries[1].summary == "Summary 2."
+    assert summaries[2] is None
+
+
+def test_summarize_many_without_descriptions(summary_service, mock_openai_client):
+    assert summary_service.summarize_many([]) == []
+    mock_openai_client.beta.chat.completions.parse.assert_not_called()
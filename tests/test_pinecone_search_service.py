@@ -1,5 +1,7 @@
+import json
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime
 from horizon_scope.infrastructure.services.pinecone_search_service import (
     PineconeSearchService,
@@ -11,7 +13,7 @@ from horizon_scope.infrastructure.config.config_manager import ConfigManager
 @pytest.fixture
 def mock_config():
     config = Mock(spec=ConfigManager)
-    config.get.side_effect = lambda *args: {
+    config.get.side_effect = lambda *args, default=None: {
         (
             "horizon-scope",
             "vector-search-service",
@@ -31,7 +33,7 @@ def mock_config():
             "embeddings",
             "model",
         ): "text-embedding-ada-002",
-    }[args]
+    }.get(args, default)
     return config
 
 
@@ -46,15 +48,25 @@ def mock_openai_client():
 
 
 @pytest.fixture
-def pinecone_search_service(mock_config, mock_pinecone_index, mock_openai_client):
+def mock_async_openai_client():
+    return Mock()
+
+
+@pytest.fixture
+def pinecone_search_service(
+    mock_config, mock_pinecone_index, mock_openai_client, mock_async_openai_client
+):
     with patch(
         "horizon_scope.infrastructure.services.pinecone_search_service.Pinecone"
     ) as mock_pinecone:
         mock_pinecone.return_value.Index.return_value = mock_pinecone_index
         with patch(
-            "horizon_scope.infrastructure.services.pinecone_search_service.OpenAI"
-        ) as mock_openai:
+            "horizon_scope.infrastructure.services.openai_embedding_service.OpenAI"
+        ) as mock_openai, patch(
+            "horizon_scope.infrastructure.services.openai_embedding_service.AsyncOpenAI"
+        ) as mock_async_openai:
             mock_openai.return_value = mock_openai_client
+            mock_async_openai.return_value = mock_async_openai_client
             return PineconeSearchService(mock_config)
 
 
@@ -110,6 +122,66 @@ def test_search(pinecone_search_service, mock_openai_client, mock_pinecone_index
     )
 
 
+def test_asearch(pinecone_search_service, mock_async_openai_client, mock_pinecone_index):
+    # Arrange
+    query = "test query"
+    k = 1
+    mock_embedding = [0.1, 0.2, 0.3]
+    embedding_response = Mock()
+    embedding_response.data = [Mock(embedding=mock_embedding)]
+    mock_async_openai_client.embeddings.create = AsyncMock(
+        return_value=embedding_response
+    )
+    mock_search_results = Mock()
+    mock_search_results.matches = [
+        Mock(
+            id="1",
+            metadata={
+                "title": "Project 1",
+                "objective": "Description 1",
+                "contentUpdateDate": "2023-01-01T00:00:00",
+            },
+            score=0.9,
+        ),
+    ]
+    mock_pinecone_index.query.return_value = mock_search_results
+
+    # Act
+    results = asyncio.run(pinecone_search_service.asearch(query, k))
+
+    # Assert
+    assert len(results) == 1
+    assert results[0].id == "1"
+    assert results[0].similarity == 0.9
+    mock_async_openai_client.embeddings.create.assert_awaited_once_with(
+        model="text-embedding-ada-002", input=query
+    )
+    mock_pinecone_index.query.assert_called_once_with(
+        vector=mock_embedding, top_k=k, include_metadata=True
+    )
+
+
+def test_search_reuses_cached_query_embedding(
+    pinecone_search_service, mock_openai_client, mock_pinecone_index
+):
+    # Arrange
+    mock_embedding = [0.1, 0.2, 0.3]
+    mock_openai_client.embeddings.create.return_value.data = [
+        Mock(embedding=mock_embedding)
+    ]
+    mock_pinecone_index.query.return_value.matches = []
+
+    # Act
+    pinecone_search_service.search("test query", 2)
+    pinecone_search_service.search("  test\nquery ", 2)
+
+    # Assert
+    mock_openai_client.embeddings.create.assert_called_once()
+    assert mock_pinecone_index.query.call_count == 2
+    assert pinecone_search_service.embedding_service.cache.hits == 1
+    assert pinecone_search_service.embedding_service.cache.misses == 1
+
+
 def test_index_project(
     pinecone_search_service, mock_openai_client, mock_pinecone_index
 ):
@@ -183,11 +255,237 @@ def test_initialization(mock_config):
         "horizon_scope.infrastructure.services.pinecone_search_service.Pinecone"
     ) as mock_pinecone:
         with patch(
-            "horizon_scope.infrastructure.services.pinecone_search_service.OpenAI"
-        ) as mock_openai:
-            PineconeSearchService(mock_config)
+            "horizon_scope.infrastructure.services.openai_embedding_service.OpenAI"
+        ) as mock_openai, patch(
+            "horizon_scope.infrastructure.services.openai_embedding_service.AsyncOpenAI"
+        ) as mock_async_openai:
+            service = PineconeSearchService(mock_config)
 
     # Assert
     mock_pinecone.assert_called_once_with(api_key="test_pinecone_api_key")
     mock_pinecone.return_value.Index.assert_called_once_with("test_index")
-    mock_openai.assert_called_once_with(api_key="test_openai_api_key")
+    transport = service.embedding_service.transport
+    mock_openai.assert_called_once_with(
+        api_key="test_openai_api_key",
+        base_url=None,
+        max_retries=0,
+        timeout=transport.timeout,
+        http_client=transport.http_client(),
+    )
+    mock_async_openai.assert_called_once_with(
+        api_key="test_openai_api_key",
+        base_url=None,
+        max_retries=0,
+        timeout=transport.timeout,
+        http_client=transport.async_http_client(),
+    )
+
+
+def test_index_projects(pinecone_search_service, mock_openai_client, mock_pinecone_index):
+    # Arrange
+    projects = [
+        Project(
+            id=f"id_{i}",
+            title=f"Project {i}",
+            description=f"Description {i}",
+            content_update_date="2023-01-01T00:00:00",
+        )
+        for i in range(3)
+    ]
+    mock_openai_client.embeddings.create.return_value.data = [
+        Mock(index=i, embedding=[float(i)]) for i in range(3)
+    ]
+
+    # Act
+    report = pinecone_search_service.index_projects(iter(projects), batch_size=2)
+
+    # Assert
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        model="text-embedding-ada-002",
+        input=["Description 0", "Description 1", "Description 2"],
+    )
+    assert mock_pinecone_index.upsert.call_count == 2
+    upserted = [
+        vector
+        for call in mock_pinecone_index.upsert.call_args_list
+        for vector in call.kwargs["vectors"]
+    ]
+    assert [vector["id"] for vector in upserted] == ["id_0", "id_1", "id_2"]
+    assert upserted[2] == {
+        "id": "id_2",
+        "values": [2.0],
+        "metadata": {
+            "title": "Project 2",
+            "objective": "Description 2",
+            "contentUpdateDate": "2023-01-01T00:00:00",
+        },
+    }
+    assert report.indexed == 3
+    assert report.batches == 1
+    assert report.failed_ids == []
+
+
+def test_index_projects_reports_failed_batches(
+    pinecone_search_service, mock_openai_client, mock_pinecone_index
+):
+    # Arrange
+    projects = [Project(id="id_0", description="Description 0")]
+    mock_openai_client.embeddings.create.return_value.data = [
+        Mock(index=0, embedding=[0.1])
+    ]
+    mock_pinecone_index.upsert.side_effect = Exception("Pinecone unavailable")
+
+    # Act
+    report = pinecone_search_service.index_projects(projects)
+
+    # Assert
+    mock_pinecone_index.upsert.assert_called_once()
+    assert report.indexed == 0
+    assert report.failed_ids == ["id_0"]
+
+
+def test_delete_removes_all_chunks(pinecone_search_service, mock_pinecone_index):
+    # Arrange
+    pinecone_search_service.chunker.max_chunks = 3
+    project_ids = [f"id_{i}" for i in range(400)]
+
+    # Act
+    pinecone_search_service.delete(project_ids)
+
+    # Assert
+    deleted = [
+        vector_id
+        for delete_call in mock_pinecone_index.delete.call_args_list
+        for vector_id in delete_call.kwargs["ids"]
+    ]
+    assert mock_pinecone_index.delete.call_count == 2
+    assert deleted[:3] == ["id_0", "id_0#1", "id_0#2"]
+    assert len(deleted) == 1200
+
+
+def test_search_pools_chunk_hits(
+    pinecone_search_service, mock_openai_client, mock_pinecone_index
+):
+    # Arrange
+    mock_openai_client.embeddings.create.return_value.data = [
+        Mock(embedding=[0.1, 0.2, 0.3])
+    ]
+
+    def make_match(vector_id, score):
+        project_id = vector_id.split("#")[0]
+        return Mock(
+            id=vector_id,
+            score=score,
+            metadata={"title": f"Project {project_id}", "objective": "Description"},
+        )
+
+    first_page = Mock(matches=[make_match("1#2", 0.9), make_match("1", 0.8)])
+    second_page = Mock(
+        matches=[
+            make_match("1#2", 0.9),
+            make_match("1", 0.8),
+            make_match("2", 0.7),
+            make_match("1#1", 0.6),
+        ]
+    )
+    mock_pinecone_index.query.side_effect = [first_page, second_page]
+    mock_pinecone_index.fetch.return_value = Mock(
+        vectors={
+            "1": Mock(metadata={"title": "Project 1", "objective": "Full description"})
+        }
+    )
+
+    # Act
+    results = pinecone_search_service.search("test query", 2)
+
+    # Assert
+    assert [project.id for project in results] == ["1", "2"]
+    assert results[0].similarity == 0.9
+    assert results[0].title == "Project 1"
+    # The best hit of project 1 is a later chunk, so its first chunk is fetched
+    mock_pinecone_index.fetch.assert_called_once_with(ids=["1"])
+    assert results[0].description == "Full description"
+    assert results[1].description == "Description"
+    assert [
+        query_call.kwargs["top_k"]
+        for query_call in mock_pinecone_index.query.call_args_list
+    ] == [2, 4]
+
+
+def test_index_project_with_long_description(
+    pinecone_search_service, mock_openai_client, mock_pinecone_index
+):
+    # Arrange
+    pinecone_search_service.chunker.split = Mock(return_value=["part 1", "part 2"])
+    mock_openai_client.embeddings.create.return_value.data = [
+        Mock(index=0, embedding=[0.1]),
+        Mock(index=1, embedding=[0.2]),
+    ]
+    project = Project(
+        id="test_id",
+        description="Long description",
+        content_update_date="2023-01-01T00:00:00",
+    )
+
+    # Act
+    pinecone_search_service.index_project(project)
+
+    # Assert
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        model="text-embedding-ada-002", input=["part 1", "part 2"]
+    )
+    vectors = mock_pinecone_index.upsert.call_args.kwargs["vectors"]
+    assert [vector["id"] for vector in vectors] == ["test_id", "test_id#1"]
+    assert [vector["values"] for vector in vectors] == [[0.1], [0.2]]
+    assert vectors[0]["metadata"]["objective"] == "Long description"
+    assert "objective" not in vectors[1]["metadata"]
+
+
+def test_chunked_project_metadata_fits_pinecone_limit(
+    pinecone_search_service, mock_openai_client, mock_pinecone_index
+):
+    # Arrange: a description of about 120 KB, split into four chunks
+    pinecone_search_service.chunker.split = Mock(return_value=["part"] * 4)
+    mock_openai_client.embeddings.create.return_value.data = [
+        Mock(index=index, embedding=[0.1]) for index in range(4)
+    ]
+    project = Project(
+        id="test_id",
+        title="Long project",
+        description="Überlange Beschreibung. " * 5000,
+        content_update_date="2023-01-01T00:00:00",
+    )
+
+    # Act
+    pinecone_search_service.index_project(project)
+
+    # Assert
+    vectors = mock_pinecone_index.upsert.call_args.kwargs["vectors"]
+    assert len(vectors) == 4
+    for vector in vectors:
+        metadata = json.dumps(vector["metadata"], ensure_ascii=False)
+        assert len(metadata.encode("utf-8")) < 40 * 1024
+    assert project.description.startswith(vectors[0]["metadata"]["objective"])
+
+
+def test_index_project_with_fewer_chunks_deletes_leftover_chunks(
+    pinecone_search_service, mock_openai_client, mock_pinecone_index
+):
+    # Arrange: the previous version of the project had three chunks
+    pinecone_search_service.chunker.max_chunks = 4
+    pinecone_search_service.chunker.split = Mock(return_value=["part 1", "part 2"])
+    mock_openai_client.embeddings.create.return_value.data = [
+        Mock(index=0, embedding=[0.1]),
+        Mock(index=1, embedding=[0.2]),
+    ]
+    project = Project(id="test_id", description="Shorter description")
+
+    # Act
+    pinecone_search_service.index_project(project)
+
+    # Assert
+    mock_pinecone_index.delete.assert_called_once_with(
+        ids=["test_id#2", "test_id#3"]
+    )
+    vectors = mock_pinecone_index.upsert.call_args.kwargs["vectors"]
+    assert [vector["id"] for vector in vectors] == ["test_id", "test_id#1"]
@@ -0,0 +1,57 @@
+from unittest.mock import Mock
+from horizon_scope.application.interfaces.summary_service import SummaryService
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.domain.entities.project_summary import ProjectSummary
+from horizon_scope.infrastructure.cache.sqlite_project_summary_store import (
+    SQLiteProjectSummaryStore,
+)
+from horizon_scope.ingest.summaries import SummaryRun, summarize_projects
+
+
+def make_projects(n):
+    return [Project(id=str(i), description=f"Objective {i}.") for i in range(n)]
+
+
+def summarize(descriptions):
+    return [
+        None if "3" in description else ProjectSummary(summary=description, keywords=[])
+        for description in descriptions
+    ]
+
+
+def test_summarize_projects_skips_stored_summaries():
+    # Arrange
+    store = SQLiteProjectSummaryStore(":memory:")
+    store.set("Objective 0.", ProjectSummary(summary="Stored.", keywords=[]))
+    service = Mock(spec=SummaryService)
+    service.summarize_many.side_effect = summarize
+    progress = Mock()
+
+    # Act
+    run = summarize_projects(
+        make_projects(5), service, store, chunk_size=2, progress=progress
+    )
+
+    # Assert
+    assert run == SummaryRun(summarized=3, existing=1, failed=1)
+    assert [call.args[0] for call in service.summarize_many.call_args_list] == [
+        ["Objective 1."],
+        ["Objective 2.", "Objective 3."],
+        ["Objective 4."],
+    ]
+    assert progress.call_count == 3
+    assert store.get("Objective 0.").summary == "Stored."
+    assert store.get("Objective 2.").summary == "Objective 2."
+    assert store.get("Objective 3.") is None
+
+
+def test_summarize_projects_resumes():
+    store = SQLiteProjectSummaryStore(":memory:")
+    service = Mock(spec=SummaryService)
+    service.summarize_many.side_effect = summarize
+    summarize_projects(make_projects(3), service, store)
+
+    run = summarize_projects(make_projects(3), service, store)
+
+    assert run == SummaryRun(summarized=0, existing=3, failed=0)
+    service.summarize_many.assert_called_once()
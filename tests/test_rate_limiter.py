@@ -0,0 +1,211 @@
+import asyncio
+import json
+import httpx
+import openai
+import pytest
+from unittest.mock import AsyncMock, Mock
+from horizon_scope.infrastructure.services.rate_limiter import (
+    CircuitOpenError,
+    RateLimiter,
+    TokenBucket,
+    parse_duration,
+)
+
+REQUEST = httpx.Request("POST", "http://fake.local/v1/embeddings")
+
+
+def rate_limit_error(code=None, **headers):
+    response = httpx.Response(429, headers=headers, request=REQUEST)
+    return openai.RateLimitError(
+        "Rate limit reached", response=response, body={"code": code}
+    )
+
+
+def server_error():
+    response = httpx.Response(503, request=REQUEST)
+    return openai.InternalServerError("Unavailable", response=response, body=None)
+
+
+@pytest.fixture
+def limiter():
+    return RateLimiter(base_delay=0.001, max_delay=0.01, failure_threshold=3)
+
+
+def test_parse_duration():
+    assert parse_duration("6m0s") == 360.0
+    assert parse_duration("1.5s") == 1.5
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("2") == 2.0
+    assert parse_duration("soon") is None
+    assert parse_duration(None) is None
+
+
+def test_token_bucket_queues_reservations_beyond_capacity():
+    bucket = TokenBucket(capacity=60)
+
+    assert bucket.reserve(60) == 0
+    # The next 30 units are refilled at one unit per second
+    assert bucket.reserve(30) == pytest.approx(30, abs=0.1)
+
+
+def test_token_bucket_without_limit_does_not_wait():
+    bucket = TokenBucket()
+
+    assert bucket.reserve(1_000_000) == 0
+
+
+def test_token_bucket_follows_reported_quota():
+    bucket = TokenBucket()
+
+    bucket.update(limit=600, remaining=0, reset=2.0)
+
+    assert bucket.capacity == 600
+    assert bucket.reserve(1) == pytest.approx(2.0, abs=0.1)
+
+
+def test_backoff_stays_within_max_delay():
+    limiter = RateLimiter(base_delay=1.0, max_delay=10.0)
+
+    delays = [limiter._backoff(attempt) for attempt in range(10) for _ in range(20)]
+
+    assert max(delays) <= 10.0
+    assert min(delays) >= 0.5
+
+
+def test_call_retries_rate_limits_and_pauses_the_key(limiter):
+    # Arrange
+    function = Mock(
+        side_effect=[rate_limit_error(**{"retry-after-ms": "5"}), "result"]
+    )
+
+    # Act
+    result = limiter.call("openai:gpt-4o-mini", function, "input", tokens=10)
+
+    # Assert
+    assert result == "result"
+    assert function.call_count == 2
+    function.assert_called_with("input")
+    assert limiter.limit("openai:gpt-4o-mini").requests.paused_until > 0
+
+
+def test_call_does_not_retry_other_errors(limiter):
+    function = Mock(side_effect=ValueError("Bad request"))
+
+    with pytest.raises(ValueError, match="Bad request"):
+        limiter.call("openai:gpt-4o-mini", function)
+
+    function.assert_called_once()
+
+
+def test_call_does_not_retry_exhausted_quota(limiter):
+    function = Mock(side_effect=rate_limit_error(code="insufficient_quota"))
+
+    with pytest.raises(openai.RateLimitError):
+        limiter.call("openai:gpt-4o-mini", function)
+
+    function.assert_called_once()
+
+
+def test_circuit_opens_after_consecutive_failures(limiter):
+    # Arrange
+    function = Mock(side_effect=server_error())
+
+    # Act
+    with pytest.raises(openai.InternalServerError):
+        limiter.call("pinecone:projects", function)
+    with pytest.raises(CircuitOpenError):
+        limiter.call("pinecone:projects", function)
+
+    # Assert
+    assert function.call_count == 3
+    assert limiter.limit("pinecone:other").breaker.is_open is False
+
+
+def test_success_closes_circuit(limiter):
+    function = Mock(side_effect=[server_error(), server_error(), "result"])
+
+    assert limiter.call("pinecone:projects", function) == "result"
+    assert limiter.limit("pinecone:projects").breaker.failures == 0
+
+
+def test_acall_retries_transient_errors(limiter):
+    function = AsyncMock(side_effect=[httpx.ConnectError("Refused"), "result"])
+
+    result = asyncio.run(limiter.acall("openai:gpt-4o-mini", function, tokens=10))
+
+    assert result == "result"
+    assert function.await_count == 2
+
+
+def test_from_config_sets_initial_limits():
+    config = Mock()
+    config.get.side_effect = lambda *args, default=None: {
+        ("horizon-scope", "rate-limits"): {
+            "max_retries": 2,
+            "limits": {"openai": {"gpt-4o-mini": {"requests_per_minute": 500}}},
+        }
+    }.get(args, default)
+
+    limiter = RateLimiter.from_config(config)
+
+    assert limiter.max_retries == 2
+    assert limiter.limit("openai:gpt-4o-mini").requests.capacity == 500
+    assert limiter.limit("openai:gpt-4o-mini").tokens.capacity is None
+
+
+def test_openai_client_against_fake_server(limiter):
+    # Arrange: a local fake of the embeddings endpoint that rate-limits the first request
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        if len(requests) == 1:
+            return httpx.Response(
+                429,
+                json={"error": {"message": "Rate limit reached", "code": None}},
+                headers={"retry-after-ms": "5"},
+            )
+        return httpx.Response(
+            200,
+            json={
+                "object": "list",
+                "data": [{"object": "embedding", "index": 0, "embedding": [0.1]}],
+                "model": "text-embedding-3-small",
+                "usage": {"prompt_tokens": 2, "total_tokens": 2},
+            },
+            headers={
+                "x-ratelimit-limit-requests": "3000",
+                "x-ratelimit-remaining-requests": "2999",
+                "x-ratelimit-reset-requests": "20ms",
+                "x-ratelimit-limit-tokens": "1000000",
+                "x-ratelimit-remaining-tokens": "999998",
+                "x-ratelimit-reset-tokens": "0s",
+            },
+        )
+
+    client = openai.OpenAI(
+        api_key="test",
+        base_url="http://fake.local/v1",
+        max_retries=0,
+        http_client=openai.DefaultHttpxClient(
+            transport=httpx.MockTransport(handler),
+            event_hooks=limiter.event_hooks("openai"),
+        ),
+    )
+
+    # Act
+    response = limiter.call(
+        "openai:text-embedding-3-small",
+        client.embeddings.create,
+        model="text-embedding-3-small",
+        input="query",
+        tokens=2,
+    )
+
+    # Assert
+    assert response.data[0].embedding == [0.1]
+    assert len(requests) == 2
+    limit = limiter.limit("openai:text-embedding-3-small")
+    assert limit.requests.capacity == 3000
+    assert limit.tokens.capacity == 1_000_000
+    assert limit.tokens.level <= 999_998
@@ -0,0 +1,103 @@
+import sys
+import numpy as np
+import pytest
+from unittest.mock import Mock, patch
+from horizon_scope.application.interfaces.embedding_service import EmbeddingService
+from horizon_scope.domain.entities.project import Project
+from horizon_scope.infrastructure.services.cross_encoder_reranker import (
+    CrossEncoderReranker,
+)
+from horizon_scope.infrastructure.services.embedding_reranker import (
+    EmbeddingReranker,
+)
+
+
+@pytest.fixture
+def projects():
+    return [
+        Project(id=str(i), description=f"Description {i}") for i in range(3)
+    ]
+
+
+def test_cross_encoder_reranker_sorts_by_model_score(projects):
+    # Arrange
+    cross_encoder = Mock()
+    cross_encoder.return_value.predict.return_value = np.asarray([0.1, 2.5, -1.0])
+    sentence_transformers = Mock(CrossEncoder=cross_encoder)
+
+    # Act
+    with patch.dict(sys.modules, {"sentence_transformers": sentence_transformers}):
+        reranker = CrossEncoderReranker("test-model", batch_size=8)
+        ranked = reranker.rerank("query", projects)
+
+    # Assert
+    cross_encoder.assert_called_once_with("test-model", max_length=512)
+    pairs = cross_encoder.return_value.predict.call_args.args[0]
+    assert pairs == [("query", f"Description {i}") for i in range(3)]
+    assert cross_encoder.return_value.predict.call_args.kwargs["batch_size"] == 8
+    assert [(project.id, score) for project, score in ranked] == [
+        ("1", 2.5),
+        ("0", pytest.approx(0.1)),
+        ("2", -1.0),
+    ]
+
+
+def test_cross_encoder_reranker_loads_model_once(projects):
+    cross_encoder = Mock()
+    cross_encoder.return_value.predict.return_value = np.zeros(3)
+
+    with patch.dict(
+        sys.modules, {"sentence_transformers": Mock(CrossEncoder=cross_encoder)}
+    ):
+        reranker = CrossEncoderReranker()
+        reranker.rerank("query", projects)
+        reranker.rerank("other query", projects)
+
+    cross_encoder.assert_called_once()
+
+
+def test_cross_encoder_reranker_requires_sentence_transformers(projects):
+    with patch.dict(sys.modules, {"sentence_transformers": None}):
+        with pytest.raises(ImportError, match="sentence-transformers"):
+            CrossEncoderReranker().rerank("query", projects)
+
+
+def test_cross_encoder_reranker_skips_model_without_candidates():
+    assert CrossEncoderReranker().rerank("query", []) == []
+
+
+def test_embedding_reranker_sorts_by_cosine_similarity(projects):
+    # Arrange
+    embedding_service = Mock(spec=EmbeddingService)
+    embedding_service.embed_many.return_value = [
+        [1.0, 0.0],
+        [3.0, 3.0],
+        [0.0, 2.0],
+    ]
+    embedding_service.embed.return_value = [0.0, 1.0]
+    reranker = EmbeddingReranker(embedding_service)
+
+    # Act
+    ranked = reranker.rerank("query", projects)
+
+    # Assert
+    embedding_service.embed_many.assert_called_once_with(
+        [f"Description {i}" for i in range(3)]
+    )
+    embedding_service.embed.assert_called_once_with("query")
+    assert [project.id for project, _ in ranked] == ["2", "1", "0"]
+    assert [score for _, score in ranked] == pytest.approx(
+        [1.0, np.sqrt(0.5), 0.0]
+    )
+
+
+def test_embedding_reranker_truncates_long_descriptions():
+    embedding_service = Mock(spec=EmbeddingService)
+    embedding_service.embed_many.return_value = [[1.0, 0.0]]
+    embedding_service.embed.return_value = [1.0, 0.0]
+    reranker = EmbeddingReranker(embedding_service, max_tokens=10)
+
+    reranker.rerank("query", [Project(id="1", description="word " * 1000)])
+
+    (text,) = embedding_service.embed_many.call_args.args[0]
+    assert len(text) < len("word " * 1000)
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from horizon_scope.domain.entities.score_calibration import ScoreCalibration
+from horizon_scope.infrastructure.services.score_calibration import (
+    fit_score_calibration,
+    isotonic,
+)
+
+
+@pytest.fixture
+def calibration():
+    return ScoreCalibration(
+        similarities=[0.2, 0.4, 0.6],
+        scores=[0.0, 0.2, 0.8],
+        confidences=[0.5, 0.7, 0.9],
+        n_samples=30,
+    )
+
+
+def test_estimate_interpolates_between_knots(calibration):
+    score, confidence = calibration.estimate(0.5)
+
+    assert score == pytest.approx(0.5)
+    assert confidence == pytest.approx(0.8)
+
+
+def test_estimate_is_constant_beyond_the_knots(calibration):
+    assert calibration.estimate(0.1) == (0.0, 0.5)
+    assert calibration.estimate(0.9) == (0.8, 0.9)
+    assert calibration.estimate(0.4) == (pytest.approx(0.2), pytest.approx(0.7))
+
+
+def test_isotonic_pools_violators():
+    fitted = isotonic(np.asarray([1.0, 3.0, 2.0, 4.0]), np.ones(4))
+
+    assert fitted.tolist() == [1.0, 2.5, 2.5, 4.0]
+
+
+def test_fit_score_calibration_is_monotone():
+    rng = np.random.default_rng(0)
+    similarities = rng.uniform(0.1, 0.7, 500)
+    scores = np.clip(2 * (similarities - 0.3) + rng.normal(0, 0.1, 500), 0, 1)
+    samples = [(s, score, 0.8) for s, score in zip(similarities, scores)]
+
+    calibration = fit_score_calibration(samples, n_bins=10)
+
+    assert calibration.n_samples == 500
+    assert len(calibration.similarities) == 10
+    assert calibration.similarities == sorted(calibration.similarities)
+    assert np.all(np.diff(calibration.scores) >= 0)
+    assert calibration.estimate(0.15)[0] < 0.05
+    assert calibration.estimate(0.65)[0] == pytest.approx(0.7, abs=0.1)
+    assert calibration.estimate(0.4)[1] == pytest.approx(0.8)
+
+
+def test_fit_score_calibration_with_few_samples():
+    calibration = fit_score_calibration([(0.5, 0.3, 0.9), (0.2, 0.1, 0.6)], n_bins=20)
+
+    assert calibration.similarities == [0.2, 0.5]
+    assert calibration.scores == [0.1, 0.3]
+
+
+def test_fit_score_calibration_requires_samples():
+    with pytest.raises(ValueError, match="At least one"):
+        fit_score_calibration([])
@@ -0,0 +1,110 @@
+import pytest
+from unittest.mock import patch
+from horizon_scope.domain.entities.comparison import Comparison
+from horizon_scope.infrastructure.cache.sqlite_comparison_cache import (
+    SQLiteComparisonCache,
+)
+
+
+def make_comparison(score: float) -> Comparison:
+    return Comparison(
+        summary="Test summary",
+        similarity="Test similarity",
+        difference="Test difference",
+        score=score,
+        confidence=0.9,
+        reason="Test reason",
+    )
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache" / "comparisons.sqlite")
+
+
+def test_get_returns_stored_comparison(cache_path):
+    cache = SQLiteComparisonCache(cache_path)
+    comparison = make_comparison(0.5)
+
+    cache.set("key", comparison)
+
+    assert cache.get("key") == comparison
+    assert cache.hits == 1
+    assert cache.misses == 0
+
+
+def test_get_missing_key_counts_miss(cache_path):
+    cache = SQLiteComparisonCache(cache_path)
+
+    assert cache.get("missing") is None
+    assert cache.misses == 1
+
+
+def test_entries_survive_reopening(cache_path):
+    cache = SQLiteComparisonCache(cache_path)
+    cache.set("key", make_comparison(0.5))
+    cache.close()
+
+    reopened = SQLiteComparisonCache(cache_path)
+
+    assert reopened.get("key").score == 0.5
+
+
+def test_expired_entries_are_misses(cache_path):
+    cache = SQLiteComparisonCache(cache_path, ttl_seconds=60)
+    with patch(
+        "horizon_scope.infrastructure.cache.sqlite_comparison_cache.time.time",
+        return_value=1000.0,
+    ):
+        cache.set("key", make_comparison(0.5))
+    with patch(
+        "horizon_scope.infrastructure.cache.sqlite_comparison_cache.time.time",
+        return_value=1061.0,
+    ):
+        assert cache.get("key") is None
+
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(cache_path):
+    cache = SQLiteComparisonCache(cache_path, max_entries=2)
+    cache.set("a", make_comparison(0.1))
+    cache.set("b", make_comparison(0.2))
+    cache.get("a")
+
+    cache.set("c", make_comparison(0.3))
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a").score == 0.1
+    assert cache.get("c").score == 0.3
+
+
+def test_set_tracks_entries_without_counting_the_table(cache_path):
+    # Arrange: a reopened cache that is already full
+    cache = SQLiteComparisonCache(cache_path, max_entries=2)
+    cache.set("a", make_comparison(0.1))
+    cache.set("b", make_comparison(0.2))
+    cache.close()
+    reopened = SQLiteComparisonCache(cache_path, max_entries=2)
+    statements = []
+    reopened._connection.set_trace_callback(statements.append)
+
+    # Act
+    reopened.set("b", make_comparison(0.25))
+    reopened.set("c", make_comparison(0.3))
+
+    # Assert
+    assert not any("COUNT(*)" in statement for statement in statements)
+    assert len(reopened) == 2
+    assert reopened.get("a") is None
+    assert reopened.get("b").score == 0.25
+
+
+def test_clear(cache_path):
+    cache = SQLiteComparisonCache(cache_path)
+    cache.set("key", make_comparison(0.5))
+
+    cache.clear()
+
+    assert len(cache) == 0
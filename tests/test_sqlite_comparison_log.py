@@ -0,0 +1,96 @@
+import os
+import sqlite3
+import pytest
+from horizon_scope.domain.entities.comparison import Comparison
+from horizon_scope.infrastructure.cache.sqlite_comparison_log import (
+    SQLiteComparisonLog,
+)
+
+
+def make_comparison(score: float, confidence: float = 0.9) -> Comparison:
+    return Comparison(
+        summary="Test summary",
+        similarity="Test similarity",
+        difference="Test difference",
+        score=score,
+        confidence=confidence,
+        reason="Test reason",
+    )
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "log" / "comparison_log.sqlite")
+
+
+def test_record_and_samples(log_path):
+    log = SQLiteComparisonLog(log_path)
+
+    log.record(0.3, make_comparison(0.1, 0.6))
+    log.record(0.6, make_comparison(0.7))
+
+    assert log.samples() == [(0.6, 0.7, 0.9), (0.3, 0.1, 0.6)]
+    assert log.samples(limit=1) == [(0.6, 0.7, 0.9)]
+    assert len(log) == 2
+
+
+def test_samples_persist_across_instances(log_path):
+    log = SQLiteComparisonLog(log_path)
+    log.record(0.5, make_comparison(0.4))
+    log.close()
+
+    assert SQLiteComparisonLog(log_path).samples() == [(0.5, 0.4, 0.9)]
+
+
+def test_max_entries_drops_oldest_samples(log_path):
+    log = SQLiteComparisonLog(log_path, max_entries=2)
+
+    for similarity in (0.1, 0.2, 0.3):
+        log.record(similarity, make_comparison(0.5))
+
+    assert [sample[0] for sample in log.samples()] == [0.3, 0.2]
+
+
+def test_record_ignores_recorded_keys(log_path):
+    log = SQLiteComparisonLog(log_path)
+
+    log.record(0.5, make_comparison(0.4), key="query-1")
+    log.record(0.5, make_comparison(0.4), key="query-1")
+    log.record(0.5, make_comparison(0.4), key="query-2")
+
+    assert len(log) == 2
+
+
+def test_record_tracks_samples_without_counting_the_table(log_path):
+    # Arrange
+    log = SQLiteComparisonLog(log_path, max_entries=2)
+    statements = []
+    log._connection.set_trace_callback(statements.append)
+
+    # Act
+    for similarity in (0.1, 0.2, 0.3, 0.4):
+        log.record(similarity, make_comparison(0.5), key=str(similarity))
+
+    # Assert
+    assert not any("COUNT(*)" in statement for statement in statements)
+    assert [sample[0] for sample in log.samples()] == [0.4, 0.3]
+
+
+def test_log_without_keys_is_migrated(log_path):
+    # Arrange: a log written before samples had keys
+    os.makedirs(os.path.dirname(log_path))
+    connection = sqlite3.connect(log_path)
+    connection.execute(
+        "CREATE TABLE comparison_log (similarity REAL NOT NULL, score REAL NOT NULL, "
+        "confidence REAL NOT NULL, created_at REAL NOT NULL)"
+    )
+    connection.execute("INSERT INTO comparison_log VALUES (0.2, 0.1, 0.9, 0)")
+    connection.commit()
+    connection.close()
+
+    # Act
+    log = SQLiteComparisonLog(log_path)
+    log.record(0.5, make_comparison(0.4), key="query")
+
+    # Assert
+    assert log.samples() == [(0.5, 0.4, 0.9), (0.2, 0.1, 0.9)]
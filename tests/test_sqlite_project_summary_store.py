@@ -0,0 +1,58 @@
+import pytest
+from horizon_scope.domain.entities.project_summary import ProjectSummary
+from horizon_scope.infrastructure.cache.sqlite_project_summary_store import (
+    SQLiteProjectSummaryStore,
+    summary_key,
+)
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "cache" / "summaries.sqlite")
+
+
+def make_summary(text="A project on solar cells."):
+    return ProjectSummary(summary=text, keywords=["photovoltaics", "perovskite"])
+
+
+def test_get_returns_stored_summary(store_path):
+    store = SQLiteProjectSummaryStore(store_path)
+    summary = make_summary()
+
+    store.set("Objective of the project.", summary, project_id="101")
+
+    assert store.get("Objective of the project.") == summary
+    assert len(store) == 1
+
+
+def test_get_missing_description(store_path):
+    store = SQLiteProjectSummaryStore(store_path)
+
+    assert store.get("Unknown objective.") is None
+
+
+def test_lookup_ignores_whitespace(store_path):
+    store = SQLiteProjectSummaryStore(store_path)
+    store.set("Objective of\nthe  project.", make_summary())
+
+    assert store.get(" Objective of the project. ") == make_summary()
+    assert summary_key("a  b") == summary_key("a\nb")
+    assert summary_key("a b") != summary_key("a c")
+
+
+def test_set_replaces_summary(store_path):
+    store = SQLiteProjectSummaryStore(store_path)
+    store.set("Objective.", make_summary("Old."))
+
+    store.set("Objective.", make_summary("New."))
+
+    assert store.get("Objective.").summary == "New."
+    assert len(store) == 1
+
+
+def test_summaries_persist_across_instances(store_path):
+    store = SQLiteProjectSummaryStore(store_path)
+    store.set("Objective.", make_summary())
+    store.close()
+
+    assert SQLiteProjectSummaryStore(store_path).get("Objective.") == make_summary()
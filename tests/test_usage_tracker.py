@@ -0,0 +1,94 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+import pytest
+from horizon_scope.domain.entities.token_usage import TokenUsage
+from horizon_scope.infrastructure.services.usage_tracker import (
+    UsageTracker,
+    track_usage,
+)
+
+PRICES = {"input": 0.15, "cached_input": 0.075, "output": 0.6}
+
+
+def make_usage(prompt_tokens=1000, cached_tokens=600, completion_tokens=200):
+    return SimpleNamespace(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+    )
+
+
+def test_record_counts_tokens_and_cost():
+    tracker = UsageTracker(PRICES)
+
+    usage = tracker.record(make_usage())
+
+    assert usage.requests == 1
+    assert usage.prompt_tokens == 1000
+    assert usage.cached_tokens == 600
+    assert usage.completion_tokens == 200
+    assert usage.cost == pytest.approx((400 * 0.15 + 600 * 0.075 + 200 * 0.6) / 1e6)
+    assert tracker.total == usage
+
+
+def test_record_without_usage_or_prices():
+    tracker = UsageTracker()
+
+    tracker.record(None)
+    tracker.record(SimpleNamespace(prompt_tokens=50, completion_tokens=5))
+
+    assert tracker.total.requests == 2
+    assert tracker.total.prompt_tokens == 50
+    assert tracker.total.cached_tokens == 0
+    assert tracker.total.cost == 0.0
+
+
+def test_cache_hit_ratio():
+    assert TokenUsage(prompt_tokens=1000, cached_tokens=250).cache_hit_ratio == 0.25
+    assert TokenUsage().cache_hit_ratio == 0.0
+
+
+def test_track_usage_collects_nested_scopes():
+    tracker = UsageTracker()
+    tracker.record(make_usage())
+
+    with track_usage() as outer:
+        tracker.record(make_usage())
+        with track_usage() as inner:
+            tracker.record(make_usage())
+
+    assert outer.requests == 2
+    assert inner.requests == 1
+    assert tracker.total.requests == 3
+
+
+def test_track_usage_ignores_other_threads():
+    tracker = UsageTracker()
+    recorded = threading.Event()
+
+    def record_elsewhere():
+        tracker.record(make_usage())
+        recorded.set()
+
+    with track_usage() as usage:
+        thread = threading.Thread(target=record_elsewhere)
+        thread.start()
+        thread.join()
+
+    assert recorded.is_set()
+    assert usage.requests == 0
+
+
+def test_track_usage_follows_asyncio_tasks_and_threads():
+    tracker = UsageTracker()
+
+    async def run():
+        with track_usage() as usage:
+            await asyncio.gather(
+                asyncio.to_thread(tracker.record, make_usage()),
+                asyncio.sleep(0, tracker.record(make_usage())),
+            )
+        return usage
+
+    assert asyncio.run(run()).requests == 2